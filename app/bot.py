@@ -22,10 +22,19 @@ import config
 from db import run_db_query
 from scheduler import setup_task_scheduler
 from cache import get_global_cache, start_cache_maintenance_task
-from cache_loader import get_cache_loader
+from cache_loader import get_cache_loader, start_delta_sync_task, start_guild_eviction_task
 from core.translation import translations
 from core.rate_limiter import start_cleanup_task
 from core.performance_profiler import get_profiler
+from core.keyed_locks import get_event_locks
+from core.dm_dispatcher import get_dm_dispatcher
+from core.group_engine import get_group_engine
+from core.voice_ledger import get_voice_ledger, start_voice_ledger_flush_task
+from core.settlement import get_settlement_engine
+from core.dkp_ledger import get_dkp_ledger
+from core.leaderboard import get_leaderboards
+from core.attendance_analytics import get_attendance_analytics
+from core.roster_renderer import get_roster_renderer
 from core.reliability import setup_reliability_system
 
 try:
@@ -473,6 +482,14 @@ def create_command_groups(bot: discord.Bot) -> None:
         default_member_permissions=discord.Permissions(manage_roles=True)
     )
 
+    bot.dkp_group = discord.SlashCommandGroup(
+        name=GROUPS_DATA.get("dkp", {}).get("name", {}).get("en-US", "dkp"),
+        description=GROUPS_DATA.get("dkp", {}).get("description", {}).get("en-US", "DKP standings and rankings"),
+        name_localizations=GROUPS_DATA.get("dkp", {}).get("name", {}),
+        description_localizations=GROUPS_DATA.get("dkp", {}).get("description", {}),
+        default_member_permissions=discord.Permissions(send_messages=True)
+    )
+
     groups = [
         ("admin_bot", bot.admin_group),
         ("absence", bot.absence_group),
@@ -480,7 +497,8 @@ def create_command_groups(bot: discord.Bot) -> None:
         ("loot", bot.loot_group),
         ("staff", bot.staff_group),
         ("events", bot.events_group),
-        ("statics", bot.statics_group)
+        ("statics", bot.statics_group),
+        ("dkp", bot.dkp_group)
     ]
     
     for group_name, group in groups:
@@ -502,7 +520,8 @@ def setup_global_group_error_handlers(bot: discord.Bot) -> None:
         ("loot", bot.loot_group),
         ("staff", bot.staff_group),
         ("events", bot.events_group),
-        ("statics", bot.statics_group)
+        ("statics", bot.statics_group),
+        ("dkp", bot.dkp_group)
     ]
     
     async def global_group_error_handler(ctx: discord.ApplicationContext, error: Exception):
@@ -680,43 +699,24 @@ async def on_ready() -> None:
     if not hasattr(bot, '_cache_loaded'):
         bot._cache_loaded = True
         
-        max_retries = 3
-        retry_count = 0
-        cache_loaded = False
-        
-        while retry_count < max_retries and not cache_loaded:
-            try:
-                retry_count += 1
-                logging.info(f"[Bot] Attempting cache load (attempt {retry_count}/{max_retries})...")
-                
-                await bot.cache_loader.load_all_shared_data()
-                bot.cache._initial_load_complete = True
-                cache_loaded = True
-                logging.info("[Bot] Initial cache load completed successfully - all categories loaded ONCE")
-                
-            except Exception as e:
-                logging.error(f"[Bot] Cache load attempt {retry_count} failed: {e}", exc_info=True)
-                
-                if retry_count < max_retries:
-                    wait_time = min(60, 5 * (2 ** (retry_count - 1)))
-                    logging.warning(f"[Bot] Retrying cache load in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    logging.critical("[Bot] CRITICAL: Failed to load cache after 3 attempts!")
-                    logging.critical("[Bot] The bot cannot function properly without cache.")
-                    logging.critical("[Bot] Initiating shutdown sequence...")
-
-                    try:
-                        await bot.close()
-                    except:
-                        pass
-
-                    logging.critical("[Bot] Exiting with error code 1. Please check database connection and restart manually.")
-                    import sys
-                    sys.exit(1)
-
-        if not cache_loaded:
+        try:
+            logging.info("[Bot] Starting staged cache load...")
+            await bot.cache_loader.load_all_shared_data()
             bot.cache._initial_load_complete = True
+            logging.info("[Bot] Initial cache load completed successfully - guild data will be hydrated on first use")
+        except Exception as e:
+            logging.critical(f"[Bot] CRITICAL: Failed to load cache: {e}", exc_info=True)
+            logging.critical("[Bot] The bot cannot function properly without cache.")
+            logging.critical("[Bot] Initiating shutdown sequence...")
+
+            try:
+                await bot.close()
+            except:
+                pass
+
+            logging.critical("[Bot] Exiting with error code 1. Please check database connection and restart manually.")
+            import sys
+            sys.exit(1)
     
     if PSUTIL_AVAILABLE and not hasattr(bot, '_monitor_task'):
         bot._monitor_task = asyncio.create_task(monitor_resources())
@@ -739,7 +739,10 @@ async def on_ready() -> None:
         bot._background_tasks.append(cleanup_task)
         
         await start_cache_maintenance_task(bot)
+        await start_delta_sync_task(bot, interval=config.CACHE_DELTA_SYNC_INTERVAL)
+        await start_guild_eviction_task(bot, idle_ttl=config.CACHE_GUILD_IDLE_TTL)
         await start_cleanup_task(bot)
+        await start_voice_ledger_flush_task(bot, interval=config.VOICE_LEDGER_FLUSH_INTERVAL)
 
         logging.info("[BotOptimizer] Optimization setup completed - intelligent cache system with smart features started")
 
@@ -799,6 +802,127 @@ async def performance_stats(ctx):
         inline=True
     )
     
+    load_timings = bot.cache_loader.get_load_timings() if hasattr(bot.cache_loader, 'get_load_timings') else {}
+    if load_timings:
+        eager_timings = [item for item in load_timings.items() if item[1]['status'] != 'lazy']
+        slowest = sorted(eager_timings, key=lambda item: item[1]['duration_ms'], reverse=True)[:5]
+        failed = [category for category, timing in load_timings.items() if timing['status'] == 'failed']
+        timings_value = "\n".join(
+            f"{category}: {timing['duration_ms']}ms" + (f" ({timing['attempts']} attempts)" if timing['attempts'] > 1 else "")
+            for category, timing in slowest
+        )
+        if failed:
+            timings_value += f"\n❌ Failed: {', '.join(failed)}"
+        if hasattr(bot.cache_loader, 'get_hydration_stats'):
+            hydration = bot.cache_loader.get_hydration_stats()
+            timings_value += f"\n💧 {hydration['hydrated_guilds']} guilds hydrated, {hydration['evictions']} evicted"
+        embed.add_field(
+            name="🚀 Startup Load",
+            value=timings_value,
+            inline=False
+        )
+    
+    lock_metrics = get_event_locks().get_metrics()
+    if lock_metrics['acquisitions']:
+        locks_value = (
+            f"{lock_metrics['contention_rate']}% contended\n"
+            f"Wait avg {lock_metrics['avg_wait_ms']}ms / max {lock_metrics['max_wait_ms']}ms\n"
+            f"Max queue: {lock_metrics['max_queue_length']}"
+        )
+        if lock_metrics['hot_keys']:
+            hottest = lock_metrics['hot_keys'][0]
+            locks_value += f"\nHottest: {hottest['key']} ({hottest['total_wait_ms']}ms)"
+        embed.add_field(
+            name="🔒 Event Locks",
+            value=locks_value,
+            inline=True
+        )
+
+    dm_stats = get_dm_dispatcher().get_stats()
+    if dm_stats['batches']:
+        embed.add_field(
+            name="✉️ DM Delivery",
+            value=(
+                f"{dm_stats['sent']} sent / {dm_stats['failed']} failed\n"
+                f"Closed DMs: {dm_stats['forbidden']} ({dm_stats['forbidden_cached']} cached)\n"
+                f"Rate wait: {dm_stats['rate_wait']}s"
+            ),
+            inline=True
+        )
+
+    group_stats = get_group_engine().get_stats()
+    if group_stats['runs']:
+        embed.add_field(
+            name="👥 Group Assignment",
+            value=(
+                f"{group_stats['runs']} runs ({group_stats['mode']})\n"
+                f"Avg: {group_stats['avg_ms']}ms / Max: {group_stats['max_ms']}ms\n"
+                f"Offloaded: {group_stats['offloaded']}"
+            ),
+            inline=True
+        )
+    
+    ledger_stats = get_voice_ledger().get_stats()
+    if ledger_stats['joins']:
+        embed.add_field(
+            name="🎙️ Voice Ledger",
+            value=(
+                f"{ledger_stats['open']} in voice / {ledger_stats['intervals']} intervals\n"
+                f"Flushed: {ledger_stats['flushed_rows']} ({ledger_stats['pending']} pending)\n"
+                f"Flush errors: {ledger_stats['flush_errors']}"
+            ),
+            inline=True
+        )
+    
+    settlement_stats = get_settlement_engine().get_stats()
+    if settlement_stats['settled'] or settlement_stats['duplicates']:
+        embed.add_field(
+            name="💰 DKP Settlements",
+            value=(
+                f"{settlement_stats['settled']} settled ({settlement_stats['members']} members)\n"
+                f"Avg: {settlement_stats['avg_ms']}ms / Max: {settlement_stats['max_ms']}ms\n"
+                f"Duplicates skipped: {settlement_stats['duplicates']}\n"
+                f"Ledger entries: {get_dkp_ledger().get_stats()['entries']}"
+            ),
+            inline=True
+        )
+
+    leaderboard_stats = get_leaderboards().get_stats()
+    if leaderboard_stats['guilds']:
+        embed.add_field(
+            name="🏆 Leaderboards",
+            value=(
+                f"{leaderboard_stats['guilds']} guilds / {leaderboard_stats['members']} members\n"
+                f"Builds: {leaderboard_stats['builds']} / Updates: {leaderboard_stats['updates']}\n"
+                f"Queries: {leaderboard_stats['queries']}"
+            ),
+            inline=True
+        )
+
+    analytics_stats = get_attendance_analytics().get_stats()
+    if analytics_stats['guilds']:
+        embed.add_field(
+            name="📊 Attendance Analytics",
+            value=(
+                f"{analytics_stats['guilds']} guilds / {analytics_stats['cells']} cells\n"
+                f"Builds: {analytics_stats['builds']} / Events added: {analytics_stats['events_recorded']}\n"
+                f"Queries: {analytics_stats['queries']}"
+            ),
+            inline=True
+        )
+
+    renderer_stats = get_roster_renderer().get_stats()
+    if renderer_stats['renders']:
+        embed.add_field(
+            name="📋 Roster Tables",
+            value=(
+                f"Renders: {renderer_stats['renders']} / Cached rows: {renderer_stats['cached_rows']}\n"
+                f"Rows rendered: {renderer_stats['rows_rendered']} / reused: {renderer_stats['rows_cached']}\n"
+                f"Pages edited: {renderer_stats['pages_edited']} / skipped: {renderer_stats['pages_skipped']}"
+            ),
+            inline=True
+        )
+    
     embed.add_field(
         name="⏱️ Uptime",
         value=f"{stats['uptime_hours']:.1f} hours",
@@ -895,6 +1019,10 @@ async def cleanup_background_tasks():
         bot._background_tasks.clear()
         logging.debug("[Bot] Background tasks cleanup completed")
 
+    voice_ledger = get_voice_ledger()
+    voice_ledger.close_all()
+    await voice_ledger.flush(bot.run_db_query)
+
 def _graceful_exit(sig_name):
     """
     Handle graceful shutdown on system signals.
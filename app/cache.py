@@ -4,6 +4,7 @@ import time
 from collections import defaultdict, deque, Counter
 from datetime import datetime
 from functools import wraps
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Set, List, Callable
 
 # #################################################################################### #
@@ -19,6 +20,7 @@ CACHE_CATEGORIES = {
     'discord_entities': 43200, # 12 hours - Discord members, channels, guilds (bi-daily)
     'temporary': 300         # 5 minutes - Short-term cache
 }
+GUILD_SCOPED_CATEGORIES = ('guild_data', 'user_data', 'roster_data')
 
 # #################################################################################### #
 #                            Cache Entry Management
@@ -118,6 +120,48 @@ class CacheEntry:
 
         return 0 < time_until_prediction < (self.ttl * 0.2)
 
+# #################################################################################### #
+#                            Immutable Cache Views
+# #################################################################################### #
+def freeze(value: Any) -> Any:
+    """
+    Build a read-only view of a cache value.
+    
+    Dicts become MappingProxyType, lists and tuples become tuples and sets
+    become frozensets, recursively. Scalars are returned unchanged.
+    
+    Args:
+        value: Value to freeze
+        
+    Returns:
+        Immutable equivalent of the value
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """
+    Build a private mutable copy of a (possibly frozen) cache value.
+    
+    Args:
+        value: Value to thaw
+        
+    Returns:
+        Mutable deep copy with dicts, lists and sets
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return set(value)
+    return value
+
 # #################################################################################### #
 #                            Global Cache System Core
 # #################################################################################### #
@@ -242,6 +286,48 @@ class GlobalCacheSystem:
             if was_new_entry:
                 self._category_metrics[category]['size'] += 1
     
+    async def update(self, category: str, fn: Callable[[Optional[Any]], Optional[Any]], *args, ttl: Optional[int] = None) -> Optional[Any]:
+        """
+        Copy-on-write update of a cache entry.
+        
+        The updater receives a private mutable copy of the current value (or
+        None if missing/expired) and returns the new value, or None to leave
+        the entry untouched. The result is stored frozen, so views already
+        handed out to other readers never change under them.
+        
+        Args:
+            category: Cache category
+            fn: Synchronous updater applied under the per-key lock
+            *args: Arguments for cache key generation
+            ttl: Custom TTL in seconds (optional)
+            
+        Returns:
+            Frozen new value, or None if the updater declined the update
+        """
+        key = self._generate_key(category, *args)
+        cache_ttl = ttl or self._get_ttl_for_category(category)
+        
+        async with self._locks[key]:
+            entry = self._cache.get(key)
+            was_new_entry = entry is None
+            current = None
+            if entry is not None and not entry.is_expired():
+                current = thaw(entry.value)
+            
+            new_value = fn(current)
+            if new_value is None:
+                return None
+            
+            frozen = freeze(new_value)
+            self._cache[key] = CacheEntry(frozen, cache_ttl, category)
+            
+            self._metrics['sets'] += 1
+            self._category_metrics[category]['sets'] += 1
+            
+            if was_new_entry:
+                self._category_metrics[category]['size'] += 1
+            return frozen
+    
     async def delete(self, category: str, *args) -> bool:
         """
         Delete specific cache entry.
@@ -286,9 +372,34 @@ class GlobalCacheSystem:
         
         if category in self._category_metrics:
             self._category_metrics[category]['size'] = 0
+        if category in GUILD_SCOPED_CATEGORIES and self.bot and getattr(self.bot, 'cache_loader', None):
+            self.bot.cache_loader.forget_hydrated_guilds()
         logging.info(f"[Cache] Invalidated {len(keys_to_remove)} entries in category {category}")
         return len(keys_to_remove)
 
+    async def evict_guild(self, guild_id: int) -> int:
+        """
+        Drop every guild- and user-scoped entry of one guild.
+        
+        Args:
+            guild_id: Discord guild ID
+            
+        Returns:
+            Number of entries removed
+        """
+        prefixes = (f"guild_data:{guild_id}:", f"user_data:{guild_id}:")
+        bulk_key = self._generate_key('roster_data', f'bulk_guild_members_{guild_id}')
+        keys_to_remove = [key for key in self._cache if key.startswith(prefixes) or key == bulk_key]
+
+        for key in keys_to_remove:
+            async with self._locks[key]:
+                entry = self._cache.pop(key, None)
+                if entry is not None:
+                    self._category_metrics[entry.category]['size'] -= 1
+
+        logging.debug(f"[Cache] Evicted {len(keys_to_remove)} entries of guild {guild_id}")
+        return len(keys_to_remove)
+
 # #################################################################################### #
 #                            Cache Invalidation Rules
 # #################################################################################### #
@@ -343,6 +454,9 @@ class GlobalCacheSystem:
         reload_key = f"reload_{key}"
         if reload_key in self._cache:
             await asyncio.sleep(0.1)
+
+        if _auto_reload:
+            await self._ensure_guild_hydrated(guild_id)
             
         result = await self.get('guild_data', guild_id, data_type)
 
@@ -378,7 +492,7 @@ class GlobalCacheSystem:
                 if category:
                     logging.debug(f"[Cache] Auto-reloading {category} for guild {guild_id} (missing {data_type})")
                     try:
-                        await self.bot.cache_loader.reload_category(category)
+                        await self.bot.cache_loader.reload_category(category, guild_id)
                         result = await self.get_guild_data(guild_id, data_type, _auto_reload=False)
                     except Exception as e:
                         logging.error(f"[Cache] Failed to auto-reload {category}: {e}")
@@ -387,6 +501,21 @@ class GlobalCacheSystem:
         
         return result
     
+    async def _ensure_guild_hydrated(self, guild_id: int) -> None:
+        """
+        Hydrate a guild's data on first access once the startup load is done.
+        
+        Args:
+            guild_id: Discord guild ID
+        """
+        cache_loader = getattr(self.bot, 'cache_loader', None) if self.bot else None
+        if cache_loader is None or not self._initial_load_complete:
+            return
+        try:
+            await cache_loader.ensure_guild_hydrated(guild_id)
+        except Exception as e:
+            logging.error(f"[Cache] Failed to hydrate guild {guild_id}: {e}")
+
     async def _is_guild_configured(self, guild_id: int) -> bool:
         """
         Check if a guild is configured (initialized) without triggering auto-reload.
@@ -475,6 +604,20 @@ class GlobalCacheSystem:
         """
         await self.set('guild_data', value, guild_id, data_type)
     
+    async def update_guild_data(self, guild_id: int, data_type: str, fn: Callable[[Optional[Any]], Optional[Any]]) -> Optional[Any]:
+        """
+        Copy-on-write update of guild-specific data.
+        
+        Args:
+            guild_id: Discord guild ID
+            data_type: Type of data to update
+            fn: Updater receiving a mutable copy of the current value
+            
+        Returns:
+            Frozen new value, or None if the updater declined the update
+        """
+        return await self.update('guild_data', fn, guild_id, data_type)
+    
     async def delete_guild_data(self, guild_id: int, data_type: str) -> bool:
         """
         Delete guild-specific data from cache.
@@ -506,6 +649,9 @@ class GlobalCacheSystem:
         reload_key = f"reload_{key}"
         if reload_key in self._cache:
             await asyncio.sleep(0.1)
+
+        if _auto_reload:
+            await self._ensure_guild_hydrated(guild_id)
             
         result = await self.get('user_data', guild_id, user_id, data_type)
 
@@ -527,7 +673,7 @@ class GlobalCacheSystem:
                 if category:
                     logging.debug(f"[Cache] Auto-reloading {category} for user {guild_id}/{user_id} (missing {data_type})")
                     try:
-                        await self.bot.cache_loader.reload_category(category)
+                        await self.bot.cache_loader.reload_category(category, guild_id)
                         result = await self.get_user_data(guild_id, user_id, data_type, _auto_reload=False)
                     except Exception as e:
                         logging.error(f"[Cache] Failed to auto-reload {category}: {e}")
@@ -570,6 +716,55 @@ class GlobalCacheSystem:
         """
         await self.set('roster_data', members_data, guild_id, 'members')
         await self.invalidate_related('roster_data')
+
+    async def get_guild_roster(self, guild_id: int) -> Dict:
+        """
+        Get the shared roster dictionary once a guild's entries are hydrated.
+        
+        Args:
+            guild_id: Discord guild ID whose entries must be loaded
+            
+        Returns:
+            Roster dictionary keyed by (guild_id, member_id), empty if it could not be loaded
+        """
+        return await self._get_hydrated_shared(guild_id, 'roster_data', 'guild_members', 'guild_members') or {}
+
+    async def get_guild_ideal_staff(self, guild_id: int) -> Dict[str, int]:
+        """
+        Get the ideal class composition of a guild once the guild is hydrated.
+        
+        Args:
+            guild_id: Discord guild ID
+            
+        Returns:
+            Dictionary mapping class names to ideal counts
+        """
+        ideal_staff = await self._get_hydrated_shared(guild_id, 'guild_data', 'ideal_staff', 'guild_ideal_staff')
+        return ideal_staff.get(guild_id, {}) if ideal_staff else {}
+
+    async def _get_hydrated_shared(self, guild_id: int, category: str, key: str, loader_category: str) -> Optional[Any]:
+        """
+        Read a dictionary shared by every guild after hydrating one guild.
+        
+        The shared entry can expire on its own TTL while the guild is still
+        marked hydrated; it is then reloaded for this guild only.
+        
+        Args:
+            guild_id: Discord guild ID
+            category: Cache category of the shared entry
+            key: Cache key of the shared entry
+            loader_category: Cache loader category that fills the entry
+            
+        Returns:
+            Shared dictionary, or None if it could not be loaded
+        """
+        await self._ensure_guild_hydrated(guild_id)
+        value = await self.get(category, key)
+        cache_loader = getattr(self.bot, 'cache_loader', None) if self.bot else None
+        if value is None and cache_loader is not None and self._initial_load_complete:
+            await cache_loader.reload_category(loader_category, guild_id)
+            value = await self.get(category, key)
+        return value
     
     async def get_event_data(self, guild_id: int, event_type: str = 'all') -> Optional[Any]:
         """
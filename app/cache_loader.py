@@ -3,8 +3,86 @@ Centralized Cache Loader - Manages loading of shared data into global cache.
 """
 
 import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from cache import freeze
+from core.leaderboard import get_leaderboards
+
+DELTA_SYNC_QUERIES = {
+    'events_data': """
+        SELECT guild_id, event_id, name, event_date, event_time, duration,
+               dkp_value, dkp_ins, status, registrations, actual_presence, embed_layout
+        FROM events_data WHERE updated_at >= %s
+    """,
+    'guild_members': """
+        SELECT guild_id, member_id, username, language, class, GS, build, weapons,
+               DKP, nb_events, registrations, attendances
+        FROM guild_members WHERE updated_at >= %s
+    """,
+    'user_setup': "SELECT guild_id, user_id, locale, gs, weapons FROM user_setup WHERE updated_at >= %s",
+    'event_registrations': "SELECT DISTINCT guild_id, event_id FROM event_registrations WHERE updated_at >= %s",
+}
+
+DELTA_SYNC_CATEGORIES = {'event_registrations': 'events_data'}
+
+REGISTRATION_STATUSES = ("presence", "tentative", "absence")
+
+CHANGELOG_RETENTION_HOURS = 24
+
+CATEGORY_DEPENDENCIES = {
+    'guild_settings': (),
+    'games_list': (),
+    'epic_items_t2': (),
+    'guild_roles': ('guild_settings',),
+    'guild_channels': ('guild_settings',),
+    'welcome_messages': ('guild_settings',),
+    'absence_messages': ('guild_settings',),
+    'guild_members': ('guild_settings',),
+    'user_setup': ('guild_settings',),
+    'guild_ideal_staff': ('guild_settings',),
+    'guild_ptb_settings': ('guild_settings',),
+    'static_groups': ('guild_settings',),
+    'static_data': ('static_groups',),
+    'events_data': ('guild_settings', 'games_list'),
+    'weapons': ('games_list',),
+    'weapons_combinations': ('weapons',),
+    'events_calendar': ('games_list',),
+}
+
+def compile_weapon_tables(combinations_by_game: Dict[int, list]) -> Tuple[Dict[int, Dict[frozenset, str]], Dict[int, frozenset]]:
+    """
+    Compile weapon combinations into per-game lookup tables.
+    
+    Args:
+        combinations_by_game: Combination dictionaries (role, weapon1, weapon2) by game ID
+        
+    Returns:
+        Tuple of (frozenset of a weapon pair -> role, valid weapon codes), each keyed by game ID
+    """
+    weapon_roles = {}
+    valid_weapon_codes = {}
+    for game_id, combinations in combinations_by_game.items():
+        roles = weapon_roles[game_id] = {}
+        for combo in combinations:
+            roles.setdefault(frozenset((combo['weapon1'], combo['weapon2'])), combo['role'])
+        valid_weapon_codes[game_id] = frozenset(code for combo in combinations for code in (combo['weapon1'], combo['weapon2']))
+    return weapon_roles, valid_weapon_codes
+
+EAGER_CATEGORIES = ('games_list', 'weapons', 'weapons_combinations', 'events_calendar')
+
+GUILD_CATEGORIES = (
+    'guild_settings', 'guild_roles', 'guild_channels', 'welcome_messages',
+    'guild_members', 'user_setup', 'guild_ideal_staff', 'guild_ptb_settings',
+    'static_groups', 'events_data',
+)
+
+CRITICAL_CATEGORIES = ('games_list',)
+CATEGORY_MAX_ATTEMPTS = 3
+INITIAL_LOAD_TIMEOUT = 10.0
+GUILD_IDLE_TTL = 21600
 
 class CacheLoader:
     """Centralized loader for shared guild data to eliminate redundant DB queries."""
@@ -20,25 +98,76 @@ class CacheLoader:
         self._loaded_categories = set()
         self._initial_load_complete = False
         self._load_lock = asyncio.Lock()
+        self._delta_watermarks: Dict[str, Any] = {}
+        self._changelog_watermark = 0
+        self._delta_lock = asyncio.Lock()
+        self._delta_stats = {'runs': 0, 'rows_patched': 0, 'rows_deleted': 0, 'last_run': None}
+        self._category_events: Dict[str, asyncio.Event] = {
+            category: asyncio.Event() for category in CATEGORY_DEPENDENCIES
+        }
+        self._initial_load_event = asyncio.Event()
+        self._category_timings: Dict[str, Dict[str, Any]] = {}
+        self._hydrated_guilds = set()
+        self._hydration_tasks: Dict[int, asyncio.Task] = {}
+        self._guild_last_access: Dict[int, float] = {}
+        self._hydration_stats = {'hydrations': 0, 'failures': 0, 'evictions': 0, 'last_duration_ms': 0}
+
+    @staticmethod
+    def _scope_query(query: str, only_guild_id: Optional[int]) -> tuple:
+        """
+        Restrict a full-table loader query to a single guild.
+        
+        Args:
+            query: Loader query without WHERE clause
+            only_guild_id: Guild to filter on, or None for every guild
+            
+        Returns:
+            Tuple of (query, params) for run_db_query
+        """
+        if only_guild_id is None:
+            return query, ()
+        return f"{query.rstrip()} WHERE guild_id = %s", (only_guild_id,)
+
+    def _finish_load(self, category: str, only_guild_id: Optional[int], message: str, level: int = logging.INFO) -> None:
+        """
+        Log a loader outcome and mark full loads as complete.
+        
+        Args:
+            category: Name of the data category
+            only_guild_id: Guild of a per-guild load, or None for a full load
+            message: Outcome message
+            level: Log level used for full loads
+        """
+        if only_guild_id is None:
+            logging.log(level, f"[CacheLoader] {message}")
+            self._loaded_categories.add(category)
+        else:
+            logging.debug(f"[CacheLoader] {message} (guild {only_guild_id})")
         
-    async def ensure_guild_settings_loaded(self) -> None:
+    async def ensure_guild_settings_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load guild settings (language, name, game, server) for all guilds.
         
         Loads and caches guild configuration data including PTB settings,
         language preferences, and initialization status.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'guild_settings' in self._loaded_categories:
+        if only_guild_id is None and 'guild_settings' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading guild settings for all guilds")
-        query = "SELECT guild_id, guild_ptb, guild_lang, guild_name, guild_game, guild_server, initialized, premium FROM guild_settings"
+        query, params = self._scope_query(
+            "SELECT guild_id, guild_ptb, guild_lang, guild_name, guild_game, guild_server, initialized, premium, attendance_min_presence FROM guild_settings",
+            only_guild_id
+        )
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
             if rows:
                 for row in rows:
-                    guild_id, guild_ptb, guild_lang, guild_name, guild_game, guild_server, initialized, premium = row
+                    guild_id, guild_ptb, guild_lang, guild_name, guild_game, guild_server, initialized, premium, attendance_min_presence = row
 
                     await self.bot.cache.set_guild_data(guild_id, 'guild_ptb', guild_ptb)
                     await self.bot.cache.set_guild_data(guild_id, 'guild_lang', guild_lang)
@@ -55,31 +184,39 @@ class CacheLoader:
                         'guild_game': guild_game,
                         'guild_server': guild_server,
                         'initialized': initialized,
-                        'premium': premium
+                        'premium': premium,
+                        'attendance_min_presence': attendance_min_presence
                     })
                     
-                logging.info(f"[CacheLoader] Loaded settings for {len(rows)} guilds")
-                self._loaded_categories.add('guild_settings')
+                self._finish_load('guild_settings', only_guild_id, f"Loaded settings for {len(rows)} guilds")
             else:
-                logging.warning("[CacheLoader] No guild settings found in database")
+                self._finish_load('guild_settings', only_guild_id, "No guild settings found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading guild settings: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
-    async def ensure_guild_roles_loaded(self) -> None:
+    async def ensure_guild_roles_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load guild roles (members, absent_members, rules_ok) for all guilds.
         
         Loads and caches Discord role IDs for various guild functions
         including member management and permissions.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'guild_roles' in self._loaded_categories:
+        if only_guild_id is None and 'guild_roles' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading guild roles for all guilds")
-        query = "SELECT guild_id, guild_master, officer, guardian, members, absent_members, allies, diplomats, friends, applicant, config_ok, rules_ok FROM guild_roles"
+        query, params = self._scope_query(
+            "SELECT guild_id, guild_master, officer, guardian, members, absent_members, allies, diplomats, friends, applicant, config_ok, rules_ok FROM guild_roles",
+            only_guild_id
+        )
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
             if rows:
                 for row in rows:
                     guild_id, guild_master, officer, guardian, members, absent_members, allies, diplomats, friends, applicant, config_ok, rules_ok = row
@@ -106,28 +243,32 @@ class CacheLoader:
                     if rules_ok:
                         await self.bot.cache.set_guild_data(guild_id, 'rules_ok_role', rules_ok)
                     
-                logging.info(f"[CacheLoader] Loaded roles for {len(rows)} guilds")
-                self._loaded_categories.add('guild_roles')
+                self._finish_load('guild_roles', only_guild_id, f"Loaded roles for {len(rows)} guilds")
             else:
-                logging.warning("[CacheLoader] No guild roles found in database")
+                self._finish_load('guild_roles', only_guild_id, "No guild roles found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading guild roles: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
-    async def ensure_guild_channels_loaded(self) -> None:
+    async def ensure_guild_channels_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load guild channels (rules, absence, events, etc.) for all guilds.
         
         Loads and caches Discord channel IDs for various guild functions
         including rules, events, members, and forum channels.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'guild_channels' in self._loaded_categories:
+        if only_guild_id is None and 'guild_channels' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading guild channels for all guilds")
         query = """
             SELECT guild_id, rules_channel, rules_message, announcements_channel, voice_tavern_channel, 
                    voice_war_channel, create_room_channel, events_channel, members_channel, 
-                   members_m1, members_m2, members_m3, members_m4, members_m5, groups_channel,
+                   members_m1, members_m2, members_m3, members_m4, members_m5, members_extra_messages, groups_channel,
                    statics_channel, statics_message, abs_channel, loot_channel, loot_message, tuto_channel,
                    forum_allies_channel, forum_friends_channel, forum_diplomats_channel,
                    forum_recruitment_channel, forum_members_channel, notifications_channel,
@@ -135,12 +276,14 @@ class CacheLoader:
                    external_recruitment_message
             FROM guild_channels
         """
+        query, params = self._scope_query(query, only_guild_id)
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
             if rows:
                 for row in rows:
-                    guild_id, rules_channel, rules_message, announcements_channel, voice_tavern_channel, voice_war_channel, create_room_channel, events_channel, members_channel, members_m1, members_m2, members_m3, members_m4, members_m5, groups_channel, statics_channel, statics_message, abs_channel, loot_channel, loot_message, tuto_channel, forum_allies_channel, forum_friends_channel, forum_diplomats_channel, forum_recruitment_channel, forum_members_channel, notifications_channel, external_recruitment_cat, category_diplomat, external_recruitment_channel, external_recruitment_message = row
+                    guild_id, rules_channel, rules_message, announcements_channel, voice_tavern_channel, voice_war_channel, create_room_channel, events_channel, members_channel, members_m1, members_m2, members_m3, members_m4, members_m5, members_extra_messages, groups_channel, statics_channel, statics_message, abs_channel, loot_channel, loot_message, tuto_channel, forum_allies_channel, forum_friends_channel, forum_diplomats_channel, forum_recruitment_channel, forum_members_channel, notifications_channel, external_recruitment_cat, category_diplomat, external_recruitment_channel, external_recruitment_message = row
+                    members_extra_messages = json.loads(members_extra_messages) if members_extra_messages else []
 
                     channels_data = {
                         'rules_channel': rules_channel,
@@ -156,6 +299,7 @@ class CacheLoader:
                         'members_m3': members_m3,
                         'members_m4': members_m4,
                         'members_m5': members_m5,
+                        'members_extra_messages': members_extra_messages,
                         'groups_channel': groups_channel,
                         'statics_channel': statics_channel,
                         'statics_message': statics_message,
@@ -183,6 +327,7 @@ class CacheLoader:
                         await self.bot.cache.set_guild_data(guild_id, 'members_m3', members_m3)
                         await self.bot.cache.set_guild_data(guild_id, 'members_m4', members_m4)
                         await self.bot.cache.set_guild_data(guild_id, 'members_m5', members_m5)
+                        await self.bot.cache.set_guild_data(guild_id, 'members_extra_messages', members_extra_messages)
                     
                     if external_recruitment_channel:
                         await self.bot.cache.set_guild_data(guild_id, 'external_recruitment_channel', external_recruitment_channel)
@@ -212,28 +357,35 @@ class CacheLoader:
                             'message': loot_message
                         })
                     
-                logging.info(f"[CacheLoader] Loaded channels for {len(rows)} guilds")
-                self._loaded_categories.add('guild_channels')
+                self._finish_load('guild_channels', only_guild_id, f"Loaded channels for {len(rows)} guilds")
             else:
-                logging.warning("[CacheLoader] No guild channels found in database")
+                self._finish_load('guild_channels', only_guild_id, "No guild channels found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading guild channels: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
-    async def ensure_welcome_messages_loaded(self) -> None:
+    async def ensure_welcome_messages_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load welcome messages for autorole functionality.
         
         Loads message tracking data for automatic role assignment
         based on user reactions.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'welcome_messages' in self._loaded_categories:
+        if only_guild_id is None and 'welcome_messages' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading welcome messages from database")
-        query = "SELECT guild_id, member_id, channel_id, message_id FROM welcome_messages"
+        query, params = self._scope_query(
+            "SELECT guild_id, member_id, channel_id, message_id FROM welcome_messages",
+            only_guild_id
+        )
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
             if rows:
                 for row in rows:
                     guild_id, member_id, channel_id, message_id = row
@@ -241,13 +393,13 @@ class CacheLoader:
                         "channel": channel_id, 
                         "message": message_id
                     })
-                logging.info(f"[CacheLoader] Loaded {len(rows)} welcome messages")
-                self._loaded_categories.add('welcome_messages')
+                self._finish_load('welcome_messages', only_guild_id, f"Loaded {len(rows)} welcome messages")
             else:
-                logging.warning("[CacheLoader] No welcome messages found in database")
-                self._loaded_categories.add('welcome_messages')
+                self._finish_load('welcome_messages', only_guild_id, "No welcome messages found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading welcome messages: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
     async def ensure_absence_messages_loaded(self) -> None:
         """
@@ -262,98 +414,197 @@ class CacheLoader:
         logging.debug("[CacheLoader] Absence messages will be managed directly via DB (high frequency data)")
         self._loaded_categories.add('absence_messages')
 
-    async def ensure_guild_members_loaded(self) -> None:
+    async def ensure_guild_members_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load guild members data for all guilds.
         
         Loads member information including usernames, classes, gear scores,
-        builds, weapons, DKP, and event statistics.
+        builds, weapons, DKP, and event statistics. A per-guild load only
+        replaces that guild's entries in the shared roster dictionary.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
         current_cache = await self.bot.cache.get('roster_data', 'guild_members')
-        if 'guild_members' in self._loaded_categories and current_cache:
+        if only_guild_id is None and 'guild_members' in self._loaded_categories and current_cache:
             return
             
         logging.debug("[CacheLoader] Loading guild members for all guilds")
-        query = "SELECT guild_id, member_id, username, language, class, GS, build, weapons, DKP, nb_events, registrations, attendances FROM guild_members"
+        query, params = self._scope_query(
+            "SELECT guild_id, member_id, username, language, class, GS, build, weapons, DKP, nb_events, registrations, attendances FROM guild_members",
+            only_guild_id
+        )
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
-            if rows:
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
+            if only_guild_id is not None and current_cache is not None:
+                guild_members_cache = current_cache
+                for key in [key for key in guild_members_cache if key[0] == only_guild_id]:
+                    del guild_members_cache[key]
+            else:
+                if only_guild_id is not None:
+                    self._hydrated_guilds.clear()
                 guild_members_cache = {}
-                for row in rows:
-                    guild_id, member_id, username, language, member_class, gs, build, weapons, dkp, nb_events, registrations, attendances = row
-                    
-                    member_data = {
-                        'username': username,
-                        'language': language,
-                        'class': member_class,
-                        'GS': gs,
-                        'build': build,
-                        'weapons': weapons,
-                        'DKP': dkp or 0,
-                        'nb_events': nb_events or 0,
-                        'registrations': registrations or 0,
-                        'attendances': attendances or 0
-                    }
 
-                    key = (guild_id, member_id)
+            get_leaderboards().invalidate(only_guild_id)
+            if rows:
+                for row in rows:
+                    key, member_data = self._build_member_record(row)
                     guild_members_cache[key] = member_data
 
                 await self.bot.cache.set('roster_data', guild_members_cache, 'guild_members')
                     
-                logging.info(f"[CacheLoader] Loaded guild members: {len(rows)} members")
-                self._loaded_categories.add('guild_members')
+                self._finish_load('guild_members', only_guild_id, f"Loaded guild members: {len(rows)} members")
             else:
-                logging.warning("[CacheLoader] No guild members found in database")
-                await self.bot.cache.set('roster_data', {}, 'guild_members')
-                self._loaded_categories.add('guild_members')
+                await self.bot.cache.set('roster_data', guild_members_cache, 'guild_members')
+                self._finish_load('guild_members', only_guild_id, "No guild members found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading guild members: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
-    async def ensure_events_data_loaded(self) -> None:
+    @staticmethod
+    def _build_member_record(row) -> tuple:
+        """
+        Build a roster cache entry from a guild_members row.
+        
+        Args:
+            row: (guild_id, member_id, username, language, class, GS, build, weapons,
+                  DKP, nb_events, registrations, attendances)
+            
+        Returns:
+            Tuple of ((guild_id, member_id), member_data)
+        """
+        guild_id, member_id, username, language, member_class, gs, build, weapons, dkp, nb_events, registrations, attendances = row
+        member_data = {
+            'username': username,
+            'language': language,
+            'class': member_class,
+            'GS': gs,
+            'build': build,
+            'weapons': weapons,
+            'DKP': dkp or 0,
+            'nb_events': nb_events or 0,
+            'registrations': registrations or 0,
+            'attendances': attendances or 0
+        }
+        return (guild_id, member_id), member_data
+
+    async def ensure_events_data_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load events data for all guilds.
         
         Loads event information including dates, times, DKP values,
         status, and attendance tracking.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'events_data' in self._loaded_categories:
+        if only_guild_id is None and 'events_data' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading events data for all guilds")
         query = """
             SELECT guild_id, event_id, name, event_date, event_time, duration, 
-                   dkp_value, status, registrations, actual_presence
+                   dkp_value, dkp_ins, status, registrations, actual_presence, embed_layout
             FROM events_data
         """
+        query, params = self._scope_query(query, only_guild_id)
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
             if rows:
+                registrations = await self.fetch_event_registrations(only_guild_id)
                 for row in rows:
-                    guild_id, event_id, name, event_date, event_time, duration, dkp_value, status, registrations, actual_presence = row
-                    
-                    event_data = {
-                        'event_id': event_id,
-                        'name': name,
-                        'event_date': event_date,
-                        'event_time': event_time,
-                        'duration': duration,
-                        'dkp_value': dkp_value,
-                        'status': status,
-                        'registrations': registrations,
-                        'actual_presence': actual_presence
-                    }
-                    
+                    guild_id, event_id, event_data = self._build_event_record(row, registrations.get((row[0], row[1])))
                     await self.bot.cache.set_guild_data(guild_id, f'event_{event_id}', event_data)
                     
-                logging.info(f"[CacheLoader] Loaded events data: {len(rows)} events")
-                self._loaded_categories.add('events_data')
+                self._finish_load('events_data', only_guild_id, f"Loaded events data: {len(rows)} events")
             else:
-                logging.warning("[CacheLoader] No events data found in database")
+                self._finish_load('events_data', only_guild_id, "No events data found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading events data: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
+    async def fetch_event_registrations(self, guild_id: Optional[int] = None, event_ids: Optional[list] = None) -> Dict[tuple, Dict[str, list]]:
+        """
+        Read registrations from the event_registrations table.
+        
+        Members are listed in registration order (last status change first
+        come, first listed). Events without any row are absent from the result
+        and fall back to the events_data.registrations JSON snapshot.
+        
+        Args:
+            guild_id: Restrict the read to one guild (required with event_ids)
+            event_ids: Restrict the read to these events of the guild
+            
+        Returns:
+            Dictionary mapping (guild_id, event_id) to {status: [member_id, ...]}
+        """
+        query = "SELECT guild_id, event_id, member_id, status FROM event_registrations"
+        params = ()
+        if guild_id is not None:
+            query += " WHERE guild_id = %s"
+            params = (guild_id,)
+            if event_ids:
+                query += f" AND event_id IN ({','.join(['%s'] * len(event_ids))})"
+                params += tuple(event_ids)
+        query += " ORDER BY updated_at, member_id"
+
+        rows = await self.bot.run_db_query(query, params, fetch_all=True)
+        registrations: Dict[tuple, Dict[str, list]] = {}
+        for row_guild_id, event_id, member_id, status in rows or ():
+            if status not in REGISTRATION_STATUSES:
+                continue
+            event_registrations = registrations.setdefault((row_guild_id, event_id), {k: [] for k in REGISTRATION_STATUSES})
+            event_registrations[status].append(int(member_id))
+        return registrations
+
+    @staticmethod
+    def _build_event_record(row, registrations: Optional[Dict[str, list]] = None) -> tuple:
+        """
+        Build a frozen event cache record from an events_data row.
+        
+        Args:
+            row: (guild_id, event_id, name, event_date, event_time, duration,
+                  dkp_value, dkp_ins, status, registrations, actual_presence, embed_layout)
+            registrations: Rows from event_registrations, preferred over the JSON column
+            
+        Returns:
+            Tuple of (guild_id, event_id, frozen event record)
+        """
+        (guild_id, event_id, name, event_date, event_time, duration, dkp_value, dkp_ins,
+         status, registrations_json, actual_presence, embed_layout) = row
+        if registrations is None:
+            try:
+                registrations = json.loads(registrations_json) if registrations_json else None
+            except (json.JSONDecodeError, TypeError):
+                registrations = None
+        try:
+            actual_presence = json.loads(actual_presence) if actual_presence else None
+        except (json.JSONDecodeError, TypeError):
+            actual_presence = None
+        try:
+            embed_layout = json.loads(embed_layout) if embed_layout else None
+        except (json.JSONDecodeError, TypeError):
+            embed_layout = None
+
+        event_data = {
+            'event_id': event_id,
+            'name': name,
+            'event_date': event_date,
+            'event_time': event_time,
+            'duration': duration,
+            'dkp_value': dkp_value,
+            'dkp_ins': dkp_ins,
+            'status': status,
+            'registrations': registrations or {"presence": [], "tentative": [], "absence": []},
+            'actual_presence': actual_presence or [],
+            'embed_layout': embed_layout
+        }
+        return guild_id, event_id, freeze(event_data)
+
     async def ensure_static_data_loaded(self) -> None:
         """
         Load static groups data and mark other static data as on-demand.
@@ -374,32 +625,37 @@ class CacheLoader:
 
         self._loaded_categories.add('static_data')
     
-    async def ensure_static_groups_loaded(self) -> None:
+    async def ensure_static_groups_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load static groups data for all guilds.
         
         Loads PvP static group configurations including leaders
         and member assignments for guild war organization.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'static_groups' in self._loaded_categories:
+        if only_guild_id is None and 'static_groups' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading static groups from database")
         
-        query = """
+        guild_filter = "AND g.guild_id = %s" if only_guild_id is not None else ""
+        query = f"""
             SELECT g.guild_id, g.group_name, g.leader_id, 
                    GROUP_CONCAT(m.member_id ORDER BY m.position_order) as member_ids
             FROM guild_static_groups g
             LEFT JOIN guild_static_members m ON g.id = m.group_id
-            WHERE g.is_active = TRUE
+            WHERE g.is_active = TRUE {guild_filter}
             GROUP BY g.guild_id, g.group_name, g.leader_id
         """
+        params = (only_guild_id,) if only_guild_id is not None else ()
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
 
             guild_static_groups = {}
-            for row in rows:
+            for row in rows or []:
                 guild_id, group_name, leader_id, member_ids_str = row
 
                 member_ids = []
@@ -414,30 +670,37 @@ class CacheLoader:
                     "member_ids": member_ids
                 }
 
+            if only_guild_id is not None and only_guild_id not in guild_static_groups:
+                await self.bot.cache.delete_guild_data(only_guild_id, 'static_groups')
+
             for guild_id, groups_data in guild_static_groups.items():
                 await self.bot.cache.set_guild_data(guild_id, 'static_groups', groups_data)
             
-            logging.info(f"[CacheLoader] Loaded static groups for {len(guild_static_groups)} guilds")
-            self._loaded_categories.add('static_groups')
+            self._finish_load('static_groups', only_guild_id, f"Loaded static groups for {len(guild_static_groups)} guilds")
             
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading static groups: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
-    async def ensure_user_setup_loaded(self) -> None:
+    async def ensure_user_setup_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load user setup data for all users.
         
         Loads user-specific configuration including locale preferences,
         gear scores, and weapon setups.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'user_setup' in self._loaded_categories:
+        if only_guild_id is None and 'user_setup' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading user setup data for all users")
-        query = "SELECT guild_id, user_id, locale, gs, weapons FROM user_setup"
+        query, params = self._scope_query("SELECT guild_id, user_id, locale, gs, weapons FROM user_setup", only_guild_id)
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
             if rows:
                 for row in rows:
                     guild_id, user_id, locale, gs, weapons = row
@@ -450,13 +713,13 @@ class CacheLoader:
                     
                     await self.bot.cache.set_user_data(guild_id, user_id, 'setup', setup_data)
                     
-                logging.info(f"[CacheLoader] Loaded user setup data: {len(rows)} users")
-                self._loaded_categories.add('user_setup')
+                self._finish_load('user_setup', only_guild_id, f"Loaded user setup data: {len(rows)} users")
             else:
-                logging.warning("[CacheLoader] No user setup data found in database")
-                self._loaded_categories.add('user_setup')
+                self._finish_load('user_setup', only_guild_id, "No user setup data found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading user setup data: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
     async def ensure_weapons_loaded(self) -> None:
         """
@@ -524,33 +787,44 @@ class CacheLoader:
                     })
                 
                 await self.bot.cache.set_static_data('weapons_combinations', combinations_by_game)
+                weapon_roles, valid_weapon_codes = compile_weapon_tables(combinations_by_game)
+                await self.bot.cache.set_static_data('weapon_roles', weapon_roles)
+                await self.bot.cache.set_static_data('valid_weapon_codes', valid_weapon_codes)
                     
                 logging.info(f"[CacheLoader] Loaded weapons combinations: {len(rows)} combinations for {len(combinations_by_game)} games")
                 self._loaded_categories.add('weapons_combinations')
             else:
                 logging.warning("[CacheLoader] No weapons combinations found in database")
                 await self.bot.cache.set_static_data('weapons_combinations', {})
+                await self.bot.cache.set_static_data('weapon_roles', {})
+                await self.bot.cache.set_static_data('valid_weapon_codes', {})
                 self._loaded_categories.add('weapons_combinations')
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading weapons combinations: {e}", exc_info=True)
     
-    async def ensure_guild_ideal_staff_loaded(self) -> None:
+    async def ensure_guild_ideal_staff_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Load guild ideal staff data for all guilds.
         
         Loads ideal class composition targets for each guild,
         defining optimal member distribution across classes.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'guild_ideal_staff' in self._loaded_categories:
+        if only_guild_id is None and 'guild_ideal_staff' in self._loaded_categories:
             return
             
         logging.debug("[CacheLoader] Loading guild ideal staff data for all guilds")
-        query = "SELECT guild_id, class_name, ideal_count FROM guild_ideal_staff"
+        query, params = self._scope_query("SELECT guild_id, class_name, ideal_count FROM guild_ideal_staff", only_guild_id)
         
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
+            ideal_staff = {}
+            if only_guild_id is not None:
+                ideal_staff = await self.bot.cache.get('guild_data', 'ideal_staff') or {}
+                ideal_staff.pop(only_guild_id, None)
             if rows:
-                ideal_staff = {}
                 for row in rows:
                     guild_id, class_name, ideal_count = row
                     
@@ -560,14 +834,14 @@ class CacheLoader:
                 
                 await self.bot.cache.set('guild_data', ideal_staff, 'ideal_staff')
                     
-                logging.info(f"[CacheLoader] Loaded guild ideal staff: {len(rows)} class configurations for {len(ideal_staff)} guilds")
-                self._loaded_categories.add('guild_ideal_staff')
+                self._finish_load('guild_ideal_staff', only_guild_id, f"Loaded guild ideal staff: {len(rows)} class configurations for {len(ideal_staff)} guilds")
             else:
-                logging.warning("[CacheLoader] No guild ideal staff data found in database")
-                await self.bot.cache.set('guild_data', {}, 'ideal_staff')
-                self._loaded_categories.add('guild_ideal_staff')
+                await self.bot.cache.set('guild_data', ideal_staff, 'ideal_staff')
+                self._finish_load('guild_ideal_staff', only_guild_id, "No guild ideal staff data found in database", logging.WARNING)
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading guild ideal staff: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
     
     async def ensure_games_list_loaded(self) -> None:
         """
@@ -705,65 +979,133 @@ class CacheLoader:
 
     async def load_all_shared_data(self) -> None:
         """
-        Load all shared data categories in parallel - ONCE at startup.
+        Load the eager shared data categories in dependency stages - ONCE at startup.
         
-        This method should be called ONCE during bot initialization
-        to load all necessary data in a single optimized operation.
+        Only EAGER_CATEGORIES are loaded here; per-guild categories are
+        hydrated on first use by ensure_guild_hydrated() and the remaining
+        global ones by their own ensure_*_loaded() call. Each eager category
+        starts as soon as its dependencies have settled, is retried on its
+        own up to CATEGORY_MAX_ATTEMPTS times and signals its asyncio.Event
+        when done, so cogs can wait only for what they need.
+        
+        Raises:
+            RuntimeError: If a critical category could not be loaded
         """
         async with self._load_lock:
             if self._initial_load_complete:
                 logging.debug("[CacheLoader] Initial load already complete, skipping")
                 return
                 
-            logging.info("[CacheLoader] Starting optimized initial data load")
+            logging.info("[CacheLoader] Starting staged initial data load")
             start_time = asyncio.get_event_loop().time()
+            await self._snapshot_delta_watermarks()
 
-            tasks = [
-                self.ensure_guild_settings_loaded(),
-                self.ensure_guild_roles_loaded(),
-                self.ensure_guild_channels_loaded(),
-                self.ensure_welcome_messages_loaded(),
-                self.ensure_absence_messages_loaded(),
-                self.ensure_guild_members_loaded(),
-                self.ensure_events_data_loaded(),
-                self.ensure_static_data_loaded(),
-                self.ensure_static_groups_loaded(),
-                self.ensure_user_setup_loaded(),
-                self.ensure_weapons_loaded(),
-                self.ensure_weapons_combinations_loaded(),
-                self.ensure_guild_ideal_staff_loaded(),
-                self.ensure_games_list_loaded(),
-                self.ensure_epic_items_t2_loaded(),
-                self.ensure_events_calendar_loaded(),
-                self.ensure_guild_ptb_settings_loaded(),
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for category in CATEGORY_DEPENDENCIES:
+                if category not in EAGER_CATEGORIES:
+                    self._category_timings[category] = {'status': 'lazy', 'attempts': 0, 'duration_ms': 0}
+                    self._category_events[category].set()
+
+            await asyncio.gather(
+                *(self._load_category_stage(category) for category in EAGER_CATEGORIES),
+                return_exceptions=True
+            )
 
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logging.error(f"[CacheLoader] Error loading category {i}: {result}")
-            
             self._initial_load_complete = True
+            self._initial_load_event.set()
             elapsed = asyncio.get_event_loop().time() - start_time
-            logging.info(f"[CacheLoader] Initial data load completed in {elapsed:.2f}s - {len(self._loaded_categories)} categories loaded")
-    
-    async def wait_for_initial_load(self) -> None:
+            failed = [c for c, t in self._category_timings.items() if t['status'] == 'failed']
+            logging.info(f"[CacheLoader] Initial data load completed in {elapsed:.2f}s - {len(self._loaded_categories)} categories loaded, {len(failed)} failed, guild data hydrated on demand")
+
+            critical_failed = [c for c in CRITICAL_CATEGORIES if c in failed]
+            if critical_failed:
+                raise RuntimeError(f"Critical cache categories failed to load: {', '.join(critical_failed)}")
+
+    async def _load_category_stage(self, category: str) -> None:
+        """
+        Load one category once its dependencies have settled, with retries.
+        
+        Args:
+            category: Name of the data category to load
+        """
+        for dependency in CATEGORY_DEPENDENCIES.get(category, ()):
+            await self._category_events[dependency].wait()
+
+        loader = self._get_category_loader(category)
+        start_time = asyncio.get_event_loop().time()
+        attempts = 0
+        try:
+            while attempts < CATEGORY_MAX_ATTEMPTS:
+                attempts += 1
+                try:
+                    await loader()
+                except Exception as e:
+                    logging.error(f"[CacheLoader] Error loading category {category} (attempt {attempts}/{CATEGORY_MAX_ATTEMPTS}): {e}", exc_info=True)
+                if category in self._loaded_categories:
+                    break
+                if attempts < CATEGORY_MAX_ATTEMPTS:
+                    await asyncio.sleep(min(10, 0.5 * (2 ** attempts)))
+        finally:
+            elapsed_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+            status = 'loaded' if category in self._loaded_categories else 'failed'
+            self._category_timings[category] = {
+                'status': status,
+                'attempts': attempts,
+                'duration_ms': elapsed_ms
+            }
+            self._category_events[category].set()
+            if status == 'loaded':
+                logging.info(f"[CacheLoader] Category {category} loaded in {elapsed_ms}ms ({attempts} attempt(s))")
+            else:
+                logging.error(f"[CacheLoader] Category {category} failed after {attempts} attempt(s) in {elapsed_ms}ms")
+
+    async def wait_for_initial_load(self, timeout: float = INITIAL_LOAD_TIMEOUT) -> None:
         """
         Wait for initial cache load to complete.
         
         Cogs can call this instead of loading data themselves.
         This ensures they wait for the centralized load to finish.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
         """
         if self._initial_load_complete:
             return
 
-        for _ in range(100):
-            if self._initial_load_complete:
-                return
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(self._initial_load_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            logging.warning("[CacheLoader] Initial load timeout - proceeding anyway")
+
+    async def wait_for_categories(self, *categories: str, timeout: float = INITIAL_LOAD_TIMEOUT) -> bool:
+        """
+        Wait only for the given categories to settle.
+        
+        Args:
+            *categories: Category names to wait for
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if every category is loaded or served lazily, False on timeout or failure
+        """
+        events = [self._category_events[c] for c in categories if c in self._category_events]
+        try:
+            await asyncio.wait_for(asyncio.gather(*(event.wait() for event in events)), timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"[CacheLoader] Timeout waiting for categories: {', '.join(categories)}")
+            return False
+        return all(
+            c in self._loaded_categories or self._category_timings.get(c, {}).get('status') == 'lazy'
+            for c in categories
+        )
+
+    def get_load_timings(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-category startup load timings.
         
-        logging.warning("[CacheLoader] Initial load timeout - proceeding anyway")
+        Returns:
+            Dictionary mapping category to status, attempts and duration_ms
+        """
+        return dict(self._category_timings)
     
     def is_loaded(self) -> bool:
         """
@@ -785,45 +1127,26 @@ class CacheLoader:
         """
         if self._initial_load_complete and category in self._loaded_categories:
             return
-        if category == 'guild_settings':
-            await self.ensure_guild_settings_loaded()
-        elif category == 'guild_roles':
-            await self.ensure_guild_roles_loaded()
-        elif category == 'guild_channels':
-            await self.ensure_guild_channels_loaded()
-        elif category == 'welcome_messages':
-            await self.ensure_welcome_messages_loaded()
-        elif category == 'absence_messages':
-            await self.ensure_absence_messages_loaded()
-        elif category == 'guild_members':
-            await self.ensure_guild_members_loaded()
-        elif category == 'events_data':
-            await self.ensure_events_data_loaded()
-        elif category == 'static_data':
-            await self.ensure_static_data_loaded()
-        elif category == 'static_groups':
-            await self.ensure_static_groups_loaded()
-        elif category == 'user_setup':
-            await self.ensure_user_setup_loaded()
-        elif category == 'weapons':
-            await self.ensure_weapons_loaded()
-        elif category == 'weapons_combinations':
-            await self.ensure_weapons_combinations_loaded()
-        elif category == 'guild_ideal_staff':
-            await self.ensure_guild_ideal_staff_loaded()
-        elif category == 'games_list':
-            await self.ensure_games_list_loaded()
-        elif category == 'epic_items_t2':
-            await self.ensure_epic_items_t2_loaded()
-        elif category == 'events_calendar':
-            await self.ensure_events_calendar_loaded()
-        elif category == 'guild_ptb_settings':
-            await self.ensure_guild_ptb_settings_loaded()
-        elif category == 'user_data':
-            await self.ensure_user_setup_loaded()
+        loader = self._get_category_loader(category)
+        if loader:
+            await loader()
         else:
             logging.warning(f"[CacheLoader] Unknown category: {category}")
     
+    def _get_category_loader(self, category: str):
+        """
+        Get the loader coroutine function for a category.
+        
+        Args:
+            category: Name of the data category
+            
+        Returns:
+            Bound ensure_*_loaded method or None if the category is unknown
+        """
+        if category == 'user_data':
+            category = 'user_setup'
+        return getattr(self, f"ensure_{category}_loaded", None)
+    
     def is_category_loaded(self, category: str) -> bool:
         """
         Check if a category has been loaded.
@@ -836,13 +1159,22 @@ class CacheLoader:
         """
         return category in self._loaded_categories
     
-    async def reload_category(self, category: str) -> None:
+    async def reload_category(self, category: str, guild_id: Optional[int] = None) -> None:
         """
         Force reload a specific category.
         
         Args:
             category: Name of the data category to reload
+            guild_id: Reload only this guild's rows of a per-guild category
         """
+        if category == 'user_data':
+            category = 'user_setup'
+        if guild_id is not None and category in GUILD_CATEGORIES:
+            try:
+                await self._get_category_loader(category)(only_guild_id=guild_id)
+            except Exception as e:
+                logging.error(f"[CacheLoader] Error reloading {category} for guild {guild_id}: {e}")
+            return
         if category in self._loaded_categories:
             self._loaded_categories.remove(category)
         await self.ensure_category_loaded(category)
@@ -856,14 +1188,17 @@ class CacheLoader:
         """
         return self._loaded_categories.copy()
 
-    async def ensure_guild_ptb_settings_loaded(self) -> None:
+    async def ensure_guild_ptb_settings_loaded(self, only_guild_id: Optional[int] = None) -> None:
         """
         Ensure guild PTB settings are loaded.
         
         Loads Peace/War (PTB) guild configurations including
         group assignments and channel mappings.
+        
+        Args:
+            only_guild_id: Restrict the load to one guild (lazy hydration)
         """
-        if 'guild_ptb_settings' in self._loaded_categories:
+        if only_guild_id is None and 'guild_ptb_settings' in self._loaded_categories:
             return
         
         query = """
@@ -876,9 +1211,10 @@ class CacheLoader:
                g11_role_id, g11_channel_id, g12_role_id, g12_channel_id
         FROM guild_ptb_settings
         """
+        query, params = self._scope_query(query, only_guild_id)
         try:
-            rows = await self.bot.run_db_query(query, fetch_all=True)
-            for row in rows:
+            rows = await self.bot.run_db_query(query, params, fetch_all=True)
+            for row in rows or []:
                 guild_id = int(row[0])
                 ptb_settings = {
                     "ptb_guild_id": int(row[1]),
@@ -898,10 +1234,321 @@ class CacheLoader:
 
                 await self.bot.cache.set_guild_data(guild_id, 'ptb_settings', ptb_settings)
             
-            self._loaded_categories.add('guild_ptb_settings')
+            if only_guild_id is None:
+                self._loaded_categories.add('guild_ptb_settings')
             logging.debug(f"[CacheLoader] PTB settings loaded for {len(rows) if rows else 0} guilds")
         except Exception as e:
             logging.error(f"[CacheLoader] Error loading guild PTB settings: {e}", exc_info=True)
+            if only_guild_id is not None:
+                raise
+
+# #################################################################################### #
+#                            Lazy Guild Hydration
+# #################################################################################### #
+    async def ensure_guild_hydrated(self, guild_id: int) -> bool:
+        """
+        Load every per-guild category for one guild on first use.
+        
+        Concurrent callers for the same guild share a single in-flight
+        load, and each call refreshes the guild's last access time used
+        by idle eviction.
+        
+        Args:
+            guild_id: Discord guild ID
+            
+        Returns:
+            True if the guild data is cached, False if hydration failed
+        """
+        self._guild_last_access[guild_id] = time.time()
+        if guild_id in self._hydrated_guilds:
+            return True
+
+        task = self._hydration_tasks.get(guild_id)
+        if task is None:
+            task = asyncio.create_task(self._hydrate_guild(guild_id))
+            self._hydration_tasks[guild_id] = task
+        return await asyncio.shield(task)
+
+    async def _hydrate_guild(self, guild_id: int) -> bool:
+        """
+        Run the per-guild loaders of every category not already fully loaded.
+        
+        Args:
+            guild_id: Discord guild ID
+            
+        Returns:
+            True if every category loaded, False otherwise
+        """
+        start_time = time.time()
+        categories = [c for c in GUILD_CATEGORIES if c not in self._loaded_categories]
+        try:
+            results = await asyncio.gather(
+                *(self._get_category_loader(category)(only_guild_id=guild_id) for category in categories),
+                return_exceptions=True
+            )
+            failed = [category for category, result in zip(categories, results) if isinstance(result, Exception)]
+            elapsed_ms = int((time.time() - start_time) * 1000)
+            if failed:
+                self._hydration_stats['failures'] += 1
+                logging.error(f"[CacheLoader] Hydration of guild {guild_id} failed for: {', '.join(failed)}")
+                return False
+
+            self._hydrated_guilds.add(guild_id)
+            self._hydration_stats['hydrations'] += 1
+            self._hydration_stats['last_duration_ms'] = elapsed_ms
+            logging.debug(f"[CacheLoader] Guild {guild_id} hydrated in {elapsed_ms}ms ({len(categories)} categories)")
+            return True
+        finally:
+            self._hydration_tasks.pop(guild_id, None)
+
+    def forget_hydrated_guilds(self) -> None:
+        """
+        Mark every guild as needing hydration again.
+        
+        Called when a guild-scoped cache category is invalidated wholesale.
+        """
+        self._hydrated_guilds.clear()
+        for category in GUILD_CATEGORIES:
+            self._loaded_categories.discard(category)
+
+    async def evict_idle_guilds(self, idle_ttl: int = GUILD_IDLE_TTL) -> int:
+        """
+        Drop cached data of guilds not accessed for idle_ttl seconds.
+        
+        Evicted guilds are hydrated again on their next access.
+        
+        Args:
+            idle_ttl: Idle period in seconds before a guild is evicted
+            
+        Returns:
+            Number of guilds evicted
+        """
+        cutoff = time.time() - idle_ttl
+        idle_guilds = [
+            guild_id for guild_id in self._hydrated_guilds
+            if self._guild_last_access.get(guild_id, 0) < cutoff and guild_id not in self._hydration_tasks
+        ]
+        if not idle_guilds:
+            return 0
+
+        for category in GUILD_CATEGORIES:
+            self._loaded_categories.discard(category)
+
+        guild_members_cache = await self.bot.cache.get('roster_data', 'guild_members')
+        ideal_staff = await self.bot.cache.get('guild_data', 'ideal_staff')
+        for guild_id in idle_guilds:
+            self._hydrated_guilds.discard(guild_id)
+            self._guild_last_access.pop(guild_id, None)
+            await self.bot.cache.evict_guild(guild_id)
+            get_leaderboards().invalidate(guild_id)
+            if guild_members_cache:
+                for key in [key for key in guild_members_cache if key[0] == guild_id]:
+                    del guild_members_cache[key]
+            if ideal_staff:
+                ideal_staff.pop(guild_id, None)
+
+        if guild_members_cache is not None:
+            await self.bot.cache.set('roster_data', guild_members_cache, 'guild_members')
+        if ideal_staff is not None:
+            await self.bot.cache.set('guild_data', ideal_staff, 'ideal_staff')
+
+        self._hydration_stats['evictions'] += len(idle_guilds)
+        logging.info(f"[CacheLoader] Evicted {len(idle_guilds)} idle guilds from cache ({len(self._hydrated_guilds)} still hydrated)")
+        return len(idle_guilds)
+
+    def get_hydration_stats(self) -> Dict[str, Any]:
+        """
+        Get lazy hydration statistics.
+        
+        Returns:
+            Dictionary with hydration, failure and eviction counters
+        """
+        return {**self._hydration_stats, 'hydrated_guilds': len(self._hydrated_guilds), 'in_flight': len(self._hydration_tasks)}
+
+# #################################################################################### #
+#                            Delta Synchronization
+# #################################################################################### #
+    async def _snapshot_delta_watermarks(self) -> None:
+        """
+        Record the DB clock and changelog position before a full load.
+
+        Rows modified during the load are replayed by the next delta sync,
+        which is harmless since patches are idempotent.
+        """
+        try:
+            now_row = await self.bot.run_db_query("SELECT NOW()", fetch_one=True)
+            changelog_row = await self.bot.run_db_query("SELECT COALESCE(MAX(id), 0) FROM cache_changelog", fetch_one=True)
+            for table in DELTA_SYNC_QUERIES:
+                self._delta_watermarks[table] = now_row[0]
+            self._changelog_watermark = int(changelog_row[0])
+            logging.debug(f"[CacheLoader] Delta watermarks initialized at {now_row[0]} (changelog id {self._changelog_watermark})")
+        except Exception as e:
+            self._delta_watermarks.clear()
+            logging.warning(f"[CacheLoader] Delta sync unavailable, falling back to full reloads: {e}")
+
+    async def sync_deltas(self) -> Dict[str, int]:
+        """
+        Patch rows changed since the last watermark into the cache.
+
+        Upserts come from the per-table updated_at columns, deletions from
+        the cache_changelog tombstones written by AFTER DELETE triggers.
+
+        Returns:
+            Dictionary with the number of patched and deleted rows
+        """
+        result = {'patched': 0, 'deleted': 0}
+        if not self._initial_load_complete or not self._delta_watermarks:
+            return result
+
+        async with self._delta_lock:
+            now_row = await self.bot.run_db_query("SELECT NOW()", fetch_one=True)
+            next_watermark = now_row[0]
+
+            for table, query in DELTA_SYNC_QUERIES.items():
+                fully_loaded = DELTA_SYNC_CATEGORIES.get(table, table) in self._loaded_categories
+                if not fully_loaded and not self._hydrated_guilds:
+                    continue
+                try:
+                    rows = await self.bot.run_db_query(query, (self._delta_watermarks[table],), fetch_all=True)
+                    if rows and not fully_loaded:
+                        rows = [row for row in rows if row[0] in self._hydrated_guilds]
+                    if rows:
+                        await self._apply_delta_rows(table, rows)
+                        result['patched'] += len(rows)
+                    self._delta_watermarks[table] = next_watermark
+                except Exception as e:
+                    logging.error(f"[CacheLoader] Delta sync failed for {table}: {e}", exc_info=True)
+
+            try:
+                tombstones = await self.bot.run_db_query(
+                    "SELECT id, table_name, guild_id, row_id FROM cache_changelog WHERE id > %s ORDER BY id",
+                    (self._changelog_watermark,), fetch_all=True
+                )
+                if tombstones:
+                    await self._apply_tombstones(tombstones)
+                    self._changelog_watermark = int(tombstones[-1][0])
+                    result['deleted'] += len(tombstones)
+                await self.bot.run_db_query(
+                    "DELETE FROM cache_changelog WHERE changed_at < NOW() - INTERVAL %s HOUR",
+                    (CHANGELOG_RETENTION_HOURS,), commit=True
+                )
+            except Exception as e:
+                logging.error(f"[CacheLoader] Error applying cache changelog: {e}", exc_info=True)
+
+            self._delta_stats['runs'] += 1
+            self._delta_stats['rows_patched'] += result['patched']
+            self._delta_stats['rows_deleted'] += result['deleted']
+            self._delta_stats['last_run'] = next_watermark
+
+        if result['patched'] or result['deleted']:
+            logging.debug(f"[CacheLoader] Delta sync: {result['patched']} rows patched, {result['deleted']} rows deleted")
+        return result
+
+    async def _apply_delta_rows(self, table: str, rows: list) -> None:
+        """
+        Patch changed rows into the cache using the full-load record builders.
+
+        Args:
+            table: Source table name
+            rows: Rows returned by the table's delta query
+        """
+        if table == 'events_data':
+            registrations = {}
+            for guild_id in {row[0] for row in rows}:
+                event_ids = [row[1] for row in rows if row[0] == guild_id]
+                registrations.update(await self.fetch_event_registrations(guild_id, event_ids))
+            for row in rows:
+                guild_id, event_id, event_data = self._build_event_record(row, registrations.get((row[0], row[1])))
+                await self.bot.cache.set_guild_data(guild_id, f'event_{event_id}', event_data)
+
+        elif table == 'event_registrations':
+            await self._refresh_event_registrations(rows)
+
+        elif table == 'guild_members':
+            guild_members_cache = await self.bot.cache.get('roster_data', 'guild_members') or {}
+            leaderboards = get_leaderboards()
+            touched_guilds = set()
+            for row in rows:
+                key, member_data = self._build_member_record(row)
+                guild_members_cache[key] = member_data
+                leaderboards.update(*key, member_data)
+                touched_guilds.add(key[0])
+            await self.bot.cache.set('roster_data', guild_members_cache, 'guild_members')
+            for guild_id in touched_guilds:
+                await self.bot.cache.delete('roster_data', f'bulk_guild_members_{guild_id}')
+
+        elif table == 'user_setup':
+            for guild_id, user_id, locale, gs, weapons in rows:
+                setup_data = {
+                    'locale': locale,
+                    'gs': gs,
+                    'weapons': weapons
+                }
+                await self.bot.cache.set_user_data(guild_id, user_id, 'setup', setup_data)
+
+    async def _apply_tombstones(self, tombstones: list) -> None:
+        """
+        Remove deleted rows from the cache.
+
+        Args:
+            tombstones: Rows of (id, table_name, guild_id, row_id) from cache_changelog
+        """
+        removed_members = []
+        unregistered = set()
+        for _, table, guild_id, row_id in tombstones:
+            if table == 'events_data':
+                await self.bot.cache.delete_guild_data(guild_id, f'event_{row_id}')
+            elif table == 'event_registrations':
+                unregistered.add((guild_id, row_id))
+            elif table == 'user_setup':
+                await self.bot.cache.delete('user_data', guild_id, row_id, 'setup')
+            elif table == 'guild_members':
+                removed_members.append((guild_id, row_id))
+
+        if removed_members:
+            guild_members_cache = await self.bot.cache.get('roster_data', 'guild_members') or {}
+            leaderboards = get_leaderboards()
+            for key in removed_members:
+                guild_members_cache.pop(key, None)
+                leaderboards.remove(*key)
+            await self.bot.cache.set('roster_data', guild_members_cache, 'guild_members')
+            for guild_id in {key[0] for key in removed_members}:
+                await self.bot.cache.delete('roster_data', f'bulk_guild_members_{guild_id}')
+
+        if unregistered:
+            await self._refresh_event_registrations(unregistered)
+
+    async def _refresh_event_registrations(self, event_keys) -> None:
+        """
+        Re-read the registrations of cached events from event_registrations.
+
+        Events that are not cached are skipped; they pick up their
+        registrations when they are next loaded.
+
+        Args:
+            event_keys: Iterable of (guild_id, event_id)
+        """
+        by_guild: Dict[int, set] = {}
+        for guild_id, event_id in event_keys:
+            by_guild.setdefault(guild_id, set()).add(event_id)
+
+        for guild_id, event_ids in by_guild.items():
+            registrations = await self.fetch_event_registrations(guild_id, sorted(event_ids))
+            for event_id in event_ids:
+                event_registrations = registrations.get((guild_id, event_id)) or {k: [] for k in REGISTRATION_STATUSES}
+                await self.bot.cache.update_guild_data(
+                    guild_id, f'event_{event_id}',
+                    lambda record, regs=event_registrations: {**record, 'registrations': regs} if record else None
+                )
+
+    def get_delta_stats(self) -> Dict[str, Any]:
+        """
+        Get delta synchronization statistics.
+
+        Returns:
+            Dictionary with run count, patched/deleted rows and last watermark
+        """
+        return {**self._delta_stats, 'enabled': bool(self._delta_watermarks)}
 
 # #################################################################################### #
 #                            Global Cache Loader Instance
@@ -922,3 +1569,62 @@ def get_cache_loader(bot=None):
     if _cache_loader is None and bot:
         _cache_loader = CacheLoader(bot)
     return _cache_loader
+
+async def start_delta_sync_task(bot, interval: int = 60):
+    """
+    Start background task polling the database for changed rows.
+    
+    Args:
+        bot: Discord bot instance
+        interval: Polling interval in seconds
+    """
+    loader = get_cache_loader(bot)
+    
+    async def delta_sync_loop():
+        try:
+            while True:
+                try:
+                    await asyncio.sleep(interval)
+                    await loader.sync_deltas()
+                except Exception as e:
+                    logging.error(f"[CacheLoader] Delta sync task error: {e}")
+        except asyncio.CancelledError:
+            logging.debug("[CacheLoader] Delta sync task cancelled")
+            raise
+    
+    task = asyncio.create_task(delta_sync_loop())
+
+    if hasattr(bot, '_background_tasks'):
+        bot._background_tasks.append(task)
+    
+    logging.info(f"[CacheLoader] Delta sync task started (interval {interval}s)")
+
+async def start_guild_eviction_task(bot, idle_ttl: int = GUILD_IDLE_TTL):
+    """
+    Start background task evicting guilds idle for longer than idle_ttl.
+    
+    Args:
+        bot: Discord bot instance
+        idle_ttl: Idle period in seconds before a guild's data is dropped
+    """
+    loader = get_cache_loader(bot)
+    interval = max(60, min(idle_ttl // 4, 900))
+    
+    async def eviction_loop():
+        try:
+            while True:
+                try:
+                    await asyncio.sleep(interval)
+                    await loader.evict_idle_guilds(idle_ttl)
+                except Exception as e:
+                    logging.error(f"[CacheLoader] Guild eviction task error: {e}")
+        except asyncio.CancelledError:
+            logging.debug("[CacheLoader] Guild eviction task cancelled")
+            raise
+    
+    task = asyncio.create_task(eviction_loop())
+
+    if hasattr(bot, '_background_tasks'):
+        bot._background_tasks.append(task)
+    
+    logging.info(f"[CacheLoader] Guild eviction task started (idle TTL {idle_ttl}s, check every {interval}s)")
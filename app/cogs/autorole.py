@@ -211,7 +211,6 @@ class AutoRole(commands.Cog):
                 logging.debug(f"[AutoRole] No welcome message in cache for member {member.id} in guild {guild.id}.")
 
             try:
-                await self.bot.cache_loader.ensure_category_loaded('user_data')
                 user_setup = await self.bot.cache.get_user_data(guild.id, member.id, 'setup')
                 
                 if user_setup is not None:
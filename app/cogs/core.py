@@ -481,6 +481,7 @@ class Core(commands.Cog):
                 ("DELETE FROM welcome_messages WHERE guild_id = %s", (guild_id,)),
                 ("DELETE FROM absence_messages WHERE guild_id = %s", (guild_id,)), 
                 ("DELETE FROM contracts WHERE guild_id = %s", (guild_id,)),
+                ("DELETE FROM events_archive WHERE guild_id = %s", (guild_id,)),
                 ("DELETE FROM events_data WHERE guild_id = %s", (guild_id,)),
                 ("DELETE FROM user_setup WHERE guild_id = %s", (guild_id,)),
                 ("DELETE FROM guild_members WHERE guild_id = %s", (guild_id,)),
@@ -12,6 +12,15 @@ import discord
 import pytz
 from discord.ext import commands
 
+from cache import freeze, thaw
+from config import ATTENDANCE_MIN_PRESENCE_PERCENT
+from db import run_db_transaction
+from core.attendance_analytics import NUMPY_AVAILABLE, get_attendance_analytics
+from core.dkp_ledger import get_dkp_ledger
+from core.keyed_locks import get_event_locks
+from core.leaderboard import ATTENDANCE as ATTENDANCE_RATE, DKP, GS, get_leaderboards
+from core.settlement import ATTENDANCE, REGISTRATIONS, Settlement, get_settlement_engine
+from core.voice_ledger import get_voice_ledger
 from core.translation import translations as global_translations
 
 GUILD_ATTENDANCE = global_translations.get("guild_attendance", {})
@@ -28,13 +37,110 @@ class GuildAttendance(commands.Cog):
         """
         self.bot = bot
         self._processed_events = set()
-
+        self.event_locks = get_event_locks()
+        self.voice_ledger = get_voice_ledger()
+        self.settlement_engine = get_settlement_engine()
+        self.dkp_ledger = get_dkp_ledger()
+        self.leaderboards = get_leaderboards()
+        self.analytics = get_attendance_analytics()
+        self._ledger_warmed = False
+
+        self._register_events_commands()
+        self._register_dkp_commands()
+
+    def _register_events_commands(self):
+        """Register attendance commands with the centralized events group."""
+        if hasattr(self.bot, 'events_group'):
+
+            self.bot.events_group.command(
+                name=GUILD_ATTENDANCE.get("attendance_threshold", {}).get("name", {}).get("en-US", "attendance_threshold"),
+                description=GUILD_ATTENDANCE.get("attendance_threshold", {}).get("description", {}).get("en-US", "Set the minimum voice presence required for attendance"),
+                name_localizations=GUILD_ATTENDANCE.get("attendance_threshold", {}).get("name", {}),
+                description_localizations=GUILD_ATTENDANCE.get("attendance_threshold", {}).get("description", {})
+            )(self.attendance_threshold)
+
+            self.bot.events_group.command(
+                name=GUILD_ATTENDANCE.get("attendance_stats", {}).get("name", {}).get("en-US", "attendance_stats"),
+                description=GUILD_ATTENDANCE.get("attendance_stats", {}).get("description", {}).get("en-US", "Show attendance trends of the roster or a member"),
+                name_localizations=GUILD_ATTENDANCE.get("attendance_stats", {}).get("name", {}),
+                description_localizations=GUILD_ATTENDANCE.get("attendance_stats", {}).get("description", {})
+            )(self.attendance_stats)
+
+            self.bot.events_group.command(
+                name=GUILD_ATTENDANCE.get("dkp_audit", {}).get("name", {}).get("en-US", "dkp_audit"),
+                description=GUILD_ATTENDANCE.get("dkp_audit", {}).get("description", {}).get("en-US", "Show the DKP ledger entries of an event"),
+                name_localizations=GUILD_ATTENDANCE.get("dkp_audit", {}).get("name", {}),
+                description_localizations=GUILD_ATTENDANCE.get("dkp_audit", {}).get("description", {})
+            )(self.dkp_audit)
+
+            self.bot.events_group.command(
+                name=GUILD_ATTENDANCE.get("dkp_rebuild", {}).get("name", {}).get("en-US", "dkp_rebuild"),
+                description=GUILD_ATTENDANCE.get("dkp_rebuild", {}).get("description", {}).get("en-US", "Recompute DKP and counters from the ledger"),
+                name_localizations=GUILD_ATTENDANCE.get("dkp_rebuild", {}).get("name", {}),
+                description_localizations=GUILD_ATTENDANCE.get("dkp_rebuild", {}).get("description", {})
+            )(self.dkp_rebuild)
+
+    def _register_dkp_commands(self):
+        """Register ranking commands with the centralized dkp group."""
+        if hasattr(self.bot, 'dkp_group'):
+
+            self.bot.dkp_group.command(
+                name=GUILD_ATTENDANCE.get("dkp_leaderboard", {}).get("name", {}).get("en-US", "leaderboard"),
+                description=GUILD_ATTENDANCE.get("dkp_leaderboard", {}).get("description", {}).get("en-US", "Show the top members by DKP, attendance rate or gear score"),
+                name_localizations=GUILD_ATTENDANCE.get("dkp_leaderboard", {}).get("name", {}),
+                description_localizations=GUILD_ATTENDANCE.get("dkp_leaderboard", {}).get("description", {})
+            )(self.dkp_leaderboard)
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Initialize attendance data on bot ready."""
-        asyncio.create_task(self.bot.cache_loader.wait_for_initial_load())
-        logging.debug("[Guild_Attendance] Waiting for initial cache load")
+        """Initialize attendance data and the voice ledger on bot ready."""
+        asyncio.create_task(self.bot.cache_loader.wait_for_categories('guild_settings', 'guild_roles', 'guild_members', 'events_data'))
+        logging.debug("[Guild_Attendance] Waiting for attendance-related cache categories")
+        asyncio.create_task(self._init_voice_ledger())
+
+    async def _init_voice_ledger(self) -> None:
+        """
+        Reload recent voice intervals once, then align open intervals with current voice channels.
+
+        The channel scan only happens here, on startup and reconnects, to
+        recover joins and leaves missed while the gateway was down.
+        """
+        try:
+            if not self._ledger_warmed:
+                await self.voice_ledger.warm(self.bot.run_db_query)
+                self._ledger_warmed = True
+            for guild in self.bot.guilds:
+                self.voice_ledger.seed(guild.id, (
+                    member.id
+                    for channel in guild.voice_channels if channel != guild.afk_channel
+                    for member in channel.members if not member.bot
+                ))
+            logging.debug(f"[GuildAttendance] Voice ledger seeded for {len(self.bot.guilds)} guilds")
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error initializing voice ledger: {e}", exc_info=True)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        """
+        Record voice joins and leaves in the presence ledger.
+
+        Moving between counted channels keeps the interval open; the AFK
+        channel counts as disconnected.
+
+        Args:
+            member: Member whose voice state changed
+            before: Previous voice state
+            after: New voice state
+        """
+        if member.bot:
+            return
+        afk_channel = member.guild.afk_channel
+        was_connected = before.channel is not None and before.channel != afk_channel
+        is_connected = after.channel is not None and after.channel != afk_channel
+        if is_connected and not was_connected:
+            self.voice_ledger.join(member.guild.id, member.id)
+        elif was_connected and not is_connected:
+            self.voice_ledger.leave(member.guild.id, member.id)
 
     async def get_event_from_cache(self, guild_id: int, event_id: int) -> Optional[Dict]:
         """
@@ -45,10 +151,10 @@ class GuildAttendance(commands.Cog):
             event_id: Event ID to retrieve
             
         Returns:
-            Event data dictionary or None if not found
+            Private mutable copy of the event data or None if not found
         """
         try:
-            event_data = await self.bot.cache.get_guild_data(guild_id, f'event_{event_id}')
+            event_data = thaw(await self.bot.cache.get_guild_data(guild_id, f'event_{event_id}'))
             if event_data:
                 event_data['guild_id'] = guild_id
                 if not event_data.get('registrations'):
@@ -81,27 +187,28 @@ class GuildAttendance(commands.Cog):
             event_data: Event data dictionary to store
         """
         try:
-            cache_data = event_data.copy()
-            cache_data.pop('guild_id', None)
+            cache_data = freeze({k: v for k, v in event_data.items() if k != 'guild_id'})
             await self.bot.cache.set_guild_data(guild_id, f'event_{event_id}', cache_data)
         except Exception as e:
             logging.error(f"[GuildAttendance] Error storing event {event_id} for guild {guild_id}: {e}", exc_info=True)
 
-    async def get_closed_events_for_guild(self, guild_id: int) -> List[Dict]:
+    async def get_closed_events_for_guild(self, guild_id: int, include_archive: bool = True) -> List[Dict]:
         """
-        Get all closed events for a specific guild from global cache.
+        Get all closed events for a specific guild.
         
         Args:
             guild_id: Discord guild ID
+            include_archive: Also return events moved to events_archive
             
         Returns:
             List of closed event dictionaries
         """
         try:
-            query = """
+            source = "events_history" if include_archive else "events_data"
+            query = f"""
                 SELECT event_id, name, event_date, event_time, duration, 
                        dkp_value, status, registrations, actual_presence
-                FROM events_data WHERE guild_id = ? AND status = 'Closed'
+                FROM {source} WHERE guild_id = ? AND status = 'Closed'
             """
             rows = await self.bot.run_db_query(query, (guild_id,), fetch_all=True)
             events = []
@@ -146,13 +253,17 @@ class GuildAttendance(commands.Cog):
             
             roles_data = await self.bot.cache.get_guild_data(guild_id, 'roles')
             members_role = roles_data.get('members') if roles_data else None
+
+            settings_data = await self.bot.cache.get_guild_data(guild_id, 'settings') or {}
+            min_presence = settings_data.get('attendance_min_presence')
             
             return {
                 "guild_lang": guild_lang,
                 "premium": premium,
                 "events_channel": events_channel,
                 "notifications_channel": notifications_channel,
-                "members_role": members_role
+                "members_role": members_role,
+                "attendance_min_presence": ATTENDANCE_MIN_PRESENCE_PERCENT if min_presence is None else int(min_presence)
             }
         except Exception as e:
             logging.error(f"[GuildAttendance] Error getting guild settings for {guild_id}: {e}", exc_info=True)
@@ -169,7 +280,7 @@ class GuildAttendance(commands.Cog):
             Dictionary mapping member IDs to member data
         """       
         try:
-            guild_members_cache = await self.bot.cache.get('roster_data', 'guild_members') or {}
+            guild_members_cache = await self.bot.cache.get_guild_roster(guild_id)
             guild_specific_members = {}
             
             for (g_id, member_id), member_data in guild_members_cache.items():
@@ -190,22 +301,82 @@ class GuildAttendance(commands.Cog):
             guild_members: Dictionary of updated member data to store
         """
         try:
-            current_cache = await self.bot.cache.get('roster_data', 'guild_members') or {}
+            current_cache = await self.bot.cache.get_guild_roster(guild_id)
             
             for member_id, member_data in guild_members.items():
                 key = (guild_id, member_id)
                 current_cache[key] = member_data
+                self.leaderboards.update(guild_id, member_id, member_data)
             
             await self.bot.cache.set('roster_data', current_cache, 'guild_members')
             logging.debug(f"[GuildAttendance] Updated centralized cache for {len(guild_members)} members in guild {guild_id}")
         except Exception as e:
             logging.error(f"[GuildAttendance] Error updating centralized cache: {e}", exc_info=True)
 
+    async def _patch_roster_cache(self, settlement: Settlement) -> int:
+        """
+        Apply a committed settlement to the roster cache entries it touches.
+        
+        Args:
+            settlement: Settlement applied to the database
+            
+        Returns:
+            Number of roster entries updated (members without a roster entry are skipped)
+        """
+        guild_id = settlement.guild_id
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        members = {member_id: roster[(guild_id, member_id)] for member_id in settlement.deltas if (guild_id, member_id) in roster}
+        updated = settlement.apply_to(members)
+        if updated:
+            await self._update_centralized_cache(guild_id, updated)
+        skipped = len(settlement.deltas) - len(updated)
+        if skipped:
+            logging.debug(f"[GuildAttendance] {skipped} members of event {settlement.event_id} have no roster entry, skipped")
+        return len(updated)
+
+    async def _restrict_to_roster(self, settlement: Settlement) -> bool:
+        """
+        Drop settlement deltas of members without a roster entry.
+        
+        Args:
+            settlement: Settlement about to be applied
+            
+        Returns:
+            True if the settlement can be applied, False if the guild's roster is not loaded
+        """
+        guild_id = settlement.guild_id
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        roster_ids = {member_id for (g, member_id) in roster if g == guild_id}
+        if not roster_ids:
+            logging.warning(f"[GuildAttendance] Roster of guild {guild_id} not loaded, {settlement.phase} of event {settlement.event_id} not settled")
+            return False
+        dropped = settlement.restrict_to(roster_ids)
+        if dropped:
+            logging.debug(f"[GuildAttendance] {dropped} members of event {settlement.event_id} have no roster entry, not settled")
+        return True
 
     async def process_event_registrations(self, guild_id: int, event_id: int, event_data: Dict) -> None:
         """
         Process event registrations and calculate attendance/DKP.
         
+        Runs under the event lock and uses the cached registrations, so pending
+        reaction flushes for the event land before DKP is computed.
+        
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event ID to process
+            event_data: Event data containing registration information
+        """
+        async with self.event_locks.lock((guild_id, event_id)):
+            cached_event = await self.get_event_data(guild_id, event_id)
+            if cached_event.get("registrations"):
+                event_data = {**event_data, "registrations": cached_event["registrations"]}
+            await self._process_event_registrations(guild_id, event_id, event_data)
+
+    async def _process_event_registrations(self, guild_id: int, event_id: int, event_data: Dict) -> None:
+        """
+        Apply registration DKP and counters for an event; the caller holds the event lock.
+        
         Args:
             guild_id: Discord guild ID
             event_id: Event ID to process
@@ -242,92 +413,38 @@ class GuildAttendance(commands.Cog):
 
         all_registered = presence_ids | tentative_ids | absence_ids
 
-        updates_to_batch = []
-        guild_members = await self.get_guild_members(guild_id)
-
-        for member_id, member_data in guild_members.items():
-            if await self._member_has_members_role(guild, member_id):
-                member_data["nb_events"] += 1
-            updates_to_batch.append((
-                member_data["DKP"],
-                member_data["nb_events"], 
-                member_data["registrations"],
-                member_data["attendances"],
-                guild_id,
-                member_id
-            ))
-
+        settlement = Settlement(guild_id, event_id, REGISTRATIONS)
+        for member_id in self._members_role_ids(guild, settings):
+            settlement.add(member_id, reason="members_role", nb_events=1)
         for member_id in all_registered:
-            if member_id not in guild_members:
-                initial_nb_events = 1 if await self._member_has_members_role(guild, member_id) else 0
-                guild_members[member_id] = {
-                    "class": "Unknown",
-                    "GS": 0,
-                    "weapons": "",
-                    "DKP": 0,
-                    "nb_events": initial_nb_events,
-                    "registrations": 0,
-                    "attendances": 0
-                }
-            
-            member_data = guild_members[member_id]
-
-            member_data["registrations"] += 1
-
-            if dkp_registration > 0:
-                member_data["DKP"] += dkp_registration
-                logging.debug(f"[GuildAttendance] Member {member_id} earned {dkp_registration} DKP for registration")
-
-            found = False
-            for i, update_data in enumerate(updates_to_batch):
-                if update_data[4] == guild_id and update_data[5] == member_id:
-                    updates_to_batch[i] = (
-                        member_data["DKP"],
-                        member_data["nb_events"], 
-                        member_data["registrations"],
-                        member_data["attendances"],
-                        guild_id,
-                        member_id
-                    )
-                    found = True
-                    break
-            
-            if not found:
-                updates_to_batch.append((
-                    member_data["DKP"],
-                    member_data["nb_events"], 
-                    member_data["registrations"],
-                    member_data["attendances"],
-                    guild_id,
-                    member_id
-                ))
+            settlement.add(member_id, reason="registration", registrations=1, DKP=dkp_registration)
+        if not await self._restrict_to_roster(settlement):
+            return
 
-        if updates_to_batch:
-            try:
-                update_query = """
-                UPDATE guild_members 
-                SET DKP = %s, nb_events = %s, registrations = %s, attendances = %s 
-                WHERE guild_id = %s AND member_id = %s
-                """
-                for update_data in updates_to_batch:
-                    await self.bot.run_db_query(update_query, update_data, commit=True)
-                
-                logging.info(f"[GuildAttendance] Updated registration stats for {len(updates_to_batch)} members in event {event_id}")
+        try:
+            settled = await self.settlement_engine.settle(settlement, self.bot.run_db_query, run_db_transaction)
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error updating registration stats: {e}", exc_info=True)
+            return
+        if not settled:
+            return
 
-                await self._update_centralized_cache(guild_id, guild_members)
+        updated = await self._patch_roster_cache(settlement)
+        logging.info(f"[GuildAttendance] Updated registration stats for {updated} members in event {event_id}")
 
-                await self._send_registration_notification(guild_id, event_id, len(all_registered), len(presence_ids), len(tentative_ids), len(absence_ids), dkp_registration)
-                
-            except Exception as e:
-                logging.error(f"[GuildAttendance] Error updating registration stats: {e}", exc_info=True)
+        await self._send_registration_notification(guild_id, event_id, len(all_registered), len(presence_ids), len(tentative_ids), len(absence_ids), dkp_registration)
 
-    async def check_voice_presence(self):
+    async def check_voice_presence(self, due: Optional[Dict[int, Set[int]]] = None):
         """
         Check voice presence for all guilds and process attendance.
         
-        This method is called periodically by the scheduler to monitor voice channels
-        and update event attendance based on member presence. It processes all guilds
-        concurrently to improve performance.
+        This method is called by the scheduler when an event's attendance
+        transition is due to update event attendance from the time members
+        spent in voice during the event, as recorded by the voice ledger. It
+        processes guilds concurrently to improve performance.
+        
+        Args:
+            due: Restrict the check to these {guild_id: {event_id}}, or None for every guild
         """
         try:
             tz = pytz.timezone("Europe/Paris")
@@ -337,9 +454,14 @@ class GuildAttendance(commands.Cog):
             logging.debug("[GuildAttendance] Starting guild processing")
 
             guild_tasks = []
-            for guild in self.bot.guilds:
-                guild_id = guild.id
-                guild_tasks.append(self._process_guild_attendance(guild, now))
+            if due is None:
+                for guild in self.bot.guilds:
+                    guild_tasks.append(self._process_guild_attendance(guild, now))
+            else:
+                for guild_id, event_ids in due.items():
+                    guild = self.bot.get_guild(guild_id)
+                    if guild:
+                        guild_tasks.append(self._process_guild_attendance(guild, now, event_ids))
             
             if guild_tasks:
                 await asyncio.gather(*guild_tasks, return_exceptions=True)
@@ -362,13 +484,14 @@ class GuildAttendance(commands.Cog):
         event_data = await self.bot.cache.get_guild_data(guild_id, f'event_{event_id}')
         return event_data or {}
 
-    async def _get_current_events_for_guild(self, guild_id: int, now: datetime) -> List[Dict]:
+    async def _get_current_events_for_guild(self, guild_id: int, now: datetime, event_ids: Optional[Set[int]] = None) -> List[Dict]:
         """
         Get current events for a guild.
         
         Args:
             guild_id: Discord guild ID
             now: Current datetime for filtering events
+            event_ids: Only consider these events (optional)
             
         Returns:
             List of event dictionaries currently active for the guild
@@ -382,12 +505,15 @@ class GuildAttendance(commands.Cog):
         SELECT guild_id, event_id, name, event_date, event_time, duration, 
                dkp_value, dkp_ins, status, registrations, actual_presence
         FROM events_data 
-        WHERE guild_id = %s AND status LIKE '%Closed%'
+        WHERE guild_id = %s AND status LIKE '%Closed%' AND event_date BETWEEN %s AND %s
         """
         try:
-            rows = await self.bot.run_db_query(query, (guild_id,), fetch_all=True)
+            today = now.astimezone(tz).date()
+            rows = await self.bot.run_db_query(query, (guild_id, today - timedelta(days=1), today), fetch_all=True)
             
             for row in rows:
+                if event_ids is not None and int(row[1]) not in event_ids:
+                    continue
                 try:
                     event_data = {
                         "guild_id": int(row[0]),
@@ -437,6 +563,8 @@ class GuildAttendance(commands.Cog):
                     logging.debug(f"[GuildAttendance] Event {event_data['event_id']}: condition {event_check_time} <= {now} <= {event_check_end} = {event_check_time <= now <= event_check_end}")
                     
                     if event_check_time <= now <= event_check_end:
+                        event_data["event_start"] = event_start
+                        event_data["event_end"] = event_end
                         current_events.append(event_data)
                         logging.debug(f"[GuildAttendance] Event {event_data['event_id']} matches time window, added to current events")
                         
@@ -466,8 +594,7 @@ class GuildAttendance(commands.Cog):
             if self._was_already_processed(event_data):
                 return
 
-            voice_members = await self._get_voice_connected_members(guild)
-            logging.debug(f"[GuildAttendance] Found {len(voice_members)} members in voice channels")
+            voice_members = await self._get_voice_attendees(guild, event_data, now)
 
             try:
                 dkp_presence = int(event_data.get("dkp_value", 0))
@@ -495,39 +622,52 @@ class GuildAttendance(commands.Cog):
             
             if attendance_changes:
                 logging.info(f"[GuildAttendance] Applying {len(attendance_changes)} attendance changes for event {event_id}")
-                await self._apply_attendance_changes(guild.id, event_id, attendance_changes)
-                await self._update_event_actual_presence(guild.id, event_id, list(voice_members))
-                await self._send_attendance_notification(guild.id, event_id, attendance_changes)
-
-                if not hasattr(self, '_processed_events'):
-                    self._processed_events = set()
-                self._processed_events.add(event_id)
-                logging.debug(f"[GuildAttendance] Marked event {event_id} as processed - will never be processed again")
+                settled = await self._apply_attendance_changes(guild.id, event_id, attendance_changes, list(voice_members))
+                if settled:
+                    await self._update_event_actual_presence(guild.id, event_id, list(voice_members))
+                    await self._send_attendance_notification(guild.id, event_id, attendance_changes)
+
+                if settled is not None:
+                    self._processed_events.add(event_id)
+                    logging.debug(f"[GuildAttendance] Marked event {event_id} as processed - will never be processed again")
             else:
+                settled = False
                 logging.debug(f"[GuildAttendance] No attendance changes to apply for event {event_id}")
+
+            if settled is not None and NUMPY_AVAILABLE:
+                self.analytics.record_event(
+                    guild.id, event_id, event_data.get("event_date"), registrations,
+                    set(event_data.get("actual_presence") or []) | voice_members
+                )
                 
         except Exception as e:
             logging.error(f"[GuildAttendance] Error processing voice attendance for event {event_id}: {e}", exc_info=True)
 
-    async def _get_voice_connected_members(self, guild: discord.Guild) -> Set[int]:
+    async def _get_voice_attendees(self, guild: discord.Guild, event_data: Dict, now: datetime) -> Set[int]:
         """
-        Get voice connected members for attendance tracking.
-        
+        Get members whose time in voice during the event reaches the guild threshold.
+
         Args:
-            guild: Discord guild to check voice channels
-            
+            guild: Discord guild where the event is taking place
+            event_data: Dictionary containing event information and its window
+            now: Current datetime for processing
+
         Returns:
-            Set of member IDs currently connected to voice channels
+            Set of member IDs counted as present
         """
-        voice_members = set()
-        
-        for channel in guild.voice_channels:
-            for member in channel.members:
-                if not member.bot:
-                    voice_members.add(member.id)
-        
-        logging.debug(f"[GuildAttendance] Found {len(voice_members)} members in voice channels")
-        return voice_members
+        settings = await self.get_guild_settings(guild.id)
+        min_percent = settings.get("attendance_min_presence", ATTENDANCE_MIN_PRESENCE_PERCENT)
+        event_start = event_data.get("event_start")
+        event_end = event_data.get("event_end")
+        if event_start is None or event_end is None:
+            event_end = now
+            event_start = now - timedelta(minutes=int(event_data.get("duration") or 60))
+
+        attendees = self.voice_ledger.attendees(
+            guild.id, event_start.timestamp(), event_end.timestamp(), min_percent, now=now.timestamp()
+        )
+        logging.debug(f"[GuildAttendance] Found {len(attendees)} members with at least {min_percent}% voice presence for event {event_data.get('event_id')}")
+        return set(attendees)
 
     def _was_already_processed(self, event_data: Dict) -> bool:
         """
@@ -552,35 +692,22 @@ class GuildAttendance(commands.Cog):
             
         return False
 
-    async def _member_has_members_role(self, guild: discord.Guild, member_id: int) -> bool:
+    def _members_role_ids(self, guild: discord.Guild, settings: Dict[str, Any]) -> Set[int]:
         """
-        Check if member has the members role.
+        Get the IDs of every member holding the members role.
         
         Args:
             guild: Discord guild to check in
-            member_id: Discord member ID to check
+            settings: Guild settings containing the members role ID
             
         Returns:
-            True if member has the members role, False otherwise
+            Set of member IDs with the members role (empty if the role is not configured)
         """
-        try:
-            settings = await self.get_guild_settings(guild.id)
-            members_role_id = settings.get("members_role")
-            if not members_role_id:
-                return False
-            
-            member = guild.get_member(member_id)
-            if not member:
-                return False
-            
-            members_role = guild.get_role(members_role_id)
-            if not members_role:
-                return False
-            
-            return members_role in member.roles
-        except Exception as e:
-            logging.error(f"[GuildAttendance] Error checking member role for {member_id}: {e}")
-            return False
+        members_role_id = settings.get("members_role")
+        members_role = guild.get_role(members_role_id) if members_role_id else None
+        if not members_role:
+            return set()
+        return {member.id for member in members_role.members}
 
     async def _calculate_attendance_changes(self, voice_members: Set[int], presence_ids: Set[int], 
                                    tentative_ids: Set[int], absence_ids: Set[int], 
@@ -623,6 +750,7 @@ class GuildAttendance(commands.Cog):
                 "member_id": member_id,
                 "dkp_change": 0,
                 "attendance_change": 0,
+                "code": "",
                 "reason": ""
             }
 
@@ -630,12 +758,14 @@ class GuildAttendance(commands.Cog):
                 if is_voice_present:
                     change["dkp_change"] = dkp_presence
                     change["attendance_change"] = 1
+                    change["code"] = "present_and_present"
                     change["reason"] = GUILD_ATTENDANCE["reasons"]["present_and_present"].get(
                         guild_lang, GUILD_ATTENDANCE["reasons"]["present_and_present"].get("en-US")
                     )
                 else:
                     change["dkp_change"] = -dkp_registration
                     change["attendance_change"] = 0
+                    change["code"] = "present_but_absent"
                     change["reason"] = GUILD_ATTENDANCE["reasons"]["present_but_absent"].get(
                         guild_lang, GUILD_ATTENDANCE["reasons"]["present_but_absent"].get("en-US")
                     )
@@ -644,10 +774,12 @@ class GuildAttendance(commands.Cog):
                 if is_voice_present:
                     change["dkp_change"] = dkp_presence
                     change["attendance_change"] = 1
+                    change["code"] = "tentative_and_present"
                     change["reason"] = GUILD_ATTENDANCE["reasons"]["tentative_and_present"].get(
                         guild_lang, GUILD_ATTENDANCE["reasons"]["tentative_and_present"].get("en-US")
                     )
                 else:
+                    change["code"] = "tentative_and_absent"
                     change["reason"] = GUILD_ATTENDANCE["reasons"]["tentative_and_absent"].get(
                         guild_lang, GUILD_ATTENDANCE["reasons"]["tentative_and_absent"].get("en-US")
                     )
@@ -656,10 +788,12 @@ class GuildAttendance(commands.Cog):
                 if is_voice_present:
                     change["dkp_change"] = dkp_presence
                     change["attendance_change"] = 1
+                    change["code"] = "absent_but_present"
                     change["reason"] = GUILD_ATTENDANCE["reasons"]["absent_but_present"].get(
                         guild_lang, GUILD_ATTENDANCE["reasons"]["absent_but_present"].get("en-US")
                     )
                 else:
+                    change["code"] = "absent_and_absent"
                     change["reason"] = GUILD_ATTENDANCE["reasons"]["absent_and_absent"].get(
                         guild_lang, GUILD_ATTENDANCE["reasons"]["absent_and_absent"].get("en-US")
                     )
@@ -673,69 +807,68 @@ class GuildAttendance(commands.Cog):
         logging.debug(f"[GuildAttendance] Total changes calculated: {len(changes)}")
         return changes
 
-    async def _apply_attendance_changes(self, guild_id: int, event_id: int, changes: List[Dict]) -> None:
+    async def _apply_attendance_changes(self, guild_id: int, event_id: int, changes: List[Dict],
+                                        actual_presence: Optional[List[int]] = None) -> Optional[bool]:
         """
         Apply attendance changes to database.
         
+        DKP and attendance deltas are written in one transaction together
+        with the event's actual presence, at most once per event.
+        
         Args:
             guild_id: Discord guild ID
             event_id: Event ID to update
             changes: List of attendance changes to apply
+            actual_presence: Member IDs counted present, stored on the event (optional)
+            
+        Returns:
+            True if applied, False if the event's attendance was already settled, None on error or while the roster is not loaded
         """
         if not changes:
-            return
-            
-        updates_to_batch = []
-        guild_members = await self.get_guild_members(guild_id)
-        
+            return False
+
+        settlement = Settlement(guild_id, event_id, ATTENDANCE)
         for change in changes:
-            member_id = change["member_id"]
-            dkp_change = change["dkp_change"]
-            attendance_change = change["attendance_change"]
-
-            if member_id in guild_members:
-                member_data = guild_members[member_id]
-                member_data["DKP"] += dkp_change
-                member_data["attendances"] += attendance_change
-                
-                updates_to_batch.append((
-                    member_data["DKP"],
-                    member_data["attendances"],
-                    guild_id,
-                    member_id
-                ))
+            settlement.add(change["member_id"], reason=change.get("code") or None, DKP=change["dkp_change"], attendances=change["attendance_change"])
+        if not await self._restrict_to_roster(settlement):
+            return None
 
-        if updates_to_batch:
-            try:
-                update_query = "UPDATE guild_members SET DKP = %s, attendances = %s WHERE guild_id = %s AND member_id = %s"
-                for update_data in updates_to_batch:
-                    await self.bot.run_db_query(update_query, update_data, commit=True)
-                
-                logging.info(f"[GuildAttendance] Applied attendance changes for {len(updates_to_batch)} members in event {event_id}")
+        extra_statements = []
+        if actual_presence is not None:
+            extra_statements.append((
+                "UPDATE events_data SET actual_presence = %s WHERE guild_id = %s AND event_id = %s",
+                (json.dumps(actual_presence), guild_id, event_id)
+            ))
 
-                await self._update_centralized_cache(guild_id, guild_members)
-                
-            except Exception as e:
-                logging.error(f"[GuildAttendance] Error applying attendance changes: {e}", exc_info=True)
+        try:
+            settled = await self.settlement_engine.settle(settlement, self.bot.run_db_query, run_db_transaction, extra_statements)
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error applying attendance changes: {e}", exc_info=True)
+            return None
+        if not settled:
+            return False
+
+        updated = await self._patch_roster_cache(settlement)
+        logging.info(f"[GuildAttendance] Applied attendance changes for {updated} members in event {event_id}")
+        return True
 
     async def _update_event_actual_presence(self, guild_id: int, event_id: int, voice_members: List[int]) -> None:
         """
-        Update event's actual presence count.
+        Update the cached event's actual presence after its settlement.
         
         Args:
             guild_id: Discord guild ID
             event_id: Event ID to update
-            voice_members: List of member IDs currently in voice channels
+            voice_members: List of member IDs counted present
         """
         try:
-            actual_presence_json = json.dumps(voice_members)
-            update_query = "UPDATE events_data SET actual_presence = %s WHERE guild_id = %s AND event_id = %s"
-            await self.bot.run_db_query(update_query, (actual_presence_json, guild_id, event_id), commit=True)
-
-            event_data = await self.bot.cache.get_guild_data(guild_id, f'event_{event_id}')
-            if event_data:
+            def set_actual_presence(event_data):
+                if event_data is None:
+                    return None
                 event_data["actual_presence"] = voice_members
-                await self.bot.cache.set_guild_data(guild_id, f'event_{event_id}', event_data)
+                return event_data
+
+            if await self.bot.cache.update_guild_data(guild_id, f'event_{event_id}', set_actual_presence):
                 logging.debug(f"[GuildAttendance] Updated actual_presence in cache for event {event_id}")
                 
         except Exception as e:
@@ -916,13 +1049,347 @@ class GuildAttendance(commands.Cog):
         except Exception as e:
             logging.error(f"[GuildAttendance] Error sending attendance notification: {e}", exc_info=True)
     
-    async def _process_guild_attendance(self, guild: discord.Guild, now: datetime):
+    async def attendance_threshold(
+        self,
+        ctx: discord.ApplicationContext,
+        percent: int = discord.Option(
+            int,
+            default=None,
+            description=GUILD_ATTENDANCE["attendance_threshold"]["options"]["percent"]["en-US"],
+            description_localizations=GUILD_ATTENDANCE["attendance_threshold"]["options"]["percent"],
+            min_value=0,
+            max_value=100
+        )
+    ):
+        """
+        Show or set the share of an event a member must spend in voice to be counted present.
+
+        Args:
+            ctx: Discord application context from the command
+            percent: New threshold in percent of the event duration (shows the current one when omitted)
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild_id = ctx.guild.id
+        settings = await self.get_guild_settings(guild_id)
+        guild_lang = settings.get("guild_lang", "en-US")
+        messages = GUILD_ATTENDANCE["attendance_threshold"]["messages"]
+
+        if percent is None:
+            current_msg = messages["current"].get(guild_lang, messages["current"].get("en-US"))
+            await ctx.followup.send(current_msg.format(percent=settings.get("attendance_min_presence")), ephemeral=True)
+            return
+
+        try:
+            await self.bot.run_db_query(
+                "UPDATE guild_settings SET attendance_min_presence = %s WHERE guild_id = %s",
+                (percent, guild_id),
+                commit=True
+            )
+
+            def set_threshold(settings_data):
+                if settings_data is None:
+                    return None
+                settings_data["attendance_min_presence"] = percent
+                return settings_data
+
+            await self.bot.cache.update_guild_data(guild_id, 'settings', set_threshold)
+            logging.info(f"[GuildAttendance] Attendance threshold set to {percent}% for guild {guild_id}")
+
+            success_msg = messages["success"].get(guild_lang, messages["success"].get("en-US"))
+            await ctx.followup.send(success_msg.format(percent=percent), ephemeral=True)
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error updating attendance threshold for guild {guild_id}: {e}", exc_info=True)
+            error_msg = messages["error"].get(guild_lang, messages["error"].get("en-US"))
+            await ctx.followup.send(error_msg, ephemeral=True)
+
+    async def attendance_stats(
+        self,
+        ctx: discord.ApplicationContext,
+        member: discord.Member = discord.Option(
+            discord.Member,
+            default=None,
+            description=GUILD_ATTENDANCE["attendance_stats"]["options"]["member"]["en-US"],
+            description_localizations=GUILD_ATTENDANCE["attendance_stats"]["options"]["member"]
+        )
+    ):
+        """
+        Show rolling attendance, no-show rate, conversion and weekday patterns.
+
+        Args:
+            ctx: Discord application context from the command
+            member: Member to detail (roster overview when omitted)
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild_id = ctx.guild.id
+        guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        texts = GUILD_ATTENDANCE["attendance_stats"]
+        messages = texts["messages"]
+
+        def message(key: str) -> str:
+            return messages[key].get(guild_lang, messages[key].get("en-US"))
+
+        if not NUMPY_AVAILABLE:
+            await ctx.followup.send(message("unavailable"), ephemeral=True)
+            return
+
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        if member is not None:
+            member_ids = [member.id]
+        else:
+            member_ids = [member_id for (g, member_id) in roster if g == guild_id] or None
+
+        try:
+            today = datetime.now(pytz.timezone("Europe/Paris")).date()
+            stats = await self.analytics.aggregates(self.bot.run_db_query, guild_id, today, member_ids)
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error computing attendance analytics for guild {guild_id}: {e}", exc_info=True)
+            await ctx.followup.send(message("error"), ephemeral=True)
+            return
+
+        if not stats["events"] or not stats["member_ids"]:
+            await ctx.followup.send(message("no_data"), ephemeral=True)
+            return
+
+        weekday_names = texts["weekdays"].get(guild_lang, texts["weekdays"].get("en-US"))
+        weekday_rates = stats["weekday_rate"].mean(axis=0)
+        weekday_lines = [
+            f"{weekday_names[day]}: {weekday_rates[day]:.0%} ({stats['events_per_weekday'][day]})"
+            for day in range(7) if stats["events_per_weekday"][day]
+        ]
+
+        if member is not None:
+            title = message("member_title").format(member=member.display_name)
+        else:
+            title = message("title").format(members=len(stats["member_ids"]))
+        embed = discord.Embed(
+            title=title,
+            description=message("events").format(events=stats["events"], window_events=stats["window_events"]),
+            color=discord.Color.blue()
+        )
+        embed.add_field(name=message("rolling"), value=f"{stats['rolling_rate'].mean():.0%}", inline=True)
+        embed.add_field(name=message("no_show"), value=f"{stats['no_show_rate'].mean():.0%}", inline=True)
+        embed.add_field(name=message("conversion"), value=f"{stats['conversion_rate'].mean():.0%}", inline=True)
+        embed.add_field(name=message("weekdays"), value="\n".join(weekday_lines), inline=False)
+
+        if member is None and len(stats["member_ids"]) > 1:
+            lowest = stats["rolling_rate"].argsort(kind="stable")[:5]
+            lines = []
+            for row in lowest:
+                member_id = stats["member_ids"][row]
+                username = roster.get((guild_id, member_id), {}).get("username") or f"ID: {member_id}"
+                lines.append(f"**{username}**: {stats['rolling_rate'][row]:.0%} / {stats['no_show_rate'][row]:.0%}")
+            embed.add_field(name=message("lowest"), value="\n".join(lines), inline=False)
+
+        await ctx.followup.send(embed=embed, ephemeral=True)
+
+    async def dkp_audit(
+        self,
+        ctx: discord.ApplicationContext,
+        event_id: int = discord.Option(
+            int,
+            description=GUILD_ATTENDANCE["dkp_audit"]["options"]["event_id"]["en-US"],
+            description_localizations=GUILD_ATTENDANCE["dkp_audit"]["options"]["event_id"]
+        )
+    ):
+        """
+        Show the ledger entries recorded for an event.
+
+        Args:
+            ctx: Discord application context from the command
+            event_id: Event to audit
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild_id = ctx.guild.id
+        guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        messages = GUILD_ATTENDANCE["dkp_audit"]["messages"]
+
+        def message(key: str) -> str:
+            return messages[key].get(guild_lang, messages[key].get("en-US"))
+
+        try:
+            entries = await self.dkp_ledger.get_event_entries(self.bot.run_db_query, guild_id, event_id)
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error reading ledger entries of event {event_id} in guild {guild_id}: {e}", exc_info=True)
+            await ctx.followup.send(message("error"), ephemeral=True)
+            return
+
+        if not entries:
+            await ctx.followup.send(message("no_data").format(event_id=event_id), ephemeral=True)
+            return
+
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        lines = []
+        for entry in entries:
+            username = roster.get((guild_id, entry["member_id"]), {}).get("username") or f"ID: {entry['member_id']}"
+            lines.append(
+                f"**{username}** ({entry['reason']}): DKP {entry['DKP']:+}, "
+                f"{entry['registrations']:+} / {entry['attendances']:+} / {entry['nb_events']:+}"
+            )
+
+        description = ""
+        for line in lines:
+            if len(description) + len(line) + 1 > 4000:
+                description += "…"
+                break
+            description += line + "\n"
+
+        embed = discord.Embed(
+            title=message("title").format(event_id=event_id, entries=len(entries)),
+            description=description,
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text=message("legend"))
+        await ctx.followup.send(embed=embed, ephemeral=True)
+
+    async def dkp_rebuild(self, ctx: discord.ApplicationContext):
+        """
+        Recompute the guild's DKP and counters from the ledger and reload the roster cache.
+
+        Args:
+            ctx: Discord application context from the command
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild_id = ctx.guild.id
+        guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        messages = GUILD_ATTENDANCE["dkp_rebuild"]["messages"]
+
+        try:
+            rebuilt = await self.dkp_ledger.rebuild_balances(run_db_transaction, guild_id)
+        except Exception as e:
+            logging.error(f"[GuildAttendance] Error rebuilding DKP balances for guild {guild_id}: {e}", exc_info=True)
+            rebuilt = False
+
+        if not rebuilt:
+            await ctx.followup.send(messages["error"].get(guild_lang, messages["error"].get("en-US")), ephemeral=True)
+            return
+
+        await self.bot.cache_loader.reload_category('guild_members', guild_id)
+        await self.bot.cache.delete('roster_data', f'bulk_guild_members_{guild_id}')
+        self.leaderboards.invalidate(guild_id)
+        await ctx.followup.send(messages["success"].get(guild_lang, messages["success"].get("en-US")), ephemeral=True)
+
+    async def _ensure_leaderboard(self, guild_id: int) -> bool:
+        """
+        Build a guild's leaderboard from the roster cache if it is not indexed yet.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            True if the guild has ranked members
+        """
+        if self.leaderboards.is_loaded(guild_id):
+            return True
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        members = [(member_id, data) for (g, member_id), data in roster.items() if g == guild_id]
+        if not members:
+            return False
+        self.leaderboards.load(guild_id, members)
+        return True
+
+    @staticmethod
+    def _format_leaderboard_score(metric: str, score: float, member_data: Dict[str, Any]) -> str:
+        """
+        Format a leaderboard score for display.
+
+        Args:
+            metric: Leaderboard metric
+            score: Ranked value
+            member_data: Roster entry of the member
+
+        Returns:
+            Display string for the score
+        """
+        if metric == ATTENDANCE_RATE:
+            return f"{score:.0%} ({member_data.get('attendances') or 0}/{member_data.get('nb_events') or 0})"
+        if metric == GS:
+            return f"{score:g} GS"
+        return f"{score:g} DKP"
+
+    async def dkp_leaderboard(
+        self,
+        ctx: discord.ApplicationContext,
+        metric: str = discord.Option(
+            default=DKP,
+            description=GUILD_ATTENDANCE["dkp_leaderboard"]["options"]["metric"]["en-US"],
+            description_localizations=GUILD_ATTENDANCE["dkp_leaderboard"]["options"]["metric"],
+            choices=[
+                discord.OptionChoice(
+                    name=choice_data["name"].get("en-US", key),
+                    value=choice_data["value"],
+                    name_localizations=choice_data["name"]
+                )
+                for key, choice_data in GUILD_ATTENDANCE["dkp_leaderboard"]["choices"].items()
+            ]
+        ),
+        limit: int = discord.Option(
+            int,
+            default=10,
+            description=GUILD_ATTENDANCE["dkp_leaderboard"]["options"]["limit"]["en-US"],
+            description_localizations=GUILD_ATTENDANCE["dkp_leaderboard"]["options"]["limit"],
+            min_value=1,
+            max_value=25
+        )
+    ):
+        """
+        Show the top members of a metric and the caller's own rank.
+
+        Args:
+            ctx: Discord application context from the command
+            metric: Ranking criterion (dkp, attendance, gs)
+            limit: Number of members to show
+        """
+        await ctx.defer(ephemeral=True)
+
+        guild_id = ctx.guild.id
+        guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        texts = GUILD_ATTENDANCE["dkp_leaderboard"]
+        messages = texts["messages"]
+
+        if not await self._ensure_leaderboard(guild_id):
+            await ctx.followup.send(messages["empty"].get(guild_lang, messages["empty"].get("en-US")), ephemeral=True)
+            return
+
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        lines = []
+        for position, (member_id, score) in enumerate(self.leaderboards.top(guild_id, metric, limit), start=1):
+            member_data = roster.get((guild_id, member_id), {})
+            username = member_data.get("username") or f"ID: {member_id}"
+            lines.append(f"`#{position}` **{username}** - {self._format_leaderboard_score(metric, score, member_data)}")
+
+        metric_name = texts["choices"][metric]["name"]
+        title = messages["title"].get(guild_lang, messages["title"].get("en-US"))
+        embed = discord.Embed(
+            title=title.format(metric=metric_name.get(guild_lang, metric_name.get("en-US"))),
+            description="\n".join(lines),
+            color=discord.Color.gold()
+        )
+
+        own_rank = self.leaderboards.rank(guild_id, metric, ctx.author.id)
+        if own_rank:
+            rank, total, score = own_rank
+            footer = messages["your_rank"].get(guild_lang, messages["your_rank"].get("en-US")).format(
+                rank=rank, total=total,
+                score=self._format_leaderboard_score(metric, score, roster.get((guild_id, ctx.author.id), {}))
+            )
+        else:
+            footer = messages["not_ranked"].get(guild_lang, messages["not_ranked"].get("en-US"))
+        embed.set_footer(text=footer)
+
+        await ctx.followup.send(embed=embed, ephemeral=True)
+
+    async def _process_guild_attendance(self, guild: discord.Guild, now: datetime, event_ids: Optional[Set[int]] = None):
         """
         Process attendance for a specific guild.
         
         Args:
             guild: Discord guild to process attendance for
             now: Current datetime for processing
+            event_ids: Only process these events (optional)
         """
         try:
             guild_id = guild.id
@@ -931,7 +1398,7 @@ class GuildAttendance(commands.Cog):
                 return
 
             logging.debug(f"[GuildAttendance] Processing guild {guild_id} ({guild.name})")
-            current_events = await self._get_current_events_for_guild(guild_id, now)
+            current_events = await self._get_current_events_for_guild(guild_id, now, event_ids)
             logging.debug(f"[GuildAttendance] Found {len(current_events)} current events for guild {guild_id}")
 
             for event_data in current_events:
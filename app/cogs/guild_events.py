@@ -3,10 +3,9 @@ Guild Events Cog - Manages event creation, scheduling, and registration system.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-import math
-import statistics
 import time
 from datetime import datetime, timedelta, time as dt_time
 from typing import Optional, List, Dict, Set, Tuple, Any
@@ -16,10 +15,20 @@ import pytz
 from discord import NotFound, HTTPException
 from discord.ext import commands, tasks
 
+from cache import freeze, thaw
+from config import (
+    EVENTS_ARCHIVE_HORIZON_DAYS, EVENTS_ARCHIVE_BATCH_SIZE, EVENTS_CREATE_CONCURRENCY,
+    EVENT_REACTION_DEBOUNCE_MS, EVENT_REACTION_WORKER_IDLE_SECONDS
+)
+from db import run_db_transaction
 from core.performance_profiler import profile_performance
 from core.reliability import discord_resilient
 from core.translation import translations as global_translations
 from core.functions import get_user_message, get_guild_message, get_effective_locale
+from core.keyed_locks import get_event_locks
+from core.event_timeline import get_event_timeline
+from core.dm_dispatcher import get_dm_dispatcher
+from core.group_engine import get_group_engine
 
 EVENT_MANAGEMENT = global_translations.get("event_management", {})
 STATIC_GROUPS = global_translations.get("static_groups", {})
@@ -35,6 +44,30 @@ WEAPON_EMOJIS = {
     "W":  "<:TL_W:1362340545376030760>"
 }
 
+EMPTY_REGISTRATIONS = {"presence": [], "tentative": [], "absence": []}
+
+REGISTRATION_EMOJIS = {
+    "presence":  "<:_yes_:1340109996666388570>",
+    "tentative": "<:_attempt_:1340110058692018248>",
+    "absence":   "<:_no_:1340110124521357313>"
+}
+EMOJI_TO_STATUS = {emoji: status for status, emoji in REGISTRATION_EMOJIS.items()}
+
+EVENT_STATUS_LABELS = {
+    "planned":   ("events_infos", "status_planned"),
+    "confirmed": ("events_infos", "status_confirmed"),
+    "closed":    ("events_infos", "status_closed"),
+    "canceled":  ("event_cancel_messages", "canceled"),
+    "cancelled": ("event_cancel_messages", "canceled")
+}
+
+EVENT_INSERT_COLUMNS = (
+    "guild_id", "event_id", "game_id", "name", "event_date", "event_time", "duration", "dkp_value",
+    "dkp_ins", "status", "initial_members", "registrations", "actual_presence", "embed_layout"
+)
+
+CANCELED_HIDDEN_FIELDS = {"presence", "tentative", "absence", "dkp_v", "dkp_i", "voice_channel", "groups"}
+
 CLASS_EMOJIS = {
     "Tank":    "<:tank:1374760483164524684>",
     "Healer":  "<:healer:1374760495613218816>",
@@ -75,8 +108,15 @@ class GuildEvents(commands.Cog):
 
         self._register_events_commands()
         self._register_statics_commands()
-        self.json_lock = asyncio.Lock()
+        self.event_locks = get_event_locks()
+        self.timeline = get_event_timeline()
+        self.dm_dispatcher = get_dm_dispatcher()
+        self.group_engine = get_group_engine()
         self.ignore_removals = {}
+        self._statics_hashes: Dict[int, str] = {}
+        self._reaction_mailboxes: Dict[Tuple[int, int], asyncio.Queue] = {}
+        self._reaction_workers: Dict[Tuple[int, int], asyncio.Task] = {}
+        self._reaction_stats = {"enqueued": 0, "flushes": 0, "edits": 0, "db_writes": 0, "max_lag": 0.0}
     
     def _register_events_commands(self):
         """Register event commands with the centralized events group."""
@@ -160,28 +200,26 @@ class GuildEvents(commands.Cog):
         Returns:
             None
         """
-        asyncio.create_task(self.bot.cache_loader.wait_for_initial_load())
-        logging.debug("[Guild_Events] Waiting for initial cache load")
+        asyncio.create_task(self.bot.cache_loader.wait_for_categories('guild_settings', 'guild_channels', 'events_data', 'static_groups', 'events_calendar'))
+        logging.debug("[Guild_Events] Waiting for events-related cache categories")
 
     async def get_event_from_cache(self, guild_id: int, event_id: int) -> Optional[Dict]:
         """
         Get event data from global cache.
         
+        The returned record is a read-only view shared with other readers;
+        use update_event_in_cache() to change it.
+        
         Args:
             guild_id: Discord guild ID
             event_id: Unique event identifier
             
         Returns:
-            Dictionary containing event data if found, None otherwise
+            Read-only mapping containing event data if found, None otherwise
         """
         try:
             event_data = await self.bot.cache.get_guild_data(guild_id, f'event_{event_id}')
             if event_data:
-                event_data['guild_id'] = guild_id
-                if not event_data.get('registrations'):
-                    event_data['registrations'] = '{"presence":[],"tentative":[],"absence":[]}'
-                if not event_data.get('actual_presence'):
-                    event_data['actual_presence'] = '[]'
                 logging.debug(f"[GuildEvents] Found event {event_id} in cache for guild {guild_id}")
             else:
                 logging.warning(f"[GuildEvents] Event {event_id} not found in cache for guild {guild_id}")
@@ -190,6 +228,44 @@ class GuildEvents(commands.Cog):
             logging.error(f"[GuildEvents] Error retrieving event {event_id} for guild {guild_id}: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _normalize_event_record(event_data: Dict) -> Dict:
+        """
+        Decode JSON columns of an event record for caching.
+        
+        Args:
+            event_data: Event record as built from the database or a command
+            
+        Returns:
+            New dictionary with decoded registrations/actual_presence and no guild_id
+        """
+        record = {k: v for k, v in event_data.items() if k != 'guild_id'}
+
+        registrations = record.get('registrations')
+        if isinstance(registrations, str):
+            try:
+                registrations = json.loads(registrations)
+            except (json.JSONDecodeError, TypeError):
+                registrations = None
+        record['registrations'] = registrations or {k: [] for k in EMPTY_REGISTRATIONS}
+
+        actual_presence = record.get('actual_presence')
+        if isinstance(actual_presence, str):
+            try:
+                actual_presence = json.loads(actual_presence)
+            except (json.JSONDecodeError, TypeError):
+                actual_presence = None
+        record['actual_presence'] = actual_presence or []
+
+        embed_layout = record.get('embed_layout')
+        if isinstance(embed_layout, str):
+            try:
+                embed_layout = json.loads(embed_layout)
+            except (json.JSONDecodeError, TypeError):
+                embed_layout = None
+        record['embed_layout'] = embed_layout
+        return record
+
     async def set_event_in_cache(self, guild_id: int, event_id: int, event_data: Dict) -> None:
         """
         Set event data in global cache.
@@ -203,12 +279,38 @@ class GuildEvents(commands.Cog):
             None
         """
         try:
-            cache_data = event_data.copy()
-            cache_data.pop('guild_id', None)
+            cache_data = freeze(self._normalize_event_record(event_data))
             await self.bot.cache.set_guild_data(guild_id, f'event_{event_id}', cache_data)
         except Exception as e:
             logging.error(f"[GuildEvents] Error storing event {event_id} for guild {guild_id}: {e}", exc_info=True)
 
+    async def update_event_in_cache(self, guild_id: int, event_id: int, fn) -> Optional[Dict]:
+        """
+        Atomically apply a change to a cached event record (copy-on-write).
+        
+        Args:
+            guild_id: Discord guild ID
+            event_id: Unique event identifier
+            fn: Function receiving a mutable copy of the normalized event record
+                and mutating it in place; it may return False to abort
+            
+        Returns:
+            Read-only view of the updated record, None if missing or aborted
+        """
+        def apply(current):
+            if current is None:
+                return None
+            record = self._normalize_event_record(current)
+            if fn(record) is False:
+                return None
+            return record
+
+        try:
+            return await self.bot.cache.update_guild_data(guild_id, f'event_{event_id}', apply)
+        except Exception as e:
+            logging.error(f"[GuildEvents] Error updating event {event_id} for guild {guild_id}: {e}", exc_info=True)
+            return None
+
     async def delete_event_from_cache(self, guild_id: int, event_id: int) -> None:
         """
         Delete event data from global cache.
@@ -220,11 +322,30 @@ class GuildEvents(commands.Cog):
         Returns:
             None
         """
+        self.timeline.remove_event(guild_id, event_id)
         try:
             await self.bot.cache.delete_guild_data(guild_id, f'event_{event_id}')
         except Exception as e:
             logging.error(f"[GuildEvents] Error deleting event {event_id} for guild {guild_id}: {e}", exc_info=True)
 
+    def schedule_event_transitions(self, guild_id: int, event_record: Dict) -> None:
+        """
+        Register an event's upcoming close, attendance, reminder and delete transitions.
+        
+        Args:
+            guild_id: Discord guild ID
+            event_record: Event record with event_id, event_date, event_time, duration and status
+            
+        Returns:
+            None
+        """
+        if not event_record:
+            return
+        self.timeline.schedule_event(
+            guild_id, int(event_record["event_id"]), event_record.get("event_date"),
+            event_record.get("event_time"), event_record.get("duration"), event_record.get("status")
+        )
+
     async def get_all_guild_events(self, guild_id: int) -> List[Dict]:
         """
         Get all events for a specific guild from global cache.
@@ -244,8 +365,11 @@ class GuildEvents(commands.Cog):
             rows = await self.bot.run_db_query(query, (guild_id,), fetch_all=True)
             events = []
             if rows:
+                registered = await self.bot.cache_loader.fetch_event_registrations(guild_id)
                 for row in rows:
                     event_id, name, event_date, event_time, duration, dkp_value, dkp_ins, status, registrations, actual_presence = row
+                    if (guild_id, event_id) in registered:
+                        registrations = json.dumps(registered[(guild_id, event_id)])
                     event_data = {
                         'guild_id': guild_id,
                         'event_id': event_id,
@@ -382,8 +506,7 @@ class GuildEvents(commands.Cog):
         Returns:
             Dictionary containing ideal staff composition data for the guild, empty dict if not found
         """
-        staff_data = await self.bot.cache.get('guild_data', 'ideal_staff')
-        return staff_data.get(guild_id, {}) if staff_data else {}
+        return await self.bot.cache.get_guild_ideal_staff(guild_id)
 
     def get_next_date_for_day(self, day_name: str, event_time_value, tz, tomorrow_only: bool = False) -> Optional[datetime]:
         """
@@ -451,140 +574,229 @@ class GuildEvents(commands.Cog):
         naive_dt = datetime.combine(event_date, dt_time(hour, minute))
         return tz.localize(naive_dt)
 
-    async def create_events_for_all_premium_guilds(self) -> None:
+    async def create_events_for_all_premium_guilds(self) -> Dict[int, Dict[str, Any]]:
         """
         Create recurring events for all premium guilds based on calendar.
         
+        Guilds are processed concurrently, at most EVENTS_CREATE_CONCURRENCY
+        at a time, and the calendar occurrences of each game are resolved
+        once and shared by every guild playing it.
+        
         Args:
             None
             
         Returns:
-            None
+            Dictionary mapping guild ID to its creation report (events created, status, duration_ms)
         """
+        premium_guilds = []
         for guild in self.bot.guilds:
-            guild_id = guild.id
-            settings = await self.bot.cache.get_guild_data(guild_id, 'settings')
+            settings = await self.bot.cache.get_guild_data(guild.id, 'settings')
             if settings and settings.get("premium") in [True, 1, "1"]:
+                premium_guilds.append((guild, settings))
+            elif not settings:
+                logging.debug(f"[GuildEvents] Guild {guild.id} has no settings configured, skipping event creation")
+            else:
+                logging.debug(f"[GuildEvents] Guild {guild.id} is not premium, skipping automatic event creation")
+
+        tz = pytz.timezone("Europe/Paris")
+        occurrences_by_game: Dict[int, List[Dict]] = {}
+        for _, settings in premium_guilds:
+            try:
+                game_id = int(settings.get("guild_game"))
+            except (ValueError, TypeError):
+                continue
+            if game_id not in occurrences_by_game:
+                occurrences_by_game[game_id] = await self._resolve_calendar_occurrences(game_id, tz)
+
+        semaphore = asyncio.Semaphore(max(EVENTS_CREATE_CONCURRENCY, 1))
+        report: Dict[int, Dict[str, Any]] = {}
+
+        async def create_for(guild, settings):
+            try:
+                occurrences = occurrences_by_game.get(int(settings.get("guild_game")))
+            except (ValueError, TypeError):
+                occurrences = None
+            async with semaphore:
+                start = time.monotonic()
                 try:
-                    await self.create_events_for_guild(guild)
-                    logging.info(f"[GuildEvents] Events created for premium guild {guild_id}.")
+                    created = await self.create_events_for_guild(guild, occurrences)
+                    status = "ok"
+                    logging.info(f"[GuildEvents] Events created for premium guild {guild.id}.")
                 except Exception as e:
-                    logging.exception(f"[GuildEvents] Error creating events for guild {guild_id}: {e}")
-            else:
-                if not settings:
-                    logging.debug(f"[GuildEvents] Guild {guild_id} has no settings configured, skipping event creation")
-                else:
-                    logging.debug(f"[GuildEvents] Guild {guild_id} is not premium, skipping automatic event creation")
+                    created, status = 0, "error"
+                    logging.exception(f"[GuildEvents] Error creating events for guild {guild.id}: {e}")
+                report[guild.id] = {
+                    "events": created or 0,
+                    "status": status,
+                    "duration_ms": int((time.monotonic() - start) * 1000)
+                }
+
+        await asyncio.gather(*(create_for(guild, settings) for guild, settings in premium_guilds))
+        return report
+
+    async def _resolve_calendar_occurrences(self, game_id: int, tz) -> List[Dict]:
+        """
+        Resolve the calendar entries of a game that take place tomorrow.
+        
+        Args:
+            game_id: Unique game identifier
+            tz: Timezone object for localization
+            
+        Returns:
+            List of dictionaries with the calendar entry, start_time, end_time and duration
+        """
+        calendar_data = await self.get_events_calendar_data(game_id)
+        occurrences = []
+        for cal_event in calendar_data.get('events', []):
+            day = cal_event.get("day")
+            start_time = self.get_next_date_for_day(day, cal_event.get("time", "21:00"), tz, tomorrow_only=True)
+            if start_time is None:
+                logging.debug(f"[GuildEvents - create_events_for_guild] Event day '{day}' is not scheduled for tomorrow. Skipping.")
+                continue
+
+            week_setting = cal_event.get("week", "all")
+            if week_setting != "all":
+                week_number = start_time.isocalendar()[1]
+                if week_setting == "odd" and week_number % 2 == 0:
+                    logging.info(f"[GuildEvents - create_events_for_guild] Event {cal_event.get('name')} not scheduled this week (even).")
+                    continue
+                elif week_setting == "even" and week_number % 2 != 0:
+                    logging.info(f"[GuildEvents - create_events_for_guild] Event {cal_event.get('name')} not scheduled this week (odd).")
+                    continue
+
+            try:
+                duration_minutes = int(cal_event.get("duration", 60))
+            except (ValueError, TypeError) as e:
+                logging.warning(f"[GuildEvents] Invalid duration value for event, using default 60min: {e}")
+                duration_minutes = 60
+
+            occurrences.append({
+                "cal_event": cal_event,
+                "start_time": start_time,
+                "end_time": start_time + timedelta(minutes=duration_minutes),
+                "duration": duration_minutes
+            })
+        logging.debug(f"[GuildEvents] Resolved {len(occurrences)} calendar occurrence(s) for game {game_id}")
+        return occurrences
+
+    @staticmethod
+    def _event_insert_query(records: List[Dict]) -> Tuple[str, tuple]:
+        """
+        Build one multi-row upsert of events_data for new events.
+        
+        Args:
+            records: Event records keyed by EVENT_INSERT_COLUMNS
+            
+        Returns:
+            Tuple of (query, params)
+        """
+        row = "(" + ", ".join(["%s"] * len(EVENT_INSERT_COLUMNS)) + ")"
+        updates = ",\n            ".join(f"{column} = VALUES({column})" for column in EVENT_INSERT_COLUMNS[2:])
+        query = f"""
+        INSERT INTO events_data ({", ".join(EVENT_INSERT_COLUMNS)})
+        VALUES {", ".join([row] * len(records))}
+        ON DUPLICATE KEY UPDATE
+            {updates}
+        """
+        params = tuple(record[column] for record in records for column in EVENT_INSERT_COLUMNS)
+        return query, params
 
     @profile_performance(threshold_ms=100.0)
     @discord_resilient(service_name='discord_api', max_retries=2)
-    async def create_events_for_guild(self, guild: discord.Guild) -> None:
+    async def create_events_for_guild(self, guild: discord.Guild, occurrences: Optional[List[Dict]] = None) -> int:
         """
         Create recurring events for a specific guild based on its game calendar.
         
+        Announcements and scheduled events are created one by one; the
+        resulting events are then persisted with a single batched insert.
+        If the batch fails, events are inserted one by one and the posts of
+        any event that still cannot be saved are deleted.
+        
         Args:
             guild: Discord guild object to create events for
+            occurrences: Calendar occurrences resolved for the guild's game (optional, resolved here if omitted)
             
         Returns:
-            None
+            Number of events created
         """
         guild_id = guild.id
         
         settings = await self.bot.cache.get_guild_data(guild_id, 'settings')
         if not settings:
             logging.error(f"[GuildEvents - create_events_for_guild] No configuration for guild {guild_id}.")
-            return
+            return 0
 
         guild_lang = settings.get("guild_lang")
 
         channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels')
         if not channels_data:
             logging.error(f"[GuildEvents - create_events_for_guild] No channels configuration for guild {guild_id}.")
-            return
+            return 0
         
         events_channel = guild.get_channel(channels_data.get("events_channel"))
         conference_channel = guild.get_channel(channels_data.get("voice_war_channel"))
         if not events_channel:
             logging.error(f"[GuildEvents - create_events_for_guild] Events channel not found for guild {guild_id}.")
-            return
+            return 0
         if not conference_channel:
             logging.error(f"[GuildEvents - create_events_for_guild] Conference channel not found for guild {guild_id}.")
-            return
+            return 0
+
+        if occurrences is None:
+            try:
+                game_id = int(settings.get("guild_game"))
+            except Exception as e:
+                logging.error(f"[GuildEvents - create_events_for_guild] Error converting guild_game for guild {guild_id}: {e}")
+                return 0
+            occurrences = await self._resolve_calendar_occurrences(game_id, pytz.timezone("Europe/Paris"))
+        if not occurrences:
+            logging.info(f"[GuildEvents - create_events_for_guild] No calendar events scheduled tomorrow for guild {guild_id}.")
+            return 0
 
         try:
-            game_id = int(settings.get("guild_game"))
+            roles_data = await self.bot.cache.get_guild_data(guild_id, 'roles')
+            members_role_id = roles_data.get("members") if roles_data else None
+            if members_role_id:
+                if hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_role_members_optimized'):
+                    initial_members = list(await self.bot.cache.get_role_members_optimized(guild_id, int(members_role_id)))
+                else:
+                    role = guild.get_role(int(members_role_id))
+                    initial_members = [member.id for member in role.members] if role else []
+            else:
+                initial_members = []
         except Exception as e:
-            logging.error(f"[GuildEvents - create_events_for_guild] Error converting guild_game for guild {guild_id}: {e}")
-            return
-
-        calendar_data = await self.get_events_calendar_data(game_id)
-        calendar = calendar_data.get('events', [])
-        if not calendar:
-            logging.info(f"[GuildEvents - create_events_for_guild] No events defined in calendar for game_id {game_id}.")
-            return
+            logging.error(f"[GuildEvents - create_events_for_guild] Error determining initial members for guild {guild_id}: {e}", exc_info=True)
+            initial_members = []
 
-        tz = pytz.timezone("Europe/Paris")
+        events_infos = EVENT_MANAGEMENT.get("events_infos", {})
+        translations = self._get_cached_translations(guild_lang, events_infos)
+        conference_link = f"https://discord.com/channels/{guild.id}/{conference_channel.id}"
+        records = []
+        posts = {}
 
-        for cal_event in calendar:
+        for occurrence in occurrences:
+            cal_event = occurrence["cal_event"]
+            start_time, end_time, duration_minutes = occurrence["start_time"], occurrence["end_time"], occurrence["duration"]
             try:
-                day = cal_event.get("day")
-                event_time_str = cal_event.get("time", "21:00")
-                start_time = self.get_next_date_for_day(day, event_time_str, tz, tomorrow_only=True)
-
-                if start_time is None:
-                    logging.debug(f"[GuildEvents - create_events_for_guild] Event day '{day}' is not scheduled for tomorrow. Skipping.")
-                    continue
-
-                try:
-                    duration_minutes = int(cal_event.get("duration", 60))
-                except (ValueError, TypeError) as e:
-                    logging.warning(f"[GuildEvents] Invalid duration value for event, using default 60min: {e}")
-                    duration_minutes = 60
-                end_time = start_time + timedelta(minutes=duration_minutes)
-
-                week_setting = cal_event.get("week", "all")
-                if week_setting != "all":
-                    week_number = start_time.isocalendar()[1]
-                    if week_setting == "odd" and week_number % 2 == 0:
-                        logging.info(f"[GuildEvents - create_events_for_guild] Event {cal_event.get('name')} not scheduled this week (even).")
-                        continue
-                    elif week_setting == "even" and week_number % 2 != 0:
-                        logging.info(f"[GuildEvents - create_events_for_guild] Event {cal_event.get('name')} not scheduled this week (odd).")
-                        continue
-
                 event_key = cal_event.get("name")
-                events_infos = EVENT_MANAGEMENT.get("events_infos", {})
                 event_info = events_infos.get(event_key)
                 event_name = event_info.get(guild_lang, event_info.get("en-US")) if event_info else event_key
 
-                translations = self._get_cached_translations(guild_lang, events_infos)
-
                 try:
-                    embed = discord.Embed(
-                        title=event_name,
-                        description=translations["description"],
-                        color=discord.Color.blue()
+                    embed_layout = self._build_event_layout(
+                        guild_lang, translations["description"], discord.Color.blue(),
+                        start_time.strftime("%d-%m-%Y"), start_time.strftime("%H:%M"), duration_minutes,
+                        cal_event.get("dkp_value", 0), cal_event.get("dkp_ins", 0), conference_link
                     )
-                    embed.add_field(name=translations["date"], value=start_time.strftime("%d-%m-%Y"), inline=True)
-                    embed.add_field(name=translations["hour"], value=start_time.strftime("%H:%M"), inline=True)
-                    embed.add_field(name=translations["duration"], value=f"{duration_minutes}", inline=True)
-                    embed.add_field(name=translations["status"], value=translations["status_planned"], inline=True)
-                    embed.add_field(name=translations["dkp_v"], value=str(cal_event.get("dkp_value", 0)), inline=True)
-                    embed.add_field(name=translations["dkp_i"], value=str(cal_event.get("dkp_ins", 0)), inline=True)
-                    embed.add_field(name=f"{translations['present']} <:_yes_:1340109996666388570> (0)", value=translations["none"], inline=False)
-                    embed.add_field(name=f"{translations['attempt']} <:_attempt_:1340110058692018248> (0)", value=translations["none"], inline=False)
-                    embed.add_field(name=f"{translations['absence']} <:_no_:1340110124521357313> (0)", value=translations["none"], inline=False)
-                    conference_link = f"https://discord.com/channels/{guild.id}/{conference_channel.id}"
-                    embed.add_field(name=translations["voice_channel"], value=f"[🏹 WAR]({conference_link})", inline=False)
-                    embed.add_field(name=translations["groups"], value=translations["auto_grouping"], inline=False)
+                    preview_record = {"event_id": None, "name": event_name, "status": translations["status_planned_db"],
+                                      "registrations": EMPTY_REGISTRATIONS}
+                    embed = self.render_event_embed(preview_record, guild_lang, embed_layout)
                 except Exception as e:
                     logging.error(f"[GuildEvents - create_events_for_guild] Error building embed for event '{event_name}': {e}", exc_info=True)
                     continue
 
                 try:
-                    announcement_task = self._send_announcement(events_channel, embed)
-
-                    announcement = await announcement_task
+                    announcement = await self._send_announcement(events_channel, embed)
                     message_link = f"https://discord.com/channels/{guild.id}/{announcement.channel.id}/{announcement.id}"
 
                     embed.set_footer(text=f"Event ID = {announcement.id}")
@@ -595,30 +807,13 @@ class GuildEvents(commands.Cog):
                     scheduled_event = await self._create_scheduled_event(
                         guild, event_name, description_scheduled, start_time, end_time, conference_channel
                     )
-                    
                 except Exception as e:
                     logging.error(f"[GuildEvents - create_events_for_guild] Error creating announcement or scheduled event: {e}", exc_info=True)
                     continue
 
-                try:
-                    roles_data = await self.bot.cache.get_guild_data(guild_id, 'roles')
-                    members_role_id = roles_data.get("members") if roles_data else None
-                    if members_role_id:
-                        if hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_role_members_optimized'):
-                            initial_members = list(await self.bot.cache.get_role_members_optimized(guild_id, int(members_role_id)))
-                        else:
-                            role = guild.get_role(int(members_role_id))
-                            if role:
-                                initial_members = [member.id for member in guild.members if role in member.roles]
-                            else:
-                                initial_members = []
-                    else:
-                        initial_members = []
-                except Exception as e:
-                    logging.error(f"[GuildEvents - create_events_for_guild] Error determining initial members for guild {guild_id}: {e}", exc_info=True)
-                    initial_members = []
+                posts[announcement.id] = (announcement, scheduled_event)
 
-                record = {
+                records.append({
                     "guild_id": guild_id,
                     "event_id": announcement.id,
                     "game_id": settings.get("guild_game"),
@@ -631,72 +826,65 @@ class GuildEvents(commands.Cog):
                     "status": translations["status_planned_db"],
                     "initial_members": json.dumps(initial_members),
                     "registrations": json.dumps({"presence": [], "tentative": [], "absence": []}),
-                    "actual_presence": json.dumps([])
-                }
+                    "actual_presence": json.dumps([]),
+                    "embed_layout": json.dumps(embed_layout)
+                })
+            except Exception as outer_e:
+                logging.error(f"[GuildEvents - create_events_for_guild] Unexpected error in create_events_for_guild for guild {guild_id}: {outer_e}", exc_info=True)
 
-                query = """
-                INSERT INTO events_data (
-                    guild_id,
-                    event_id,
-                    game_id,
-                    name,
-                    event_date,
-                    event_time,
-                    duration,
-                    dkp_value,
-                    dkp_ins,
-                    status,
-                    initial_members,
-                    registrations,
-                    actual_presence
-                ) VALUES (
-                    %(guild_id)s,
-                    %(event_id)s,
-                    %(game_id)s,
-                    %(name)s,
-                    %(event_date)s,
-                    %(event_time)s,
-                    %(duration)s,
-                    %(dkp_value)s,
-                    %(dkp_ins)s,
-                    %(status)s,
-                    %(initial_members)s,
-                    %(registrations)s,
-                    %(actual_presence)s
-                )
-                ON DUPLICATE KEY UPDATE
-                    game_id = VALUES(game_id),
-                    name = VALUES(name),
-                    event_date = VALUES(event_date),
-                    event_time = VALUES(event_time),
-                    duration = VALUES(duration),
-                    dkp_value = VALUES(dkp_value),
-                    dkp_ins = VALUES(dkp_ins),
-                    status = VALUES(status),
-                    initial_members = VALUES(initial_members),
-                    registrations = VALUES(registrations),
-                    actual_presence = VALUES(actual_presence)
-                """
+        if not records:
+            return 0
+
+        query, params = self._event_insert_query(records)
+        try:
+            await self.bot.run_db_query(query, params, commit=True)
+            logging.info(f"[GuildEvents - create_events - create_events_for_guild] {len(records)} event(s) saved in DB for guild {guild_id}")
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "foreign key constraint" in error_msg or "1452" in error_msg:
+                logging.error(f"[GuildEvents] Foreign key constraint failed for guild {guild_id}: {e}")
+            else:
+                logging.error(f"[GuildEvents - create_events - create_events_for_guild] Error saving events in DB for guild {guild_id}: {e}")
+            records = await self._insert_events_individually(guild_id, records, posts)
+
+        for record in records:
+            await self.set_event_in_cache(guild_id, record["event_id"], record)
+            self.schedule_event_transitions(guild_id, record)
+            logging.debug(f"[GuildEvents] Event {record['event_id']} cached after automatic event creation")
+        return len(records)
+
+    async def _insert_events_individually(self, guild_id: int, records: List[Dict], posts: Dict[int, tuple]) -> List[Dict]:
+        """
+        Insert events one by one after a failed batch and delete the posts of events that cannot be saved.
+        
+        Args:
+            guild_id: Discord guild ID
+            records: Event records of the failed batch
+            posts: (announcement, scheduled event) by event ID
+            
+        Returns:
+            Records saved in the database
+        """
+        saved = []
+        for record in records:
+            query, params = self._event_insert_query([record])
+            try:
+                await self.bot.run_db_query(query, params, commit=True)
+                saved.append(record)
+                continue
+            except Exception as e:
+                logging.error(f"[GuildEvents - create_events_for_guild] Error saving event {record['event_id']} in DB for guild {guild_id}: {e}")
+
+            announcement, scheduled_event = posts.get(record["event_id"], (None, None))
+            for post in (announcement, scheduled_event):
+                if post is None:
+                    continue
                 try:
-                    await self.bot.run_db_query(query, record, commit=True)
-                    logging.info(f"[GuildEvents - create_events - create_events_for_guild] Event saved in DB successfully: {announcement.id}")
-                    
-                    await self.bot.cache.invalidate_category('events_data')
-                    logging.debug(f"[GuildEvents] Cache invalidated for events_data after automatic event creation")
-
-                    await self.bot.cache.get_guild_data(guild_id, 'events_data', force_reload=True)
-                    logging.debug(f"[GuildEvents] Events cache reloaded for guild {guild_id} after automatic event creation")
-                    
+                    await post.delete()
                 except Exception as e:
-                    error_msg = str(e).lower()
-                    if "duplicate entry" in error_msg or "1062" in error_msg:
-                        logging.warning(f"[GuildEvents] Duplicate event entry for guild {guild_id}: {e}")
-                    elif "foreign key constraint" in error_msg or "1452" in error_msg:
-                        logging.error(f"[GuildEvents] Foreign key constraint failed for guild {guild_id}: {e}")
-                    else:
-                        logging.error(f"[GuildEvents - create_events - create_events_for_guild] Error saving event in DB for guild {guild_id}: {e}")
-            except Exception as outer_e:
-                logging.error(f"[GuildEvents - create_events_for_guild] Unexpected error in create_events_for_guild for guild {guild_id}: {outer_e}", exc_info=True)
+                    logging.warning(f"[GuildEvents - create_events_for_guild] Could not delete the post of unsaved event {record['event_id']}: {e}")
+        logging.info(f"[GuildEvents - create_events_for_guild] {len(saved)}/{len(records)} event(s) saved individually for guild {guild_id}")
+        return saved
 
     def _get_cached_translations(self, guild_lang: str, events_infos: Dict) -> Dict[str, str]:
         """
@@ -826,9 +1014,10 @@ class GuildEvents(commands.Cog):
 
         query = "UPDATE events_data SET status = %s WHERE guild_id = %s AND event_id = %s"
         try:
-            await self.bot.run_db_query(query, ("Confirmed", guild.id, event_id), commit=True)
-            target_event["status"] = "Confirmed"
-            await self.set_event_in_cache(guild.id, event_id_int, target_event)
+            async with self.event_locks.lock((guild.id, event_id_int)):
+                await self.bot.run_db_query(query, ("Confirmed", guild.id, event_id), commit=True)
+                confirmed = await self.update_event_in_cache(guild.id, event_id_int, lambda ev: ev.update(status="Confirmed"))
+                self.schedule_event_transitions(guild.id, confirmed)
             logging.info(f"[GuildEvents] Event {event_id} status updated to 'Confirmed' for guild {guild.id}.")
 
                 
@@ -843,46 +1032,14 @@ class GuildEvents(commands.Cog):
             await ctx.followup.send(follow_message, ephemeral=True)
             return
 
-        try:
-            message = await events_channel.fetch_message(event_id)
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-            logging.warning(f"[GuildEvents] Cannot fetch event message {event_id}: {e}")
-            follow_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_confirm_messages.no_events_message")
-            await ctx.followup.send(follow_message, ephemeral=True)
-            return
-
-        if not message.embeds:
-            follow_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_confirm_messages.no_events_message_embed")
-            await ctx.followup.send(follow_message, ephemeral=True)
-            return
-
-        new_embed = message.embeds[0]
-        new_embed.color = discord.Color.green()
-
-        status_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.status")).lower()
-        status_name  = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.status")
-        status_localized = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_confirm_messages.confirmed")
-
-        new_fields = []
-        status_found = False
-        for field in new_embed.fields:
-            if field.name.lower() == status_key:
-                new_fields.append({"name": status_name, "value": status_localized, "inline": field.inline})
-                status_found = True
-            else:
-                new_fields.append({"name": field.name, "value": field.value, "inline": field.inline})
-        if not status_found:
-            new_fields.append({"name": status_name, "value": status_localized, "inline": False})
-        new_embed.clear_fields()
-        for field in new_fields:
-            new_embed.add_field(name=field["name"], value=field["value"], inline=field["inline"])
-
         try:
             roles_data = await self.bot.cache.get_guild_data(guild_id, 'roles')
             
             members_role = roles_data.get("members") if roles_data else None
             update_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_confirm_messages.confirmed_notif", role=members_role)
-            await message.edit(content=update_message,embed=new_embed)
+            async with self.event_locks.lock((guild.id, event_id_int)):
+                latest_event = await self.get_event_from_cache(guild.id, event_id_int) or target_event
+                await self.update_event_embed(events_channel, latest_event, content=update_message)
             follow_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_confirm_messages.event_updated", event_id=event_id)
             await ctx.followup.send(follow_message, ephemeral=True)
         except Exception as e:
@@ -930,9 +1087,10 @@ class GuildEvents(commands.Cog):
 
         query = "UPDATE events_data SET status = %s WHERE guild_id = %s AND event_id = %s"
         try:
-            await self.bot.run_db_query(query, ("Canceled", guild.id, event_id_int), commit=True)
-            target_event["status"] = "Canceled"
-            await self.set_event_in_cache(guild.id, event_id_int, target_event)
+            async with self.event_locks.lock((guild.id, event_id_int)):
+                await self.bot.run_db_query(query, ("Canceled", guild.id, event_id_int), commit=True)
+                canceled = await self.update_event_in_cache(guild.id, event_id_int, lambda ev: ev.update(status="Canceled"))
+                self.schedule_event_transitions(guild.id, canceled)
             logging.info(f"[GuildEvents] Event {event_id_int} status updated to 'Canceled' for guild {guild.id}.")
                 
         except Exception as e:
@@ -947,54 +1105,14 @@ class GuildEvents(commands.Cog):
             return
 
         try:
-            message = await events_channel.fetch_message(event_id_int)
-        except Exception as e:
-            follow_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_cancel_messages.no_events_message")
-            await ctx.followup.send(follow_message, ephemeral=True)
-            return
-
-        try:
-            await message.clear_reactions()
+            await events_channel.get_partial_message(event_id_int).clear_reactions()
         except Exception as e:
             logging.error(f"❌ [GuildEvents] Error clearing reactions in event_cancel: {e}", exc_info=True)
 
-        if not message.embeds:
-            follow_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_cancel_messages.no_events_message_embed")
-            await ctx.followup.send(follow_message, ephemeral=True)
-            return
-
-        embed = message.embeds[0]
-        embed.color = discord.Color.red()
-
-        status_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.status")).lower()
-        status_name  = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.status")
-        status_localized = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_cancel_messages.canceled")
-        present_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.present")).lower()
-        tentative_key = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.attempt")).lower()
-        absence_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.absence")).lower()
-        dkp_v_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.dkp_v")).lower()
-        dkp_i_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.dkp_i")).lower()
-        groups_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.groups")).lower()
-        chan_key   = (await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "events_infos.voice_channel")).lower()
-
-        new_fields = []
-        for field in embed.fields:
-            field_name = field.name.lower()
-            if (field_name.startswith(present_key) or 
-                field_name.startswith(tentative_key) or 
-                field_name.startswith(absence_key) or 
-                field_name in [dkp_v_key, dkp_i_key, groups_key, chan_key]):
-                continue
-            elif field_name == status_key:
-                new_fields.append({"name": status_name, "value": status_localized, "inline": False})
-            else:
-                new_fields.append({"name": field.name, "value": field.value, "inline": field.inline})
-        embed.clear_fields()
-        for field in new_fields:
-            embed.add_field(name=field["name"], value=field["value"], inline=field["inline"])
-
         try:
-            await message.edit(content="", embed=embed)
+            async with self.event_locks.lock((guild.id, event_id_int)):
+                latest_event = await self.get_event_from_cache(guild.id, event_id_int) or target_event
+                await self.update_event_embed(events_channel, latest_event, content="")
             follow_message = await get_user_message(ctx, EVENT_MANAGEMENT, "event_cancel_messages.event_updated", event_id=event_id)
             await ctx.followup.send(follow_message, ephemeral=True)
         except Exception as e:
@@ -1031,7 +1149,7 @@ class GuildEvents(commands.Cog):
 
     async def _handle_event_reaction(self, payload: discord.RawReactionActionEvent, guild: discord.Guild, settings: dict) -> None:
         """
-        Process event registration reactions and update participant lists.
+        Validate an event registration reaction and enqueue it in the event mailbox.
         
         Args:
             payload: Discord raw reaction event payload
@@ -1041,77 +1159,17 @@ class GuildEvents(commands.Cog):
         Returns:
             None
         """
-        valid_emojis = [
-            "<:_yes_:1340109996666388570>",
-            "<:_attempt_:1340110058692018248>",
-            "<:_no_:1340110124521357313>"
-        ]
-        if str(payload.emoji) not in valid_emojis:
+        new_status = EMOJI_TO_STATUS.get(str(payload.emoji))
+        if not new_status:
             logging.debug(f"[GuildEvents - on_raw_reaction_add] Invalid emoji: {payload.emoji}")
             return
 
-        channel = guild.get_channel(payload.channel_id)
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except Exception as e:
-            logging.error(f"[GuildEvents - on_raw_reaction_add] Error fetching message: {e}")
-            return
-
-        member = guild.get_member(payload.user_id)
+        member = payload.member or guild.get_member(payload.user_id)
         if not member or member.bot:
             logging.debug("[GuildEvents - on_raw_reaction_add] Member not found or is a bot.")
             return
 
-        for emoji in valid_emojis:
-            if emoji != str(payload.emoji):
-                try:
-                    key = (message.id, member.id, emoji)
-                    self.ignore_removals[key] = time.time()
-                    await message.remove_reaction(emoji, member)
-                except Exception as e:
-                    logging.error(f"[GuildEvents - on_raw_reaction_add] Error removing reaction {emoji} for {member}: {e}")
-
-        async with self.json_lock:
-            target_event = await self.get_event_from_cache(guild.id, message.id)
-            if not target_event:
-                logging.debug("[GuildEvents - on_raw_reaction_add] No event found for this message.")
-                return
-
-            logging.debug(f"[GuildEvents - on_raw_reaction_add] Event found: {target_event}")
-
-            if isinstance(target_event.get("registrations"), str):
-                try:
-                    target_event["registrations"] = json.loads(target_event["registrations"])
-                    logging.debug("[GuildEvents - on_raw_reaction_add] Registrations decoded from JSON.")
-                except Exception as e:
-                    logging.error(f"[GuildEvents - on_raw_reaction_add] Error during registration decoding: {e}")
-                    target_event["registrations"] = {"presence": [], "tentative": [], "absence": []}
-
-            logging.debug(f"[GuildEvents - on_raw_reaction_add] Registrations BEFORE update: {target_event['registrations']}")
-
-            for key in ["presence", "tentative", "absence"]:
-                if payload.user_id in target_event["registrations"].get(key, []):
-                    target_event["registrations"][key].remove(payload.user_id)
-            if str(payload.emoji) == "<:_yes_:1340109996666388570>":
-                target_event["registrations"]["presence"].append(payload.user_id)
-            elif str(payload.emoji) == "<:_attempt_:1340110058692018248>":
-                target_event["registrations"]["tentative"].append(payload.user_id)
-            elif str(payload.emoji) == "<:_no_:1340110124521357313>":
-                target_event["registrations"]["absence"].append(payload.user_id)
-
-            logging.debug(f"[GuildEvents - on_raw_reaction_add] Registrations AFTER update: {target_event['registrations']}")
-
-            await self.set_event_in_cache(guild.id, message.id, target_event)
-
-        try:
-            new_registrations = json.dumps(target_event["registrations"])
-            update_query = "UPDATE events_data SET registrations = %s WHERE guild_id = %s AND event_id = %s"
-            await self.bot.run_db_query(update_query, (new_registrations, target_event["guild_id"], target_event["event_id"]), commit=True)
-            logging.debug("[GuildEvents - on_raw_reaction_add] DB update successful for registrations.")
-        except Exception as e:
-            logging.error(f"[GuildEvents - on_raw_reaction_add] Error updating DB for registrations: {e}")
-
-        await self.update_event_embed(message, target_event)
+        self._enqueue_registration_op(guild, payload.channel_id, payload.message_id, ("add", payload.user_id, new_status))
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
@@ -1131,6 +1189,10 @@ class GuildEvents(commands.Cog):
                 logging.debug(f"[GuildEvents - on_raw_reaction_remove] Ignoring automatic removal for key {key}")
                 return
 
+        removed_status = EMOJI_TO_STATUS.get(str(payload.emoji))
+        if not removed_status:
+            return
+
         guild = self.bot.get_guild(payload.guild_id)
         if not guild:
             return
@@ -1142,123 +1204,409 @@ class GuildEvents(commands.Cog):
         if payload.channel_id != events_channel_id:
             return
 
-        try:
-            channel = guild.get_channel(payload.channel_id)
-            message = await channel.fetch_message(payload.message_id)
-        except Exception as e:
-            logging.error(f"[GuildEvents - on_raw_reaction_remove] Error fetching message: {e}")
-            return
+        self._enqueue_registration_op(guild, payload.channel_id, payload.message_id, ("remove", payload.user_id, removed_status))
 
-        async with self.json_lock:
-            target_event = await self.get_event_from_cache(guild.id, message.id)
-            if not target_event:
-                return
-            if target_event.get("status", "").strip().lower() == "closed":
-                logging.debug(f"[GuildEvents - on_raw_reaction_remove] Ignoring removal since event {target_event['event_id']} is Closed.")
-                return
+# #################################################################################### #
+#                            Registration Reaction Pipeline
+# #################################################################################### #
+    def _enqueue_registration_op(self, guild: discord.Guild, channel_id: int, event_id: int, op: Tuple[str, int, str]) -> None:
+        """
+        Append a registration operation to the event mailbox, starting its worker if needed.
+        
+        Args:
+            guild: Discord guild object owning the event
+            channel_id: Events channel ID holding the event message
+            event_id: Event identifier (event message ID)
+            op: Tuple of (action, member_id, status) where action is "add" or "remove"
+            
+        Returns:
+            None
+        """
+        key = (guild.id, event_id)
+        mailbox = self._reaction_mailboxes.get(key)
+        if mailbox is None:
+            mailbox = asyncio.Queue()
+            self._reaction_mailboxes[key] = mailbox
+            self._reaction_workers[key] = asyncio.create_task(
+                self._registration_worker(guild, channel_id, event_id, mailbox)
+            )
+        mailbox.put_nowait((time.monotonic(), op))
+        self._reaction_stats["enqueued"] += 1
 
-            for key in ["presence", "tentative", "absence"]:
-                if payload.user_id in target_event["registrations"].get(key, []):
-                    target_event["registrations"][key].remove(payload.user_id)
+    async def _registration_worker(self, guild: discord.Guild, channel_id: int, event_id: int, mailbox: asyncio.Queue) -> None:
+        """
+        Drain an event mailbox, flushing at most once per debounce window.
+        
+        The first operation after an idle period is flushed immediately; operations
+        arriving within the window are applied together on the next flush. The
+        worker exits once the mailbox stays empty for the idle timeout.
+        
+        Args:
+            guild: Discord guild object owning the event
+            channel_id: Events channel ID holding the event message
+            event_id: Event identifier (event message ID)
+            mailbox: Queue of (enqueued_at, op) tuples for this event
+            
+        Returns:
+            None
+        """
+        key = (guild.id, event_id)
+        window = EVENT_REACTION_DEBOUNCE_MS / 1000
+        last_flush = 0.0
+        try:
+            while True:
+                try:
+                    first = await asyncio.wait_for(mailbox.get(), timeout=EVENT_REACTION_WORKER_IDLE_SECONDS)
+                except asyncio.TimeoutError:
+                    if mailbox.empty():
+                        return
+                    continue
 
-            await self.set_event_in_cache(guild.id, message.id, target_event)
+                delay = last_flush + window - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
 
-        await self.update_event_embed(message, target_event)
+                batch = [first]
+                while not mailbox.empty():
+                    batch.append(mailbox.get_nowait())
 
-        try:
-            new_registrations = json.dumps(target_event["registrations"])
-            update_query = "UPDATE events_data SET registrations = %s WHERE guild_id = %s AND event_id = %s"
-            await self.bot.run_db_query(update_query, (new_registrations, target_event["guild_id"], target_event["event_id"]), commit=True)
-            logging.debug("[GuildEvents - on_raw_reaction_remove] DB update successful for registrations.")
+                await self._flush_registration_batch(guild, channel_id, event_id, batch)
+                last_flush = time.monotonic()
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logging.error(f"[GuildEvents - on_raw_reaction_remove] Error updating DB for registrations: {e}")
+            logging.error(f"[GuildEvents] Registration worker for event {event_id} stopped: {e}", exc_info=True)
+        finally:
+            if self._reaction_mailboxes.get(key) is mailbox:
+                del self._reaction_mailboxes[key]
+                self._reaction_workers.pop(key, None)
 
-    async def update_event_embed(self, message, event_record):
+    async def _flush_registration_batch(self, guild: discord.Guild, channel_id: int, event_id: int, batch: List[Tuple[float, Tuple[str, int, str]]]) -> None:
         """
-        Update event embed with current registration information.
+        Apply a batch of registration operations in order, then persist and render once.
         
         Args:
-            message: Discord message object containing the event embed
-            event_record: Dictionary containing event data and registrations
+            guild: Discord guild object owning the event
+            channel_id: Events channel ID holding the event message
+            event_id: Event identifier (event message ID)
+            batch: List of (enqueued_at, op) tuples in arrival order
             
         Returns:
             None
         """
-        logging.debug("✅ [GuildEvents] Starting embed update for event.")
-        guild = self.bot.get_guild(message.guild.id)
-        guild_id = guild.id
+        stale_reactions = []
+        touched: Dict[int, Optional[str]] = {}
+
+        def apply(event_record):
+            closed = (event_record.get("status") or "").strip().lower() == "closed"
+            registrations = event_record["registrations"]
+            for _, (action, member_id, status) in batch:
+                previous = next((k for k in ("presence", "tentative", "absence") if member_id in registrations.setdefault(k, [])), None)
+                if action == "add":
+                    if closed:
+                        stale_reactions.append((member_id, status))
+                        continue
+                    if previous == status:
+                        continue
+                    if previous:
+                        registrations[previous].remove(member_id)
+                        stale_reactions.append((member_id, previous))
+                    registrations[status].append(member_id)
+                    touched[member_id] = status
+                elif previous == status and not closed:
+                    registrations[previous].remove(member_id)
+                    touched[member_id] = None
+            return bool(touched)
+
+        channel = guild.get_channel(channel_id)
+        async with self.event_locks.lock((guild.id, event_id)):
+            target_event = await self.update_event_in_cache(guild.id, event_id, apply)
+            if target_event:
+                try:
+                    queries = self._registration_write_queries(guild.id, event_id, touched)
+                    if len(queries) == 1:
+                        await self.bot.run_db_query(*queries[0], commit=True)
+                    else:
+                        await run_db_transaction(queries)
+                    self._reaction_stats["db_writes"] += 1
+                    logging.debug(f"[GuildEvents] Flushed {len(batch)} registration change(s) for event {event_id}.")
+                except Exception as e:
+                    logging.error(f"[GuildEvents] Error updating DB for registrations: {e}")
+
+                if channel:
+                    try:
+                        await self.update_event_embed(channel, target_event)
+                        self._reaction_stats["edits"] += 1
+                    except Exception as e:
+                        logging.error(f"[GuildEvents] Error updating embed for event {event_id}: {e}")
+
+        self._reaction_stats["flushes"] += 1
+        if not channel:
+            return
+
+        if stale_reactions:
+            partial = channel.get_partial_message(event_id)
+            for member_id, status in stale_reactions:
+                emoji = REGISTRATION_EMOJIS[status]
+                self.ignore_removals[(event_id, member_id, emoji)] = time.time()
+                try:
+                    await partial.remove_reaction(emoji, discord.Object(id=member_id))
+                except Exception as e:
+                    logging.error(f"[GuildEvents] Error removing reaction {emoji} for {member_id}: {e}")
+
+        lag = time.monotonic() - batch[0][0]
+        self._reaction_stats["max_lag"] = max(self._reaction_stats["max_lag"], lag)
+
+    @staticmethod
+    def _registration_write_queries(guild_id: int, event_id: int, touched: Dict[int, Optional[str]]) -> List[Tuple[str, tuple]]:
+        """
+        Build the event_registrations writes for the members a flush changed.
         
-        guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        Only changed members are written, so a single click costs one row
+        upsert or delete regardless of how many members are registered.
+        
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event identifier
+            touched: Final status per changed member, None when unregistered
+            
+        Returns:
+            List of (query, params) tuples, at most one upsert and one delete
+        """
+        queries = []
+        upserts = [(member_id, status) for member_id, status in touched.items() if status]
+        removed = [member_id for member_id, status in touched.items() if not status]
+        if upserts:
+            placeholders = ",".join(["(%s,%s,%s,%s)"] * len(upserts))
+            params = tuple(value for member_id, status in upserts for value in (guild_id, event_id, member_id, status))
+            queries.append((
+                f"INSERT INTO event_registrations (guild_id, event_id, member_id, status) VALUES {placeholders} "
+                "ON DUPLICATE KEY UPDATE status = VALUES(status)",
+                params
+            ))
+        if removed:
+            placeholders = ",".join(["%s"] * len(removed))
+            queries.append((
+                f"DELETE FROM event_registrations WHERE guild_id = %s AND event_id = %s AND member_id IN ({placeholders})",
+                (guild_id, event_id, *removed)
+            ))
+        return queries
+
+    def get_reaction_pipeline_stats(self) -> Dict[str, Any]:
+        """
+        Get registration pipeline counters.
+        
+        Returns:
+            Dictionary with enqueued, flushes, edits, db_writes, max_lag and active_mailboxes
+        """
+        return {**self._reaction_stats, "active_mailboxes": len(self._reaction_mailboxes)}
 
-        present_key = EVENT_MANAGEMENT["events_infos"]["present"] \
-            .get(guild_lang, EVENT_MANAGEMENT["events_infos"]["present"]["en-US"]) \
-            .lower()
-        attempt_key = EVENT_MANAGEMENT["events_infos"]["attempt"] \
-            .get(guild_lang, EVENT_MANAGEMENT["events_infos"]["attempt"]["en-US"]) \
-            .lower()
-        absence_key = EVENT_MANAGEMENT["events_infos"]["absence"] \
-            .get(guild_lang, EVENT_MANAGEMENT["events_infos"]["absence"]["en-US"]) \
-            .lower()
-        none_key = EVENT_MANAGEMENT["events_infos"]["none"] \
-            .get(guild_lang, EVENT_MANAGEMENT["events_infos"]["none"]["en-US"])
-
-        def format_list(id_list):
-            """
-            Format member ID list for display in embed.
+# #################################################################################### #
+#                            Event Embed Rendering
+# #################################################################################### #
+    def _build_event_layout(self, guild_lang: str, description: str, color: discord.Color, event_date: str,
+                            event_time: str, duration: int, dkp_value: int, dkp_ins: int, voice_link: str) -> Dict[str, Any]:
+        """
+        Build the announcement layout stored with an event at creation time.
+        
+        Static fields keep their creation-time name and value; the status and
+        registration fields only keep their label and are filled at render time.
+        
+        Args:
+            guild_lang: Guild language code
+            description: Embed description
+            color: Initial embed color
+            event_date: Displayed event date
+            event_time: Displayed event hour
+            duration: Duration in minutes
+            dkp_value: DKP reward for attendance
+            dkp_ins: DKP reward for registration
+            voice_link: Link to the war voice channel
             
-            Args:
-                id_list: List of Discord member IDs
-                
-            Returns:
-                String of formatted member mentions or "None" if empty
-            """
-            members = [guild.get_member(uid) for uid in id_list if guild.get_member(uid)]
-            return ", ".join(m.mention for m in members) if members else none_key
+        Returns:
+            JSON-serializable layout dictionary
+        """
+        translations = self._get_cached_translations(guild_lang, EVENT_MANAGEMENT.get("events_infos", {}))
+        return {
+            "description": description,
+            "color": color.value,
+            "fields": [
+                {"key": "date", "name": translations["date"], "value": event_date, "inline": True},
+                {"key": "hour", "name": translations["hour"], "value": event_time, "inline": True},
+                {"key": "duration", "name": translations["duration"], "value": str(duration), "inline": True},
+                {"key": "status", "name": translations["status"], "value": None, "inline": True},
+                {"key": "dkp_v", "name": translations["dkp_v"], "value": str(dkp_value), "inline": True},
+                {"key": "dkp_i", "name": translations["dkp_i"], "value": str(dkp_ins), "inline": True},
+                {"key": "presence", "name": translations["present"], "value": None, "inline": False},
+                {"key": "tentative", "name": translations["attempt"], "value": None, "inline": False},
+                {"key": "absence", "name": translations["absence"], "value": None, "inline": False},
+                {"key": "voice_channel", "name": translations["voice_channel"], "value": f"[🏹 WAR]({voice_link})", "inline": False},
+                {"key": "groups", "name": translations["groups"], "value": translations["auto_grouping"], "inline": False},
+            ]
+        }
 
-        presence_ids = event_record["registrations"].get("presence", [])
-        tentative_ids = event_record["registrations"].get("tentative", [])
-        absence_ids = event_record["registrations"].get("absence", [])
+    async def _default_event_layout(self, guild_id: int, event_record: Dict, guild_lang: str) -> Dict[str, Any]:
+        """
+        Rebuild a layout for events created before layouts were stored.
         
-        presence_str = format_list(presence_ids)
-        tentative_str = format_list(tentative_ids)
-        absence_str = format_list(absence_ids)
+        Args:
+            guild_id: Discord guild ID
+            event_record: Cached event record
+            guild_lang: Guild language code
+            
+        Returns:
+            Layout dictionary equivalent to the one built at creation time
+        """
+        event_date = event_record.get("event_date")
+        if isinstance(event_date, str):
+            try:
+                event_date = datetime.strptime(event_date, "%Y-%m-%d").date()
+            except ValueError:
+                pass
+        if hasattr(event_date, "strftime"):
+            event_date = event_date.strftime("%d-%m-%Y")
+
+        event_time = event_record.get("event_time")
+        if isinstance(event_time, timedelta):
+            total_minutes = int(event_time.total_seconds()) // 60
+            event_time = f"{total_minutes // 60:02d}:{total_minutes % 60:02d}"
+        elif hasattr(event_time, "strftime"):
+            event_time = event_time.strftime("%H:%M")
+        elif isinstance(event_time, str):
+            event_time = event_time[:5]
+
+        channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels') or {}
+        voice_link = f"https://discord.com/channels/{guild_id}/{channels_data.get('voice_war_channel')}"
+        events_infos = EVENT_MANAGEMENT.get("events_infos", {})
+        description = events_infos.get("description", {}).get(guild_lang, events_infos.get("description", {}).get("en-US", ""))
+
+        return self._build_event_layout(
+            guild_lang, description, discord.Color.blue(), str(event_date), str(event_time),
+            event_record.get("duration", 0), event_record.get("dkp_value", 0), event_record.get("dkp_ins", 0), voice_link
+        )
 
-        if not message.embeds:
-            logging.error("[GuildEvents] No embed found in the message.")
-            return
-        embed = message.embeds[0]
-
-        new_fields = []
-        for field in embed.fields:
-            lower_name = field.name.lower()
-            if present_key in lower_name or "<:_yes_:" in field.name:
-                new_name = f"{EVENT_MANAGEMENT['events_infos']['present'][guild_lang]} <:_yes_:1340109996666388570> ({len(presence_ids)})"
-                new_fields.append((new_name, presence_str, field.inline))
-            elif attempt_key in lower_name or "<:_attempt_:" in field.name:
-                new_name = f"{EVENT_MANAGEMENT['events_infos']['attempt'][guild_lang]} <:_attempt_:1340110058692018248> ({len(tentative_ids)})"
-                new_fields.append((new_name, tentative_str, field.inline))
-            elif absence_key in lower_name or "<:_no_:" in field.name:
-                new_name = f"{EVENT_MANAGEMENT['events_infos']['absence'][guild_lang]} <:_no_:1340110124521357313> ({len(absence_ids)})"
-                new_fields.append((new_name, absence_str, field.inline))
+    @staticmethod
+    def _localized_event_status(status: str, guild_lang: str) -> str:
+        """
+        Get the displayed label for a database event status.
+        
+        Args:
+            status: Event status as stored in the database
+            guild_lang: Guild language code
+            
+        Returns:
+            Localized status label, or the raw status if unknown
+        """
+        section, key = EVENT_STATUS_LABELS.get((status or "").strip().lower(), (None, None))
+        labels = EVENT_MANAGEMENT.get(section, {}).get(key, {}) if section else {}
+        return labels.get(guild_lang, labels.get("en-US", status))
+
+    def render_event_embed(self, event_record: Dict, guild_lang: str, layout: Dict, guild: Optional[discord.Guild] = None) -> discord.Embed:
+        """
+        Render an event announcement embed from cached event state.
+        
+        Args:
+            event_record: Cached event record
+            guild_lang: Guild language code
+            layout: Layout stored at creation (or rebuilt for older events)
+            guild: Guild used to drop members who left from registration lists
+            
+        Returns:
+            Embed ready to be sent or edited in
+        """
+        status = (event_record.get("status") or "").strip().lower()
+        canceled = status in ("canceled", "cancelled")
+        if status == "confirmed":
+            color = discord.Color.green()
+        elif canceled:
+            color = discord.Color.red()
+        else:
+            color = discord.Color(layout.get("color", discord.Color.blue().value))
+
+        none_labels = EVENT_MANAGEMENT.get("events_infos", {}).get("none", {})
+        none_text = none_labels.get(guild_lang, none_labels.get("en-US", "None"))
+        registrations = event_record.get("registrations") or {}
+
+        embed = discord.Embed(title=event_record.get("name"), description=layout.get("description"), color=color)
+        for field in layout.get("fields", []):
+            key = field["key"]
+            if canceled and key in CANCELED_HIDDEN_FIELDS:
+                continue
+            if key == "status":
+                embed.add_field(name=field["name"], value=self._localized_event_status(status, guild_lang),
+                                inline=False if canceled else field["inline"])
+            elif key in REGISTRATION_EMOJIS:
+                member_ids = registrations.get(key, [])
+                mentions = [f"<@{uid}>" for uid in member_ids if guild is None or guild.get_member(uid)]
+                embed.add_field(name=f"{field['name']} {REGISTRATION_EMOJIS[key]} ({len(member_ids)})",
+                                value=", ".join(mentions) if mentions else none_text, inline=field["inline"])
             else:
-                new_fields.append((field.name, field.value, field.inline))
+                embed.add_field(name=field["name"], value=field["value"], inline=field["inline"])
+        if event_record.get("event_id"):
+            embed.set_footer(text=f"Event ID = {event_record['event_id']}")
+        return embed
 
-        embed.clear_fields()
-        for name, value, inline in new_fields:
-            embed.add_field(name=name, value=value, inline=inline)
+    async def update_event_embed(self, channel: discord.TextChannel, event_record: Dict, **edit_kwargs) -> None:
+        """
+        Re-render an event announcement from cache and edit it without fetching it.
+        
+        Args:
+            channel: Events channel holding the announcement
+            event_record: Cached event record (its event_id is the message ID)
+            **edit_kwargs: Extra arguments for the message edit (e.g. content)
+            
+        Returns:
+            None
+            
+        Raises:
+            discord.HTTPException: If the edit fails (e.g. message deleted)
+        """
+        guild_id = channel.guild.id
+        guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        layout = event_record.get("embed_layout") or await self._default_event_layout(guild_id, event_record, guild_lang)
+        embed = self.render_event_embed(event_record, guild_lang, layout, channel.guild)
+        await channel.get_partial_message(event_record["event_id"]).edit(embed=embed, **edit_kwargs)
+        logging.debug(f"[GuildEvents] Embed update successful for event {event_record['event_id']}.")
 
-        try:
-            await message.edit(embed=embed)
-            logging.debug("[GuildEvents] Embed update successful.")
-        except Exception as e:
-            logging.error(f"[GuildEvents] Error updating embed: {e}")
+    def _due_guilds(self, due: Optional[Dict[int, Set[int]]]) -> List[discord.Guild]:
+        """
+        Get the guilds a cron run should visit.
+        
+        Args:
+            due: {guild_id: {event_id}} from the event timeline, or None for every guild
+            
+        Returns:
+            List of Discord guild objects
+        """
+        if due is None:
+            return list(self.bot.guilds)
+        return [guild for guild in (self.bot.get_guild(guild_id) for guild_id in due) if guild]
 
-    async def event_delete_cron(self, ctx=None) -> None:
+    @staticmethod
+    def _filter_due_events(guild_events: List[Dict], guild_id: int, due: Optional[Dict[int, Set[int]]]) -> List[Dict]:
+        """
+        Keep only the events a timeline transition is due for.
+        
+        Args:
+            guild_events: Events of the guild
+            guild_id: Discord guild ID
+            due: {guild_id: {event_id}} from the event timeline, or None to keep every event
+            
+        Returns:
+            Filtered list of events
+        """
+        if due is None:
+            return guild_events
+        event_ids = due.get(guild_id, set())
+        return [ev for ev in guild_events if ev["event_id"] in event_ids]
+
+    async def event_delete_cron(self, ctx=None, due: Optional[Dict[int, Set[int]]] = None) -> None:
         """
         Automated task to delete finished events.
         
         Args:
             ctx: Optional Discord application context (default: None)
+            due: Restrict the run to these {guild_id: {event_id}} (timeline transitions)
             
         Returns:
             None
@@ -1266,7 +1614,7 @@ class GuildEvents(commands.Cog):
         tz = pytz.timezone("Europe/Paris")
         now = datetime.now(tz)
         
-        for guild in self.bot.guilds:
+        for guild in self._due_guilds(due):
             guild_id = guild.id
             total_deleted = 0
             canceled_events_to_delete = []
@@ -1284,7 +1632,7 @@ class GuildEvents(commands.Cog):
                 logging.error(f"[GuildEvents CRON] Events channel not found for guild {guild_id}.")
                 continue
 
-            guild_events = await self.get_all_guild_events(guild_id)
+            guild_events = self._filter_due_events(await self.get_all_guild_events(guild_id), guild_id, due)
 
             for ev in guild_events:
                 try:
@@ -1346,164 +1694,228 @@ class GuildEvents(commands.Cog):
 
             logging.info(f"[GuildEvents CRON] For guild {guild_id}, messages deleted: {total_deleted}")
 
-    async def event_reminder_cron(self) -> None:
+    async def event_archive_cron(self) -> int:
+        """
+        Automated task moving closed events past the archive horizon to events_archive.
+        
+        Events are copied and deleted in chunks of EVENTS_ARCHIVE_BATCH_SIZE, one
+        transaction per chunk, so events_data and the cache only hold the active
+        window. Archived events stay readable through the events_history view.
+        
+        Returns:
+            Number of events archived
+        """
+        tz = pytz.timezone("Europe/Paris")
+        cutoff = (datetime.now(tz) - timedelta(days=EVENTS_ARCHIVE_HORIZON_DAYS)).date()
+        columns = "guild_id, event_id, game_id, name, event_date, event_time, duration, dkp_value, dkp_ins, status, initial_members, registrations, actual_presence"
+        select_query = """
+            SELECT guild_id, event_id FROM events_data
+            WHERE status = 'Closed' AND event_date < %s
+            ORDER BY event_date
+            LIMIT %s
+        """
+        total_archived = 0
+
+        while True:
+            rows = await self.bot.run_db_query(select_query, (cutoff, EVENTS_ARCHIVE_BATCH_SIZE), fetch_all=True)
+            if not rows:
+                break
+
+            placeholders = ",".join(["(%s,%s)"] * len(rows))
+            params = tuple(item for row in rows for item in row)
+            try:
+                await run_db_transaction([
+                    (f"INSERT IGNORE INTO events_archive ({columns}) SELECT {columns} FROM events_data WHERE (guild_id, event_id) IN ({placeholders})", params),
+                    (f"DELETE FROM events_data WHERE (guild_id, event_id) IN ({placeholders})", params)
+                ])
+            except Exception as e:
+                logging.error(f"[GuildEvents CRON] Error archiving batch of {len(rows)} events: {e}", exc_info=True)
+                break
+
+            for guild_id, event_id in rows:
+                await self.delete_event_from_cache(guild_id, event_id)
+            total_archived += len(rows)
+
+            if len(rows) < EVENTS_ARCHIVE_BATCH_SIZE:
+                break
+
+        logging.info(f"[GuildEvents CRON] Archived {total_archived} closed events older than {cutoff}")
+        return total_archived
+
+    async def event_reminder_cron(self, due: Optional[Dict[int, Set[int]]] = None) -> None:
         """
         Automated task to send event reminders.
         
+        Guilds are processed concurrently; DMs go through the shared DM
+        dispatcher, which enforces the global rate limit.
+        
         Args:
-            None
+            due: Restrict the run to these {guild_id: {event_id}} (timeline transitions)
             
         Returns:
             None
         """
         tz = pytz.timezone("Europe/Paris")
-        today_str = datetime.now(tz).strftime("%Y-%m-%d")
-        overall_results = []
+        now = datetime.now(tz)
+        today_str = now.strftime("%Y-%m-%d")
 
         logging.info(f"[GuildEvents - event_reminder_cron] Starting automatic reminder for {today_str}.")
+
+        guild_results = await asyncio.gather(
+            *(self._send_guild_reminders(guild, today_str, now.strftime("%H"), due) for guild in self._due_guilds(due)),
+            return_exceptions=True
+        )
+        overall_results = []
+        for result in guild_results:
+            if isinstance(result, Exception):
+                logging.error(f"[GuildEvents - event_reminder_cron] Guild reminder run failed: {result}", exc_info=result)
+            else:
+                overall_results.extend(result)
+        logging.info("Reminder results:\n" + "\n".join(overall_results))
+
+    async def _send_guild_reminders(self, guild: discord.Guild, today_str: str, slot: str, due: Optional[Dict[int, Set[int]]]) -> List[str]:
+        """
+        Remind the unregistered members of a guild's confirmed events of the day.
         
-        for guild in self.bot.guilds:
-            guild_id = guild.id
-            settings = await self.bot.cache.get_guild_data(guild_id, 'settings')
-            if not settings:
-                continue
+        Args:
+            guild: Discord guild object
+            today_str: Current date as YYYY-MM-DD
+            slot: Reminder slot (hour), part of the DM dedup key
+            due: Restrict the run to these {guild_id: {event_id}} (timeline transitions)
+            
+        Returns:
+            List of result lines for the run summary
+        """
+        overall_results = []
+        guild_id = guild.id
+        settings = await self.bot.cache.get_guild_data(guild_id, 'settings')
+        if not settings:
+            return overall_results
 
-            guild_locale = settings.get("guild_lang") or "en-US"
+        channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels')
+        if not channels_data:
+            return overall_results
+            
+        notifications_channel = guild.get_channel(channels_data.get("notifications_channel"))
+        events_channel = guild.get_channel(channels_data.get("events_channel"))
+        if not events_channel or not notifications_channel:
+            logging.error(f"[GuildEvents] Events or notifications channel not found for guild {guild.name}.")
+            return overall_results
+
+        guild_events = self._filter_due_events(await self.get_all_guild_events(guild_id), guild_id, due)
+        confirmed_events = [
+            ev for ev in guild_events
+            if str(ev.get("event_date")).strip() == today_str and str(ev.get("status", "")).strip().lower() == "confirmed"
+        ]
+        logging.info(f"[GuildEvents - event_reminder_cron] For guild {guild.name}, {len(confirmed_events)} confirmed event(s) found for today.")
 
-            channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels')
-            if not channels_data:
-                continue
-                
-            notifications_channel = guild.get_channel(channels_data.get("notifications_channel"))
-            events_channel = guild.get_channel(channels_data.get("events_channel"))
-            if not events_channel or not notifications_channel:
-                logging.error(f"[GuildEvents] Events or notifications channel not found for guild {guild.name}.")
-                continue
+        if not confirmed_events:
+            overall_results.append(f"{guild.name}: No confirmed events today.")
+            return overall_results
+
+        try:
+            roles_data = await self.bot.cache.get_guild_data(guild_id, 'roles')
+            members_role_id = roles_data.get("members") if roles_data else None
+            role = guild.get_role(int(members_role_id)) if members_role_id else None
+            if role:
+                if hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_role_members_optimized'):
+                    current_members = await self.bot.cache.get_role_members_optimized(guild_id, int(members_role_id))
+                else:
+                    current_members = {member.id for member in guild.members if role in member.roles}
+            else:
+                current_members = set()
+        except Exception as e:
+            logging.error(f"[GuildEvents - event_reminder_cron] Error retrieving current members for guild {guild.id}: {e}", exc_info=True)
+            current_members = set()
 
-            guild_events = await self.get_all_guild_events(guild_id)
-            for ev in guild_events:
-                logging.debug(f"[GuildEvents - event_reminder_cron] Comparing event {ev['event_id']}: event_date={repr(ev.get('event_date'))} (type {type(ev.get('event_date'))}), "
-                            f"today_str={repr(today_str)}, status={repr(ev.get('status', ''))} (lowercased: {repr(ev.get('status', '').strip().lower())})")
+        dm_template = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_reminder.dm_message")
 
-            confirmed_events = [
-                ev for ev in guild_events
-                if str(ev.get("event_date")).strip() == today_str and str(ev.get("status", "")).strip().lower() == "confirmed"
-            ]
-            logging.info(f"[GuildEvents - event_reminder_cron] For guild {guild.name}, {len(confirmed_events)} confirmed event(s) found for today.")
+        for event in confirmed_events:
+            registrations_obj = event.get("registrations", {})
+            if isinstance(registrations_obj, str):
+                try:
+                    registrations_obj = json.loads(registrations_obj)
+                except Exception as e:
+                    logging.error(f"[GuildEvents - event_reminder_cron] Error parsing 'registrations' for event {event['event_id']}: {e}", exc_info=True)
+                    registrations_obj = {"presence": [], "tentative": [], "absence": []}
+            registrations = set(registrations_obj.get("presence", [])) | set(registrations_obj.get("tentative", [])) | set(registrations_obj.get("absence", []))
+
+            to_remind = current_members - registrations
+            event_link = f"https://discord.com/channels/{guild.id}/{events_channel.id}/{event['event_id']}"
+            logging.debug(f"[GuildEvents - event_reminder_cron] For event {event['event_id']}, registered: {registrations}, to remind: {to_remind}")
+
+            recipients = []
+            for member_id in to_remind:
+                member = guild.get_member(member_id)
+                if member:
+                    recipients.append(member)
+                else:
+                    logging.warning(f"[GuildEvents - event_reminder_cron] Member {member_id} not found in guild {guild.name}.")
+
+            def build_dm(member, event=event, event_link=event_link):
+                return dm_template.format(
+                    member_name=member.name,
+                    event_name=event["name"],
+                    date=event["event_date"],
+                    time=event["event_time"],
+                    link=event_link
+                )
 
-            if not confirmed_events:
-                overall_results.append(f"{guild.name}: No confirmed events today.")
-                continue
+            report = await self.dm_dispatcher.send_batch(
+                f"event_reminder:{event['event_id']}", recipients, build_dm,
+                dedup_key=f"event_reminder:{guild_id}:{event['event_id']}:{today_str}:{slot}"
+            )
+            reminded = [f"<@{member_id}>" for member_id in report["sent"]]
 
-            for event in confirmed_events:
-                registrations_obj = event.get("registrations", {})
-                if isinstance(registrations_obj, str):
+            try:
+                if reminded:
+                    reminder_template = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_reminder.notification_reminded")
+                    if reminder_template is None:
+                        reminder_template = EVENT_MANAGEMENT.get("event_reminder", {}).get("notification_reminded", {}).get("en-US", 
+                            "## :bell: Event Reminder\nFor event **{event}**\n({event_link})\n\n{len} member(s) were reminded: {members}"
+                        )
                     try:
-                        registrations_obj = json.loads(registrations_obj)
+                        reminder_msg = reminder_template.format(event=event["name"], event_link=event_link, len=len(reminded), members=", ".join(reminded))
                     except Exception as e:
-                        logging.error(f"[GuildEvents - event_reminder_cron] Error parsing 'registrations' for event {event['event_id']}: {e}", exc_info=True)
-                        registrations_obj = {"presence": [], "tentative": [], "absence": []}
-                registrations = set(registrations_obj.get("presence", [])) | set(registrations_obj.get("tentative", [])) | set(registrations_obj.get("absence", []))
-                initial_members = event.get("initial_members", [])
-                if isinstance(initial_members, str):
+                        logging.error(f"[GuildEvents - event_reminder_cron] Error formatting reminder template: {e}", exc_info=True)
+                        reminder_msg = f"Reminder: {event['name']} - {event_link}"
+                    result = (f"For event **{event['name']}** in guild {guild.name}: {len(reminded)} member(s) reminded, "
+                              f"{len(report['forbidden'])} with closed DMs, {len(report['failed'])} failed: " + ", ".join(reminded))
+                    await notifications_channel.send(reminder_msg)
+                    overall_results.append(result)
+                else:
+                    reminder_template = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_reminder.notification_all_OK")
+                    if reminder_template is None:
+                        reminder_template = EVENT_MANAGEMENT.get("event_reminder", {}).get("notification_all_OK", {}).get("en-US", 
+                            "## :bell: Event Reminder\nFor event **{event}**\n({event_link})\n\nAll members have responded."
+                        )
                     try:
-                        initial_members = json.loads(initial_members)
+                        reminder_msg = reminder_template.format(event=event["name"], event_link=event_link)
                     except Exception as e:
-                        logging.error(f"[GuildEvents - event_reminder_cron] Error parsing 'initial_members' for event {event['event_id']}: {e}", exc_info=True)
-                        initial_members = []
-                initial = set(initial_members)
-                
-                try:
-                    roles_data = await self.bot.cache.get_guild_data(guild_id, 'roles')
-                    members_role_id = roles_data.get("members") if roles_data else None
-                    if members_role_id:
-                        role = guild.get_role(int(members_role_id))
-                        if role:
-                            if hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_role_members_optimized'):
-                                current_members = await self.bot.cache.get_role_members_optimized(guild_id, int(members_role_id))
-                            else:
-                                current_members = {member.id for member in guild.members if role in member.roles}
-                        else:
-                            current_members = set()
-                    else:
-                        current_members = set()
-                except Exception as e:
-                    logging.error(f"[GuildEvents - event_reminder_cron] Error retrieving current members for guild {guild.id}: {e}", exc_info=True)
-                    current_members = set()
-                
-                updated_initial = current_members
-                to_remind = list(updated_initial - registrations)
-                reminded = []
-                event_link = f"https://discord.com/channels/{guild.id}/{events_channel.id}/{event['event_id']}"
-                dm_template = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_reminder.dm_message")
-                logging.debug(f"[GuildEvents - event_reminder_cron] For event {event['event_id']}, initial members: {initial}, registered: {registrations}, to remind: {to_remind}")
-                for member_id in to_remind:
-                    member = guild.get_member(member_id)
-                    if member:
-                        try:
-                            dm_message = dm_template.format(
-                                member_name=member.name,
-                                event_name=event["name"],
-                                date=event["event_date"],
-                                time=event["event_time"],
-                                link=event_link
-                            )
-                            await member.send(dm_message)
-                            reminded.append(member.mention)
-                            logging.debug(f"[GuildEvents - event_reminder_cron] DM sent to {member.name} for event {event['name']}")
-                        except Exception as e:
-                            logging.error(f"[GuildEvents - event_reminder_cron] Error sending DM to {member_id} in guild {guild.name}: {e}")
-                    else:
-                        logging.warning(f"[GuildEvents - event_reminder_cron] Member {member_id} not found in guild {guild.name}.")
-
-                try:
-                    if reminded:
-                        reminder_template = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_reminder.notification_reminded")
-                        if reminder_template is None:
-                            reminder_template = EVENT_MANAGEMENT.get("event_reminder", {}).get("notification_reminded", {}).get("en-US", 
-                                "## :bell: Event Reminder\nFor event **{event}**\n({event_link})\n\n{len} member(s) were reminded: {members}"
-                            )
-                        try:
-                            reminder_msg = reminder_template.format(event=event["name"], event_link=event_link, len=len(reminded), members=", ".join(reminded))
-                        except Exception as e:
-                            logging.error(f"[GuildEvents - event_reminder_cron] Error formatting reminder template: {e}", exc_info=True)
-                            reminder_msg = f"Reminder: {event['name']} - {event_link}"
-                        result = f"For event **{event['name']}** in guild {guild.name}: {len(reminded)} member(s) reminded: " + ", ".join(reminded)
-                        await notifications_channel.send(reminder_msg)
-                        overall_results.append(result)
-                    else:
-                        reminder_template = await get_guild_message(self.bot, guild_id, EVENT_MANAGEMENT, "event_reminder.notification_all_OK")
-                        if reminder_template is None:
-                            reminder_template = EVENT_MANAGEMENT.get("event_reminder", {}).get("notification_all_OK", {}).get("en-US", 
-                                "## :bell: Event Reminder\nFor event **{event}**\n({event_link})\n\nAll members have responded."
-                            )
-                        try:
-                            reminder_msg = reminder_template.format(event=event["name"], event_link=event_link)
-                        except Exception as e:
-                            logging.error(f"[GuildEvents - event_reminder_cron] Error formatting 'all OK' reminder template: {e}", exc_info=True)
-                            reminder_msg = f"Reminder: {event['name']} - {event_link}"
-                        result = f"For event **{event['name']}** in guild {guild.name}, all members have responded."
-                        await notifications_channel.send(reminder_msg)
-                        overall_results.append(result)
-                except Exception as e:
-                    logging.error(f"[GuildEvents - event_reminder_cron] Error sending reminder message in guild {guild.name}: {e}", exc_info=True)
-                    overall_results.append(f"{guild.name}: Error sending reminder.")
-        logging.info("Reminder results:\n" + "\n".join(overall_results))
-
-    async def event_close_cron(self) -> None:
+                        logging.error(f"[GuildEvents - event_reminder_cron] Error formatting 'all OK' reminder template: {e}", exc_info=True)
+                        reminder_msg = f"Reminder: {event['name']} - {event_link}"
+                    result = f"For event **{event['name']}** in guild {guild.name}, all members have responded."
+                    await notifications_channel.send(reminder_msg)
+                    overall_results.append(result)
+            except Exception as e:
+                logging.error(f"[GuildEvents - event_reminder_cron] Error sending reminder message in guild {guild.name}: {e}", exc_info=True)
+                overall_results.append(f"{guild.name}: Error sending reminder.")
+        return overall_results
+
+    async def event_close_cron(self, due: Dict[int, Set[int]]) -> None:
         """
         Automated task to close events and process registrations.
         
+        The event timeline only hands out close transitions inside the close
+        window, so every due event that is still planned or confirmed is closed.
+        
         Args:
-            None
+            due: {guild_id: {event_id}} of the events whose close transition is due
             
         Returns:
             None
         """
-        tz = pytz.timezone("Europe/Paris")
-        now = datetime.now(tz)
-
-        for guild in self.bot.guilds:
+        for guild in self._due_guilds(due):
             guild_id = guild.id
             closed_events_to_update = []
 
@@ -1522,90 +1934,48 @@ class GuildEvents(commands.Cog):
 
             guild_lang = settings.get("guild_lang") or "en-US"
 
-            guild_events = await self.get_all_guild_events(guild_id)
+            guild_events = self._filter_due_events(await self.get_all_guild_events(guild_id), guild_id, due)
             for ev in guild_events:
-                try:
-                    if isinstance(ev["event_date"], str):
-                        event_date = datetime.strptime(ev["event_date"], "%Y-%m-%d").date()
-                    else:
-                        event_date = ev["event_date"]
-                    if isinstance(ev["event_time"], str):
-                        time_str = ev["event_time"][:5]
-                        event_time = datetime.strptime(time_str, "%H:%M").time()
-                    elif isinstance(ev["event_time"], timedelta):
-                        total_seconds = int(ev["event_time"].total_seconds())
-                        hours = total_seconds // 3600
-                        minutes = (total_seconds % 3600) // 60
-                        event_time = dt_time(hours, minutes)
-                    elif isinstance(ev["event_time"], dt_time):
-                        event_time = ev["event_time"]
-                    elif isinstance(ev["event_time"], datetime):
-                        event_time = ev["event_time"].time()
-                    else:
-                        logging.warning(f"[GuildEvents CRON] Unknown time type for event {ev['event_id']}. Defaulting to '21:00'.")
-                        event_time = datetime.strptime("21:00", "%H:%M").time()
-
-                    start_dt = tz.localize(datetime.combine(event_date, event_time))
-                except Exception as e:
-                    logging.error(f"[GuildEvents CRON] Error parsing event {ev['event_id']}: {e}", exc_info=True)
+                if (ev.get("status") or "").strip().lower() not in ("confirmed", "planned"):
+                    logging.debug(f"[GuildEvents CRON] Event {ev['event_id']} is no longer open, not closing it.")
                     continue
 
-                time_diff = start_dt - now
-                time_condition = timedelta(minutes=-60) <= time_diff <= timedelta(minutes=15)
-                status_condition = ev.get("status", "").strip().lower() in ["confirmed", "planned"]
-                
-                logging.debug(f"[GuildEvents CRON] Event {ev['event_id']}: time_diff={time_diff}, condition={time_condition and status_condition}")
-                
-                if time_condition and status_condition:
-                    closed_localized = EVENT_MANAGEMENT["events_infos"]["status_closed"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["status_closed"].get("en-US"))
-                    closed_db = "Closed"
-                    try:
-                        msg = await events_channel.fetch_message(ev["event_id"])
-                    except Exception as e:
-                        logging.error(f"[GuildEvents CRON] Error fetching message for event {ev['event_id']}: {e}", exc_info=True)
-                        continue
-
-                    if msg.embeds:
-                        embed = msg.embeds[0]
-                        new_fields = []
-                        for field in embed.fields:
-                            expected_field_name = EVENT_MANAGEMENT["events_infos"]["status"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["status"].get("en-US"))
-                            if field.name.lower() == expected_field_name.lower():
-                                new_fields.append({"name": field.name, "value": closed_localized, "inline": field.inline})
-                            else:
-                                new_fields.append({"name": field.name, "value": field.value, "inline": field.inline})
-                        embed.clear_fields()
-                        for field in new_fields:
-                            embed.add_field(name=field["name"], value=field["value"], inline=field["inline"])
+                closed_db = "Closed"
+                try:
+                    async with self.event_locks.lock((guild_id, ev["event_id"])):
+                        current = await self.get_event_from_cache(guild_id, ev["event_id"]) or self._normalize_event_record(ev)
+                        closed_view = {**current, "status": closed_db}
+                        layout = current.get("embed_layout")
+                        if layout and (current.get("status") or "").strip().lower() == "confirmed":
+                            closed_view["embed_layout"] = {**layout, "color": discord.Color.green().value}
+                        closed_layout = closed_view.get("embed_layout")
+
+                        await self.update_event_embed(events_channel, closed_view)
+                        closed = await self.update_event_in_cache(guild_id, ev["event_id"], lambda record: record.update(status=closed_db, embed_layout=closed_layout))
+                        self.schedule_event_transitions(guild_id, closed)
+                    snapshot = json.dumps(thaw(current.get("registrations") or {"presence": [], "tentative": [], "absence": []}))
+                    closed_events_to_update.append((closed_db, snapshot, guild_id, ev["event_id"]))
+                    ev["status"] = closed_db
+                    logging.info(f"[GuildEvents CRON] Event {ev['event_id']} marked as Closed.")
+                    await events_channel.get_partial_message(ev["event_id"]).clear_reactions()
+                    logging.info(f"[GuildEvents CRON] Reactions cleared for event {ev['event_id']}.")
+                    await self.create_groups(guild_id, ev["event_id"])
+                        
+                    attendance_cog = self.bot.get_cog("GuildAttendance")
+                    if attendance_cog:
                         try:
-                            await msg.edit(embed=embed)
-                            closed_events_to_update.append((closed_db, guild_id, ev["event_id"]))
-                            ev["status"] = closed_db
-                            logging.info(f"[GuildEvents CRON] Event {ev['event_id']} marked as Closed.")
-                            await msg.clear_reactions()
-                            logging.info(f"[GuildEvents CRON] Reactions cleared for event {ev['event_id']}.")
-                            await self.create_groups(guild_id, ev["event_id"])
-                            
-                            attendance_cog = self.bot.get_cog("GuildAttendance")
-                            if attendance_cog:
-                                try:
-                                    await attendance_cog.process_event_registrations(guild_id, ev["event_id"], ev)
-                                    logging.debug(f"[GuildEvents CRON] Registrations processed for event {ev['event_id']}")
-                                except Exception as e:
-                                    logging.error(f"[GuildEvents CRON] Error processing registrations for event {ev['event_id']}: {e}", exc_info=True)
+                            await attendance_cog.process_event_registrations(guild_id, ev["event_id"], ev)
+                            logging.debug(f"[GuildEvents CRON] Registrations processed for event {ev['event_id']}")
                         except Exception as e:
-                            logging.error(f"[GuildEvents CRON] Error updating event {ev['event_id']}: {e}", exc_info=True)
+                            logging.error(f"[GuildEvents CRON] Error processing registrations for event {ev['event_id']}: {e}", exc_info=True)
+                except Exception as e:
+                    logging.error(f"[GuildEvents CRON] Error updating event {ev['event_id']}: {e}", exc_info=True)
 
             if closed_events_to_update:
                 try:
-                    event_ids = [str(item[2]) for item in closed_events_to_update]
-                    placeholders = ",".join(["%s"] * len(event_ids))
-                    update_query = f"UPDATE events_data SET status = %s WHERE guild_id = %s AND event_id IN ({placeholders})"
-                    params = [closed_events_to_update[0][0], guild_id] + event_ids
-                    await self.bot.run_db_query(update_query, params, commit=True)
+                    update_query = "UPDATE events_data SET status = %s, registrations = %s WHERE guild_id = %s AND event_id = %s"
+                    await run_db_transaction([(update_query, params) for params in closed_events_to_update])
                     logging.debug(f"[GuildEvents CRON] Batch updated {len(closed_events_to_update)} events to Closed status for guild {guild_id}")
-
-                        
                 except Exception as e:
                     logging.error(f"[GuildEvents CRON] Error batch updating event statuses for guild {guild_id}: {e}", exc_info=True)
 
@@ -1652,128 +2022,8 @@ class GuildEvents(commands.Cog):
                     f"entries, {len(missing)} missing.")
         return classes, missing
 
-    @staticmethod
-    def _get_optimal_grouping(n: int, min_size: int = 4, max_size: int = 6) -> "list[int]":
-        """
-        Calculate optimal group sizes for a given number of participants.
-        
-        Args:
-            n: Total number of participants
-            min_size: Minimum group size (default: 4)
-            max_size: Maximum group size (default: 6)
-            
-        Returns:
-            List of integers representing optimal group sizes
-        """
-        logging.debug(f"[Guild_Events - GetOptimalGrouping] Start – n={n}, min={min_size}, max={max_size}")
-        possible = []
-        try:
-            for k in range(math.ceil(n/max_size), n // min_size + 1):
-                base  = n // k
-                extra = n % k
-                if base < min_size or base + 1 > max_size:
-                    continue
-                grouping = [base+1]*extra + [base]*(k-extra)
-                possible.append((k, grouping))
-
-            if not possible:
-                k = math.ceil(n/max_size)
-                base  = n // k
-                extra = n % k
-                result = [base+1]*extra + [base]*(k-extra)
-                logging.debug(f"[Guild_Events - GetOptimalGrouping] Fallback result → {result}")
-                return result
-
-            possible.sort(key=lambda t: (sum(1 for s in t[1] if s == max_size), -t[0]),
-                        reverse=True)
-            result = possible[0][1]
-            logging.debug(f"[Guild_Events - GetOptimalGrouping] Best result → {result}")
-            return result
-        except Exception as exc:
-            logging.exception("[Guild_Events - GetOptimalGrouping] Unexpected error.", exc_info=exc)
-            return [min_size] * math.ceil(n / min_size)
-
-    def _calculate_gs_ranges(self, members_data: List[Dict]) -> List[Tuple[int, int]]:
-        """
-        Calculate gear score ranges for balanced grouping.
-        
-        Args:
-            members_data: List of dictionaries containing member information including GS
-            
-        Returns:
-            List of tuples representing gear score ranges (min, max)
-        """
-        gs_values = []
-        for member in members_data:
-            try:
-                gs_str = member.get("GS", "0")
-                if isinstance(gs_str, str) and gs_str.lower() in ["n/a", "na", "", "unknown"]:
-                    continue
-                gs = int(float(gs_str))
-                if gs > 0:
-                    gs_values.append(gs)
-            except (ValueError, TypeError):
-                continue
-        
-        if len(gs_values) < 2:
-            return [(0, 10000)]
-        
-        gs_values.sort()
-        min_gs, max_gs = gs_values[0], gs_values[-1]
-        
-        total_members = len(gs_values)
-        gs_spread = max_gs - min_gs
-        
-        if total_members < 10:
-            tolerance = max(gs_spread * 0.4, 200)
-        elif total_members < 30:
-            tolerance = max(gs_spread * 0.25, 150)
-        else:
-            std_dev = statistics.stdev(gs_values) if len(gs_values) > 1 else 100
-            tolerance = min(std_dev * 1.2, 200)
-        
-        ranges = []
-        current_min = min_gs
-        
-        while current_min < max_gs:
-            range_max = min(current_min + tolerance, max_gs)
-            ranges.append((int(current_min), int(range_max)))
-            current_min = range_max - (tolerance * 0.1)
-            
-            if len(ranges) >= 5:
-                break
-        
-        logging.debug(f"[GuildEvents - GS Ranges] Calculated ranges for {total_members} members: {ranges}")
-        return ranges
-
-    def _get_member_gs_range(self, member_gs, gs_ranges: List[Tuple[int, int]]) -> int:
-        """
-        Determine which gear score range a member belongs to.
-        
-        Args:
-            member_gs: Member's gear score value
-            gs_ranges: List of gear score range tuples
-            
-        Returns:
-            Integer index of the appropriate gear score range
-        """
-        try:
-            if isinstance(member_gs, str) and member_gs.lower() in ["n/a", "na", ""]:
-                return 0
-            gs = int(float(member_gs))
-            for i, (min_gs, max_gs) in enumerate(gs_ranges):
-                if min_gs <= gs <= max_gs:
-                    return i
-            for i, (min_gs, max_gs) in enumerate(gs_ranges):
-                if gs < min_gs:
-                    return i
-                if gs > max_gs and i == len(gs_ranges) - 1:
-                    return i
-        except (ValueError, TypeError):
-            pass
-        return 0
-
-    async def _format_static_group_members(self, member_ids: List[int], guild_obj, absent_text: str) -> List[str]:
+    async def _format_static_group_members(self, member_ids: List[int], guild_obj, absent_text: str,
+                                           guild_members_cache: Optional[Dict] = None) -> List[str]:
         """
         Format static group members for display with class icons and status.
         
@@ -1781,13 +2031,15 @@ class GuildEvents(commands.Cog):
             member_ids: List of Discord member IDs
             guild_obj: Discord guild object
             absent_text: Text to display for absent members
+            guild_members_cache: Roster cache to read from (optional, loaded if omitted)
             
         Returns:
             List of formatted member strings with class icons and names
         """
         member_info_list = []
 
-        guild_members_cache = await self.bot.cache.get('roster_data', 'guild_members') or {}
+        if guild_members_cache is None:
+            guild_members_cache = await self.bot.cache.get_guild_roster(guild_obj.id) if guild_obj else {}
 
         for member_id in member_ids:
             member = guild_obj.get_member(member_id) if guild_obj else None
@@ -1848,452 +2100,132 @@ class GuildEvents(commands.Cog):
         
         return formatted_members
 
-    def _calculate_member_score(self, member: Dict, target_class: str, target_gs_range: int, 
-                               gs_ranges: List[Tuple[int, int]], is_tentative: bool = False) -> float:
-        """
-        Calculate a score for how well a member fits a target group position.
-        
-        Args:
-            member: Dictionary containing member information
-            target_class: Target class for the position
-            target_gs_range: Target gear score range index
-            gs_ranges: List of gear score range tuples
-            is_tentative: Whether the member is tentative (default: False)
-            
-        Returns:
-            Float score representing member fit (higher is better)
+    async def _assign_groups_enhanced(self, guild_id: int, presence_ids: List[int], tentative_ids: List[int], roster_data: Dict,
+                                      static_groups: Optional[Dict] = None, ideal_staff: Optional[Dict] = None) -> List[List[Dict]]:
         """
-        score = 0.0
-        
-        if member.get("class") == target_class:
-            score += 0.7
-        elif target_class in ["Melee DPS", "Ranged DPS"] and member.get("class") in ["Melee DPS", "Ranged DPS"]:
-            score += 0.5
-        elif member.get("class") in ["Melee DPS", "Ranged DPS", "Flanker"]:
-            score += 0.3
+        Assign members to balanced groups with the group engine.
         
-        member_gs_range = self._get_member_gs_range(member.get("GS", 0), gs_ranges)
-        if member_gs_range == target_gs_range:
-            score += 0.2
-        elif abs(member_gs_range - target_gs_range) == 1:
-            score += 0.1
-        
-        if not is_tentative:
-            score += 0.1
-        else:
-            score += 0.05
-        
-        return score
-
-    async def _assign_groups_enhanced(self, guild_id: int, presence_ids: List[int], tentative_ids: List[int], roster_data: Dict) -> List[List[Dict]]:
-        """
-        Assign members to balanced groups using enhanced algorithm with gear score and class balancing.
+        Static groups and ideal staff are read from the cache unless given;
+        the assignment itself runs in the engine, off the event loop for
+        large events.
         
         Args:
             guild_id: Discord guild ID
             presence_ids: List of confirmed participant IDs
             tentative_ids: List of tentative participant IDs
             roster_data: Dictionary containing member roster information
+            static_groups: Static groups of the guild (optional)
+            ideal_staff: Ideal staff composition of the guild (optional)
             
         Returns:
             List of groups, where each group is a list of member dictionaries
         """
-        logging.info("[GuildEvents - Groups Enhanced] Starting enhanced group assignment")
-        
-        all_inscribed = set(presence_ids + tentative_ids)
-        final_groups = []
-        used_members = set()
-        incomplete_static_groups = []
-        
-        def get_member_info(uid: int, tentative: bool = False):
-            """
-            Get formatted member information for event display.
-            
-            Args:
-                uid: Discord user ID
-                tentative: Whether the member is tentative (default: False)
-                
-            Returns:
-                Dictionary with member information and tentative status, None if not found
-            """
-            info = roster_data["members"].get(str(uid))
-            if not info:
-                return None
-            return {**info, "tentative": tentative, "user_id": uid}
-        
-        all_members_data = [info for uid in all_inscribed if (info := get_member_info(uid)) is not None]
-        gs_ranges = self._calculate_gs_ranges(all_members_data)
-        logging.info(f"[GuildEvents - Groups Enhanced] GS ranges calculated: {gs_ranges}")
-        
-        logging.info("[GuildEvents - Groups Enhanced] Step 1: Processing static groups (complete or N-1)")
-        
-        static_groups = await self.get_static_groups_data(guild_id)
-        for group_name, group_data in static_groups.items():
-            member_ids = group_data["member_ids"]
-            configured_count = len(member_ids)
-            present_members = [mid for mid in member_ids if mid in presence_ids and mid not in used_members]
-            present_count = len(present_members)
-            
-            logging.debug(f"[GuildEvents - Groups Enhanced] Static '{group_name}': {present_count}/{configured_count} present")
-            
-            if present_count == configured_count or present_count == (configured_count - 1):
-                group_members = []
-                for mid in present_members:
-                    is_tentative = mid in tentative_ids
-                    member_info = get_member_info(mid, is_tentative)
-                    if member_info:
-                        group_members.append(member_info)
-                        used_members.add(mid)
-                
-                if group_members:
-                    incomplete_static_groups.append({
-                        "name": group_name,
-                        "members": group_members,
-                        "missing_slots": 6 - len(group_members),
-                        "original_ids": member_ids
-                    })
-                    logging.info(f"[GuildEvents - Groups Enhanced] Static '{group_name}' created with {len(group_members)}/6 members")
-            else:
-                logging.debug(f"[GuildEvents - Groups Enhanced] Static '{group_name}' not eligible ({present_count}/{configured_count})")
+        if static_groups is None:
+            static_groups = await self.get_static_groups_data(guild_id)
+        if ideal_staff is None:
+            ideal_staff = await self.get_ideal_staff_data(guild_id)
+        return await self.group_engine.assign_async(
+            presence_ids, tentative_ids, roster_data.get("members", {}), static_groups, ideal_staff
+        )
 
-        logging.info("[GuildEvents - Groups Enhanced] Step 2: Completing static groups")
+    async def _build_group_roster(self, guild, member_ids: List[int]) -> Dict:
+        """
+        Build the grouping roster of the registered members still in the guild.
         
-        for static_group in incomplete_static_groups:
-            if static_group["missing_slots"] > 0:
-                existing_classes = [m["class"] for m in static_group["members"]]
-                missing_classes = []
-
-                if len(static_group["members"]) == (len(static_group["original_ids"]) - 1):
-                    missing_id = [mid for mid in static_group["original_ids"] if mid not in [m["user_id"] for m in static_group["members"]]][0]
-                    missing_info = get_member_info(missing_id)
-                    if missing_info:
-                        missing_classes.append(missing_info["class"])
-
-                essential_classes = ["Tank", "Healer"]
-                for essential in essential_classes:
-                    if essential not in existing_classes:
-                        missing_classes.append(essential)
-
-                available_members = [uid for uid in all_inscribed if uid not in used_members and uid not in static_group["original_ids"]]
-                
-                for _ in range(static_group["missing_slots"]):
-                    best_candidate = None
-                    best_score = 0
-                    
-                    for uid in available_members:
-                        member_info = get_member_info(uid, uid in tentative_ids)
-                        if not member_info:
-                            continue
-
-                        if missing_classes and member_info["class"] in missing_classes:
-                            score = self._calculate_member_score(
-                                member_info, missing_classes[0], 0, gs_ranges, uid in tentative_ids
-                            )
-                        else:
-                            score = self._calculate_member_score(
-                                member_info, "Melee DPS", 0, gs_ranges, uid in tentative_ids
-                            )
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_candidate = uid
-                    
-                    if best_candidate:
-                        member_info = get_member_info(best_candidate, best_candidate in tentative_ids)
-                        static_group["members"].append(member_info)
-                        used_members.add(best_candidate)
-                        available_members.remove(best_candidate)
-                        static_group["missing_slots"] -= 1
-                        
-                        if missing_classes and member_info and member_info.get("class") in missing_classes:
-                            missing_classes.remove(member_info["class"])
-                        
-                        if member_info:
-                            logging.info(f"[GuildEvents - Groups Enhanced] Added {member_info.get('class', 'Unknown')} to static '{static_group['name']}'")
+        Args:
+            guild: Discord guild object
+            member_ids: Registered member IDs
             
-            final_groups.append(static_group["members"])
+        Returns:
+            Dictionary with a 'members' mapping of member ID (as string) to pseudo, GS, weapons and class
+        """
+        guild_members_cache = await self.bot.cache.get_guild_roster(guild.id)
+        roster_data = {"members": {}}
+        for member_id in member_ids:
+            member = guild.get_member(member_id)
+            if not member:
+                continue
+            md = guild_members_cache.get((guild.id, member_id), {})
+            roster_data["members"][str(member_id)] = {
+                "pseudo": member.display_name,
+                "GS": md.get("GS", "N/A"),
+                "weapons": md.get("weapons", "N/A"),
+                "class": md.get("class", "Unknown"),
+            }
+        return roster_data
 
-        logging.info("[GuildEvents - Groups Enhanced] Step 3: Creating optimized groups with GS matching")
+    def _group_inputs_version(self, presence_ids: List[int], tentative_ids: List[int], roster_data: Dict,
+                              static_groups: Dict, ideal_staff: Dict) -> str:
+        """
+        Hash every input that can change a group assignment.
         
-        remaining_members = [uid for uid in all_inscribed if uid not in used_members]
-        present_remaining = [uid for uid in remaining_members if uid in presence_ids]
-        tentative_remaining = [uid for uid in remaining_members if uid in tentative_ids]
-
-        gs_buckets = {}
-        for i, gs_range in enumerate(gs_ranges):
-            gs_buckets[i] = {"Tank": [], "Healer": [], "Melee DPS": [], "Ranged DPS": [], "Flanker": []}
-
-        for uid in present_remaining:
-            member_info = get_member_info(uid, False)
-            if member_info:
-                gs_range_idx = self._get_member_gs_range(member_info.get("GS", 0), gs_ranges)
-                if member_info["class"] in gs_buckets[gs_range_idx]:
-                    gs_buckets[gs_range_idx][member_info["class"]].append(member_info)
+        Pseudos and weapons are left out: they only affect display and are
+        read again from the roster when memoized groups are reused.
         
-        for gs_idx in sorted(gs_buckets.keys(), reverse=True):
-            bucket = gs_buckets[gs_idx]
-
-            while len(bucket["Flanker"]) >= 5:
-                flanker_group = bucket["Flanker"][:6] if len(bucket["Flanker"]) >= 6 else bucket["Flanker"][:5]
-                final_groups.append(flanker_group)
-                bucket["Flanker"] = bucket["Flanker"][len(flanker_group):]
-                for member in flanker_group:
-                    used_members.add(member["user_id"])
-                logging.info(f"[GuildEvents - Groups Enhanced] Flanker group formed for GS range {gs_ranges[gs_idx]}")
-
-            while (len(bucket["Tank"]) >= 1 and len(bucket["Healer"]) >= 1):
-                group = []
-
-                tanks_needed = min(2, len(bucket["Tank"]))
-                healers_needed = min(2, len(bucket["Healer"]))
-                
-                for _ in range(tanks_needed):
-                    if bucket["Tank"]:
-                        member = bucket["Tank"].pop(0)
-                        group.append(member)
-                        used_members.add(member["user_id"])
-                
-                for _ in range(healers_needed):
-                    if bucket["Healer"]:
-                        member = bucket["Healer"].pop(0)
-                        group.append(member)
-                        used_members.add(member["user_id"])
-
-                remaining_slots = 6 - len(group)
-                dps_classes = ["Melee DPS", "Ranged DPS", "Flanker"]
-                
-                for dps_class in dps_classes:
-                    while remaining_slots > 0 and bucket[dps_class]:
-                        member = bucket[dps_class].pop(0)
-                        group.append(member)
-                        used_members.add(member["user_id"])
-                        remaining_slots -= 1
-                
-                if len(group) >= 4:
-                    final_groups.append(group)
-                    logging.info(f"[GuildEvents - Groups Enhanced] Optimized group formed for GS range {gs_ranges[gs_idx]} with {len(group)} members")
-                else:
-                    for member in group:
-                        used_members.discard(member["user_id"])
-                        bucket[member["class"]].append(member)
-                    break
+        Args:
+            presence_ids: Confirmed participant IDs
+            tentative_ids: Tentative participant IDs
+            roster_data: Grouping roster
+            static_groups: Static groups of the guild
+            ideal_staff: Ideal staff composition of the guild
+            
+        Returns:
+            Hex digest identifying the inputs
+        """
+        members = roster_data.get("members", {})
+        snapshot = (
+            self.group_engine.mode,
+            tuple(presence_ids),
+            tuple(tentative_ids),
+            tuple((uid, info.get("class"), str(info.get("GS"))) for uid, info in sorted(members.items())),
+            tuple((name, tuple(data.get("member_ids", ()))) for name, data in static_groups.items()),
+            tuple(sorted(ideal_staff.items())),
+        )
+        return hashlib.sha256(repr(snapshot).encode()).hexdigest()
 
-        for uid in tentative_remaining:
-            if uid not in used_members:
-                member_info = get_member_info(uid, True)
-                if member_info and final_groups:
-                    best_group = None
-                    best_score = 0
-                    
-                    for group in final_groups:
-                        if len(group) < 6:
-                            valid_gs_values = [int(m.get("GS", 0)) for m in group if m.get("GS", "0").isdigit()]
-                            group_gs_avg = sum(valid_gs_values) / len(valid_gs_values) if valid_gs_values else 0
-                            gs_range_idx = self._get_member_gs_range(group_gs_avg, gs_ranges)
-                            score = self._calculate_member_score(member_info, "Melee DPS", gs_range_idx, gs_ranges, True)
-                            
-                            if score > best_score:
-                                best_score = score
-                                best_group = group
-                    
-                    if best_group:
-                        best_group.append(member_info)
-                        used_members.add(uid)
-                        logging.info(f"[GuildEvents - Groups Enhanced] Added tentative {member_info['class']} to optimized group")
-
-        logging.info("[GuildEvents - Groups Enhanced] Step 4: Creating non-optimized groups")
-        
-        remaining_members = [uid for uid in all_inscribed if uid not in used_members]
-        
-        while len(remaining_members) >= 4:
-            group = []
-
-            for uid in remaining_members[:6]:
-                member_info = get_member_info(uid, uid in tentative_ids)
-                if member_info:
-                    group.append(member_info)
-                    used_members.add(uid)
-            
-            remaining_members = [uid for uid in remaining_members if uid not in used_members]
-            
-            if len(group) >= 4:
-                final_groups.append(group)
-                logging.info(f"[GuildEvents - Groups Enhanced] Non-optimized group formed with {len(group)} members")
-
-        logging.info("[GuildEvents - Groups Enhanced] Step 5: Final redistribution")
-        
-        final_remaining = [uid for uid in all_inscribed if uid not in used_members]
-
-        for uid in final_remaining[:]:
-            member_info = get_member_info(uid, uid in tentative_ids)
-            if member_info:
-                for group in final_groups:
-                    if len(group) < 6:
-                        group.append(member_info)
-                        used_members.add(uid)
-                        final_remaining.remove(uid)
-                        logging.info(f"[GuildEvents - Groups Enhanced] Added remaining member to existing group")
-                        break
-
-        if final_remaining:
-            last_group = []
-            for uid in final_remaining:
-                member_info = get_member_info(uid, uid in tentative_ids)
-                if member_info:
-                    last_group.append(member_info)
-                    used_members.add(uid)
-            
-            if last_group:
-                final_groups.append(last_group)
-                logging.info(f"[GuildEvents - Groups Enhanced] Final isolation group formed with {len(last_group)} members")
-        
-        logging.info(f"[GuildEvents - Groups Enhanced] Completed: {len(final_groups)} groups formed with enhanced logic")
-        return final_groups
-
-    def _assign_groups_legacy(self, presence_ids: "list[int]", tentative_ids: "list[int]", roster_data: dict) -> "list[list[dict]]":
-        """
-        Assign members to groups using legacy algorithm for backward compatibility.
+    async def _get_event_groups(self, guild_id: int, event_id: int, presence_ids: List[int], tentative_ids: List[int],
+                                roster_data: Dict) -> List[List[Dict]]:
+        """
+        Get the group assignment of an event, reusing the memoized one when its inputs are unchanged.
+        
+        The assignment is stored with the cached event as member IDs under
+        the version of its inputs; any change to registrations, the class or
+        GS of a registrant, static groups or ideal staff gives a new version
+        and the groups are computed again.
         
         Args:
-            presence_ids: List of confirmed participant IDs
-            tentative_ids: List of tentative participant IDs 
-            roster_data: Dictionary containing member roster information
+            guild_id: Discord guild ID
+            event_id: Unique event identifier
+            presence_ids: Confirmed participant IDs
+            tentative_ids: Tentative participant IDs
+            roster_data: Grouping roster of the registered members
             
         Returns:
             List of groups, where each group is a list of member dictionaries
         """
-        logging.debug("[Guild_Events - AssignGroups] Starting group assignment…")
-
-        buckets = {c: [] for c in ("Tank", "Healer",
-                                   "Melee DPS", "Ranged DPS", "Flanker")}
-
-        def _push(uid: int, tentative: bool):
-            """
-            Add a member to the appropriate class bucket for group assignment.
-            
-            Args:
-                uid: Discord user ID
-                tentative: Whether the member is tentative
-                
-            Returns:
-                None
-            """
-            info = roster_data["members"].get(str(uid))
-            if not info:
-                logging.warning(f"[Guild_Events - AssignGroups] UID {uid} missing from roster, skipped.")
-                return
-            try:
-                buckets[info["class"]].append({**info, "tentative": tentative})
-            except KeyError:
-                logging.error(f"[Guild_Events - AssignGroups] Unknown class '{info.get('class')}' for UID {uid}.")
-
-        for uid in presence_ids:
-            _push(uid, False)
-        for uid in tentative_ids:
-            _push(uid, True)
-
-        try:
-            groups = []
-
-            titular_flankers = [m for m in buckets["Flanker"] if not m["tentative"]]
-            if len(titular_flankers) >= 4:
-                grp = titular_flankers[:6]
-                if len(grp) < 6:
-                    extra = [m for m in buckets["Flanker"] if m["tentative"]][:6-len(grp)]
-                    grp.extend(extra)
-                groups.append(grp)
-                used = {id(m) for m in grp}
-                buckets["Flanker"] = [m for m in buckets["Flanker"] if id(m) not in used]
-
-            buckets["Ranged DPS"].extend(buckets.pop("Flanker"))
-
-            sizes = self._get_optimal_grouping(len(presence_ids), 4, 6)
-
-            def _pop(role, titular_first=True):
-                """
-                Remove and return a member from the specified role bucket.
-                
-                Args:
-                    role: Class role to pop from
-                    titular_first: Whether to prioritize confirmed members over tentative (default: True)
-                    
-                Returns:
-                    Member dictionary if found, None otherwise
-                """
-                pool = buckets[role]
-                for i, m in enumerate(pool):
-                    if (titular_first and not m["tentative"]) or not titular_first:
-                        return pool.pop(i)
-                return None
-
-            for size in sizes:
-                grp = []
-                for role in ("Tank", "Healer"):
-                    member = _pop(role) or _pop(role, False)
-                    if member:
-                        grp.append(member)
-
-                for role in ("Melee DPS", "Ranged DPS"):
-                    while len(grp) < size and buckets[role]:
-                        member = _pop(role)
-                        if not member:
-                            break
-                        grp.append(member)
-
-                role_cycle, idx = ("Melee DPS", "Ranged DPS"), 0
-                while len(grp) < size and any(buckets[r] for r in role_cycle):
-                    role = role_cycle[idx % 2]
-                    member = _pop(role) or _pop(role, False)
-                    if member:
-                        grp.append(member)
-                    idx += 1
-
-                groups.append(grp)
-
-            fill_order = ("Healer", "Tank", "Melee DPS", "Ranged DPS")
-
-            def _need_role(g):
-                """
-                Determine which role is most needed for group balance.
-                
-                Args:
-                    g: Current group list of members
-                    
-                Returns:
-                    String role name that is most needed, None if group is balanced
-                """
-                classes = [m["class"] for m in g]
-                if "Healer" not in classes and buckets["Healer"]:
-                    return "Healer"
-                if "Tank" not in classes and buckets["Tank"]:
-                    return "Tank"
-                melee  = sum(c == "Melee DPS"   for c in classes)
-                ranged = sum(c == "Ranged DPS"  for c in classes)
-                if melee > ranged and buckets["Melee DPS"]:
-                    return "Melee DPS"
-                if buckets["Ranged DPS"]:
-                    return "Ranged DPS"
-                return None
-
-            for grp in groups:
-                while len(grp) < 6 and any(buckets[r] for r in fill_order):
-                    role = _need_role(grp) or next(r for r in fill_order if buckets[r])
-                    grp.append(buckets[role].pop(0))
+        static_groups = await self.get_static_groups_data(guild_id)
+        ideal_staff = await self.get_ideal_staff_data(guild_id)
+        version = self._group_inputs_version(presence_ids, tentative_ids, roster_data, static_groups, ideal_staff)
+
+        event = await self.get_event_from_cache(guild_id, event_id) or {}
+        memo = event.get("group_assignment") or {}
+        members = roster_data.get("members", {})
+        if memo.get("version") == version:
+            presence = set(presence_ids)
+            logging.debug(f"[GuildEvents] Reusing memoized groups for event {event_id} in guild {guild_id}")
+            return [
+                [{**members[str(uid)], "tentative": uid not in presence, "user_id": uid} for uid in group]
+                for group in memo.get("groups", ())
+            ]
 
-            remaining = [m for pool in buckets.values() for m in pool]
-            if remaining:
-                comp_sizes = self._get_optimal_grouping(len(remaining), 4, 6)
-                start = 0
-                for cs in comp_sizes:
-                    groups.append(remaining[start:start+cs])
-                    start += cs
+        groups = await self._assign_groups_enhanced(guild_id, presence_ids, tentative_ids, roster_data, static_groups, ideal_staff)
+        assignment = {"version": version, "groups": [[m["user_id"] for m in group] for group in groups]}
 
-            logging.info(f"[Guild_Events - AssignGroups] Finished – {len(groups)} group(s) built.")
-            return groups
+        def store(record):
+            record["group_assignment"] = assignment
 
-        except Exception as exc:
-            logging.exception("[Guild_Events - AssignGroups] Unexpected error during grouping.", exc_info=exc)
-            return []
+        await self.update_event_in_cache(guild_id, event_id, store)
+        return groups
 
     async def create_groups(self, guild_id: int, event_id: int) -> None:
         """
@@ -2335,7 +2267,8 @@ class GuildEvents(commands.Cog):
             logging.error(f"[GuildEvent - Cron Create_Groups] Channels not found (groups/events) for guild {guild_id}")
             return
 
-        event = await self.get_event_from_cache(guild_id, event_id)
+        async with self.event_locks.lock((guild_id, event_id)):
+            event = await self.get_event_from_cache(guild_id, event_id)
         if not event:
             logging.error(f"[GuildEvent - Cron Create_Groups] Event not found for guild {guild_id} and event {event_id}")
             return
@@ -2347,8 +2280,8 @@ class GuildEvents(commands.Cog):
             except (json.JSONDecodeError, ValueError) as e:
                 logging.warning(f"[GuildEvents] Invalid JSON in registrations, using defaults: {e}")
                 registrations = {"presence": [], "tentative": [], "absence": []}
-        presence_ids  = registrations.get("presence", [])
-        tentative_ids = registrations.get("tentative", [])
+        presence_ids  = list(registrations.get("presence", []))
+        tentative_ids = list(registrations.get("tentative", []))
 
         presence_count  = len(presence_ids)
         tentative_count = len(tentative_ids)
@@ -2363,39 +2296,15 @@ class GuildEvents(commands.Cog):
         )
 
         try:
-            roster_data = {"members": {}}
-
-            if hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_bulk_guild_members'):
-                members_data = await self.bot.cache.get_bulk_guild_members(guild_id)
-                for member_id, member_data in members_data.items():
-                    try:
-                        discord_member = guild.get_member(member_id)
-                        if discord_member:
-                            roster_data["members"][str(member_id)] = {
-                                "pseudo": discord_member.display_name,
-                                "GS": member_data.get("GS", "N/A"),
-                                "weapons": member_data.get("weapons", "N/A"),
-                                "class": member_data.get("class", "Unknown"),
-                            }
-                    except Exception:
-                        continue
-            else:
-                for member in guild.members:
-                    md = await self.get_guild_member_data(guild_id, member.id)
-                    roster_data["members"][str(member.id)] = {
-                        "pseudo": member.display_name,
-                        "GS": md.get("GS", "N/A"),
-                        "weapons": md.get("weapons", "N/A"),
-                        "class": md.get("class", "Unknown"),
-                    }
+            roster_data = await self._build_group_roster(guild, presence_ids + tentative_ids)
         except Exception as exc:
             logging.exception("[Guild_Events - CreateGroups] Failed to build roster.", exc_info=exc)
             return
 
         try:
-            all_groups = await self._assign_groups_enhanced(guild_id, presence_ids, tentative_ids, roster_data)
+            all_groups = await self._get_event_groups(guild_id, event_id, presence_ids, tentative_ids, roster_data)
         except Exception as exc:
-            logging.exception("[Guild_Events - CreateGroups] _assign_groups_enhanced crashed.", exc_info=exc)
+            logging.exception("[Guild_Events - CreateGroups] Group assignment crashed.", exc_info=exc)
             return
 
         try:
@@ -2581,16 +2490,6 @@ class GuildEvents(commands.Cog):
             return
 
         description = EVENT_MANAGEMENT["events_infos"]["description"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["description"].get("en-US"))
-        if status.lower() == "confirmed":
-            localized_status = EVENT_MANAGEMENT["events_infos"]["status_confirmed"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["status_confirmed"].get("en-US"))
-        else:
-            localized_status = EVENT_MANAGEMENT["events_infos"]["status_planned"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["status_planned"].get("en-US"))
-        event_present = EVENT_MANAGEMENT["events_infos"]["present"].get(guild_lang,EVENT_MANAGEMENT["events_infos"]["present"].get("en-US"))
-        event_attempt = EVENT_MANAGEMENT["events_infos"]["attempt"].get(guild_lang,EVENT_MANAGEMENT["events_infos"]["attempt"].get("en-US"))
-        event_absence = EVENT_MANAGEMENT["events_infos"]["absence"].get(guild_lang,EVENT_MANAGEMENT["events_infos"]["absence"].get("en-US"))
-        event_voice_channel = EVENT_MANAGEMENT["events_infos"]["voice_channel"].get(guild_lang,EVENT_MANAGEMENT["events_infos"]["voice_channel"].get("en-US"))
-        event_groups = EVENT_MANAGEMENT["events_infos"]["groups"].get(guild_lang,EVENT_MANAGEMENT["events_infos"]["groups"].get("en-US"))
-        event_auto_grouping = EVENT_MANAGEMENT["events_infos"]["auto_grouping"].get(guild_lang,EVENT_MANAGEMENT["events_infos"]["auto_grouping"].get("en-US"))
         channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels')
         conference_channel = guild.get_channel(channels_data.get("voice_war_channel")) if channels_data else None
         events_channel = guild.get_channel(channels_data.get("events_channel")) if channels_data else None
@@ -2601,20 +2500,14 @@ class GuildEvents(commands.Cog):
             return
 
         embed_color = discord.Color.green() if status.lower() == "confirmed" else discord.Color.blue()
-        embed = discord.Embed(title=event_name, description=description, color=embed_color)
-        embed.add_field(name=EVENT_MANAGEMENT["events_infos"]["date"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["date"].get("en-US")), value=event_date, inline=True)
-        embed.add_field(name=EVENT_MANAGEMENT["events_infos"]["hour"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["hour"].get("en-US")), value=event_time, inline=True)
-        embed.add_field(name=EVENT_MANAGEMENT["events_infos"]["duration"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["duration"].get("en-US")), value=str(duration), inline=True)
-        embed.add_field(name=EVENT_MANAGEMENT["events_infos"]["status"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["status"].get("en-US")), value=localized_status, inline=True)
-        embed.add_field(name=EVENT_MANAGEMENT["events_infos"]["dkp_v"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["dkp_v"].get("en-US")), value=str(dkp_value), inline=True)
-        embed.add_field(name=EVENT_MANAGEMENT["events_infos"]["dkp_i"].get(guild_lang, EVENT_MANAGEMENT["events_infos"]["dkp_i"].get("en-US")), value=str(dkp_ins), inline=True)
-        none_text = EVENT_MANAGEMENT["events_infos"]["none"].get(guild_lang, "None")
-        embed.add_field(name=f"{event_present} <:_yes_:1340109996666388570> (0)", value=none_text, inline=False)
-        embed.add_field(name=f"{event_attempt} <:_attempt_:1340110058692018248> (0)", value=none_text, inline=False)
-        embed.add_field(name=f"{event_absence} <:_no_:1340110124521357313> (0)", value=none_text, inline=False)
         conference_link = f"https://discord.com/channels/{guild.id}/{conference_channel.id}"
-        embed.add_field(name=event_voice_channel, value=f"[🏹 WAR]({conference_link})", inline=False)
-        embed.add_field(name=event_groups, value=event_auto_grouping, inline=False)
+        embed_layout = self._build_event_layout(
+            guild_lang, description, embed_color, event_date, event_time, duration, dkp_value, dkp_ins, conference_link
+        )
+        embed = self.render_event_embed(
+            {"event_id": None, "name": event_name, "status": status, "registrations": EMPTY_REGISTRATIONS},
+            guild_lang, embed_layout
+        )
 
         try:
             if status.lower() == "confirmed":
@@ -2681,7 +2574,8 @@ class GuildEvents(commands.Cog):
             "status": status,
             "initial_members": json.dumps(initial_members),
             "registrations": json.dumps({"presence": [], "tentative": [], "absence": []}),
-            "actual_presence": json.dumps([])
+            "actual_presence": json.dumps([]),
+            "embed_layout": json.dumps(embed_layout)
         }
         query = """
         INSERT INTO events_data (
@@ -2697,7 +2591,8 @@ class GuildEvents(commands.Cog):
             status,
             initial_members,
             registrations,
-            actual_presence
+            actual_presence,
+            embed_layout
         ) VALUES (
             %(guild_id)s,
             %(event_id)s,
@@ -2711,7 +2606,8 @@ class GuildEvents(commands.Cog):
             %(status)s,
             %(initial_members)s,
             %(registrations)s,
-            %(actual_presence)s
+            %(actual_presence)s,
+            %(embed_layout)s
         )
         ON DUPLICATE KEY UPDATE
             game_id = VALUES(game_id),
@@ -2724,11 +2620,13 @@ class GuildEvents(commands.Cog):
             status = VALUES(status),
             initial_members = VALUES(initial_members),
             registrations = VALUES(registrations),
-            actual_presence = VALUES(actual_presence)
+            actual_presence = VALUES(actual_presence),
+            embed_layout = VALUES(embed_layout)
         """
         try:
             await self.bot.run_db_query(query, record, commit=True)
             await self.set_event_in_cache(guild.id, announcement.id, record)
+            self.schedule_event_transitions(guild.id, record)
             logging.info(f"[GuildEvents - event_create] Event saved in DB successfully: {announcement.id}")
 
             
@@ -2776,7 +2674,7 @@ class GuildEvents(commands.Cog):
             query = "INSERT INTO guild_static_groups (guild_id, group_name, leader_id) VALUES (%s, %s, %s)"
             await self.bot.run_db_query(query, (guild_id, group_name, leader_id), commit=True)
 
-            await self.bot.cache_loader.reload_category('static_groups')
+            await self.bot.cache_loader.reload_category('static_groups', guild_id)
             
             success_msg = STATIC_GROUPS["static_create"]["messages"]["success"].get(guild_lang, STATIC_GROUPS["static_create"]["messages"]["success"].get("en-US")).format(group_name=group_name)
             await ctx.followup.send(success_msg, ephemeral=True)
@@ -2854,7 +2752,7 @@ class GuildEvents(commands.Cog):
             query = "INSERT INTO guild_static_members (group_id, member_id, position_order) VALUES (%s, %s, %s)"
             await self.bot.run_db_query(query, (group_id, member.id, position), commit=True)
 
-            await self.bot.cache_loader.reload_category('static_groups')
+            await self.bot.cache_loader.reload_category('static_groups', guild_id)
             
             member_count = len(current_members) + 1
             success_msg = STATIC_GROUPS["static_add"]["messages"]["success"].get(guild_lang, STATIC_GROUPS["static_add"]["messages"]["success"].get("en-US")).format(member=member.mention, group_name=group_name, count=member_count)
@@ -2922,7 +2820,7 @@ class GuildEvents(commands.Cog):
             query = "DELETE FROM guild_static_members WHERE group_id = %s AND member_id = %s"
             await self.bot.run_db_query(query, (group_id, member.id), commit=True)
 
-            await self.bot.cache_loader.reload_category('static_groups')
+            await self.bot.cache_loader.reload_category('static_groups', guild_id)
             
             member_count = len(current_members) - 1
             success_msg = STATIC_GROUPS["static_remove"]["messages"]["success"].get(guild_lang, STATIC_GROUPS["static_remove"]["messages"]["success"].get("en-US")).format(member=member.mention, group_name=group_name, count=member_count)
@@ -2988,8 +2886,8 @@ class GuildEvents(commands.Cog):
                 logging.warning(f"[GuildEvents] Invalid JSON in registrations, using defaults: {e}")
                 registrations = {"presence": [], "tentative": [], "absence": []}
         
-        presence_ids = registrations.get("presence", [])
-        tentative_ids = registrations.get("tentative", [])
+        presence_ids = list(registrations.get("presence", []))
+        tentative_ids = list(registrations.get("tentative", []))
         
         if not presence_ids and not tentative_ids:
             error_msg = await get_user_message(ctx, STATIC_GROUPS, "preview_groups.messages.no_registrations")
@@ -2997,20 +2895,7 @@ class GuildEvents(commands.Cog):
             return
 
         try:
-            guild_members_cache = await self.bot.cache.get('roster_data', 'guild_members') or {}
-            logging.debug(f"[GuildEvents] preview_groups: Guild members cache contains {len(guild_members_cache)} entries")
-            
-            roster_data = {"members": {}}
-            for member in ctx.guild.members:
-                key = (guild_id, member.id)
-                md = guild_members_cache.get(key, {})
-                logging.debug(f"[GuildEvents] preview_groups: Member {member.id} data: {md}")
-                roster_data["members"][str(member.id)] = {
-                    "pseudo": member.display_name,
-                    "GS": md.get("GS", "N/A"),
-                    "weapons": md.get("weapons", "N/A"),
-                    "class": md.get("class", "Unknown"),
-                }
+            roster_data = await self._build_group_roster(ctx.guild, presence_ids + tentative_ids)
         except Exception as exc:
             logging.error(f"[GuildEvents] Error building roster for guild {guild_id}: {exc}")
             error_msg = await get_user_message(ctx, STATIC_GROUPS, "preview_groups.messages.error_building_roster", error=str(exc))
@@ -3018,7 +2903,7 @@ class GuildEvents(commands.Cog):
             return
 
         try:
-            all_groups = await self._assign_groups_enhanced(guild_id, presence_ids, tentative_ids, roster_data)
+            all_groups = await self._get_event_groups(guild_id, event_id_int, presence_ids, tentative_ids, roster_data)
         except Exception as exc:
             logging.error(f"[GuildEvents] Error generating groups for event {event_id}: {exc}")
             error_msg = await get_user_message(ctx, STATIC_GROUPS, "preview_groups.messages.error_generating_groups", error=str(exc))
@@ -3106,15 +2991,68 @@ class GuildEvents(commands.Cog):
         except Exception as e:
             logging.error(f"[GuildEvents] Error in cron static groups update for guild {guild_id}: {e}")
 
-    async def update_static_groups_message(self, guild_id: int) -> bool:
+    async def _render_static_groups(self, guild_id: int, guild_lang: str) -> List[Tuple[str, str, int]]:
+        """
+        Render the statics view from cached static groups and roster data.
+        
+        Args:
+            guild_id: Discord guild ID
+            guild_lang: Guild language code
+            
+        Returns:
+            List of (title, description, color) tuples, one per embed; the
+            header description is left empty for the update timestamp
+        """
+        messages = STATIC_GROUPS["static_update"]["messages"]
+
+        def text(key: str) -> str:
+            return messages[key].get(guild_lang, messages[key].get("en-US"))
+
+        title = text("title")
+        static_groups = await self.get_static_groups_data(guild_id)
+        if not static_groups:
+            return [(title, text("no_groups"), discord.Color.blue().value)]
+
+        guild_obj = self.bot.get_guild(guild_id)
+        guild_members_cache = await self.bot.cache.get_guild_roster(guild_id)
+        leader_label = text("leader")
+        members_count_template = text("members_count")
+        no_members_text = text("no_members")
+        absent_text = text("absent")
+
+        rendered = [(title, "", discord.Color.blue().value)]
+        for group_name, group_data in static_groups.items():
+            member_ids = group_data["member_ids"]
+            leader_id = group_data["leader_id"]
+
+            leader = guild_obj.get_member(leader_id) if guild_obj else None
+            leader_mention = leader.mention if leader else f"<@{leader_id}> ({absent_text})"
+
+            formatted_members = await self._format_static_group_members(member_ids, guild_obj, absent_text, guild_members_cache)
+
+            members_count = members_count_template.format(count=len(member_ids))
+            description = f"{leader_label} {leader_mention}\n{members_count}\n\n"
+            if formatted_members:
+                description += "\n".join(f"• {member_line}" for member_line in formatted_members)
+            else:
+                description += no_members_text
+            rendered.append((f"🛡️ {group_name}", description, discord.Color.gold().value))
+        return rendered
+
+    async def update_static_groups_message(self, guild_id: int, force: bool = False) -> bool:
         """
         Update static groups message in the groups channel.
         
+        The view is rendered from the cache and hashed; when the hash matches
+        the one kept for the guild, the message is left untouched. Edits go
+        through a partial message, so the message is never fetched.
+        
         Args:
             guild_id: Discord guild ID
+            force: Edit even if the content is unchanged (default: False)
             
         Returns:
-            Boolean indicating whether the update was successful
+            Boolean indicating whether the message is up to date
         """
         try:
             guild_ptb_config = await self.bot.cache.get_guild_data(guild_id, 'ptb_settings')
@@ -3122,84 +3060,43 @@ class GuildEvents(commands.Cog):
                 logging.debug(f"[GuildEvents] Skipping statics update for PTB guild {guild_id}")
                 return False
             
-            guild_settings = await self.get_guild_settings(guild_id)
-            guild_lang = guild_settings.get("guild_lang", "en-US")
-            
-            query = "SELECT statics_channel, statics_message FROM guild_channels WHERE guild_id = %s"
-            result = await self.bot.run_db_query(query, (guild_id,), fetch_one=True)
-            
-            if not result or not result[0] or not result[1]:
+            channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels') or {}
+            channel_id = channels_data.get("statics_channel")
+            message_id = channels_data.get("statics_message")
+            if not channel_id or not message_id:
                 logging.debug(f"[GuildEvents] No statics channel/message configured for guild {guild_id}")
                 return False
-                
-            channel_id, message_id = result
-            
+
+            guild_settings = await self.get_guild_settings(guild_id)
+            guild_lang = guild_settings.get("guild_lang", "en-US")
+
+            rendered = await self._render_static_groups(guild_id, guild_lang)
+            content_hash = hashlib.sha256(repr((message_id, rendered)).encode()).hexdigest()
+            if not force and self._statics_hashes.get(guild_id) == content_hash:
+                logging.debug(f"[GuildEvents] Static groups unchanged for guild {guild_id}, edit skipped")
+                return True
+
             channel = self.bot.get_channel(channel_id)
             if not channel:
                 channel = await self.bot.fetch_channel(channel_id)
             if not channel:
                 logging.error(f"[GuildEvents] Statics channel {channel_id} not found for guild {guild_id}")
                 return False
-                
+
+            embeds = []
+            for title, description, color in rendered:
+                if not description:
+                    description = f"*Updated: <t:{int(time.time())}:R>*"
+                embeds.append(discord.Embed(title=title, description=description, color=discord.Color(color)))
+
             try:
-                message = await channel.fetch_message(message_id)
+                await channel.get_partial_message(message_id).edit(embeds=embeds)
             except discord.NotFound:
                 logging.error(f"[GuildEvents] Statics message {message_id} not found for guild {guild_id}")
+                self._statics_hashes.pop(guild_id, None)
                 return False
-            
-            title = STATIC_GROUPS["static_update"]["messages"]["title"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["title"].get("en-US"))
-            
-            embeds = []
-            guild_obj = self.bot.get_guild(guild_id)
-            
-            static_groups = await self.get_static_groups_data(guild_id)
-            if not static_groups:
-                no_groups_text = STATIC_GROUPS["static_update"]["messages"]["no_groups"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["no_groups"].get("en-US"))
-                embed = discord.Embed(
-                    title=title,
-                    description=no_groups_text,
-                    color=discord.Color.blue()
-                )
-                embeds.append(embed)
-            else:
-                header_embed = discord.Embed(
-                    title=title,
-                    description=f"*Updated: <t:{int(time.time())}:R>*",
-                    color=discord.Color.blue()
-                )
-                embeds.append(header_embed)
-                
-                leader_label = STATIC_GROUPS["static_update"]["messages"]["leader"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["leader"].get("en-US"))
-                members_count_template = STATIC_GROUPS["static_update"]["messages"]["members_count"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["members_count"].get("en-US"))
-                no_members_text = STATIC_GROUPS["static_update"]["messages"]["no_members"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["no_members"].get("en-US"))
-                absent_text = STATIC_GROUPS["static_update"]["messages"]["absent"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["absent"].get("en-US"))
-                
-                for group_name, group_data in static_groups.items():
-                    member_ids = group_data["member_ids"]
-                    member_count = len(member_ids)
-                    leader_id = group_data["leader_id"]
-                    
-                    leader = guild_obj.get_member(leader_id) if guild_obj else None
-                    leader_mention = leader.mention if leader else f"<@{leader_id}> ({absent_text})"
-
-                    formatted_members = await self._format_static_group_members(member_ids, guild_obj, absent_text)
-                    
-                    members_count = members_count_template.format(count=member_count)
-                    description = f"{leader_label} {leader_mention}\n{members_count}\n\n"
-                    
-                    if formatted_members:
-                        description += "\n".join(f"• {member_line}" for member_line in formatted_members)
-                    else:
-                        description += no_members_text
-                    
-                    group_embed = discord.Embed(
-                        title=f"🛡️ {group_name}",
-                        description=description,
-                        color=discord.Color.gold()
-                    )
-                    embeds.append(group_embed)
-            
-            await message.edit(embeds=embeds)
+
+            self._statics_hashes[guild_id] = content_hash
             logging.info(f"[GuildEvents] Static groups message updated for guild {guild_id}")
             return True
             
@@ -3223,15 +3120,14 @@ class GuildEvents(commands.Cog):
         guild_settings = await self.get_guild_settings(guild_id)
         guild_lang = guild_settings.get("guild_lang", "en-US")
         
-        query = "SELECT statics_channel, statics_message FROM guild_channels WHERE guild_id = %s"
-        result = await self.bot.run_db_query(query, (guild_id,), fetch_one=True)
+        channels_data = await self.bot.cache.get_guild_data(guild_id, 'channels') or {}
         
-        if not result or not result[0] or not result[1]:
+        if not channels_data.get("statics_channel") or not channels_data.get("statics_message"):
             no_channel_msg = STATIC_GROUPS["static_update"]["messages"]["no_channel"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["no_channel"].get("en-US"))
             await ctx.followup.send(no_channel_msg, ephemeral=True)
             return
         
-        success = await self.update_static_groups_message(guild_id)
+        success = await self.update_static_groups_message(guild_id, force=True)
         
         if success:
             success_msg = STATIC_GROUPS["static_update"]["messages"]["success"].get(guild_lang, STATIC_GROUPS["static_update"]["messages"]["success"].get("en-US"))
@@ -3274,7 +3170,7 @@ class GuildEvents(commands.Cog):
             query = "UPDATE guild_static_groups SET is_active = FALSE WHERE guild_id = %s AND group_name = %s"
             await self.bot.run_db_query(query, (guild_id, group_name), commit=True)
 
-            await self.bot.cache_loader.reload_category('static_groups')
+            await self.bot.cache_loader.reload_category('static_groups', guild_id)
             
             success_msg = STATIC_GROUPS["static_delete"]["messages"]["success"].get(guild_lang, STATIC_GROUPS["static_delete"]["messages"]["success"].get("en-US")).format(group_name=group_name)
             await ctx.followup.send(success_msg, ephemeral=True)
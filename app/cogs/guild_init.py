@@ -417,6 +417,7 @@ class GuildInit(commands.Cog):
                     members_m3 = VALUES(members_m3),
                     members_m4 = VALUES(members_m4),
                     members_m5 = VALUES(members_m5),
+                    members_extra_messages = NULL,
                     groups_channel = VALUES(groups_channel),
                     statics_channel = VALUES(statics_channel),
                     statics_message = VALUES(statics_message),
@@ -452,6 +453,7 @@ class GuildInit(commands.Cog):
                     "members_m3": m_ids[2],
                     "members_m4": m_ids[3],
                     "members_m5": m_ids[4],
+                    "members_extra_messages": [],
                     "groups_channel": groups.id,
                     "statics_channel": statics_ch.id,
                     "statics_message": statics_msg.id,
@@ -3,8 +3,13 @@ Guild Members Cog - Manages guild member profiles, roster updates, and member da
 """
 
 import asyncio
+import csv
+import hashlib
+import io
+import json
 import logging
 import re
+import tempfile
 import time
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Optional, Union
@@ -13,15 +18,137 @@ from urllib.parse import urlparse
 import discord
 from discord.ext import commands, tasks
 
+from config import (
+    ROSTER_DEBOUNCE_MS, ROSTER_WORKER_IDLE_SECONDS,
+    ROSTER_EXPORT_PAGE_SIZE, ROSTER_IMPORT_CHUNK_SIZE, ROSTER_IMPORT_MAX_BYTES
+)
+from core.dm_dispatcher import get_dm_dispatcher
 from core.functions import get_user_message
+from core.keyed_locks import get_roster_locks
+from core.leaderboard import get_leaderboards
 from core.performance_profiler import profile_performance
 from core.rate_limiter import admin_rate_limit
+from core.roster_renderer import CLASSES, get_roster_renderer, paginate, render_header
 from core.translation import translations as global_translations
 from db import run_db_transaction
 
 ABSENCE_TRANSLATIONS = global_translations.get("absence_system", {}).get("messages", {})
 GUILD_MEMBERS = global_translations.get("member_management", {})
 
+def roster_checksum(entries) -> int:
+    """
+    Compute an order-independent checksum of roster entries.
+    
+    Entries are combined with XOR, so the checksum can be patched by
+    XOR-ing out the old entries of a member and XOR-ing in the new ones.
+    
+    Args:
+        entries: Iterable of (member_id, username) pairs
+        
+    Returns:
+        64-bit checksum (0 for an empty roster)
+    """
+    checksum = 0
+    for member_id, username in entries:
+        digest = hashlib.blake2b(f"{member_id}:{username}".encode("utf-8"), digest_size=8).digest()
+        checksum ^= int.from_bytes(digest, "big")
+    return checksum
+
+ROSTER_INSERT_FIELDS = (
+    "member_id", "username", "language", "GS", "build", "weapons", "DKP", "nb_events", "registrations", "attendances", "class"
+)
+ROSTER_INSERT = """
+    INSERT INTO guild_members
+    (guild_id, member_id, username, language, GS, build, weapons, DKP, nb_events, registrations, attendances, `class`)
+    VALUES {rows}
+    ON DUPLICATE KEY UPDATE
+    username = VALUES(username),
+    language = VALUES(language),
+    GS = VALUES(GS),
+    build = VALUES(build),
+    weapons = VALUES(weapons),
+    `class` = VALUES(`class`)
+"""
+ROSTER_EXPORT_COLUMNS = (
+    "member_id", "username", "language", "GS", "build", "weapons", "class", "DKP",
+    "nb_events", "registrations", "attendances", "playtime", "game_mode", "wishlist_items"
+)
+ROSTER_EXPORT_QUERY = """
+    SELECT gm.member_id, gm.username, gm.language, gm.GS, gm.build, gm.weapons, gm.`class`, gm.DKP,
+           gm.nb_events, gm.registrations, gm.attendances, us.playtime, us.game_mode, COALESCE(lw.items, 0)
+    FROM guild_members gm
+    LEFT JOIN user_setup us ON us.guild_id = gm.guild_id AND us.user_id = gm.member_id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS items FROM loot_wishlist WHERE guild_id = %s GROUP BY user_id
+    ) lw ON lw.user_id = gm.member_id
+    WHERE gm.guild_id = %s AND gm.member_id > %s
+    ORDER BY gm.member_id
+    LIMIT %s
+"""
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+ROSTER_IMPORT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+ROSTER_IMPORT_UPSERT = """
+    INSERT INTO guild_members (guild_id, member_id, GS, weapons, `class`, build)
+    VALUES {rows}
+    ON DUPLICATE KEY UPDATE
+    GS = COALESCE(VALUES(GS), GS),
+    weapons = COALESCE(VALUES(weapons), weapons),
+    `class` = COALESCE(VALUES(`class`), `class`),
+    build = COALESCE(VALUES(build), build)
+"""
+
+def encode_roster_row(values, export_format: str) -> bytes:
+    """
+    Encode one roster export line.
+
+    CSV cells starting with a formula, tab or carriage return character are
+    prefixed with a quote so spreadsheets display member-controlled text
+    instead of evaluating it.
+
+    Args:
+        values: Column values in ROSTER_EXPORT_COLUMNS order
+        export_format: "csv" or "ndjson"
+
+    Returns:
+        UTF-8 encoded line, newline included
+    """
+    if export_format == "ndjson":
+        return (json.dumps(dict(zip(ROSTER_EXPORT_COLUMNS, values)), ensure_ascii=False, default=float) + "\n").encode("utf-8")
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\r\n").writerow(
+        f"'{value}" if isinstance(value, str) and value[:1] in CSV_FORMULA_PREFIXES else value
+        for value in values
+    )
+    return buffer.getvalue().encode("utf-8")
+
+def iter_roster_import(text: str, import_format: str):
+    """
+    Parse roster import rows lazily.
+
+    Args:
+        text: Decoded file content
+        import_format: "csv" (with a header row) or "ndjson"
+
+    Yields:
+        Tuples of (line number, row dict with lower-case keys, or None when the line cannot be parsed)
+    """
+    if import_format == "csv":
+        reader = csv.DictReader(io.StringIO(text))
+        for row in reader:
+            yield reader.line_num, {str(key).strip().lower(): value for key, value in row.items() if key is not None}
+        return
+
+    for line_number, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, None
+            continue
+        yield line_number, {str(key).strip().lower(): value for key, value in row.items()} if isinstance(row, dict) else None
+
 class GuildMembers(commands.Cog):
     """Cog for managing guild member profiles, roster updates, and member data."""
     
@@ -36,6 +163,13 @@ class GuildMembers(commands.Cog):
             None
         """
         self.bot = bot
+        self.dm_dispatcher = get_dm_dispatcher()
+        self.roster_locks = get_roster_locks()
+        self.roster_renderer = get_roster_renderer()
+        self._roster_mailboxes: Dict[int, asyncio.Queue] = {}
+        self._roster_workers: Dict[int, asyncio.Task] = {}
+        self._roster_checksums: Dict[int, int] = {}
+        self._roster_stats = {"enqueued": 0, "flushes": 0, "reconciled": 0, "checksum_hits": 0}
         
         self.allowed_build_domains = ['questlog.gg', 'maxroll.gg']
         self.max_username_length = 32
@@ -122,6 +256,20 @@ class GuildMembers(commands.Cog):
                 name_localizations=GUILD_MEMBERS.get("config_roster", {}).get("name", {}),
                 description_localizations=GUILD_MEMBERS.get("config_roster", {}).get("description", {})
             )(self.config_roster)
+
+            self.bot.staff_group.command(
+                name=GUILD_MEMBERS.get("export_roster", {}).get("name", {}).get("en-US", "export_roster"),
+                description=GUILD_MEMBERS.get("export_roster", {}).get("description", {}).get("en-US", "Export the roster as CSV or NDJSON"),
+                name_localizations=GUILD_MEMBERS.get("export_roster", {}).get("name", {}),
+                description_localizations=GUILD_MEMBERS.get("export_roster", {}).get("description", {})
+            )(self.export_roster)
+
+            self.bot.staff_group.command(
+                name=GUILD_MEMBERS.get("import_roster", {}).get("name", {}).get("en-US", "import_roster"),
+                description=GUILD_MEMBERS.get("import_roster", {}).get("description", {}).get("en-US", "Bulk update GS, weapons and builds from a file"),
+                name_localizations=GUILD_MEMBERS.get("import_roster", {}).get("name", {}),
+                description_localizations=GUILD_MEMBERS.get("import_roster", {}).get("description", {})
+            )(self.import_roster)
     
     def _sanitize_string(self, text: str, max_length: int = 100) -> str:
         """
@@ -257,56 +405,36 @@ class GuildMembers(commands.Cog):
         except Exception as e:
             logging.error(f"[GuildMembers] Error loading user setup members: {e}", exc_info=True)
 
-    async def _load_members_data(self) -> None:
+    async def _load_members_data(self, guild_id: Optional[int] = None) -> None:
         """
         Load member-specific data into cache (legacy method for compatibility).
         
         Args:
-            None
+            guild_id: Refresh only this guild's roster and ideal staff (optional)
             
         Returns:
             None
         """
         await self._load_user_setup_members()
+        if guild_id is not None:
+            await self.bot.cache_loader.reload_category('guild_members', guild_id)
+            await self.bot.cache_loader.reload_category('guild_ideal_staff', guild_id)
+            return
         await self.bot.cache_loader.ensure_guild_members_loaded()
         await self.bot.cache_loader.ensure_guild_ideal_staff_loaded()
         logging.debug("[GuildMembers] Guild members and ideal staff data loaded via cache loaders")
 
-    async def get_weapons_combinations(self, game_id: int) -> List[Dict[str, str]]:
+    async def get_guild_members(self, guild_id: int) -> Dict[Tuple[int, int], Dict[str, Any]]:
         """
-        Get weapon combinations for a specific game from cache.
+        Get guild members from cache once a guild's roster is hydrated.
         
         Args:
-            game_id: The ID of the game to get weapon combinations for
-            
-        Returns:
-            List of weapon combination dictionaries for the specified game
-        """
-        combinations = await self.bot.cache.get('static_data', 'weapons_combinations')
-        return combinations.get(game_id, []) if combinations else []
-
-    async def get_guild_members(self) -> Dict[Tuple[int, int], Dict[str, Any]]:
-        """
-        Get all guild members from cache.
-        
-        Args:
-            None
+            guild_id: The ID of the guild whose roster entries must be loaded
             
         Returns:
             Dictionary mapping (guild_id, member_id) tuples to member data dictionaries
         """
-        guild_members = await self.bot.cache.get('roster_data', 'guild_members')
-        if not guild_members:
-            logging.warning("[GuildMembers] guild_members cache empty or None, forcing reload...")
-            try:
-                if 'guild_members' in self.bot.cache_loader._loaded_categories:
-                    self.bot.cache_loader._loaded_categories.discard('guild_members')
-                await self.bot.cache_loader.ensure_guild_members_loaded()
-                guild_members = await self.bot.cache.get('roster_data', 'guild_members')
-                logging.debug(f"[GuildMembers] After cache reload: {type(guild_members)} - {guild_members is None}")
-            except Exception as e:
-                logging.error(f"[GuildMembers] Error reloading guild members cache: {e}")
-        return guild_members or {}
+        return await self.bot.cache.get_guild_roster(guild_id)
 
     async def get_user_setup_members(self) -> Dict[Tuple[int, int], Dict[str, Any]]:
         """
@@ -331,8 +459,7 @@ class GuildMembers(commands.Cog):
         Returns:
             Dictionary mapping class names to ideal count numbers
         """
-        ideal_staff = await self.bot.cache.get('guild_data', 'ideal_staff')
-        return ideal_staff.get(guild_id, {}) if ideal_staff else {}
+        return await self.bot.cache.get_guild_ideal_staff(guild_id)
 
     async def update_guild_member_cache(self, guild_id: int, member_id: int, field: str, value: Any) -> None:
         """
@@ -347,42 +474,56 @@ class GuildMembers(commands.Cog):
         Returns:
             None
         """
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         key = (guild_id, member_id)
         if key in guild_members:
             guild_members[key][field] = value
             await self.bot.cache.set('roster_data', guild_members, 'guild_members')
+            get_leaderboards().update(guild_id, member_id, guild_members[key])
 
-    async def determine_class(self, weapons_list: list, guild_id: int) -> str:
+    async def get_weapon_tables(self, guild_id: int) -> Tuple[Dict[frozenset, str], frozenset]:
         """
-        Determine class based on weapon combination.
+        Get the compiled weapon lookup tables of a guild's game.
         
         Args:
-            weapons_list: List of weapon codes
-            guild_id: The ID of the guild to check weapon combinations for
+            guild_id: The ID of the guild
             
         Returns:
-            The determined class name or "NULL" if no match found
+            Tuple of (frozenset of a weapon pair -> role, valid weapon codes), empty when the game is unknown
         """
-        if not isinstance(weapons_list, list) or not weapons_list:
-            return "NULL"
-        
+        if not isinstance(guild_id, int):
+            return {}, frozenset()
+
         game = await self.bot.cache.get_guild_data(guild_id, 'guild_game')
         if not game:
-            return "NULL"
+            return {}, frozenset()
         
         game_id = self._validate_integer(game)
         if game_id is None:
+            return {}, frozenset()
+
+        weapon_roles = await self.bot.cache.get_static_data('weapon_roles') or {}
+        valid_weapon_codes = await self.bot.cache.get_static_data('valid_weapon_codes') or {}
+        return weapon_roles.get(game_id, {}), valid_weapon_codes.get(game_id, frozenset())
+
+    async def determine_class(self, weapons_list: list, guild_id: int) -> str:
+        """
+        Determine class based on weapon combination.
+        
+        Args:
+            weapons_list: List of weapon codes
+            guild_id: The ID of the guild to check weapon combinations for
+            
+        Returns:
+            The determined class name or "NULL" if no match found
+        """
+        if not isinstance(weapons_list, list) or len(weapons_list) != 2:
             return "NULL"
         
-        combinations = await self.get_weapons_combinations(game_id)
-        sorted_weapons = sorted(weapons_list)
-        for combo in combinations:
-            if sorted([combo["weapon1"], combo["weapon2"]]) == sorted_weapons:
-                return combo["role"]
-        return "NULL"
+        weapon_roles, _ = await self.get_weapon_tables(guild_id)
+        return weapon_roles.get(frozenset(weapons_list), "NULL")
 
-    async def get_valid_weapons(self, guild_id: int) -> set:
+    async def get_valid_weapons(self, guild_id: int) -> frozenset:
         """
         Get valid weapons for a guild based on its game configuration.
         
@@ -392,23 +533,8 @@ class GuildMembers(commands.Cog):
         Returns:
             Set of valid weapon codes for the guild's game
         """
-        valid = set()
-        if not isinstance(guild_id, int):
-            return valid
-
-        game = await self.bot.cache.get_guild_data(guild_id, 'guild_game')
-        if not game:
-            return valid
-        
-        game_id = self._validate_integer(game)
-        if game_id is None:
-            return valid
-        
-        combinations = await self.get_weapons_combinations(game_id)
-        for combo in combinations:
-            valid.add(combo["weapon1"])
-            valid.add(combo["weapon2"])
-        return valid
+        _, valid_weapon_codes = await self.get_weapon_tables(guild_id)
+        return valid_weapon_codes
 
     async def gs(
         self,
@@ -449,7 +575,7 @@ class GuildMembers(commands.Cog):
                 logging.exception(f"[GuildMembers - GS] Error sending followup message for invalid value: {ex}")
             return
         
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         logging.debug(f"[GuildMembers - GS] Guild members cache contains {len(guild_members)} entries")
         if key not in guild_members:
             logging.debug(f"[GuildMembers - GS] Profile not found in guild_members cache for key {key}, trying database fallback...")
@@ -534,7 +660,7 @@ class GuildMembers(commands.Cog):
         member_id = ctx.author.id
         key = (guild_id, member_id)
         
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         logging.debug(f"[GuildMembers - Weapons] Guild members cache contains {len(guild_members)} entries")
         if key not in guild_members:
             logging.debug(f"[GuildMembers - Weapons] Profile not found in guild_members cache for key {key}, trying database fallback...")
@@ -587,7 +713,7 @@ class GuildMembers(commands.Cog):
             await ctx.followup.send(msg, ephemeral=True)
             return
 
-        valid_weapons = await self.get_valid_weapons(guild_id)
+        weapon_roles, valid_weapons = await self.get_weapon_tables(guild_id)
         if weapon1_code not in valid_weapons or weapon2_code not in valid_weapons:
             msg = await get_user_message(ctx, GUILD_MEMBERS["weapons"], "not_valid")
             await ctx.followup.send(msg, ephemeral=True)
@@ -595,7 +721,7 @@ class GuildMembers(commands.Cog):
 
         try:
             weapons_normalized = sorted([weapon1_code, weapon2_code])
-            player_class = await self.determine_class(weapons_normalized, guild_id)
+            player_class = weapon_roles.get(frozenset(weapons_normalized), "NULL")
             weapons_str = "/".join(weapons_normalized)
             
             query = "UPDATE guild_members SET weapons = %s, `class` = %s WHERE guild_id = %s AND member_id = %s"
@@ -644,7 +770,7 @@ class GuildMembers(commands.Cog):
         member_id = ctx.author.id
         key = (guild_id, member_id)
         
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         if key not in guild_members:
             logging.debug(f"[GuildMembers - Build] Profile not found in guild_members cache for key {key}, trying database fallback...")
             try:
@@ -720,7 +846,7 @@ class GuildMembers(commands.Cog):
         member_id = ctx.author.id
         key = (guild_id, member_id)
         
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         if key not in guild_members:
             logging.debug(f"[GuildMembers - Username] Profile not found in guild_members cache for key {key}, trying database fallback...")
             try:
@@ -795,7 +921,7 @@ class GuildMembers(commands.Cog):
         await ctx.defer(ephemeral=True)
         guild_id = ctx.guild.id
         
-        await self.bot.cache_loader.reload_category('guild_channels')
+        await self.bot.cache_loader.reload_category('guild_channels', guild_id)
         
         roles_config = await self.bot.cache.get_guild_data(guild_id, 'roles')
         locale = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
@@ -812,15 +938,8 @@ class GuildMembers(commands.Cog):
             await ctx.followup.send(msg, ephemeral=True)
             return
 
-        actual_members = {
-            m.id: m for m in ctx.guild.members
-            if not m.bot and (members_role_id in [role.id for role in m.roles] or 
-                             (absent_role_id and absent_role_id in [role.id for role in m.roles]))
-        }
-
         try:
-            guild_members_db = await self._get_guild_members_bulk(guild_id)
-            user_setup_db = await self._get_user_setup_bulk(guild_id)
+            deleted, updated, inserted = await self._sync_roster(ctx.guild, members_role_id, absent_role_id, locale)
         except Exception as e:
             logging.error(f"[GuildMembers] Error loading member data for guild {guild_id}: {e}", exc_info=True)
             msg = await get_user_message(ctx, GUILD_MEMBERS["maj_roster"], "messages.database_error")
@@ -829,18 +948,6 @@ class GuildMembers(commands.Cog):
             await ctx.followup.send(msg, ephemeral=True)
             return
 
-        to_delete, to_update, to_insert = await self._calculate_roster_changes(
-            guild_id, actual_members, guild_members_db, user_setup_db, locale
-        )
-
-        deleted, updated, inserted = await self._apply_roster_changes_bulk(
-            guild_id, to_delete, to_update, to_insert
-        )
-
-        await self.bot.cache.invalidate_category('roster_data')
-        await self._load_user_setup_members()
-        await self.bot.cache_loader.reload_category('guild_members')
-
         logging.info("[GuildMembers] Starting parallel message updates (recruitment + members)")
         try:
             results = await asyncio.gather(
@@ -864,28 +971,151 @@ class GuildMembers(commands.Cog):
         
         logging.info(f"[GuildMembers] Optimized maj_roster completed in {execution_time:.0f}ms: -{deleted} +{inserted} ~{updated}")
 
+    def _roster_role_members(self, guild: discord.Guild, members_role_id: int, absent_role_id: Optional[int]) -> Dict[int, discord.Member]:
+        """
+        Collect the non-bot members holding the members or absent members role.
+        
+        Args:
+            guild: Discord guild
+            members_role_id: ID of the members role
+            absent_role_id: ID of the absent members role (optional)
+            
+        Returns:
+            Dictionary mapping member IDs to Discord members
+        """
+        actual_members = {}
+        for role_id in (members_role_id, absent_role_id):
+            role = guild.get_role(role_id) if role_id else None
+            if role:
+                actual_members.update((member.id, member) for member in role.members if not member.bot)
+        return actual_members
+
+    async def _sync_roster(self, guild: discord.Guild, members_role_id: int, absent_role_id: Optional[int], locale: str) -> Tuple[int, int, int]:
+        """
+        Synchronize guild_members with the role holders of a guild.
+        
+        Computes the change set against the database, applies it in one
+        transaction and patches only the changed roster cache entries. On
+        success the guild's roster checksum is reset to the synced roster.
+        
+        Args:
+            guild: Discord guild
+            members_role_id: ID of the members role
+            absent_role_id: ID of the absent members role (optional)
+            locale: Guild's locale for language defaults
+            
+        Returns:
+            Tuple of (deleted_count, updated_count, inserted_count)
+            
+        Raises:
+            Exception: When the current roster cannot be read
+        """
+        guild_id = guild.id
+        async with self.roster_locks.lock(guild_id):
+            actual_members = self._roster_role_members(guild, members_role_id, absent_role_id)
+            guild_members_db = await self._get_guild_members_bulk(guild_id)
+            user_setup_db = await self._get_user_setup_bulk(guild_id)
+
+            counts = await self._apply_roster_sync(guild_id, actual_members, guild_members_db, user_setup_db, locale)
+            if counts is None:
+                self._roster_checksums.pop(guild_id, None)
+                return 0, 0, 0
+            self._roster_checksums[guild_id] = roster_checksum(
+                (member_id, member.display_name) for member_id, member in actual_members.items()
+            )
+            return counts
+
+    async def _apply_roster_sync(self, guild_id: int, actual_members: dict, guild_members_db: dict,
+                                 user_setup_db: dict, locale: str) -> Optional[Tuple[int, int, int]]:
+        """
+        Bring the given database rows in line with the given Discord members.
+        
+        Rows of guild_members_db missing from actual_members are deleted, so
+        both dictionaries must cover the same set of members.
+        
+        Args:
+            guild_id: The ID of the guild
+            actual_members: Dictionary of Discord members that belong in the roster
+            guild_members_db: Dictionary of members from database
+            user_setup_db: Dictionary of user setup data from database
+            locale: Guild's locale for language defaults
+            
+        Returns:
+            Tuple of (deleted_count, updated_count, inserted_count), or None if the transaction failed
+        """
+        to_delete, to_update, to_insert = await self._calculate_roster_changes(
+            guild_id, actual_members, guild_members_db, user_setup_db, locale
+        )
+        if not (to_delete or to_update or to_insert):
+            logging.debug(f"[GuildMembers] Roster already in sync for guild {guild_id}")
+            return 0, 0, 0
+
+        counts = await self._apply_roster_changes_bulk(guild_id, to_delete, to_update, to_insert)
+        if not any(counts):
+            return None
+        await self._patch_roster_cache(guild_id, to_delete, to_update, to_insert)
+        return counts
+
+    async def _patch_roster_cache(self, guild_id: int, to_delete: list, to_update: list, to_insert: list) -> None:
+        """
+        Apply a committed roster change set to the roster cache.
+        
+        Args:
+            guild_id: The ID of the guild
+            to_delete: Member IDs removed from the roster
+            to_update: Update tuples (member_id, changes) where changes is [(field, value), ...]
+            to_insert: Member data dictionaries added to the roster
+        """
+        roster = await self.bot.cache.get_guild_roster(guild_id)
+        leaderboards = get_leaderboards()
+
+        for member_id in to_delete:
+            roster.pop((guild_id, member_id), None)
+            leaderboards.remove(guild_id, member_id)
+        for member_id, changes in to_update:
+            key = (guild_id, member_id)
+            if key in roster:
+                roster[key] = {**roster[key], **dict(changes)}
+                leaderboards.update(guild_id, member_id, roster[key])
+        for member_data in to_insert:
+            member_id = member_data['member_id']
+            roster[(guild_id, member_id)] = {field: value for field, value in member_data.items() if field != 'member_id'}
+            leaderboards.update(guild_id, member_id, roster[(guild_id, member_id)])
+
+        await self.bot.cache.set('roster_data', roster, 'guild_members')
+        await self.bot.cache.delete('roster_data', f'bulk_guild_members_{guild_id}')
+        logging.debug(f"[GuildMembers] Patched roster cache for guild {guild_id}: -{len(to_delete)} ~{len(to_update)} +{len(to_insert)}")
+
     @profile_performance(threshold_ms=50.0)
-    async def _get_guild_members_bulk(self, guild_id: int) -> dict:
+    async def _get_guild_members_bulk(self, guild_id: int, member_ids: Optional[List[int]] = None) -> dict:
         """
         Retrieves all guild members with performance optimization.
         
         Args:
             guild_id: The ID of the guild to retrieve members for
+            member_ids: Restrict the read to these members, bypassing the bulk cache (optional)
             
         Returns:
             Dictionary mapping member IDs to member data dictionaries
         """
-        if hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_bulk_guild_members'):
+        member_filter = ""
+        filter_params: Tuple[int, ...] = ()
+        if member_ids is not None:
+            if not member_ids:
+                return {}
+            member_filter = f"AND member_id IN ({','.join(['%s'] * len(member_ids))})"
+            filter_params = tuple(member_ids)
+        elif hasattr(self.bot, 'cache') and hasattr(self.bot.cache, 'get_bulk_guild_members'):
             return await self.bot.cache.get_bulk_guild_members(guild_id)
 
-        query = """
+        query = f"""
         SELECT member_id, username, language, GS, build, weapons, DKP, 
                nb_events, registrations, attendances, `class`
         FROM guild_members 
-        WHERE guild_id = %s
+        WHERE guild_id = %s {member_filter}
         """
         
-        rows = await self.bot.run_db_query(query, (guild_id,), fetch_all=True)
+        rows = await self.bot.run_db_query(query, (guild_id, *filter_params), fetch_all=True)
         members_db = {}
         
         if rows:
@@ -906,17 +1136,28 @@ class GuildMembers(commands.Cog):
         
         return members_db
 
-    async def _get_user_setup_bulk(self, guild_id: int) -> dict:
+    async def _get_user_setup_bulk(self, guild_id: int, member_ids: Optional[List[int]] = None) -> dict:
         """
         Retrieves consolidated member data from guild_members, with fallback to user_setup for missing members.
         
         Args:
             guild_id: The ID of the guild to retrieve setup data for
+            member_ids: Restrict the read to these members (optional)
             
         Returns:
             Dictionary mapping member IDs to consolidated setup data dictionaries
         """
-        query = """
+        setup_filter = members_filter = ""
+        filter_params: Tuple[int, ...] = ()
+        if member_ids is not None:
+            if not member_ids:
+                return {}
+            placeholders = ','.join(['%s'] * len(member_ids))
+            setup_filter = f"AND us.user_id IN ({placeholders})"
+            members_filter = f"AND gm.member_id IN ({placeholders})"
+            filter_params = tuple(member_ids)
+
+        query = f"""
         SELECT COALESCE(gm.member_id, us.user_id) as member_id,
                COALESCE(us.locale, gm.language) as locale,
                COALESCE(gm.GS, us.gs) as gs,
@@ -925,7 +1166,7 @@ class GuildMembers(commands.Cog):
                gm.class
         FROM user_setup us
         LEFT JOIN guild_members gm ON us.guild_id = gm.guild_id AND us.user_id = gm.member_id
-        WHERE us.guild_id = %s
+        WHERE us.guild_id = %s {setup_filter}
         
         UNION
         
@@ -937,10 +1178,11 @@ class GuildMembers(commands.Cog):
                gm.class
         FROM guild_members gm
         WHERE gm.guild_id = %s 
-        AND gm.member_id NOT IN (SELECT user_id FROM user_setup WHERE guild_id = %s)
+        AND gm.member_id NOT IN (SELECT user_id FROM user_setup WHERE guild_id = %s) {members_filter}
         """
         
-        rows = await self.bot.run_db_query(query, (guild_id, guild_id, guild_id), fetch_all=True)
+        params = (guild_id,) + filter_params + (guild_id, guild_id) + filter_params
+        rows = await self.bot.run_db_query(query, params, fetch_all=True)
         setup_db = {}
         
         if rows:
@@ -974,6 +1216,7 @@ class GuildMembers(commands.Cog):
         to_delete = []
         to_update = []
         to_insert = []
+        weapon_roles, valid_weapons = await self.get_weapon_tables(guild_id)
 
         for member_id in guild_members_db.keys():
             if member_id not in actual_members:
@@ -984,8 +1227,8 @@ class GuildMembers(commands.Cog):
                 db_member = guild_members_db[member_id]
                 user_setup = user_setup_db.get(member_id, {})
 
-                weapons_normalized, computed_class = await self._process_weapons_optimized(
-                    user_setup.get('weapons'), guild_id
+                weapons_normalized, computed_class = self._classify_weapons(
+                    user_setup.get('weapons'), weapon_roles, valid_weapons
                 )
                 
                 language = user_setup.get('locale', locale)
@@ -1017,8 +1260,8 @@ class GuildMembers(commands.Cog):
             else:
                 user_setup = user_setup_db.get(member_id, {})
                 
-                weapons_normalized, computed_class = await self._process_weapons_optimized(
-                    user_setup.get('weapons'), guild_id
+                weapons_normalized, computed_class = self._classify_weapons(
+                    user_setup.get('weapons'), weapon_roles, valid_weapons
                 )
                 
                 language = user_setup.get('locale', locale)
@@ -1054,6 +1297,22 @@ class GuildMembers(commands.Cog):
             weapons_raw: Raw weapon string from database
             guild_id: The ID of the guild for weapon validation
             
+        Returns:
+            Tuple of (normalized_weapons_string, computed_class)
+        """
+        weapon_roles, valid_weapons = await self.get_weapon_tables(guild_id)
+        return self._classify_weapons(weapons_raw, weapon_roles, valid_weapons)
+
+    @staticmethod
+    def _classify_weapons(weapons_raw: str, weapon_roles: Dict[frozenset, str], valid_weapons: frozenset) -> Tuple[str, str]:
+        """
+        Normalize a weapon string and look up its class in the game tables.
+        
+        Args:
+            weapons_raw: Raw weapon string from database
+            weapon_roles: Weapon pair to role table of the guild's game
+            valid_weapons: Valid weapon codes of the guild's game
+            
         Returns:
             Tuple of (normalized_weapons_string, computed_class)
         """
@@ -1075,12 +1334,14 @@ class GuildMembers(commands.Cog):
         if len(weapons_list) != 2:
             return "NULL", "NULL"
         
-        valid_weapons = await self.get_valid_weapons(guild_id)
+        if weapons_list[0] == weapons_list[1]:
+            return "NULL", "NULL"
+        
         if weapons_list[0] not in valid_weapons or weapons_list[1] not in valid_weapons:
             return "NULL", "NULL"
         
         weapons_normalized = "/".join(sorted(weapons_list))
-        computed_class = await self.determine_class(sorted(weapons_list), guild_id)
+        computed_class = weapon_roles.get(frozenset(weapons_list), "NULL")
         
         return weapons_normalized, computed_class
 
@@ -1149,45 +1410,19 @@ class GuildMembers(commands.Cog):
                 updated_count = len(to_update)
 
             if to_insert:
-                insert_query = """
-                    INSERT INTO guild_members 
-                    (guild_id, member_id, username, language, GS, build, weapons, DKP, nb_events, registrations, attendances, `class`)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                    username = VALUES(username),
-                    language = VALUES(language),
-                    GS = VALUES(GS),
-                    build = VALUES(build),
-                    weapons = VALUES(weapons),
-                    DKP = VALUES(DKP),
-                    nb_events = VALUES(nb_events),
-                    registrations = VALUES(registrations),
-                    attendances = VALUES(attendances),
-                    `class` = VALUES(`class`)
-                """
+                insert_params = []
                 for member_data in to_insert:
-                    required_fields = ['member_id', 'username', 'language', 'GS', 'build', 'weapons', 'DKP', 'nb_events', 'registrations', 'attendances', 'class']
-                    if not all(field in member_data for field in required_fields):
+                    if not all(field in member_data for field in ROSTER_INSERT_FIELDS):
                         raise ValueError("Missing required fields in member data")
 
                     if not isinstance(member_data['member_id'], int) or member_data['member_id'] <= 0:
                         raise ValueError(f"Invalid member ID format in insert: {member_data['member_id']}")
-                        
-                    params = (
-                        guild_id,
-                        member_data['member_id'],
-                        member_data['username'],
-                        member_data['language'],
-                        member_data['GS'],
-                        member_data['build'],
-                        member_data['weapons'],
-                        member_data['DKP'],
-                        member_data['nb_events'],
-                        member_data['registrations'],
-                        member_data['attendances'],
-                        member_data['class']
-                    )
-                    transaction_queries.append((insert_query, params))
+
+                    insert_params.append(guild_id)
+                    insert_params.extend(member_data[field] for field in ROSTER_INSERT_FIELDS)
+                row_placeholder = "(" + ", ".join(["%s"] * (len(ROSTER_INSERT_FIELDS) + 1)) + ")"
+                insert_query = ROSTER_INSERT.format(rows=", ".join([row_placeholder] * len(to_insert)))
+                transaction_queries.append((insert_query, tuple(insert_params)))
                 inserted_count = len(to_insert)
 
             if transaction_queries:
@@ -1243,7 +1478,7 @@ class GuildMembers(commands.Cog):
 
         try:
             logging.debug("[GuildMembers] update_recruitment_message - Getting guild members")
-            guild_members = await self.get_guild_members()
+            guild_members = await self.get_guild_members(guild_id)
             members_in_roster = [v for (g, _), v in guild_members.items() if g == guild_id]
             total_members = len(members_in_roster)
             logging.info(f"[GuildMembers] Recruitment message - Guild members cache contains {len(guild_members)} total entries, {len(members_in_roster)} for guild {guild_id}")
@@ -1379,14 +1614,6 @@ class GuildMembers(commands.Cog):
         channel_id = await self.bot.cache.get_guild_data(guild_id, 'members_channel')
         logging.info(f"[GuildMembers] Retrieved members_channel ID: {channel_id}")
         
-        message_ids = []
-        for i in range(1, 6):
-            msg_id = await self.bot.cache.get_guild_data(guild_id, f'members_m{i}')
-            message_ids.append(msg_id)
-            logging.debug(f"[GuildMembers] Message {i}: {msg_id}")
-
-        logging.info(f"[GuildMembers] Channel ID: {channel_id}, Message IDs: {message_ids}")
-
         channel = self.bot.get_channel(channel_id)
         if not channel:
             logging.error(f"[GuildMembers] Unable to retrieve roster channel with ID {channel_id}")
@@ -1394,8 +1621,8 @@ class GuildMembers(commands.Cog):
         
         logging.info(f"[GuildMembers] Successfully retrieved channel: {channel.name}")
 
-        guild_members = await self.get_guild_members()
-        members_in_roster = [v for (g, _), v in guild_members.items() if g == guild_id]
+        guild_members = await self.get_guild_members(guild_id)
+        members_in_roster = [(member_id, data) for (g, member_id), data in guild_members.items() if g == guild_id]
         logging.info(f"[GuildMembers] Guild members cache contains {len(guild_members)} total entries, {len(members_in_roster)} for guild {guild_id}")
         
         if not members_in_roster:
@@ -1409,7 +1636,7 @@ class GuildMembers(commands.Cog):
                         key = (guild_id, member_id)
                         current_cache[key] = data
                     await self.bot.cache.set('roster_data', current_cache, 'guild_members')
-                    members_in_roster = list(guild_members_db.values())
+                    members_in_roster = list(guild_members_db.items())
                     logging.info(f"[GuildMembers] Updated global cache and found {len(members_in_roster)} members")
             except Exception as e:
                 logging.error(f"[GuildMembers] Error loading members from database: {e}", exc_info=True)
@@ -1417,141 +1644,110 @@ class GuildMembers(commands.Cog):
         if not members_in_roster:
             logging.warning("[GuildMembers] No members found in roster")
             return
-            
-        sorted_members = sorted(members_in_roster, key=lambda x: x.get("username", "").lower())
-
-        tank_count = sum(1 for m in sorted_members if (m.get("class") or "").lower() == "tank")
-        dps_melee_count = sum(1 for m in sorted_members if (m.get("class") or "").lower() == "melee dps")
-        dps_distant_count = sum(1 for m in sorted_members if (m.get("class") or "").lower() == "ranged dps")
-        heal_count = sum(1 for m in sorted_members if (m.get("class") or "").lower() == "healer")
-        flank_count = sum(1 for m in sorted_members if (m.get("class") or "").lower() == "flanker")
-
-        username_width = 20
-        language_width = 8
-        gs_width = 8
-        build_width = 7
-        weapons_width = 9
-        class_width = 14
-        dkp_width = 10
-        reg_width = 8
-        att_width = 8
 
         header_labels = GUILD_MEMBERS.get("table", {}).get("header", {}).get(locale)
-        
         if not header_labels:
             logging.error(f"[GuildMembers] No header labels found for locale {locale}")
             return
-        
-        header = (
-            f"{header_labels[0].ljust(username_width)}│"
-            f"{header_labels[1].center(language_width)}│"
-            f"{header_labels[2].center(gs_width)}│"
-            f"{header_labels[3].center(build_width)}│"
-            f"{header_labels[4].center(weapons_width)}│"
-            f"{header_labels[5].center(class_width)}│"
-            f"{header_labels[6].center(dkp_width)}│"
-            f"{header_labels[7].center(reg_width)}│"
-            f"{header_labels[8].center(att_width)}"
-        )
-        separator = "─" * len(header)
-
-        rows = []
-        for m in sorted_members:
-            username = m.get("username", "")[:username_width].ljust(username_width)
-            language_text = str(m.get("language", "en-US"))[:language_width].center(language_width)
-            gs = str(m.get("GS", "NULL")).center(gs_width)
-            build_value = m.get("build")
-            build_flag = "Y" if build_value and build_value not in ("NULL", None, "", "None") else " "
-            build_flag = build_flag.center(build_width)
-            weapons = m.get("weapons", "NULL")
-            if isinstance(weapons, str) and weapons != "NULL":
-                weapons_str = weapons.center(weapons_width)
-            else:
-                weapons_str = " ".center(weapons_width)
-            member_class = m.get("class", "NULL")
-            if isinstance(member_class, str) and member_class != "NULL":
-                class_str = member_class.center(class_width)
-            else :
-                class_str = " ".center(class_width)
-            dkp = str(m.get("DKP", 0)).center(dkp_width)
-            nb_events = m.get("nb_events", 0)
-            if nb_events > 0:
-                reg_pct = round((m.get("registrations", 0) / nb_events) * 100)
-                att_pct = round((m.get("attendances", 0) / nb_events) * 100)
-            else:
-                reg_pct = 0
-                att_pct = 0
-            registrations = f"{reg_pct}%".center(reg_width)
-            attendances = f"{att_pct}%".center(att_width)
-            rows.append(f"{username}│{language_text}│{gs}│{build_flag}│{weapons_str}│{class_str}│{dkp}│{registrations}│{attendances}")
-
-        if not rows:
-            logging.warning("[GuildMembers] No members found in roster")
-            return
 
-        now_str = datetime.now().strftime("%d/%m/%Y à %H:%M")
         role_labels = GUILD_MEMBERS.get("table", {}).get("role_stats", {}).get(locale)
-        
         if not role_labels:
             logging.error(f"[GuildMembers] No role labels found for locale {locale}")
             return
-        
-        role_stats = (
-            f"{role_labels[0]}: {tank_count}\n"
-            f"{role_labels[1]}: {dps_melee_count}\n"
-            f"{role_labels[2]}: {dps_distant_count}\n"
-            f"{role_labels[3]}: {heal_count}\n"
-            f"{role_labels[4]}: {flank_count}"
+
+        rows, class_counts = self.roster_renderer.render_rows(guild_id, members_in_roster)
+
+        now_str = datetime.now().strftime("%d/%m/%Y à %H:%M")
+        role_stats = "\n".join(
+            f"{label}: {class_counts[class_name]}" for label, class_name in zip(role_labels, CLASSES)
         )
         footer_template = GUILD_MEMBERS.get("table", {}).get("footer", {}).get(locale,
             "Number of members: {count}\\n{stats}\\nUpdated {date}")
         update_footer = "\n" + footer_template.format(count=len(rows), stats=role_stats, date=now_str).replace("\\n", "\n")
-        max_length = 2000
-        message_contents = []
-        current_block = f"```\n{header}\n{separator}\n"
-        for row in rows:
-            if len(current_block) + len(row) + len(update_footer) + 10 > max_length:
-                current_block += "```"
-                message_contents.append(current_block)
-                current_block = f"```\n{header}\n{separator}\n{row}\n"
-            else:
-                current_block += f"{row}\n"
-        if current_block:
-            current_block += "```" + update_footer
-            message_contents.append(current_block)
+        message_contents = paginate(render_header(header_labels), rows, update_footer)
 
         try:
-            logging.info(f"[GuildMembers] Starting message updates for {len(message_contents)} message contents")
-            logging.info(f"[GuildMembers] Will update {len(message_ids)} messages in channel {channel.name}")
-            
-            for i in range(5):
-                try:
-                    message_id = message_ids[i]
-                    if not message_id:
-                        logging.warning(f"[GuildMembers] Message ID {i+1}/5 is None, skipping")
-                        continue
-                        
-                    logging.info(f"[GuildMembers] Fetching message {i+1}/5 with ID {message_id}")
-                    message = await channel.fetch_message(message_id)
-                    new_content = message_contents[i] if i < len(message_contents) else "."
-
-                    logging.info(f"[GuildMembers] Message {i+1}/5 content length: old={len(message.content)}, new={len(new_content)}")
-                    if message.content != new_content:
-                        logging.info(f"[GuildMembers] Updating message {i+1}/5 (content changed)")
-                        await message.edit(content=new_content)
-                        logging.info(f"[GuildMembers] Message {i+1}/5 updated successfully")
-                        if i < 4:
-                            await asyncio.sleep(0.25)
-                    else:
-                        logging.info(f"[GuildMembers] Message {i+1}/5 content unchanged, skipping update")
-                except discord.NotFound:
-                    logging.warning(f"[GuildMembers] Roster message {i+1}/5 not found (ID: {message_ids[i]})")
-                except Exception as e:
-                    logging.error(f"[GuildMembers] Error updating roster message {i+1}/5: {e}", exc_info=True)
+            await self._publish_roster_pages(guild_id, channel, message_contents, now_str)
         except Exception as e:
             logging.exception(f"[GuildMembers] Error updating member messages: {e}")
         logging.info("[GuildMembers] Member message update completed")
 
+    async def _publish_roster_pages(self, guild_id: int, channel: discord.TextChannel, message_contents: List[str], now_str: str) -> None:
+        """
+        Write roster pages into the member list messages.
+        
+        Pages fill members_m1..m5 first; further pages go to extra messages
+        created on demand and deleted once the roster shrinks. A message
+        whose content digest (timestamp excluded) is unchanged is skipped
+        without being fetched.
+        
+        Args:
+            guild_id: The ID of the guild
+            channel: Member list channel
+            message_contents: Page contents in display order
+            now_str: Update timestamp included in the footer
+            
+        Returns:
+            None
+        """
+        fixed_ids = [await self.bot.cache.get_guild_data(guild_id, f'members_m{i}') for i in range(1, 6)]
+        extra_ids = list(await self.bot.cache.get_guild_data(guild_id, 'members_extra_messages') or [])
+        extra_pages = message_contents[len(fixed_ids):]
+        extra_changed = False
+
+        for index, message_id in enumerate(fixed_ids + extra_ids[:len(extra_pages)]):
+            content = message_contents[index] if index < len(message_contents) else "."
+            if not message_id:
+                logging.warning(f"[GuildMembers] Roster message {index + 1} is not configured, skipping")
+                continue
+            digest = self.roster_renderer.digest(content.replace(now_str, ""))
+            if not self.roster_renderer.page_changed(guild_id, message_id, digest):
+                continue
+            try:
+                await channel.get_partial_message(message_id).edit(content=content)
+                self.roster_renderer.remember_page(guild_id, message_id, digest)
+                logging.debug(f"[GuildMembers] Roster message {index + 1} updated")
+                await asyncio.sleep(0.25)
+            except discord.NotFound:
+                logging.warning(f"[GuildMembers] Roster message {index + 1} not found (ID: {message_id})")
+                self.roster_renderer.remember_page(guild_id, message_id, None)
+                if message_id in extra_ids:
+                    extra_ids.remove(message_id)
+                    extra_changed = True
+            except Exception as e:
+                logging.error(f"[GuildMembers] Error updating roster message {index + 1}: {e}", exc_info=True)
+
+        for content in extra_pages[len(extra_ids):]:
+            try:
+                message = await channel.send(content)
+                extra_ids.append(message.id)
+                self.roster_renderer.remember_page(guild_id, message.id, self.roster_renderer.digest(content.replace(now_str, "")))
+                extra_changed = True
+            except Exception as e:
+                logging.error(f"[GuildMembers] Error creating roster message for guild {guild_id}: {e}", exc_info=True)
+                break
+
+        for message_id in extra_ids[len(extra_pages):]:
+            try:
+                await channel.get_partial_message(message_id).delete()
+            except discord.NotFound:
+                pass
+            except Exception as e:
+                logging.error(f"[GuildMembers] Error deleting roster message {message_id}: {e}", exc_info=True)
+                continue
+            extra_ids.remove(message_id)
+            self.roster_renderer.remember_page(guild_id, message_id, None)
+            extra_changed = True
+
+        if extra_changed:
+            await self.bot.run_db_query(
+                "UPDATE guild_channels SET members_extra_messages = %s WHERE guild_id = %s",
+                (json.dumps(extra_ids) if extra_ids else None, guild_id),
+                commit=True
+            )
+            await self.bot.cache.set_guild_data(guild_id, 'members_extra_messages', extra_ids)
+            logging.info(f"[GuildMembers] Roster for guild {guild_id} now uses {len(extra_ids)} extra message(s)")
+
     async def show_build(
         self,
         ctx: discord.ApplicationContext,
@@ -1584,8 +1780,7 @@ class GuildMembers(commands.Cog):
         
         guild_id = ctx.guild.id
 
-        await self.bot.cache_loader.ensure_guild_members_loaded()
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         matching = [m for (g, _), m in guild_members.items() 
                    if g == guild_id and m.get("username", "").lower().startswith(sanitized_username.lower())]
 
@@ -1624,10 +1819,8 @@ class GuildMembers(commands.Cog):
         guild = ctx.guild
         guild_id = guild.id
 
-        await self.bot.cache_loader.ensure_guild_members_loaded()
-        
         incomplete_members = []
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         logging.debug(f"[GuildMembers] notify_incomplete_profiles: Found {len(guild_members)} total members in cache")
         
         guild_member_count = 0
@@ -1649,20 +1842,11 @@ class GuildMembers(commands.Cog):
             await ctx.followup.send(msg, ephemeral=True)
             return
 
-        successes = 0
-        failures = 0
-        for member_id in incomplete_members:
-            member = guild.get_member(member_id)
-            msg = await get_user_message(ctx, GUILD_MEMBERS["notify_profile"], "mp_sent")
-            if member:
-                try:
-                    await member.send(msg)
-                    successes += 1
-                except Exception as e:
-                    logging.error(f"[GuildMembers] Error sending DM to {member.display_name} (ID: {member_id}): {e}")
-                    failures += 1
-            else:
-                failures += 1
+        msg = await get_user_message(ctx, GUILD_MEMBERS["notify_profile"], "mp_sent")
+        recipients = [guild.get_member(member_id) for member_id in incomplete_members]
+        report = await self.dm_dispatcher.send_batch(f"profile_nudge:{guild_id}", recipients, msg)
+        successes = len(report["sent"])
+        failures = len(incomplete_members) - successes
 
         msg = await get_user_message(ctx, GUILD_MEMBERS["notify_profile"], "success", successes=successes, failures=failures)
         await ctx.followup.send(msg,ephemeral=True)
@@ -1753,7 +1937,7 @@ class GuildMembers(commands.Cog):
                 """
                 await self.bot.run_db_query(query, (guild_id, class_name, count), commit=True)
 
-            await self.bot.cache_loader.reload_category('guild_ideal_staff')
+            await self.bot.cache_loader.reload_category('guild_ideal_staff', guild_id)
             
             await self.update_recruitment_message(ctx)
             
@@ -1768,6 +1952,245 @@ class GuildMembers(commands.Cog):
             error_msg = await get_user_message(ctx, GUILD_MEMBERS["config_roster"], "messages.update_error")
             await ctx.followup.send(error_msg, ephemeral=True)
 
+    async def _stream_roster_export(self, guild_id: int, export_format: str):
+        """
+        Stream a guild's roster export line by line.
+
+        Rows are read by keyset pages of ROSTER_EXPORT_PAGE_SIZE members, so
+        at most one page of the roster is held in memory at a time.
+
+        Args:
+            guild_id: The ID of the guild
+            export_format: "csv" or "ndjson"
+
+        Yields:
+            Encoded lines, starting with the header row for CSV
+        """
+        if export_format == "csv":
+            yield encode_roster_row(ROSTER_EXPORT_COLUMNS, export_format)
+
+        last_member_id = 0
+        while True:
+            rows = await self.bot.run_db_query(
+                ROSTER_EXPORT_QUERY, (guild_id, guild_id, last_member_id, ROSTER_EXPORT_PAGE_SIZE), fetch_all=True
+            ) or []
+            for row in rows:
+                yield encode_roster_row(row, export_format)
+            if len(rows) < ROSTER_EXPORT_PAGE_SIZE:
+                return
+            last_member_id = rows[-1][0]
+
+    @admin_rate_limit(cooldown_seconds=60)
+    async def export_roster(
+        self,
+        ctx: discord.ApplicationContext,
+        export_format: str = discord.Option(
+            str,
+            name="format",
+            description=GUILD_MEMBERS.get("export_roster", {}).get("options", {}).get("format", {}).get("description", {}).get("en-US", "File format"),
+            description_localizations=GUILD_MEMBERS.get("export_roster", {}).get("options", {}).get("format", {}).get("description", {}),
+            choices=[
+                discord.OptionChoice(name="CSV", value="csv"),
+                discord.OptionChoice(name="NDJSON", value="ndjson")
+            ],
+            default="csv"
+        )
+    ):
+        """
+        Export the guild roster as a CSV or NDJSON attachment.
+
+        Args:
+            ctx: Discord application context
+            export_format: "csv" or "ndjson"
+
+        Returns:
+            None
+        """
+        await ctx.defer(ephemeral=True)
+
+        if not ctx.guild:
+            invalid_context_msg = await get_user_message(ctx, GUILD_MEMBERS["export_roster"], "messages.invalid_context")
+            await ctx.followup.send(invalid_context_msg, ephemeral=True)
+            return
+
+        guild_id = ctx.guild.id
+        try:
+            with tempfile.TemporaryFile() as buffer:
+                lines = -1 if export_format == "csv" else 0
+                async for line in self._stream_roster_export(guild_id, export_format):
+                    buffer.write(line)
+                    lines += 1
+                buffer.seek(0)
+
+                msg = await get_user_message(ctx, GUILD_MEMBERS["export_roster"], "messages.success", count=lines)
+                await ctx.followup.send(msg, file=discord.File(buffer, filename=f"roster_{guild_id}.{export_format}"), ephemeral=True)
+            logging.info(f"[GuildMembers - ExportRoster] Exported {lines} members of guild {guild_id} as {export_format}")
+        except Exception as e:
+            logging.exception(f"[GuildMembers - ExportRoster] Error exporting roster for guild {guild_id}: {e}")
+            error_msg = await get_user_message(ctx, GUILD_MEMBERS["export_roster"], "messages.export_error")
+            await ctx.followup.send(error_msg, ephemeral=True)
+
+    def _validate_import_row(self, row: dict, weapon_roles: Dict[frozenset, str], valid_weapons: frozenset) -> Optional[Tuple[int, list]]:
+        """
+        Validate one roster import row.
+
+        Empty and "NULL" cells leave the stored value unchanged; any other
+        invalid cell rejects the whole row.
+
+        Args:
+            row: Row with lower-case keys (member_id, gs, weapons, build)
+            weapon_roles: Weapon pair -> role table of the guild's game
+            valid_weapons: Valid weapon codes of the guild's game
+
+        Returns:
+            Tuple of (member_id, changes) where changes is [(field, value), ...], or None if the row is invalid
+        """
+        def blank(value: Any) -> bool:
+            return value is None or str(value).strip() in ("", "NULL", "None")
+
+        member_id = self._validate_integer(row.get("member_id"), 1)
+        if member_id is None:
+            return None
+
+        changes = []
+        gs = row.get("gs")
+        if not blank(gs) and str(gs).strip() != "0":
+            gs_value = self._validate_integer(gs, self.min_gs_value, self.max_gs_value)
+            if gs_value is None:
+                return None
+            changes.append(("GS", gs_value))
+
+        weapons = row.get("weapons")
+        if not blank(weapons):
+            if not isinstance(weapons, str):
+                return None
+            codes = [self._validate_weapon_code(code) for code in re.split(r"[/,]", weapons)]
+            if len(codes) != 2 or None in codes or codes[0] == codes[1] or not valid_weapons.issuperset(codes):
+                return None
+            codes.sort()
+            changes.append(("weapons", "/".join(codes)))
+            changes.append(("class", weapon_roles.get(frozenset(codes), "NULL")))
+
+        build = row.get("build")
+        if not blank(build):
+            if not self._validate_url(build):
+                return None
+            changes.append(("build", self._sanitize_string(build.strip(), 500)))
+
+        return member_id, changes
+
+    async def _import_roster_rows(self, guild_id: int, text: str, import_format: str) -> Optional[Tuple[int, List[int]]]:
+        """
+        Validate roster import rows and apply them as chunked upserts in one transaction.
+
+        Only members already on the roster are accepted. The roster cache is
+        patched once after the transaction commits.
+
+        Args:
+            guild_id: The ID of the guild
+            text: Decoded file content
+            import_format: "csv" or "ndjson"
+
+        Returns:
+            Tuple of (updated member count, rejected line numbers), or None if the transaction failed
+        """
+        weapon_roles, valid_weapons = await self.get_weapon_tables(guild_id)
+
+        async with self.roster_locks.lock(guild_id):
+            roster = await self.get_guild_members(guild_id)
+            updates: Dict[int, list] = {}
+            rejected = []
+            for line_number, row in iter_roster_import(text, import_format):
+                change = self._validate_import_row(row, weapon_roles, valid_weapons) if row else None
+                if change is None or (guild_id, change[0]) not in roster:
+                    rejected.append(line_number)
+                elif change[1]:
+                    updates[change[0]] = change[1]
+
+            if not updates:
+                return 0, rejected
+
+            to_update = list(updates.items())
+            transaction_queries = []
+            for start in range(0, len(to_update), ROSTER_IMPORT_CHUNK_SIZE):
+                chunk = to_update[start:start + ROSTER_IMPORT_CHUNK_SIZE]
+                params = []
+                for member_id, changes in chunk:
+                    fields = dict(changes)
+                    params.extend((guild_id, member_id, fields.get("GS"), fields.get("weapons"), fields.get("class"), fields.get("build")))
+                rows_placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(chunk))
+                transaction_queries.append((ROSTER_IMPORT_UPSERT.format(rows=rows_placeholders), tuple(params)))
+
+            if not await run_db_transaction(transaction_queries):
+                logging.error(f"[GuildMembers] Roster import transaction failed for guild {guild_id}")
+                return None
+            await self._patch_roster_cache(guild_id, [], to_update, [])
+
+        logging.info(f"[GuildMembers] Imported {len(to_update)} members for guild {guild_id} in {len(transaction_queries)} chunks, {len(rejected)} rows rejected")
+        return len(to_update), rejected
+
+    @admin_rate_limit(cooldown_seconds=60)
+    async def import_roster(
+        self,
+        ctx: discord.ApplicationContext,
+        file: discord.Attachment = discord.Option(
+            discord.Attachment,
+            description=GUILD_MEMBERS.get("import_roster", {}).get("options", {}).get("file", {}).get("description", {}).get("en-US", "CSV or NDJSON file"),
+            description_localizations=GUILD_MEMBERS.get("import_roster", {}).get("options", {}).get("file", {}).get("description", {})
+        )
+    ):
+        """
+        Bulk update GS, weapons and builds from a CSV or NDJSON attachment.
+
+        Args:
+            ctx: Discord application context
+            file: Attachment with member_id and any of gs, weapons, build columns
+
+        Returns:
+            None
+        """
+        await ctx.defer(ephemeral=True)
+
+        if not ctx.guild:
+            invalid_context_msg = await get_user_message(ctx, GUILD_MEMBERS["import_roster"], "messages.invalid_context")
+            await ctx.followup.send(invalid_context_msg, ephemeral=True)
+            return
+
+        guild_id = ctx.guild.id
+        import_format = ROSTER_IMPORT_FORMATS.get("." + file.filename.lower().rpartition(".")[2])
+        if not import_format:
+            msg = await get_user_message(ctx, GUILD_MEMBERS["import_roster"], "messages.unsupported_format")
+            await ctx.followup.send(msg, ephemeral=True)
+            return
+
+        if file.size > ROSTER_IMPORT_MAX_BYTES:
+            msg = await get_user_message(ctx, GUILD_MEMBERS["import_roster"], "messages.too_large", max_kb=ROSTER_IMPORT_MAX_BYTES // 1024)
+            await ctx.followup.send(msg, ephemeral=True)
+            return
+
+        try:
+            text = (await file.read()).decode("utf-8-sig")
+            result = await self._import_roster_rows(guild_id, text, import_format)
+        except UnicodeDecodeError:
+            result = None
+            logging.warning(f"[GuildMembers - ImportRoster] Attachment for guild {guild_id} is not UTF-8")
+        except Exception as e:
+            result = None
+            logging.exception(f"[GuildMembers - ImportRoster] Error importing roster for guild {guild_id}: {e}")
+
+        if result is None:
+            msg = await get_user_message(ctx, GUILD_MEMBERS["import_roster"], "messages.import_error")
+            await ctx.followup.send(msg, ephemeral=True)
+            return
+
+        updated, rejected = result
+        rejected_lines = ", ".join(str(line) for line in rejected[:20]) + ("…" if len(rejected) > 20 else "")
+        msg = await get_user_message(
+            ctx, GUILD_MEMBERS["import_roster"], "messages.success",
+            updated=updated, rejected=len(rejected), lines=rejected_lines or "-"
+        )
+        await ctx.followup.send(msg, ephemeral=True)
+
     async def change_language(
         self,
         ctx: discord.ApplicationContext,
@@ -1801,7 +2224,7 @@ class GuildMembers(commands.Cog):
         member_id = ctx.author.id
 
         key = (guild_id, member_id)
-        guild_members = await self.get_guild_members()
+        guild_members = await self.get_guild_members(guild_id)
         if key not in guild_members:
             logging.debug(f"[GuildMembers - ChangeLanguage] Profile not found in guild_members cache for key {key}, trying database fallback...")
             try:
@@ -1855,129 +2278,82 @@ class GuildMembers(commands.Cog):
             error_msg = await get_user_message(ctx, GUILD_MEMBERS["change_language"], "messages.error", error=str(e))
             await ctx.followup.send(error_msg, ephemeral=True)
 
-    async def run_maj_roster(self, guild_id: int) -> None:
+    async def _roster_sync_config(self, guild_id: int) -> Optional[Tuple[int, Optional[int], str]]:
         """
-        Run roster update for a specific guild.
+        Get the roster settings of a guild that takes part in roster maintenance.
         
         Args:
-            guild_id: The ID of the guild to update roster for
+            guild_id: The ID of the guild
             
         Returns:
-            None
+            Tuple of (members_role_id, absent_role_id, locale), or None for PTB,
+            unconfigured guilds and guilds without a members role
         """
         guild_ptb_config = await self.bot.cache.get_guild_data(guild_id, 'ptb_settings')
         if guild_ptb_config and guild_ptb_config.get('is_ptb_guild', False):
             logging.debug(f"[GuildMembers] Skipping roster update for PTB guild {guild_id}")
-            return
+            return None
 
         guild_settings = await self.bot.cache.get_guild_data(guild_id, 'settings')
         if not guild_settings or not guild_settings.get('initialized', False):
             logging.debug(f"[GuildMembers] Skipping roster update for unconfigured guild {guild_id}")
-            return
+            return None
         
         roles_config = await self.bot.cache.get_guild_data(guild_id, 'roles')
         if not roles_config:
             logging.debug(f"[GuildMembers] No roles configured for guild {guild_id}")
-            return
+            return None
 
         members_role_id = roles_config.get("members")
-        absent_role_id = roles_config.get("absent_members")
         if not members_role_id:
             logging.error(f"[GuildMembers] Members role not configured for guild {guild_id}")
+            return None
+
+        locale = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
+        return members_role_id, roles_config.get("absent_members"), locale
+
+    async def run_maj_roster(self, guild_id: int) -> None:
+        """
+        Reconcile the roster of a specific guild.
+        
+        Event-driven maintenance keeps the roster current, so the scheduled
+        run only compares the checksum of the role holders with the checksum
+        of the synced roster and runs a full diff when they differ (or when
+        the guild has not been synced since startup).
+        
+        Args:
+            guild_id: The ID of the guild to update roster for
+            
+        Returns:
+            None
+        """
+        config = await self._roster_sync_config(guild_id)
+        if not config:
             return
+        members_role_id, absent_role_id, locale = config
 
         guild = self.bot.get_guild(guild_id)
         if not guild:
             logging.error(f"[GuildMembers] Guild {guild_id} not found on Discord")
             return
 
-        actual_members = {
-            m.id: m for m in guild.members
-            if not m.bot and (members_role_id in [r.id for r in m.roles] or absent_role_id in [r.id for r in m.roles])
-        }
+        self._roster_stats["reconciled"] += 1
+        expected = self._roster_checksums.get(guild_id)
+        if expected is not None and guild_id not in self._roster_mailboxes:
+            actual_members = self._roster_role_members(guild, members_role_id, absent_role_id)
+            if roster_checksum((member_id, member.display_name) for member_id, member in actual_members.items()) == expected:
+                self._roster_stats["checksum_hits"] += 1
+                logging.debug(f"[GuildMembers] Roster checksum matches for guild {guild_id}, skipping diff")
+                return
 
-        guild_members = await self.get_guild_members()
-        to_delete = []
-        for (g, user_id), data in guild_members.items():
-            if g == guild_id and user_id not in actual_members:
-                delete_query = "DELETE FROM guild_members WHERE guild_id = %s AND member_id = %s"
-                await self.bot.run_db_query(delete_query, (guild_id, user_id), commit=True)
-                to_delete.append(user_id)
-
-        user_setup_members = await self.get_user_setup_members()
-        for member in actual_members.values():
-            key = (guild_id, member.id)
-            if key in guild_members:
-                record = guild_members[key]
-                if record.get("username") != member.display_name:
-                    update_query = "UPDATE guild_members SET username = %s WHERE guild_id = %s AND member_id = %s"
-                    await self.bot.run_db_query(update_query, (member.display_name, guild_id, member.id), commit=True)
-                    logging.debug(f"[GuildMembers] Username updated for {member.display_name} (ID: {member.id})")
-            else:
-                key_setup = (guild_id, member.id)
-                user_setup = user_setup_members.get(key_setup, {})
-                if user_setup:
-                    language = user_setup.get("locale") or "en-US"
-                    if language and '-' in language:
-                        language = language.split('-')[0]
-                    gs_value = user_setup.get("gs")
-                    logging.debug(f"[GuildMembers] User setup values for {member.display_name}: language={language}, gs={gs_value}")
-                else:
-                    language = "en-US"
-                    gs_value = 0
-                    logging.debug(f"[GuildMembers] No user_setup info for {member.display_name}. Default values: language={language}, gs={gs_value}")
-                if gs_value in (None, "", "NULL"):
-                    gs_value = 0
-                new_record = {
-                    "username": member.display_name,
-                    "language": language,
-                    "GS": gs_value,
-                    "build": None,
-                    "weapons": None,
-                    "DKP": 0,
-                    "nb_events": 0,
-                    "registrations": 0,
-                    "attendances": 0,
-                    "class": None
-                }
-                insert_query = """
-                    INSERT INTO guild_members 
-                    (guild_id, member_id, username, language, GS, build, weapons, DKP, nb_events, registrations, attendances, `class`)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                    username = VALUES(username),
-                    language = VALUES(language),
-                    GS = VALUES(GS),
-                    build = VALUES(build),
-                    weapons = VALUES(weapons),
-                    DKP = VALUES(DKP),
-                    nb_events = VALUES(nb_events),
-                    registrations = VALUES(registrations),
-                    attendances = VALUES(attendances),
-                    `class` = VALUES(`class`)
-                """
-                await self.bot.run_db_query(
-                    insert_query,
-                    (
-                        guild_id,
-                        member.id,
-                        new_record["username"],
-                        new_record["language"],
-                        new_record["GS"],
-                        new_record["build"],
-                        new_record["weapons"],
-                        new_record["DKP"],
-                        new_record["nb_events"],
-                        new_record["registrations"],
-                        new_record["attendances"],
-                        new_record["class"]
-                    ),
-                    commit=True
-                )
-                logging.debug(f"[GuildMembers] New member added: {member.display_name} (ID: {member.id})")
+        try:
+            deleted, updated, inserted = await self._sync_roster(guild, members_role_id, absent_role_id, locale)
+        except Exception as e:
+            logging.error(f"[GuildMembers] Error loading member data for guild {guild_id}: {e}", exc_info=True)
+            return
+        logging.debug(f"[GuildMembers] Roster sync for guild {guild_id}: -{deleted} ~{updated} +{inserted}")
 
         try:
-            await self._load_members_data()
             await self.update_recruitment_message(guild)
             await self.update_members_message(guild)
             logging.info(f"[GuildMembers] Roster synchronization completed for guild {guild_id}")
@@ -2001,10 +2377,158 @@ class GuildMembers(commands.Cog):
         except Exception as e:
             logging.exception(f"[GuildMembers] Error during on_ready initialization: {e}")
     
+# #################################################################################### #
+#                            Event-Driven Roster Maintenance
+# #################################################################################### #
+    def _enqueue_roster_change(self, guild: discord.Guild, member_id: int, member: Optional[discord.Member]) -> None:
+        """
+        Append a member change to the guild roster mailbox, starting its worker if needed.
+        
+        Args:
+            guild: Discord guild of the member
+            member_id: Discord member ID
+            member: Current member state, or None when the member left the guild
+            
+        Returns:
+            None
+        """
+        mailbox = self._roster_mailboxes.get(guild.id)
+        if mailbox is None:
+            mailbox = asyncio.Queue()
+            self._roster_mailboxes[guild.id] = mailbox
+            self._roster_workers[guild.id] = asyncio.create_task(self._roster_worker(guild, mailbox))
+        mailbox.put_nowait((member_id, member))
+        self._roster_stats["enqueued"] += 1
+
+    async def _roster_worker(self, guild: discord.Guild, mailbox: asyncio.Queue) -> None:
+        """
+        Drain a guild roster mailbox, flushing at most once per debounce window.
+        
+        Changes arriving within the window are coalesced per member and
+        written together. The worker exits once the mailbox stays empty for
+        the idle timeout.
+        
+        Args:
+            guild: Discord guild owning the roster
+            mailbox: Queue of (member_id, member) tuples for this guild
+            
+        Returns:
+            None
+        """
+        window = ROSTER_DEBOUNCE_MS / 1000
+        try:
+            while True:
+                try:
+                    first = await asyncio.wait_for(mailbox.get(), timeout=ROSTER_WORKER_IDLE_SECONDS)
+                except asyncio.TimeoutError:
+                    if mailbox.empty():
+                        return
+                    continue
+
+                await asyncio.sleep(window)
+                batch = [first]
+                while not mailbox.empty():
+                    batch.append(mailbox.get_nowait())
+
+                await self._flush_roster_batch(guild, batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"[GuildMembers] Roster worker for guild {guild.id} stopped: {e}", exc_info=True)
+        finally:
+            if self._roster_mailboxes.get(guild.id) is mailbox:
+                del self._roster_mailboxes[guild.id]
+                self._roster_workers.pop(guild.id, None)
+
+    async def _flush_roster_batch(self, guild: discord.Guild, batch: List[Tuple[int, Optional[discord.Member]]]) -> None:
+        """
+        Apply a batch of member changes to the roster in one transaction.
+        
+        Only the members of the batch are read and diffed; the guild's roster
+        checksum is patched with their old and new entries.
+        
+        Args:
+            guild: Discord guild owning the roster
+            batch: List of (member_id, member) tuples in arrival order
+            
+        Returns:
+            None
+        """
+        guild_id = guild.id
+        config = await self._roster_sync_config(guild_id)
+        if not config:
+            return
+        members_role_id, absent_role_id, locale = config
+        roster_role_ids = {members_role_id, absent_role_id} - {None}
+
+        changes = dict(batch)
+        actual_members = {
+            member_id: member for member_id, member in changes.items()
+            if member is not None and not member.bot and any(role.id in roster_role_ids for role in member.roles)
+        }
+
+        async with self.roster_locks.lock(guild_id):
+            guild_members_db = await self._get_guild_members_bulk(guild_id, list(changes))
+            if not actual_members and not guild_members_db:
+                return
+            user_setup_db = await self._get_user_setup_bulk(guild_id, list(changes))
+
+            counts = await self._apply_roster_sync(guild_id, actual_members, guild_members_db, user_setup_db, locale)
+            if counts is None:
+                self._roster_checksums.pop(guild_id, None)
+                return
+            if guild_id in self._roster_checksums:
+                self._roster_checksums[guild_id] ^= roster_checksum(
+                    (member_id, data.get('username')) for member_id, data in guild_members_db.items()
+                ) ^ roster_checksum(
+                    (member_id, member.display_name) for member_id, member in actual_members.items()
+                )
+            self._roster_stats["flushes"] += 1
+
+        deleted, updated, inserted = counts
+        logging.debug(f"[GuildMembers] Flushed {len(batch)} roster change(s) for guild {guild_id}: -{deleted} ~{updated} +{inserted}")
+        if any(counts):
+            try:
+                await self.update_recruitment_message(guild)
+                await self.update_members_message(guild)
+            except Exception as e:
+                logging.error(f"[GuildMembers] Error refreshing roster messages for guild {guild_id}: {e}", exc_info=True)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        """
+        Queue a joining member for roster maintenance.
+        
+        Args:
+            member: Member who joined the guild
+            
+        Returns:
+            None
+        """
+        if not member.bot:
+            self._enqueue_roster_change(member.guild, member.id, member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        """
+        Queue a departing member for removal from the roster.
+        
+        Args:
+            member: Member who left the guild
+            
+        Returns:
+            None
+        """
+        if not member.bot:
+            self._enqueue_roster_change(member.guild, member.id, None)
+
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
         """
-        Sync member nickname changes to PTB guild.
+        Queue roster role and nickname changes for roster maintenance and sync nicknames to the PTB guild.
+        
+        Only a change to the member's members/absent roles, or a nickname
+        change of a member holding one of them, reaches the roster mailbox.
         
         Args:
             before: Member state before the update
@@ -2014,6 +2538,15 @@ class GuildMembers(commands.Cog):
             None
         """
         try:
+            if not after.bot and (before.display_name != after.display_name or before.roles != after.roles):
+                config = await self._roster_sync_config(after.guild.id)
+                if config:
+                    roster_role_ids = set(config[:2]) - {None}
+                    roles_before = {role.id for role in before.roles} & roster_role_ids
+                    roles_after = {role.id for role in after.roles} & roster_role_ids
+                    if roles_before != roles_after or (roles_after and before.display_name != after.display_name):
+                        self._enqueue_roster_change(after.guild, after.id, after)
+
             if before.display_name == after.display_name:
                 return
 
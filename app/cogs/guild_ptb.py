@@ -11,6 +11,7 @@ import discord
 import pytz
 from discord.ext import commands
 
+from core.dm_dispatcher import get_dm_dispatcher
 from core.reliability import discord_resilient
 from core.translation import translations as global_translations
 
@@ -34,6 +35,7 @@ class GuildPTB(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
+        self.dm_dispatcher = get_dm_dispatcher()
 
         self._register_admin_commands()
     
@@ -383,7 +385,7 @@ class GuildPTB(commands.Cog):
             await self.bot.run_db_query(query, data, commit=True)
 
             await self.bot.cache.delete_guild_data(main_guild_id, 'ptb_settings')
-            await self.bot.cache_loader.reload_category('guild_ptb_settings')
+            await self.bot.cache_loader.reload_category('guild_ptb_settings', main_guild_id)
             
             logging.info(f"[GuildPTB] Saved PTB settings for guild {main_guild_id}")
             
@@ -443,7 +445,7 @@ class GuildPTB(commands.Cog):
             if missing_groups:
                 logging.debug(f"[GuildPTB] Missing group configs: {missing_groups}, reloading PTB settings")
                 await self.bot.cache.invalidate_category('guild_data')
-                await self.bot.cache_loader.reload_category('guild_ptb_settings')
+                await self.bot.cache_loader.reload_category('guild_ptb_settings', main_guild_id)
                 ptb_settings = await self.get_guild_ptb_settings(main_guild_id)
                 if not ptb_settings:
                     logging.error(f"[GuildPTB] Still no PTB settings after reload for guild {main_guild_id}")
@@ -616,18 +618,13 @@ class GuildPTB(commands.Cog):
             invitation_message = GUILD_PTB["invitation"]["dm_message"].get(guild_lang,
                 GUILD_PTB["invitation"]["dm_message"].get("en-US")).format(invite_url=invite.url)
             
-            for member_id in all_member_ids:
-                ptb_member = ptb_guild.get_member(member_id)
-                if not ptb_member:
-                    main_member = main_guild.get_member(member_id)
-                    if main_member:
-                        try:
-                            await main_member.send(invitation_message)
-                            logging.debug(f"[GuildPTB] Sent PTB invitation to {main_member.display_name}")
-                        except discord.Forbidden:
-                            logging.warning(f"[GuildPTB] Cannot send DM to {main_member.display_name}")
-                        except Exception as e:
-                            logging.error(f"[GuildPTB] Error sending invitation to {main_member.display_name}: {e}")
+            missing_members = [
+                main_guild.get_member(member_id) for member_id in all_member_ids
+                if not ptb_guild.get_member(member_id)
+            ]
+            report = await self.dm_dispatcher.send_batch(f"ptb_invitations:{main_guild_id}", missing_members, invitation_message)
+            if report['forbidden'] or report['failed']:
+                logging.warning(f"[GuildPTB] PTB invitations for guild {main_guild_id}: {len(report['forbidden'])} closed DMs, {len(report['failed'])} failed")
                             
         except Exception as e:
             logging.error(f"[GuildPTB] Error sending invitations: {e}", exc_info=True)
@@ -7,7 +7,7 @@ import logging
 import os
 import re
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 
 import discord
 from discord.ext import commands
@@ -37,6 +37,8 @@ def get_openai_client():
         raise ValueError("API_KEY not found in environment")
     return OpenAI(api_key=api_key)
 
+DEFAULT_WEAPON_CODES = frozenset(("B", "CB", "DG", "GS", "S", "SNS", "SP", "W"))
+
 _FALLBACK = {
     "bow": "B",
     "arc": "B",
@@ -292,23 +294,25 @@ class LLMInteraction(commands.Cog):
                 await asyncio.sleep(1)
         return "Request timed out after multiple attempts."
 
-    async def normalize_weapons(self, raw: str) -> str:
+    async def normalize_weapons(self, raw: str, valid_codes: Optional[Iterable[str]] = None) -> str:
         """
         Normalize weapon names to standardized codes using AI and fallback logic.
         
         Args:
             raw: Raw weapon names input from user
+            valid_codes: Weapon codes of the guild's game (defaults to the known codes)
             
         Returns:
             Normalized weapon codes separated by '/' (max 32 chars)
         """
+        valid_codes = frozenset(valid_codes) if valid_codes else DEFAULT_WEAPON_CODES
         try:
             sanitized_input = self.sanitize_prompt(raw)
             ai_out = await asyncio.wait_for(
                 self.bot.loop.run_in_executor(None, _ask_ai, f"Input: {sanitized_input}"),
                 timeout=15.0
             )
-            codes = re.findall(r"\b(?:B|CB|DG|GS|S|SNS|SP|W)\b", ai_out.upper())
+            codes = [code for code in re.findall(r"\b[A-Z]+\b", ai_out.upper()) if code in valid_codes]
             if codes:
                 return "/".join(dict.fromkeys(codes))[:32]
         except Exception as e:
@@ -317,7 +321,8 @@ class LLMInteraction(commands.Cog):
         for token in re.split(r"[ ,;/|]+", raw.lower()):
             for k, v in _FALLBACK.items():
                 if k in token:
-                    codes.append(v)
+                    if v in valid_codes:
+                        codes.append(v)
                     break
         return "/".join(dict.fromkeys(codes))[:32]
 
@@ -398,7 +398,6 @@ class LootWishlist(commands.Cog):
                 logging.debug(f"[LootWishlist] Skipping loot update for PTB guild {guild_id}")
                 return False
             
-            await self.bot.cache_loader.ensure_guild_channels_loaded()
             loot_data = await self.bot.cache.get_guild_data(guild_id, 'loot_message')
             
             if not loot_data:
@@ -425,7 +424,6 @@ class LootWishlist(commands.Cog):
 
             stats = await self.get_wishlist_stats(guild_id)
 
-            await self.bot.cache_loader.ensure_guild_settings_loaded()
             guild_lang = await self.bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
 
             title = await get_guild_message(self.bot, guild_id, LOOT_WISHLIST_DATA, "placeholder.title")
@@ -1285,7 +1285,9 @@ class ProfileSetup(commands.Cog):
                         llm_cog = interaction.client.get_cog("LLMInteraction")
                         try:
                             if llm_cog:
-                                weapons_clean = await llm_cog.normalize_weapons(weapons_input)
+                                guild_members_cog = interaction.client.get_cog("GuildMembers")
+                                valid_codes = await guild_members_cog.get_valid_weapons(guild_id) if guild_members_cog else None
+                                weapons_clean = await llm_cog.normalize_weapons(weapons_input, valid_codes)
                                 if not weapons_clean:
                                     weapons_clean = weapons_input
                             else:
@@ -122,6 +122,62 @@ DB_POOL_SIZE = validate_int_env_var("DB_POOL_SIZE", os.getenv("DB_POOL_SIZE"), d
 DB_TIMEOUT = validate_int_env_var("DB_TIMEOUT", os.getenv("DB_TIMEOUT"), default=30)
 DB_CIRCUIT_BREAKER_THRESHOLD = validate_int_env_var("DB_CIRCUIT_BREAKER_THRESHOLD", os.getenv("DB_CIRCUIT_BREAKER_THRESHOLD"), default=5)
 
+# #################################################################################### #
+#                            Cache Synchronization Settings
+# #################################################################################### #
+CACHE_DELTA_SYNC_INTERVAL = validate_int_env_var("CACHE_DELTA_SYNC_INTERVAL", os.getenv("CACHE_DELTA_SYNC_INTERVAL"), default=60)
+CACHE_GUILD_IDLE_TTL = validate_int_env_var("CACHE_GUILD_IDLE_TTL", os.getenv("CACHE_GUILD_IDLE_TTL"), default=21600)
+
+# #################################################################################### #
+#                            Event Creation Settings
+# #################################################################################### #
+EVENTS_CREATE_CONCURRENCY = validate_int_env_var("EVENTS_CREATE_CONCURRENCY", os.getenv("EVENTS_CREATE_CONCURRENCY"), default=4)
+
+# #################################################################################### #
+#                            Event Archival Settings
+# #################################################################################### #
+EVENTS_ARCHIVE_HORIZON_DAYS = validate_int_env_var("EVENTS_ARCHIVE_HORIZON_DAYS", os.getenv("EVENTS_ARCHIVE_HORIZON_DAYS"), default=30)
+EVENTS_ARCHIVE_BATCH_SIZE = validate_int_env_var("EVENTS_ARCHIVE_BATCH_SIZE", os.getenv("EVENTS_ARCHIVE_BATCH_SIZE"), default=500)
+
+# #################################################################################### #
+#                            Event Registration Settings
+# #################################################################################### #
+EVENT_REACTION_DEBOUNCE_MS = validate_int_env_var("EVENT_REACTION_DEBOUNCE_MS", os.getenv("EVENT_REACTION_DEBOUNCE_MS"), default=1500)
+EVENT_REACTION_WORKER_IDLE_SECONDS = validate_int_env_var("EVENT_REACTION_WORKER_IDLE_SECONDS", os.getenv("EVENT_REACTION_WORKER_IDLE_SECONDS"), default=60)
+
+# #################################################################################### #
+#                            Roster Maintenance Settings
+# #################################################################################### #
+ROSTER_DEBOUNCE_MS = validate_int_env_var("ROSTER_DEBOUNCE_MS", os.getenv("ROSTER_DEBOUNCE_MS"), default=5000)
+ROSTER_WORKER_IDLE_SECONDS = validate_int_env_var("ROSTER_WORKER_IDLE_SECONDS", os.getenv("ROSTER_WORKER_IDLE_SECONDS"), default=60)
+ROSTER_EXPORT_PAGE_SIZE = validate_int_env_var("ROSTER_EXPORT_PAGE_SIZE", os.getenv("ROSTER_EXPORT_PAGE_SIZE"), default=500)
+ROSTER_IMPORT_CHUNK_SIZE = validate_int_env_var("ROSTER_IMPORT_CHUNK_SIZE", os.getenv("ROSTER_IMPORT_CHUNK_SIZE"), default=200)
+ROSTER_IMPORT_MAX_BYTES = validate_int_env_var("ROSTER_IMPORT_MAX_BYTES", os.getenv("ROSTER_IMPORT_MAX_BYTES"), default=1048576)
+
+# #################################################################################### #
+#                            DM Delivery Settings
+# #################################################################################### #
+DM_MAX_CONCURRENCY = validate_int_env_var("DM_MAX_CONCURRENCY", os.getenv("DM_MAX_CONCURRENCY"), default=5)
+DM_RATE_PER_SECOND = validate_int_env_var("DM_RATE_PER_SECOND", os.getenv("DM_RATE_PER_SECOND"), default=2)
+DM_BURST = validate_int_env_var("DM_BURST", os.getenv("DM_BURST"), default=5)
+DM_MAX_RETRIES = validate_int_env_var("DM_MAX_RETRIES", os.getenv("DM_MAX_RETRIES"), default=3)
+DM_FORBIDDEN_TTL_SECONDS = validate_int_env_var("DM_FORBIDDEN_TTL_SECONDS", os.getenv("DM_FORBIDDEN_TTL_SECONDS"), default=86400)
+DM_DEDUP_TTL_SECONDS = validate_int_env_var("DM_DEDUP_TTL_SECONDS", os.getenv("DM_DEDUP_TTL_SECONDS"), default=3600)
+
+# #################################################################################### #
+#                            Group Assignment Settings
+# #################################################################################### #
+GROUPS_ENGINE_MODE = validate_env_var("GROUPS_ENGINE_MODE", os.getenv("GROUPS_ENGINE_MODE"), required=False) or "enhanced"
+GROUPS_OFFLOAD_THRESHOLD = validate_int_env_var("GROUPS_OFFLOAD_THRESHOLD", os.getenv("GROUPS_OFFLOAD_THRESHOLD"), default=100)
+
+# #################################################################################### #
+#                            Voice Presence Ledger Settings
+# #################################################################################### #
+VOICE_LEDGER_FLUSH_INTERVAL = validate_int_env_var("VOICE_LEDGER_FLUSH_INTERVAL", os.getenv("VOICE_LEDGER_FLUSH_INTERVAL"), default=60)
+VOICE_LEDGER_FLUSH_BATCH_SIZE = validate_int_env_var("VOICE_LEDGER_FLUSH_BATCH_SIZE", os.getenv("VOICE_LEDGER_FLUSH_BATCH_SIZE"), default=500)
+VOICE_LEDGER_RETENTION_DAYS = validate_int_env_var("VOICE_LEDGER_RETENTION_DAYS", os.getenv("VOICE_LEDGER_RETENTION_DAYS"), default=90)
+ATTENDANCE_MIN_PRESENCE_PERCENT = validate_int_env_var("ATTENDANCE_MIN_PRESENCE_PERCENT", os.getenv("ATTENDANCE_MIN_PRESENCE_PERCENT"), default=50)
+
 # #################################################################################### #
 #                            Translation System Configuration
 # #################################################################################### #
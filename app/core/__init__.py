@@ -7,6 +7,16 @@ from core.translation import translations, load_translations
 from core.reliability import discord_resilient, setup_reliability_system
 from core.rate_limiter import admin_rate_limit, start_cleanup_task
 from core.performance_profiler import profile_performance, get_profiler
+from core.keyed_locks import KeyedLockManager, get_event_locks, get_roster_locks
+from core.event_timeline import EventTimeline, get_event_timeline
+from core.dm_dispatcher import DMDispatcher, get_dm_dispatcher
+from core.group_engine import GroupEngine, get_group_engine
+from core.voice_ledger import VoicePresenceLedger, get_voice_ledger
+from core.dkp_ledger import DKPLedger, get_dkp_ledger
+from core.settlement import Settlement, SettlementEngine, get_settlement_engine
+from core.leaderboard import LeaderboardIndex, OrderStatisticTree, get_leaderboards
+from core.attendance_analytics import AttendanceAnalytics, get_attendance_analytics
+from core.roster_renderer import RosterRenderer, get_roster_renderer
 
 __all__ = [
     # Functions
@@ -30,5 +40,40 @@ __all__ = [
     
     # Performance
     "profile_performance",
-    "get_profiler"
+    "get_profiler",
+    
+    # Locking
+    "KeyedLockManager",
+    "get_event_locks",
+    "get_roster_locks",
+    
+    # Scheduling
+    "EventTimeline",
+    "get_event_timeline",
+    
+    # Messaging
+    "DMDispatcher",
+    "get_dm_dispatcher",
+    
+    # Group assignment
+    "GroupEngine",
+    "get_group_engine",
+    
+    # Attendance
+    "VoicePresenceLedger",
+    "get_voice_ledger",
+    "Settlement",
+    "SettlementEngine",
+    "get_settlement_engine",
+    "DKPLedger",
+    "get_dkp_ledger",
+    "LeaderboardIndex",
+    "OrderStatisticTree",
+    "get_leaderboards",
+    "AttendanceAnalytics",
+    "get_attendance_analytics",
+    
+    # Roster
+    "RosterRenderer",
+    "get_roster_renderer"
 ]
@@ -0,0 +1,302 @@
+"""
+Attendance Analytics - Per-guild member x event presence matrices and vectorized attendance aggregates.
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    logging.warning("[AttendanceAnalytics] numpy not available - attendance analytics disabled")
+
+ROLLING_WINDOW_DAYS = 28
+
+PRESENCE, TENTATIVE, ABSENCE, ATTENDED = range(4)
+REGISTRATION_PLANES = {"presence": PRESENCE, "tentative": TENTATIVE, "absence": ABSENCE}
+
+HISTORY_QUERY = """
+    SELECT event_id, event_date, registrations, actual_presence
+    FROM events_history
+    WHERE guild_id = %s AND status = 'Closed'
+"""
+
+def _as_date(value: Any) -> date:
+    """
+    Normalize an event date from the database or the cache.
+
+    Args:
+        value: date, datetime or ISO string
+
+    Returns:
+        Date of the event
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def _json_value(value: Any, default: Any) -> Any:
+    """
+    Decode a JSON column, tolerating already decoded values.
+
+    Args:
+        value: Raw column value
+        default: Value returned when missing or invalid
+
+    Returns:
+        Decoded value or default
+    """
+    if value is None:
+        return default
+    if isinstance(value, (dict, list)):
+        return value
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+def _ratio(numerator, denominator):
+    """Divide element-wise, yielding 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape), where=denominator > 0)
+
+class GuildAttendanceMatrix:
+    """
+    Boolean member x event matrix of one guild.
+
+    Four planes share the same rows and columns: registered present,
+    tentative, absent, and actually attended. Rows and columns are
+    appended with doubling capacity, so recording a new event is
+    amortized O(members) and aggregates are whole-matrix reductions.
+    """
+
+    def __init__(self, members_capacity: int = 64, events_capacity: int = 64):
+        """
+        Initialize an empty matrix.
+
+        Args:
+            members_capacity: Initial row capacity
+            events_capacity: Initial column capacity
+        """
+        self.member_ids: List[int] = []
+        self.member_rows: Dict[int, int] = {}
+        self.event_ids: List[int] = []
+        self.event_cols: Dict[int, int] = {}
+        self._flags = np.zeros((4, members_capacity, events_capacity), dtype=bool)
+        self._days = np.zeros(events_capacity, dtype=np.int64)
+
+    def _grow(self, members: int, events: int) -> None:
+        _, row_capacity, col_capacity = self._flags.shape
+        if members <= row_capacity and events <= col_capacity:
+            return
+        while row_capacity < members:
+            row_capacity *= 2
+        while col_capacity < events:
+            col_capacity *= 2
+        flags = np.zeros((4, row_capacity, col_capacity), dtype=bool)
+        flags[:, :len(self.member_ids), :len(self.event_ids)] = self._flags[:, :len(self.member_ids), :len(self.event_ids)]
+        days = np.zeros(col_capacity, dtype=np.int64)
+        days[:len(self.event_ids)] = self._days[:len(self.event_ids)]
+        self._flags, self._days = flags, days
+
+    def _rows(self, member_ids: Iterable[int]) -> List[int]:
+        member_ids = list(member_ids)
+        new_ids = [member_id for member_id in dict.fromkeys(member_ids) if member_id not in self.member_rows]
+        if new_ids:
+            self._grow(len(self.member_ids) + len(new_ids), len(self.event_ids))
+            for member_id in new_ids:
+                self.member_rows[member_id] = len(self.member_ids)
+                self.member_ids.append(member_id)
+        return [self.member_rows[member_id] for member_id in member_ids]
+
+    def set_event(self, event_id: int, event_date: Any, registrations: Dict[str, list], attended: Iterable[int]) -> None:
+        """
+        Write or overwrite the column of a closed event.
+
+        Args:
+            event_id: Event ID
+            event_date: Event date
+            registrations: Registration lists by status (presence, tentative, absence)
+            attended: Member IDs counted present
+        """
+        col = self.event_cols.get(event_id)
+        if col is None:
+            col = len(self.event_ids)
+            self._grow(len(self.member_ids), col + 1)
+            self.event_cols[event_id] = col
+            self.event_ids.append(event_id)
+        else:
+            self._flags[:, :, col] = False
+        self._days[col] = _as_date(event_date).toordinal()
+
+        for status, plane in REGISTRATION_PLANES.items():
+            rows = self._rows(int(member_id) for member_id in (registrations or {}).get(status, []))
+            self._flags[plane, rows, col] = True
+        rows = self._rows(int(member_id) for member_id in attended or [])
+        self._flags[ATTENDED, rows, col] = True
+
+    def aggregates(self, today: date, member_ids: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        """
+        Compute attendance aggregates with vector operations.
+
+        Args:
+            today: Reference day of the rolling window
+            member_ids: Restrict rows to these members (all tracked members when None)
+
+        Returns:
+            Dictionary with member_ids, event counts and per-member arrays:
+            rolling_rate, no_show_rate, conversion_rate, attended and
+            weekday_rate (members x 7, Monday first)
+        """
+        members, events = len(self.member_ids), len(self.event_ids)
+        if member_ids is None:
+            rows = np.arange(members)
+            selected = list(self.member_ids)
+        else:
+            selected = [member_id for member_id in member_ids if member_id in self.member_rows]
+            rows = np.fromiter((self.member_rows[member_id] for member_id in selected), dtype=np.int64, count=len(selected))
+
+        presence, tentative, _, attended = self._flags[:, rows, :events]
+        days = self._days[:events]
+        window = days > today.toordinal() - ROLLING_WINDOW_DAYS
+        registered = presence | tentative
+
+        weekdays = (days - 1) % 7
+        weekday_onehot = np.eye(7, dtype=np.int64)[weekdays]
+        events_per_weekday = weekday_onehot.sum(axis=0)
+
+        return {
+            "member_ids": selected,
+            "events": events,
+            "window_events": int(window.sum()),
+            "events_per_weekday": events_per_weekday,
+            "attended": attended.sum(axis=1),
+            "rolling_rate": _ratio(attended[:, window].sum(axis=1), window.sum()),
+            "no_show_rate": _ratio((presence & ~attended).sum(axis=1), presence.sum(axis=1)),
+            "conversion_rate": _ratio((registered & attended).sum(axis=1), registered.sum(axis=1)),
+            "weekday_rate": _ratio(attended.astype(np.int64) @ weekday_onehot, events_per_weekday)
+        }
+
+class AttendanceAnalytics:
+    """
+    Cache one attendance matrix per guild.
+
+    A guild is built from events_history on first use; after that each
+    event is added as it closes, so the JSON documents of past events are
+    decoded once per process.
+    """
+
+    def __init__(self):
+        """Initialize the matrix cache."""
+        self._guilds: Dict[int, GuildAttendanceMatrix] = {}
+        self._stats = {'builds': 0, 'events_recorded': 0, 'queries': 0}
+
+    async def ensure(self, run_db_query: Callable[..., Awaitable[Any]], guild_id: int) -> GuildAttendanceMatrix:
+        """
+        Get a guild's matrix, building it from the event history if needed.
+
+        Args:
+            run_db_query: Database query coroutine
+            guild_id: Discord guild ID
+
+        Returns:
+            Attendance matrix of the guild
+        """
+        matrix = self._guilds.get(guild_id)
+        if matrix is not None:
+            return matrix
+
+        rows = await run_db_query(HISTORY_QUERY, (guild_id,), fetch_all=True) or []
+        matrix = GuildAttendanceMatrix(events_capacity=max(64, len(rows)))
+        for event_id, event_date, registrations, actual_presence in rows:
+            matrix.set_event(
+                event_id, event_date,
+                _json_value(registrations, {}),
+                _json_value(actual_presence, [])
+            )
+        self._guilds[guild_id] = matrix
+        self._stats['builds'] += 1
+        logging.debug(f"[AttendanceAnalytics] Built matrix for guild {guild_id}: {len(matrix.member_ids)} members x {len(matrix.event_ids)} events")
+        return matrix
+
+    def record_event(self, guild_id: int, event_id: int, event_date: Any, registrations: Dict[str, list], attended: Iterable[int]) -> None:
+        """
+        Add a closed event to a built matrix (ignored until the guild is built).
+
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event ID
+            event_date: Event date
+            registrations: Registration lists by status
+            attended: Member IDs counted present
+        """
+        matrix = self._guilds.get(guild_id)
+        if matrix is None:
+            return
+        try:
+            matrix.set_event(event_id, event_date, registrations, attended)
+            self._stats['events_recorded'] += 1
+        except (TypeError, ValueError) as e:
+            logging.warning(f"[AttendanceAnalytics] Could not record event {event_id} for guild {guild_id}: {e}")
+
+    async def aggregates(self, run_db_query: Callable[..., Awaitable[Any]], guild_id: int, today: date,
+                         member_ids: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        """
+        Compute attendance aggregates for a guild.
+
+        Args:
+            run_db_query: Database query coroutine
+            guild_id: Discord guild ID
+            today: Reference day of the rolling window
+            member_ids: Restrict rows to these members
+
+        Returns:
+            Aggregates as returned by GuildAttendanceMatrix.aggregates
+        """
+        matrix = await self.ensure(run_db_query, guild_id)
+        self._stats['queries'] += 1
+        return matrix.aggregates(today, member_ids)
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """
+        Drop a guild's matrix, or every matrix.
+
+        Args:
+            guild_id: Discord guild ID (None for all guilds)
+        """
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get analytics statistics.
+
+        Returns:
+            Dictionary with cached guilds, matrix cells, builds, recorded events and queries
+        """
+        return {
+            **self._stats,
+            'guilds': len(self._guilds),
+            'cells': sum(len(matrix.member_ids) * len(matrix.event_ids) for matrix in self._guilds.values())
+        }
+
+attendance_analytics = AttendanceAnalytics()
+
+def get_attendance_analytics() -> AttendanceAnalytics:
+    """
+    Get the shared attendance analytics cache.
+
+    Returns:
+        Global AttendanceAnalytics instance
+    """
+    return attendance_analytics
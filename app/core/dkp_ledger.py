@@ -0,0 +1,211 @@
+"""
+DKP Ledger - Append-only DKP and counter entries with balances materialized on guild_members.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+COUNTERS = ("DKP", "nb_events", "registrations", "attendances")
+
+OPENING_BALANCE = "opening_balance"
+ROSTER_REMOVED = "roster_removed"
+BACKUP_RESTORED = "backup_restored"
+
+Statement = Tuple[str, tuple]
+Entry = Tuple[int, str, Dict[str, int]]
+
+class DKPLedger:
+    """
+    Build the statements that append to dkp_ledger and keep balances in step.
+
+    Every change to DKP, nb_events, registrations or attendances is an
+    entry (member, event, reason, deltas). The guild_members columns are the
+    materialized sum of a member's entries: writers append entries and add
+    the same deltas to the balances in one transaction, without reading the
+    current values, so concurrent awards cannot overwrite each other. When
+    a member leaves the roster, a database trigger appends a closing entry
+    that brings their sum back to zero.
+    """
+
+    def __init__(self):
+        """Initialize the ledger counters."""
+        self._stats = {'entries': 0, 'rebuilds': 0}
+
+    def entries_statement(self, guild_id: int, event_id: Optional[int], entries: Iterable[Entry]) -> Optional[Statement]:
+        """
+        Build one multi-row insert for a batch of entries.
+
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event the entries settle (None for manual entries)
+            entries: (member_id, reason, deltas) tuples, deltas keyed by counter
+
+        Returns:
+            (query, params) tuple, or None when there is nothing to insert
+        """
+        params = []
+        count = 0
+        for member_id, reason, deltas in entries:
+            params.extend((guild_id, member_id, event_id, reason))
+            params.extend(deltas.get(counter, 0) for counter in COUNTERS)
+            count += 1
+        if not count:
+            return None
+        self._stats['entries'] += count
+        values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s)"] * count)
+        return (
+            f"INSERT INTO dkp_ledger (guild_id, member_id, event_id, reason, DKP, nb_events, registrations, attendances) VALUES {values}",
+            tuple(params)
+        )
+
+    def balances_statement(self, guild_id: int, deltas: Dict[int, Dict[str, int]]) -> Optional[Statement]:
+        """
+        Build the batched increment of materialized balances.
+
+        The deltas are joined from a derived table, so every member is
+        updated by one statement and members without a roster row are ignored.
+
+        Args:
+            guild_id: Discord guild ID
+            deltas: Counter deltas by member ID
+
+        Returns:
+            (query, params) tuple, or None when there is nothing to update
+        """
+        if not deltas:
+            return None
+        rows = " UNION ALL ".join(["SELECT %s AS member_id, %s AS dkp, %s AS nb_events, %s AS registrations, %s AS attendances"] * len(deltas))
+        params = []
+        for member_id, member_deltas in deltas.items():
+            params.append(member_id)
+            params.extend(member_deltas.get(counter, 0) for counter in COUNTERS)
+        params.append(guild_id)
+        return (
+            f"""
+            UPDATE guild_members g
+            JOIN ({rows}) d ON g.member_id = d.member_id
+            SET g.DKP = COALESCE(g.DKP, 0) + d.dkp,
+                g.nb_events = COALESCE(g.nb_events, 0) + d.nb_events,
+                g.registrations = COALESCE(g.registrations, 0) + d.registrations,
+                g.attendances = COALESCE(g.attendances, 0) + d.attendances
+            WHERE g.guild_id = %s
+            """,
+            tuple(params)
+        )
+
+    def adjustment_statement(self, guild_id: int, member_id: int, reason: str, balances: Dict[str, Any]) -> Statement:
+        """
+        Build an entry bringing a member's ledger sum to given balances.
+
+        Used when balances are written directly (backup restore), so a later
+        rebuild from the ledger reproduces them instead of undoing them.
+
+        Args:
+            guild_id: Discord guild ID
+            member_id: Discord member ID
+            reason: Ledger reason of the entry
+            balances: Target value by counter
+
+        Returns:
+            (query, params) tuple
+        """
+        targets = [balances.get(counter) or 0 for counter in COUNTERS]
+        self._stats['entries'] += 1
+        return (
+            """
+            INSERT INTO dkp_ledger (guild_id, member_id, event_id, reason, DKP, nb_events, registrations, attendances)
+            SELECT %s, %s, NULL, %s,
+                   %s - COALESCE(SUM(DKP), 0), %s - COALESCE(SUM(nb_events), 0),
+                   %s - COALESCE(SUM(registrations), 0), %s - COALESCE(SUM(attendances), 0)
+            FROM dkp_ledger WHERE guild_id = %s AND member_id = %s
+            """,
+            (guild_id, member_id, reason, *targets, guild_id, member_id)
+        )
+
+    def rebuild_statement(self, guild_id: int) -> Statement:
+        """
+        Build the statement recomputing every balance of a guild from its entries.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            (query, params) tuple
+        """
+        return (
+            """
+            UPDATE guild_members g
+            LEFT JOIN (
+                SELECT member_id, SUM(DKP) AS dkp, SUM(nb_events) AS nb_events,
+                       SUM(registrations) AS registrations, SUM(attendances) AS attendances
+                FROM dkp_ledger WHERE guild_id = %s GROUP BY member_id
+            ) l ON l.member_id = g.member_id
+            SET g.DKP = COALESCE(l.dkp, 0),
+                g.nb_events = COALESCE(l.nb_events, 0),
+                g.registrations = COALESCE(l.registrations, 0),
+                g.attendances = COALESCE(l.attendances, 0)
+            WHERE g.guild_id = %s
+            """,
+            (guild_id, guild_id)
+        )
+
+    async def rebuild_balances(self, run_transaction: Callable[[List[Statement]], Awaitable[Any]], guild_id: int) -> bool:
+        """
+        Recompute a guild's materialized balances from the ledger.
+
+        The roster cache is not touched; reload the guild_members category
+        afterwards.
+
+        Args:
+            run_transaction: Transaction coroutine taking (query, params) tuples
+            guild_id: Discord guild ID
+
+        Returns:
+            True if the transaction succeeded
+        """
+        result = await run_transaction([self.rebuild_statement(guild_id)])
+        self._stats['rebuilds'] += 1
+        logging.info(f"[DKPLedger] Rebuilt DKP balances for guild {guild_id} from the ledger")
+        return result is not False
+
+    async def get_event_entries(self, run_db_query: Callable[..., Awaitable[Any]], guild_id: int, event_id: int) -> List[Dict[str, Any]]:
+        """
+        Get the entries recorded for an event.
+
+        Args:
+            run_db_query: Database query coroutine
+            guild_id: Discord guild ID
+            event_id: Event ID
+
+        Returns:
+            List of entries with member_id, reason, counter deltas and created_at
+        """
+        rows = await run_db_query(
+            "SELECT member_id, reason, DKP, nb_events, registrations, attendances, created_at "
+            "FROM dkp_ledger WHERE guild_id = %s AND event_id = %s ORDER BY entry_id",
+            (guild_id, event_id), fetch_all=True
+        )
+        return [
+            {"member_id": row[0], "reason": row[1], **dict(zip(COUNTERS, row[2:6])), "created_at": row[6]}
+            for row in rows or []
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get ledger statistics.
+
+        Returns:
+            Dictionary with the number of entries built and balance rebuilds
+        """
+        return dict(self._stats)
+
+dkp_ledger = DKPLedger()
+
+def get_dkp_ledger() -> DKPLedger:
+    """
+    Get the shared DKP ledger.
+
+    Returns:
+        Global DKPLedger instance
+    """
+    return dkp_ledger
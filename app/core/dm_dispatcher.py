@@ -0,0 +1,217 @@
+"""
+DM Dispatcher - Shared, rate-limited direct message delivery with retries, dedup and per-batch reports.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+import discord
+
+from config import (
+    DM_MAX_CONCURRENCY, DM_RATE_PER_SECOND, DM_BURST, DM_MAX_RETRIES,
+    DM_FORBIDDEN_TTL_SECONDS, DM_DEDUP_TTL_SECONDS
+)
+
+RETRY_BASE_DELAY = 1.0
+
+class TokenBucket:
+    """Async token bucket shared by every DM batch."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = max(rate, 0.001)
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting for the bucket to refill if needed.
+
+        Waiters are served in arrival order, so concurrent batches share the
+        rate instead of one batch starving the others.
+
+        Returns:
+            Seconds spent waiting
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+            return waited
+
+class DMDispatcher:
+    """
+    Deliver direct messages in batches under one global rate limit.
+
+    Each batch runs its sends with bounded concurrency. Recipients are
+    deduplicated within a batch and, when a dedup key is given, across
+    batches for DM_DEDUP_TTL_SECONDS. Users whose DMs are closed (403) are
+    remembered for DM_FORBIDDEN_TTL_SECONDS and skipped without a request.
+    """
+
+    def __init__(self, max_concurrency: int = DM_MAX_CONCURRENCY, rate_per_second: float = DM_RATE_PER_SECOND,
+                 burst: int = DM_BURST, max_retries: int = DM_MAX_RETRIES,
+                 forbidden_ttl: int = DM_FORBIDDEN_TTL_SECONDS, dedup_ttl: int = DM_DEDUP_TTL_SECONDS):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_concurrency: Concurrent sends per batch
+            rate_per_second: Global DM rate
+            burst: Global burst size
+            max_retries: Retries for transient errors (429, 5xx, timeouts)
+            forbidden_ttl: Seconds a 403 recipient is skipped
+            dedup_ttl: Seconds a (dedup_key, recipient) pair is remembered
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.max_retries = max_retries
+        self.forbidden_ttl = forbidden_ttl
+        self.dedup_ttl = dedup_ttl
+        self._bucket = TokenBucket(rate_per_second, burst)
+        self._forbidden: Dict[int, float] = {}
+        self._delivered: Dict[tuple, float] = {}
+        self._stats = {'batches': 0, 'sent': 0, 'forbidden': 0, 'failed': 0, 'retries': 0, 'skipped': 0, 'rate_wait': 0.0}
+
+    async def send_batch(self, name: str, recipients: Iterable[Any],
+                         content: Union[str, Callable[[Any], str]], dedup_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send one message to every recipient and report the outcome.
+
+        Args:
+            name: Batch name used in logs and the report
+            recipients: Members or users to message (None entries are ignored)
+            content: Message text, or a function building it from the recipient
+            dedup_key: Key identifying the message across batches (optional)
+
+        Returns:
+            Report dictionary with the recipient IDs that were sent, closed
+            their DMs (forbidden), were skipped (negative cache or already
+            delivered) or failed, plus retries and duration_ms
+        """
+        start = time.monotonic()
+        self._prune()
+        report = {'name': name, 'requested': 0, 'sent': [], 'forbidden': [], 'skipped': [], 'failed': [], 'retries': 0, 'duration_ms': 0}
+
+        queue: Dict[int, Any] = {}
+        now = time.monotonic()
+        for recipient in recipients:
+            if recipient is None:
+                continue
+            report['requested'] += 1
+            if recipient.id in queue:
+                continue
+            if self._forbidden.get(recipient.id, 0) > now:
+                report['skipped'].append(recipient.id)
+            elif dedup_key and self._delivered.get((dedup_key, recipient.id), 0) > now:
+                report['skipped'].append(recipient.id)
+            else:
+                queue[recipient.id] = recipient
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def deliver(recipient):
+            async with semaphore:
+                outcome = await self._send_one(recipient, content, report)
+            report[outcome].append(recipient.id)
+            if outcome == 'sent' and dedup_key:
+                self._delivered[(dedup_key, recipient.id)] = time.monotonic() + self.dedup_ttl
+
+        await asyncio.gather(*(deliver(recipient) for recipient in queue.values()))
+
+        report['duration_ms'] = int((time.monotonic() - start) * 1000)
+        self._stats['batches'] += 1
+        for key in ('sent', 'forbidden', 'failed', 'skipped'):
+            self._stats[key] += len(report[key])
+        self._stats['retries'] += report['retries']
+        logging.info(
+            f"[DMDispatcher] {name}: {len(report['sent'])} sent, {len(report['forbidden'])} closed DMs, "
+            f"{len(report['skipped'])} skipped, {len(report['failed'])} failed in {report['duration_ms']}ms"
+        )
+        return report
+
+    async def _send_one(self, recipient: Any, content: Union[str, Callable[[Any], str]], report: Dict[str, Any]) -> str:
+        """
+        Send one DM, retrying transient errors with exponential backoff.
+
+        Args:
+            recipient: Member or user to message
+            content: Message text or builder
+            report: Batch report (retries are counted in place)
+
+        Returns:
+            Outcome key: 'sent', 'forbidden' or 'failed'
+        """
+        try:
+            message = content(recipient) if callable(content) else content
+        except Exception as e:
+            logging.error(f"[DMDispatcher] Error building message for {recipient.id}: {e}", exc_info=True)
+            return 'failed'
+
+        for attempt in range(self.max_retries + 1):
+            self._stats['rate_wait'] += await self._bucket.acquire()
+            try:
+                await recipient.send(message)
+                return 'sent'
+            except discord.Forbidden:
+                self._forbidden[recipient.id] = time.monotonic() + self.forbidden_ttl
+                logging.debug(f"[DMDispatcher] DMs closed for {recipient.id}, skipping for {self.forbidden_ttl}s")
+                return 'forbidden'
+            except discord.NotFound:
+                return 'failed'
+            except (discord.HTTPException, asyncio.TimeoutError, OSError) as e:
+                status = getattr(e, 'status', None)
+                transient = status is None or status == 429 or status >= 500
+                if not transient or attempt == self.max_retries:
+                    logging.warning(f"[DMDispatcher] Failed to DM {recipient.id}: {e}")
+                    return 'failed'
+                report['retries'] += 1
+                retry_after = getattr(e, 'retry_after', None)
+                await asyncio.sleep(retry_after or RETRY_BASE_DELAY * (2 ** attempt))
+            except Exception as e:
+                logging.error(f"[DMDispatcher] Unexpected error sending DM to {recipient.id}: {e}", exc_info=True)
+                return 'failed'
+        return 'failed'
+
+    def _prune(self) -> None:
+        """Drop expired negative-cache and dedup entries."""
+        now = time.monotonic()
+        self._forbidden = {user_id: until for user_id, until in self._forbidden.items() if until > now}
+        self._delivered = {key: until for key, until in self._delivered.items() if until > now}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get delivery statistics.
+
+        Returns:
+            Dictionary with cumulative counters, seconds spent waiting on the
+            rate limit and the size of the closed-DM negative cache
+        """
+        return {**self._stats, 'rate_wait': round(self._stats['rate_wait'], 2), 'forbidden_cached': len(self._forbidden)}
+
+dm_dispatcher = DMDispatcher()
+
+def get_dm_dispatcher() -> DMDispatcher:
+    """
+    Get the shared DM dispatcher.
+
+    Returns:
+        Global DMDispatcher instance
+    """
+    return dm_dispatcher
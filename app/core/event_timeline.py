@@ -0,0 +1,299 @@
+"""
+Event Timeline - In-memory index of upcoming event transitions with a sleeper that wakes when the next one is due.
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import pytz
+
+TIMEZONE = pytz.timezone("Europe/Paris")
+
+CLOSE = "close"
+ATTENDANCE = "attendance"
+REMINDER = "reminder"
+DELETE = "delete"
+TRANSITION_ORDER = (CLOSE, ATTENDANCE, REMINDER, DELETE)
+
+CLOSE_LEAD = timedelta(minutes=15)
+CLOSE_GRACE = timedelta(minutes=60)
+ATTENDANCE_GRACE = timedelta(minutes=10)
+REMINDER_TIMES = (dt_time(13, 0), dt_time(18, 0))
+DELETE_TIMES = (dt_time(4, 30), dt_time(23, 30))
+MAX_SLEEP_SECONDS = 300
+
+def current_time() -> datetime:
+    """
+    Get the current time in the bot timezone.
+
+    Returns:
+        Timezone-aware current datetime
+    """
+    return datetime.now(TIMEZONE)
+
+def parse_event_start(event_date: Any, event_time: Any) -> Optional[datetime]:
+    """
+    Build the localized start of an event from its stored date and time.
+
+    Accepts the shapes the DB driver and the cache hand out: date or
+    'YYYY-MM-DD' string for the date; time, timedelta, datetime or 'HH:MM'
+    string for the time.
+
+    Args:
+        event_date: Event date
+        event_time: Event start time
+
+    Returns:
+        Timezone-aware start datetime, or None if the values cannot be parsed
+    """
+    try:
+        if isinstance(event_date, datetime):
+            event_date = event_date.date()
+        elif not isinstance(event_date, date):
+            event_date = datetime.strptime(str(event_date)[:10], "%Y-%m-%d").date()
+
+        if isinstance(event_time, timedelta):
+            seconds = int(event_time.total_seconds())
+            event_time = dt_time(seconds // 3600, (seconds % 3600) // 60)
+        elif isinstance(event_time, datetime):
+            event_time = event_time.time()
+        elif not isinstance(event_time, dt_time):
+            event_time = datetime.strptime(str(event_time)[:5], "%H:%M").time()
+
+        return TIMEZONE.localize(datetime.combine(event_date, event_time))
+    except (ValueError, TypeError):
+        return None
+
+class EventTimeline:
+    """
+    Min-heap of (due_at, transition) entries for every active event.
+
+    Rescheduling an event bumps its version; entries of older versions stay
+    in the heap and are discarded when they reach the top, so updates are
+    O(log n) and popping due work is proportional to the due entries.
+    """
+
+    def __init__(self):
+        """Initialize an empty timeline."""
+        self._heap: List[Tuple[datetime, int, int, int, str, datetime, int]] = []
+        self._versions: Dict[Tuple[int, int], int] = {}
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._stats = {'scheduled': 0, 'fired': 0, 'expired': 0, 'max_lateness': 0.0}
+
+    def schedule_event(self, guild_id: int, event_id: int, event_date: Any, event_time: Any,
+                       duration: Any, status: str, now: Optional[datetime] = None) -> int:
+        """
+        Replace the pending transitions of an event according to its status.
+
+        Planned and confirmed events get close, attendance, reminder and
+        delete transitions; closed events keep attendance and delete; canceled
+        events only keep delete. Attendance is due when the event ends so the
+        whole window is covered by the voice ledger. Transitions whose window
+        already ended are not scheduled.
+
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event identifier
+            event_date: Event date
+            event_time: Event start time
+            duration: Event duration in minutes
+            status: Event status
+            now: Current time (defaults to now in the bot timezone)
+
+        Returns:
+            Number of transitions scheduled
+        """
+        key = (guild_id, event_id)
+        version = self._versions.get(key, 0) + 1
+        self._versions[key] = version
+
+        start = parse_event_start(event_date, event_time)
+        if start is None:
+            logging.warning(f"[EventTimeline] Unparseable date/time for event {event_id} in guild {guild_id}, not scheduled")
+            return 0
+        try:
+            end = start + timedelta(minutes=int(duration or 0))
+        except (ValueError, TypeError):
+            end = start
+
+        now = now or current_time()
+        status = (status or "").strip().lower()
+        transitions = []
+        if status in ("planned", "confirmed"):
+            transitions.append((CLOSE, start - CLOSE_LEAD, start + CLOSE_GRACE))
+            for reminder_time in REMINDER_TIMES:
+                reminder_at = TIMEZONE.localize(datetime.combine(start.date(), reminder_time))
+                if reminder_at < start:
+                    transitions.append((REMINDER, reminder_at, start))
+        if status in ("planned", "confirmed", "closed"):
+            transitions.append((ATTENDANCE, end, end + ATTENDANCE_GRACE))
+        if status:
+            delete_at = self._next_delete_slot(end)
+            transitions.append((DELETE, delete_at, delete_at + timedelta(days=1)))
+
+        scheduled = 0
+        earliest = self._heap[0][0] if self._heap else None
+        for kind, due_at, expires_at in transitions:
+            if expires_at <= now:
+                continue
+            self._sequence += 1
+            heapq.heappush(self._heap, (due_at, self._sequence, guild_id, event_id, kind, expires_at, version))
+            scheduled += 1
+            if earliest is None or due_at < earliest:
+                self._wakeup.set()
+        self._stats['scheduled'] += scheduled
+        if not scheduled:
+            self._versions.pop(key, None)
+        return scheduled
+
+    def remove_event(self, guild_id: int, event_id: int) -> None:
+        """
+        Drop every pending transition of an event.
+
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event identifier
+        """
+        self._versions.pop((guild_id, event_id), None)
+
+    def clear(self) -> None:
+        """Drop every pending transition."""
+        self._heap.clear()
+        self._versions.clear()
+        self._wakeup.set()
+
+    @staticmethod
+    def _next_delete_slot(end: datetime) -> datetime:
+        """
+        Get the first message cleanup slot after an event ends.
+
+        Args:
+            end: Event end
+
+        Returns:
+            Localized datetime of the next cleanup slot
+        """
+        day = end.date()
+        while True:
+            for slot in DELETE_TIMES:
+                candidate = TIMEZONE.localize(datetime.combine(day, slot))
+                if candidate > end:
+                    return candidate
+            day += timedelta(days=1)
+
+    def _is_current(self, entry: tuple) -> bool:
+        """
+        Check whether a heap entry belongs to the event's latest schedule.
+
+        Args:
+            entry: Heap entry
+
+        Returns:
+            True if the entry has not been superseded or removed
+        """
+        return self._versions.get((entry[2], entry[3])) == entry[6]
+
+    def next_due(self) -> Optional[datetime]:
+        """
+        Get the due time of the next live transition.
+
+        Returns:
+            Due datetime, or None when nothing is scheduled
+        """
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> Dict[str, Dict[int, Set[int]]]:
+        """
+        Remove and return every transition due at or before now.
+
+        Transitions whose window has already ended are dropped and counted as
+        expired instead of being returned.
+
+        Args:
+            now: Current time (defaults to now in the bot timezone)
+
+        Returns:
+            Dictionary mapping transition kind to {guild_id: {event_id, ...}}
+        """
+        now = now or current_time()
+        due: Dict[str, Dict[int, Set[int]]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            due_at, _, guild_id, event_id, kind, expires_at, _ = entry
+            if expires_at <= now:
+                self._stats['expired'] += 1
+                logging.warning(f"[EventTimeline] {kind} transition for event {event_id} in guild {guild_id} expired unfired")
+                continue
+            due.setdefault(kind, {}).setdefault(guild_id, set()).add(event_id)
+            if kind == DELETE:
+                self._versions.pop((guild_id, event_id), None)
+            self._stats['fired'] += 1
+            self._stats['max_lateness'] = max(self._stats['max_lateness'], (now - due_at).total_seconds())
+        return due
+
+    async def run(self, dispatch: Callable[[str, Dict[int, Set[int]]], Awaitable[None]]) -> None:
+        """
+        Sleep until the next transition is due and hand due work to dispatch.
+
+        The sleeper wakes early when an earlier transition is scheduled and
+        re-checks at least every MAX_SLEEP_SECONDS to absorb clock changes.
+
+        Args:
+            dispatch: Coroutine called with (kind, {guild_id: {event_id}}) in TRANSITION_ORDER
+        """
+        logging.info("[EventTimeline] Sleeper started")
+        while True:
+            self._wakeup.clear()
+            due_at = self.next_due()
+            timeout = MAX_SLEEP_SECONDS
+            if due_at is not None:
+                timeout = min(timeout, max(0.0, (due_at - current_time()).total_seconds()))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            due = self.pop_due()
+            for kind in TRANSITION_ORDER:
+                if kind in due:
+                    try:
+                        await dispatch(kind, due[kind])
+                    except Exception as e:
+                        logging.error(f"[EventTimeline] Dispatch of {kind} transitions failed: {e}", exc_info=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get timeline statistics.
+
+        Returns:
+            Dictionary with scheduled/fired/expired counts, tracked events,
+            heap size, next due time and worst firing lateness in seconds
+        """
+        next_due = self.next_due()
+        return {
+            **self._stats,
+            'max_lateness': round(self._stats['max_lateness'], 3),
+            'tracked_events': len(self._versions),
+            'heap_size': len(self._heap),
+            'next_due': next_due.isoformat() if next_due else None
+        }
+
+event_timeline = EventTimeline()
+
+def get_event_timeline() -> EventTimeline:
+    """
+    Get the shared event timeline.
+
+    Returns:
+        Global EventTimeline instance
+    """
+    return event_timeline
@@ -76,9 +76,6 @@ async def get_effective_locale(bot, guild_id: int, user_id: int) -> str:
         Effective locale string (e.g., "en-US", "fr", "es-ES")
     """
     try:
-        await bot.cache_loader.ensure_guild_settings_loaded()
-        await bot.cache_loader.ensure_user_setup_loaded()
-
         guild_member_data = await bot.cache.get_guild_member_data(guild_id, user_id)
         if guild_member_data and guild_member_data.get('language'):
             member_language = guild_member_data.get('language')
@@ -197,8 +194,6 @@ async def get_guild_message(bot, guild_id: int, translations, key, **kwargs) ->
         Formatted localized message string using guild language
     """
     try:
-        await bot.cache_loader.ensure_guild_settings_loaded()
-
         guild_lang = await bot.cache.get_guild_data(guild_id, 'guild_lang') or "en-US"
 
         keys = key.split(".")
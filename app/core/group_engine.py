@@ -0,0 +1,723 @@
+"""
+Group Engine - Pure, synchronous raid group assignment from registrations, roster, static groups and ideal staff.
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import statistics
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import GROUPS_ENGINE_MODE, GROUPS_OFFLOAD_THRESHOLD
+
+CLASSES = ("Tank", "Healer", "Melee DPS", "Ranged DPS", "Flanker")
+TANK, HEALER, MELEE, RANGED, FLANKER = range(len(CLASSES))
+UNKNOWN = len(CLASSES)
+CLASS_INDEX = {name: idx for idx, name in enumerate(CLASSES)}
+
+LEGACY = "legacy"
+ENHANCED = "enhanced"
+OPTIMIZED = "optimized"
+MODES = (LEGACY, ENHANCED, OPTIMIZED)
+
+GROUP_SIZE = 6
+MIN_GROUP_SIZE = 4
+MAX_GS_RANGES = 5
+DEFAULT_IDEAL_STAFF = {"Tank": 20, "Healer": 20, "Flanker": 10, "Ranged DPS": 10, "Melee DPS": 10}
+
+CLASS_WEIGHT = 1.0
+GS_WEIGHT = 1.0
+OPTIMIZE_MAX_PASSES = 8
+
+def parse_gs(value: Any) -> int:
+    """
+    Convert a roster gear score to an integer.
+
+    Args:
+        value: Gear score as stored in the roster (int, numeric string, 'N/A'...)
+
+    Returns:
+        Gear score, or 0 when unknown
+    """
+    try:
+        return max(int(float(value)), 0)
+    except (ValueError, TypeError):
+        return 0
+
+def optimal_sizes(n: int, min_size: int = MIN_GROUP_SIZE, max_size: int = GROUP_SIZE) -> List[int]:
+    """
+    Split n participants into group sizes, preferring full groups.
+
+    Args:
+        n: Number of participants
+        min_size: Minimum group size
+        max_size: Maximum group size
+
+    Returns:
+        List of group sizes summing to n
+    """
+    if n <= 0:
+        return []
+    possible = []
+    for k in range(math.ceil(n / max_size), n // min_size + 1):
+        base, extra = divmod(n, k)
+        if base < min_size or base + (1 if extra else 0) > max_size:
+            continue
+        possible.append((k, [base + 1] * extra + [base] * (k - extra)))
+
+    if not possible:
+        k = math.ceil(n / max_size)
+        base, extra = divmod(n, k)
+        return [base + 1] * extra + [base] * (k - extra)
+
+    possible.sort(key=lambda t: (sum(1 for s in t[1] if s == max_size), -t[0]), reverse=True)
+    return possible[0][1]
+
+def gs_ranges(gs_values: Sequence[int]) -> List[Tuple[int, int]]:
+    """
+    Split known gear scores into at most MAX_GS_RANGES overlapping bands.
+
+    The band width follows the spread for small events and the standard
+    deviation for large ones.
+
+    Args:
+        gs_values: Known (positive) gear scores
+
+    Returns:
+        List of (min, max) bands in ascending order
+    """
+    values = sorted(gs for gs in gs_values if gs > 0)
+    if len(values) < 2:
+        return [(0, 10000)]
+
+    min_gs, max_gs = values[0], values[-1]
+    spread = max_gs - min_gs
+    if len(values) < 10:
+        tolerance = max(spread * 0.4, 200)
+    elif len(values) < 30:
+        tolerance = max(spread * 0.25, 150)
+    else:
+        tolerance = min(statistics.stdev(values) * 1.2, 200)
+
+    ranges = []
+    current_min = min_gs
+    while current_min < max_gs and len(ranges) < MAX_GS_RANGES:
+        range_max = min(current_min + tolerance, max_gs)
+        ranges.append((int(current_min), int(range_max)))
+        current_min = range_max - (tolerance * 0.1)
+    return ranges or [(min_gs, max_gs)]
+
+def gs_range_index(gs: float, range_starts: Sequence[int]) -> int:
+    """
+    Find the band of a gear score.
+
+    Args:
+        gs: Gear score (0 when unknown)
+        range_starts: Lower bounds of the bands, ascending
+
+    Returns:
+        Index of the highest band starting at or below gs (0 when unknown)
+    """
+    if gs <= 0:
+        return 0
+    return max(bisect.bisect_right(range_starts, gs) - 1, 0)
+
+def member_score(member_class: int, member_range: int, target_class: int, target_range: int, tentative: bool) -> float:
+    """
+    Score how well a member fits an open slot.
+
+    Args:
+        member_class: Class index of the member
+        member_range: GS band of the member
+        target_class: Class index wanted for the slot
+        target_range: GS band wanted for the slot
+        tentative: Whether the member is tentative
+
+    Returns:
+        Fit score, higher is better
+    """
+    score = 0.0
+    if member_class == target_class:
+        score += 0.7
+    elif target_class in (MELEE, RANGED) and member_class in (MELEE, RANGED):
+        score += 0.5
+    elif member_class in (MELEE, RANGED, FLANKER):
+        score += 0.3
+
+    distance = abs(member_range - target_range)
+    if distance == 0:
+        score += 0.2
+    elif distance == 1:
+        score += 0.1
+
+    return score + (0.05 if tentative else 0.1)
+
+def class_shares(ideal_staff: Optional[Dict[str, int]]) -> Tuple[float, ...]:
+    """
+    Turn an ideal staff configuration into per-class target shares.
+
+    Args:
+        ideal_staff: Ideal member count per class name (optional)
+
+    Returns:
+        Tuple of shares indexed like CLASSES, summing to 1
+    """
+    staff = {name: count for name, count in (ideal_staff or {}).items() if name in CLASS_INDEX and count and count > 0}
+    staff = staff or DEFAULT_IDEAL_STAFF
+    total = sum(staff.values())
+    return tuple(staff.get(name, 0) / total for name in CLASSES)
+
+@lru_cache(maxsize=4096)
+def _class_penalty(counts: Tuple[int, ...], shares: Tuple[float, ...]) -> float:
+    """
+    Penalty of one group's class mix against the target shares.
+
+    A missing tank or healer costs one point each; the distance between
+    the class counts and the target shares adds up to one more.
+
+    Args:
+        counts: Member count per class index (UNKNOWN last)
+        shares: Target share per class index
+
+    Returns:
+        Penalty, 0 for a perfect mix
+    """
+    size = sum(counts)
+    if not size:
+        return 0.0
+    penalty = (counts[TANK] == 0) + (counts[HEALER] == 0)
+    deviation = sum(abs(counts[idx] - size * share) for idx, share in enumerate(shares)) + counts[UNKNOWN]
+    return penalty + deviation / (2 * size)
+
+class _Snapshot:
+    """Array view of the registered members found in the roster."""
+
+    __slots__ = ("ids", "infos", "classes", "gs", "tentative", "index", "presence", "missing")
+
+    def __init__(self, presence_ids: Iterable[int], tentative_ids: Iterable[int], members: Dict[str, Dict]):
+        """
+        Build the arrays in registration order, presence first.
+
+        Args:
+            presence_ids: Confirmed participant IDs
+            tentative_ids: Tentative participant IDs
+            members: Roster members keyed by member ID as string
+        """
+        self.presence = set(presence_ids)
+        self.ids: List[int] = []
+        self.infos: List[Dict] = []
+        self.classes: List[int] = []
+        self.gs: List[int] = []
+        self.tentative: List[bool] = []
+        self.index: Dict[int, int] = {}
+        self.missing: List[int] = []
+
+        for uid in dict.fromkeys([*presence_ids, *tentative_ids]):
+            info = members.get(str(uid))
+            if not info:
+                self.missing.append(uid)
+                continue
+            self.index[uid] = len(self.ids)
+            self.ids.append(uid)
+            self.infos.append(info)
+            self.classes.append(CLASS_INDEX.get(info.get("class"), UNKNOWN))
+            self.gs.append(parse_gs(info.get("GS")))
+            self.tentative.append(uid not in self.presence)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def member(self, idx: int) -> Dict:
+        """
+        Build the output dictionary of a member.
+
+        Args:
+            idx: Member index
+
+        Returns:
+            Roster information with tentative flag and user_id
+        """
+        return {**self.infos[idx], "tentative": self.tentative[idx], "user_id": self.ids[idx]}
+
+class GroupEngine:
+    """
+    Build balanced groups of at most GROUP_SIZE members.
+
+    Three modes are available: 'legacy' (role-first fill), 'enhanced' (static
+    groups first, then tank/healer cores per GS band) and 'optimized' (the
+    enhanced result refined by member swaps that lower the class balance +
+    GS variance objective). Members of static groups are never swapped.
+    """
+
+    def __init__(self, mode: str = GROUPS_ENGINE_MODE, offload_threshold: int = GROUPS_OFFLOAD_THRESHOLD):
+        """
+        Initialize the engine.
+
+        Args:
+            mode: Default assignment mode
+            offload_threshold: Registered member count from which assign_async runs in a worker thread
+        """
+        if mode not in MODES:
+            logging.warning(f"[GroupEngine] Unknown mode '{mode}', falling back to '{ENHANCED}'")
+            mode = ENHANCED
+        self.mode = mode
+        self.offload_threshold = offload_threshold
+        self._stats = {'runs': 0, 'offloaded': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'by_mode': {m: 0 for m in MODES}}
+
+    def assign(self, presence_ids: Sequence[int], tentative_ids: Sequence[int], roster_members: Dict[str, Dict],
+               static_groups: Optional[Dict[str, Dict]] = None, ideal_staff: Optional[Dict[str, int]] = None,
+               mode: Optional[str] = None) -> List[List[Dict]]:
+        """
+        Assign registered members to groups.
+
+        Args:
+            presence_ids: Confirmed participant IDs
+            tentative_ids: Tentative participant IDs
+            roster_members: Roster members keyed by member ID as string ('pseudo', 'GS', 'weapons', 'class')
+            static_groups: Static groups by name, each with 'member_ids' (optional)
+            ideal_staff: Ideal member count per class name (optional)
+            mode: Assignment mode (defaults to the engine mode)
+
+        Returns:
+            List of groups, each a list of member dictionaries with 'tentative' and 'user_id'
+        """
+        mode = mode if mode in MODES else self.mode
+        start = time.perf_counter()
+        snap = _Snapshot(presence_ids, tentative_ids, roster_members)
+        if snap.missing:
+            logging.warning(f"[GroupEngine] {len(snap.missing)} registered member(s) missing from roster, skipped")
+
+        if mode == LEGACY:
+            groups = self._assign_legacy(snap)
+            pinned = set()
+        else:
+            groups, pinned = self._assign_enhanced(snap, static_groups or {})
+            if mode == OPTIMIZED:
+                self._optimize(snap, groups, pinned, class_shares(ideal_staff))
+
+        result = [[snap.member(idx) for idx in group] for group in groups if group]
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self._stats['runs'] += 1
+        self._stats['by_mode'][mode] += 1
+        self._stats['total_ms'] += elapsed
+        self._stats['max_ms'] = max(self._stats['max_ms'], elapsed)
+        logging.info(f"[GroupEngine] {mode}: {len(snap)} members in {len(result)} groups ({elapsed:.1f}ms)")
+        return result
+
+    async def assign_async(self, presence_ids: Sequence[int], tentative_ids: Sequence[int], roster_members: Dict[str, Dict],
+                           static_groups: Optional[Dict[str, Dict]] = None, ideal_staff: Optional[Dict[str, int]] = None,
+                           mode: Optional[str] = None) -> List[List[Dict]]:
+        """
+        Assign groups, in a worker thread when the event is large.
+
+        Args:
+            presence_ids: Confirmed participant IDs
+            tentative_ids: Tentative participant IDs
+            roster_members: Roster members keyed by member ID as string
+            static_groups: Static groups by name (optional)
+            ideal_staff: Ideal member count per class name (optional)
+            mode: Assignment mode (defaults to the engine mode)
+
+        Returns:
+            List of groups, as returned by assign()
+        """
+        args = (list(presence_ids), list(tentative_ids), roster_members, static_groups, ideal_staff, mode)
+        if len(args[0]) + len(args[1]) >= self.offload_threshold:
+            self._stats['offloaded'] += 1
+            return await asyncio.to_thread(self.assign, *args)
+        return self.assign(*args)
+
+# #################################################################################### #
+#                            Legacy Mode
+# #################################################################################### #
+    @staticmethod
+    def _assign_legacy(snap: _Snapshot) -> List[List[int]]:
+        """
+        Role-first assignment: one tank and one healer per group, then DPS.
+
+        Args:
+            snap: Member arrays
+
+        Returns:
+            Groups as lists of member indices
+        """
+        titular = {c: deque() for c in (TANK, HEALER, MELEE, RANGED, FLANKER)}
+        tentative = {c: deque() for c in (TANK, HEALER, MELEE, RANGED, FLANKER)}
+        for idx, cls in enumerate(snap.classes):
+            if cls == UNKNOWN:
+                logging.debug(f"[GroupEngine] Unknown class for {snap.ids[idx]}, left for the remainder groups")
+                continue
+            (tentative if snap.tentative[idx] else titular)[cls].append(idx)
+
+        groups: List[List[int]] = []
+        if len(titular[FLANKER]) >= MIN_GROUP_SIZE:
+            group = [titular[FLANKER].popleft() for _ in range(min(GROUP_SIZE, len(titular[FLANKER])))]
+            while len(group) < GROUP_SIZE and tentative[FLANKER]:
+                group.append(tentative[FLANKER].popleft())
+            groups.append(group)
+        titular[RANGED].extend(titular.pop(FLANKER))
+        tentative[RANGED].extend(tentative.pop(FLANKER))
+
+        def pop(cls: int, titular_only: bool = True) -> Optional[int]:
+            if titular[cls]:
+                return titular[cls].popleft()
+            if not titular_only and tentative[cls]:
+                return tentative[cls].popleft()
+            return None
+
+        def available(cls: int) -> bool:
+            return bool(titular[cls] or tentative[cls])
+
+        present = sum(1 for flag in snap.tentative if not flag)
+        for size in optimal_sizes(present):
+            group = []
+            for cls in (TANK, HEALER):
+                idx = pop(cls, False)
+                if idx is not None:
+                    group.append(idx)
+            for cls in (MELEE, RANGED):
+                while len(group) < size and titular[cls]:
+                    group.append(pop(cls))
+            turn = 0
+            while len(group) < size and (available(MELEE) or available(RANGED)):
+                idx = pop((MELEE, RANGED)[turn % 2], False)
+                if idx is not None:
+                    group.append(idx)
+                turn += 1
+            groups.append(group)
+
+        def needed(group: List[int]) -> Optional[int]:
+            classes = [snap.classes[idx] for idx in group]
+            if HEALER not in classes and available(HEALER):
+                return HEALER
+            if TANK not in classes and available(TANK):
+                return TANK
+            if classes.count(MELEE) > classes.count(RANGED) and available(MELEE):
+                return MELEE
+            if available(RANGED):
+                return RANGED
+            return None
+
+        fill_order = (HEALER, TANK, MELEE, RANGED)
+        for group in groups:
+            while len(group) < GROUP_SIZE and any(available(c) for c in fill_order):
+                cls = needed(group) or next(c for c in fill_order if available(c))
+                group.append(pop(cls, False))
+
+        remaining = [idx for cls in fill_order for idx in (*titular[cls], *tentative[cls])]
+        remaining += [idx for idx, cls in enumerate(snap.classes) if cls == UNKNOWN]
+        start = 0
+        for size in optimal_sizes(len(remaining)):
+            groups.append(remaining[start:start + size])
+            start += size
+        return groups
+
+# #################################################################################### #
+#                            Enhanced Mode
+# #################################################################################### #
+    @staticmethod
+    def _assign_enhanced(snap: _Snapshot, static_groups: Dict[str, Dict]) -> Tuple[List[List[int]], set]:
+        """
+        Static groups first, then tank/healer cores per GS band, then fill.
+
+        Args:
+            snap: Member arrays
+            static_groups: Static groups by name, each with 'member_ids'
+
+        Returns:
+            Tuple of (groups as lists of member indices, pinned static member indices)
+        """
+        ranges = gs_ranges(snap.gs)
+        starts = [low for low, _ in ranges]
+        bands = [gs_range_index(gs, starts) for gs in snap.gs]
+        used: set = set()
+        pinned: set = set()
+        groups: List[List[int]] = []
+
+        def score(idx: int, target_class: int, target_band: int) -> float:
+            return member_score(snap.classes[idx], bands[idx], target_class, target_band, snap.tentative[idx])
+
+        for name, data in static_groups.items():
+            configured = list(data.get("member_ids", []))
+            present = [mid for mid in configured if mid in snap.presence and snap.index.get(mid) not in used]
+            if len(present) not in (len(configured), len(configured) - 1):
+                continue
+            members = [snap.index[mid] for mid in present if mid in snap.index]
+            if not members:
+                continue
+            used.update(members)
+            pinned.update(members)
+
+            existing = {snap.classes[idx] for idx in members}
+            wanted = []
+            if len(members) == len(configured) - 1:
+                absent = next((mid for mid in configured if snap.index.get(mid) not in members), None)
+                absent_idx = snap.index.get(absent)
+                if absent_idx is not None:
+                    wanted.append(snap.classes[absent_idx])
+            wanted += [cls for cls in (TANK, HEALER) if cls not in existing]
+
+            configured_set = set(configured)
+            candidates = [idx for idx in range(len(snap)) if idx not in used and snap.ids[idx] not in configured_set]
+            while len(members) < GROUP_SIZE and candidates:
+                best = max(candidates, key=lambda idx: score(
+                    idx, wanted[0] if wanted and snap.classes[idx] in wanted else MELEE, 0))
+                candidates.remove(best)
+                members.append(best)
+                used.add(best)
+                if snap.classes[best] in wanted:
+                    wanted.remove(snap.classes[best])
+            groups.append(members)
+            logging.debug(f"[GroupEngine] Static '{name}' placed with {len(members)} members")
+
+        buckets = [[deque() for _ in CLASSES] for _ in ranges]
+        for idx in range(len(snap)):
+            if idx not in used and not snap.tentative[idx] and snap.classes[idx] != UNKNOWN:
+                buckets[bands[idx]][snap.classes[idx]].append(idx)
+
+        for band in reversed(buckets):
+            while len(band[FLANKER]) >= GROUP_SIZE - 1:
+                group = [band[FLANKER].popleft() for _ in range(min(GROUP_SIZE, len(band[FLANKER])))]
+                used.update(group)
+                groups.append(group)
+
+            while band[TANK] and band[HEALER]:
+                group = [band[TANK].popleft() for _ in range(min(2, len(band[TANK])))]
+                group += [band[HEALER].popleft() for _ in range(min(2, len(band[HEALER])))]
+                for cls in (MELEE, RANGED, FLANKER):
+                    while len(group) < GROUP_SIZE and band[cls]:
+                        group.append(band[cls].popleft())
+                if len(group) < MIN_GROUP_SIZE:
+                    for idx in reversed(group):
+                        band[snap.classes[idx]].appendleft(idx)
+                    break
+                used.update(group)
+                groups.append(group)
+
+        gs_sum = [sum(snap.gs[idx] for idx in group) for group in groups]
+        gs_count = [sum(1 for idx in group if snap.gs[idx]) for group in groups]
+        for idx in range(len(snap)):
+            if idx in used or not snap.tentative[idx]:
+                continue
+            best, best_score = None, 0.0
+            for g, group in enumerate(groups):
+                if len(group) >= GROUP_SIZE:
+                    continue
+                average = gs_sum[g] / gs_count[g] if gs_count[g] else 0
+                candidate = score(idx, MELEE, gs_range_index(average, starts))
+                if candidate > best_score:
+                    best, best_score = g, candidate
+            if best is not None:
+                groups[best].append(idx)
+                gs_sum[best] += snap.gs[idx]
+                gs_count[best] += 1 if snap.gs[idx] else 0
+                used.add(idx)
+
+        remaining = [idx for idx in range(len(snap)) if idx not in used]
+        while len(remaining) >= MIN_GROUP_SIZE:
+            groups.append(remaining[:GROUP_SIZE])
+            remaining = remaining[GROUP_SIZE:]
+
+        open_groups = deque(group for group in groups if len(group) < GROUP_SIZE)
+        leftovers = []
+        for idx in remaining:
+            while open_groups and len(open_groups[0]) >= GROUP_SIZE:
+                open_groups.popleft()
+            if open_groups:
+                open_groups[0].append(idx)
+            else:
+                leftovers.append(idx)
+        if leftovers:
+            groups.append(leftovers)
+        return groups, pinned
+
+# #################################################################################### #
+#                            Optimized Mode
+# #################################################################################### #
+    @staticmethod
+    def _optimize(snap: _Snapshot, groups: List[List[int]], pinned: set, shares: Tuple[float, ...]) -> None:
+        """
+        Swap members between groups while the objective decreases.
+
+        The objective is CLASS_WEIGHT * mean class penalty + GS_WEIGHT *
+        variance of the group GS means over the variance of all known GS.
+        Per-group class counts and GS sums are kept in arrays so that each
+        candidate swap is evaluated in constant time. Groups are edited in
+        place.
+
+        Args:
+            snap: Member arrays
+            groups: Groups as lists of member indices
+            pinned: Member indices that must stay in their group
+            shares: Target class shares
+        """
+        n_groups = len(groups)
+        if n_groups < 2:
+            return
+
+        known = [gs for gs in snap.gs if gs]
+        gs_scale = GS_WEIGHT / statistics.pvariance(known) if len(known) > 1 and statistics.pvariance(known) else 0.0
+        class_scale = CLASS_WEIGHT / n_groups
+
+        counts = [[0] * (UNKNOWN + 1) for _ in groups]
+        gs_sum = [0] * n_groups
+        gs_count = [0] * n_groups
+        for g, group in enumerate(groups):
+            for idx in group:
+                counts[g][snap.classes[idx]] += 1
+                if snap.gs[idx]:
+                    gs_sum[g] += snap.gs[idx]
+                    gs_count[g] += 1
+        penalty = [_class_penalty(tuple(c), shares) for c in counts]
+
+        def mean(total: int, count: int) -> Optional[float]:
+            return total / count if count else None
+
+        means = [mean(gs_sum[g], gs_count[g]) for g in range(n_groups)]
+        s1 = sum(m for m in means if m is not None)
+        s2 = sum(m * m for m in means if m is not None)
+        k = sum(1 for m in means if m is not None)
+
+        def move(a: int, b: int, from_a: int, from_b: int) -> None:
+            counts[a][from_a] -= 1
+            counts[a][from_b] += 1
+            counts[b][from_b] -= 1
+            counts[b][from_a] += 1
+
+        def gs_variance(s1: float, s2: float, k: int) -> float:
+            return (s2 / k - (s1 / k) ** 2) if k else 0.0
+
+        for _ in range(OPTIMIZE_MAX_PASSES):
+            improved = False
+            for a in range(n_groups):
+                for b in range(a + 1, n_groups):
+                    for pos_a in range(len(groups[a])):
+                        i = groups[a][pos_a]
+                        if i in pinned:
+                            continue
+                        for pos_b in range(len(groups[b])):
+                            j = groups[b][pos_b]
+                            if j in pinned or (snap.classes[i] == snap.classes[j] and snap.gs[i] == snap.gs[j]):
+                                continue
+                            ci, cj = snap.classes[i], snap.classes[j]
+                            delta = 0.0
+                            if ci != cj:
+                                move(a, b, ci, cj)
+                                new_pa = _class_penalty(tuple(counts[a]), shares)
+                                new_pb = _class_penalty(tuple(counts[b]), shares)
+                                move(a, b, cj, ci)
+                                delta += class_scale * (new_pa + new_pb - penalty[a] - penalty[b])
+                            else:
+                                new_pa, new_pb = penalty[a], penalty[b]
+
+                            new_sum_a = gs_sum[a] - snap.gs[i] + snap.gs[j]
+                            new_sum_b = gs_sum[b] - snap.gs[j] + snap.gs[i]
+                            new_cnt_a = gs_count[a] - bool(snap.gs[i]) + bool(snap.gs[j])
+                            new_cnt_b = gs_count[b] - bool(snap.gs[j]) + bool(snap.gs[i])
+                            new_ma, new_mb = mean(new_sum_a, new_cnt_a), mean(new_sum_b, new_cnt_b)
+                            n1, n2, nk = s1, s2, k
+                            for old, new in ((means[a], new_ma), (means[b], new_mb)):
+                                if old is not None:
+                                    n1, n2, nk = n1 - old, n2 - old * old, nk - 1
+                                if new is not None:
+                                    n1, n2, nk = n1 + new, n2 + new * new, nk + 1
+                            delta += gs_scale * (gs_variance(n1, n2, nk) - gs_variance(s1, s2, k))
+
+                            if delta >= -1e-9:
+                                continue
+                            groups[a][pos_a], groups[b][pos_b] = j, i
+                            move(a, b, ci, cj)
+                            penalty[a], penalty[b] = new_pa, new_pb
+                            gs_sum[a], gs_sum[b] = new_sum_a, new_sum_b
+                            gs_count[a], gs_count[b] = new_cnt_a, new_cnt_b
+                            means[a], means[b] = new_ma, new_mb
+                            s1, s2, k = n1, n2, nk
+                            i = j
+                            improved = True
+            if not improved:
+                break
+
+# #################################################################################### #
+#                            Quality Metrics
+# #################################################################################### #
+    @staticmethod
+    def evaluate(groups: List[List[Dict]], ideal_staff: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        Measure the balance of an assignment.
+
+        Args:
+            groups: Groups as returned by assign()
+            ideal_staff: Ideal member count per class name (optional)
+
+        Returns:
+            Dictionary with group/member counts, groups without tank or
+            healer, undersized groups, mean class penalty, standard deviation
+            and spread of the group GS means, and the combined objective
+        """
+        shares = class_shares(ideal_staff)
+        penalties, means, known = [], [], []
+        missing_tank = missing_healer = undersized = 0
+        for group in groups:
+            counts = [0] * (UNKNOWN + 1)
+            group_gs = []
+            for member in group:
+                counts[CLASS_INDEX.get(member.get("class"), UNKNOWN)] += 1
+                gs = parse_gs(member.get("GS"))
+                if gs:
+                    group_gs.append(gs)
+            penalties.append(_class_penalty(tuple(counts), shares))
+            missing_tank += counts[TANK] == 0
+            missing_healer += counts[HEALER] == 0
+            undersized += len(group) < MIN_GROUP_SIZE
+            known += group_gs
+            if group_gs:
+                means.append(sum(group_gs) / len(group_gs))
+
+        class_penalty = sum(penalties) / len(penalties) if penalties else 0.0
+        gs_variance = statistics.pvariance(means) if len(means) > 1 else 0.0
+        total_variance = statistics.pvariance(known) if len(known) > 1 else 0.0
+        gs_term = gs_variance / total_variance if total_variance else 0.0
+        return {
+            'groups': len(groups),
+            'members': sum(len(group) for group in groups),
+            'missing_tank': missing_tank,
+            'missing_healer': missing_healer,
+            'undersized': undersized,
+            'class_penalty': round(class_penalty, 4),
+            'gs_mean_stdev': round(math.sqrt(gs_variance), 1),
+            'gs_mean_spread': round(max(means) - min(means), 1) if means else 0.0,
+            'objective': round(CLASS_WEIGHT * class_penalty + GS_WEIGHT * gs_term, 4)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with run counts per mode, offloaded runs and timings in milliseconds
+        """
+        runs = self._stats['runs']
+        return {
+            **self._stats,
+            'by_mode': dict(self._stats['by_mode']),
+            'mode': self.mode,
+            'total_ms': round(self._stats['total_ms'], 1),
+            'max_ms': round(self._stats['max_ms'], 1),
+            'avg_ms': round(self._stats['total_ms'] / runs, 1) if runs else 0.0
+        }
+
+group_engine = GroupEngine()
+
+def get_group_engine() -> GroupEngine:
+    """
+    Get the shared group engine.
+
+    Returns:
+        Global GroupEngine instance
+    """
+    return group_engine
@@ -0,0 +1,191 @@
+"""
+Keyed Lock Manager - Per-key asyncio locks with automatic reclamation and contention metrics.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable
+
+class _LockEntry:
+    """Lock for one key plus the number of tasks holding or waiting for it."""
+
+    __slots__ = ("lock", "refs")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.refs = 0
+
+class KeyedLockManager:
+    """
+    Hand out one asyncio lock per key.
+
+    A key's lock exists only while at least one task holds or waits for it:
+    the entry is dropped as soon as the last task releases it, so idle keys
+    never accumulate. Locks are not reentrant.
+    """
+
+    def __init__(self, name: str, max_tracked_keys: int = 256):
+        """
+        Initialize the lock manager.
+
+        Args:
+            name: Name used in log messages and metrics
+            max_tracked_keys: Number of keys kept in per-key contention statistics
+        """
+        self.name = name
+        self._entries: Dict[Hashable, _LockEntry] = {}
+        self._max_tracked_keys = max_tracked_keys
+        self._key_stats: "OrderedDict[Hashable, Dict[str, float]]" = OrderedDict()
+        self._metrics = {
+            'acquisitions': 0,
+            'contended': 0,
+            'total_wait': 0.0,
+            'max_wait': 0.0,
+            'max_queue_length': 0,
+            'reclaimed': 0
+        }
+
+    @asynccontextmanager
+    async def lock(self, key: Hashable) -> AsyncIterator[None]:
+        """
+        Acquire the lock for a key for the duration of the block.
+
+        Args:
+            key: Hashable lock key, e.g. (guild_id, event_id)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _LockEntry()
+        queue_length = entry.refs
+        entry.refs += 1
+
+        start = time.monotonic()
+        try:
+            await entry.lock.acquire()
+        except BaseException:
+            self._release_ref(key, entry)
+            raise
+        self._record(key, time.monotonic() - start, queue_length)
+
+        try:
+            yield
+        finally:
+            entry.lock.release()
+            self._release_ref(key, entry)
+
+    def locked(self, key: Hashable) -> bool:
+        """
+        Check whether a key's lock is currently held.
+
+        Args:
+            key: Lock key
+
+        Returns:
+            True if a task holds the lock for this key
+        """
+        entry = self._entries.get(key)
+        return bool(entry and entry.lock.locked())
+
+    def _release_ref(self, key: Hashable, entry: _LockEntry) -> None:
+        """
+        Drop one reference to a key and reclaim its lock when unused.
+
+        Args:
+            key: Lock key
+            entry: Entry the reference was taken on
+        """
+        entry.refs -= 1
+        if entry.refs == 0 and self._entries.get(key) is entry:
+            del self._entries[key]
+            self._metrics['reclaimed'] += 1
+
+    def _record(self, key: Hashable, waited: float, queue_length: int) -> None:
+        """
+        Record one acquisition in global and per-key statistics.
+
+        Args:
+            key: Lock key
+            waited: Seconds spent waiting for the lock
+            queue_length: Tasks holding or waiting for the key on arrival
+        """
+        metrics = self._metrics
+        metrics['acquisitions'] += 1
+        metrics['total_wait'] += waited
+        metrics['max_wait'] = max(metrics['max_wait'], waited)
+        metrics['max_queue_length'] = max(metrics['max_queue_length'], queue_length)
+        if queue_length:
+            metrics['contended'] += 1
+
+        stats = self._key_stats.pop(key, None) or {'acquisitions': 0, 'total_wait': 0.0, 'max_wait': 0.0, 'max_queue_length': 0}
+        stats['acquisitions'] += 1
+        stats['total_wait'] += waited
+        stats['max_wait'] = max(stats['max_wait'], waited)
+        stats['max_queue_length'] = max(stats['max_queue_length'], queue_length)
+        self._key_stats[key] = stats
+        while len(self._key_stats) > self._max_tracked_keys:
+            self._key_stats.popitem(last=False)
+
+        if waited > 1.0:
+            logging.debug(f"[KeyedLocks] {self.name} lock {key} waited {waited:.2f}s behind {queue_length} task(s)")
+
+    def get_metrics(self, top: int = 5) -> Dict[str, Any]:
+        """
+        Get contention metrics.
+
+        Args:
+            top: Number of most-waited keys to include
+
+        Returns:
+            Dictionary with acquisition counts, wait times (ms), live queue
+            lengths per key and the keys with the highest cumulative wait
+        """
+        metrics = self._metrics
+        acquisitions = metrics['acquisitions']
+        hot_keys = sorted(self._key_stats.items(), key=lambda item: item[1]['total_wait'], reverse=True)[:top]
+        return {
+            'name': self.name,
+            'acquisitions': acquisitions,
+            'contended': metrics['contended'],
+            'contention_rate': round(metrics['contended'] / acquisitions * 100, 2) if acquisitions else 0.0,
+            'avg_wait_ms': round(metrics['total_wait'] / acquisitions * 1000, 2) if acquisitions else 0.0,
+            'max_wait_ms': round(metrics['max_wait'] * 1000, 2),
+            'max_queue_length': metrics['max_queue_length'],
+            'active_keys': len(self._entries),
+            'reclaimed': metrics['reclaimed'],
+            'queue_lengths': {str(key): entry.refs - 1 for key, entry in self._entries.items() if entry.refs > 1},
+            'hot_keys': [
+                {
+                    'key': str(key),
+                    'acquisitions': stats['acquisitions'],
+                    'total_wait_ms': round(stats['total_wait'] * 1000, 2),
+                    'max_wait_ms': round(stats['max_wait'] * 1000, 2),
+                    'max_queue_length': stats['max_queue_length']
+                }
+                for key, stats in hot_keys if stats['total_wait'] > 0
+            ]
+        }
+
+event_locks = KeyedLockManager("events")
+
+def get_event_locks() -> KeyedLockManager:
+    """
+    Get the shared per-event lock manager, keyed by (guild_id, event_id).
+
+    Returns:
+        Global KeyedLockManager instance for event records
+    """
+    return event_locks
+
+roster_locks = KeyedLockManager("roster")
+
+def get_roster_locks() -> KeyedLockManager:
+    """
+    Get the shared per-guild roster lock manager, keyed by guild_id.
+
+    Returns:
+        Global KeyedLockManager instance for guild rosters
+    """
+    return roster_locks
@@ -0,0 +1,379 @@
+"""
+Leaderboard Index - Per-guild order-statistics trees over DKP, attendance rate and gear score.
+"""
+
+import logging
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DKP = "dkp"
+ATTENDANCE = "attendance"
+GS = "gs"
+METRICS = (DKP, ATTENDANCE, GS)
+
+def _number(value: Any) -> float:
+    """
+    Coerce a roster value to a number.
+
+    Args:
+        value: Raw value from the roster (int, Decimal, numeric string, None, "NULL")
+
+    Returns:
+        Float value, 0.0 when not numeric
+    """
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def metric_scores(metric: str, data: Dict[str, Any]) -> Tuple[float, ...]:
+    """
+    Compute the sort values of a roster entry for a metric.
+
+    The first value is the displayed score; the others break ties
+    (attendance rate ties go to the member with more attendances).
+
+    Args:
+        metric: Leaderboard metric (dkp, attendance, gs)
+        data: Roster entry
+
+    Returns:
+        Tuple of values, higher ranks first
+    """
+    if metric == DKP:
+        return (_number(data.get("DKP")),)
+    if metric == ATTENDANCE:
+        nb_events = _number(data.get("nb_events"))
+        attendances = _number(data.get("attendances"))
+        return (min(attendances / nb_events, 1.0) if nb_events > 0 else 0.0, attendances)
+    if metric == GS:
+        return (_number(data.get("GS")),)
+    raise ValueError(f"Unknown leaderboard metric: {metric}")
+
+class _Node:
+    """Treap node carrying its subtree size."""
+
+    __slots__ = ('key', 'priority', 'size', 'left', 'right')
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.priority = random.random()
+        self.size = 1
+        self.left: Optional['_Node'] = None
+        self.right: Optional['_Node'] = None
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node else 0
+
+def _update(node: _Node) -> _Node:
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+def _split(node: Optional[_Node], key: tuple) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split into keys < key and keys >= key."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        return _update(node), right
+    left, right = _split(node.left, key)
+    node.left = right
+    return left, _update(node)
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Merge two treaps where every key of left is below every key of right."""
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+def _remove(node: Optional[_Node], key: tuple) -> Optional[_Node]:
+    if node is None:
+        return None
+    if key == node.key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    else:
+        node.right = _remove(node.right, key)
+    return _update(node)
+
+class OrderStatisticTree:
+    """
+    Sorted set of unique keys with rank queries.
+
+    A treap whose nodes carry subtree sizes: insert, remove and rank run
+    in O(log n) expected time, and reading the first k keys costs
+    O(log n + k).
+    """
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._root: Optional[_Node] = None
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def insert(self, key: tuple) -> None:
+        """
+        Insert a key (keys must be unique).
+
+        Args:
+            key: Comparable key
+        """
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key)), right)
+
+    def remove(self, key: tuple) -> None:
+        """
+        Remove a key if present.
+
+        Args:
+            key: Key to remove
+        """
+        self._root = _remove(self._root, key)
+
+    def rank(self, key: tuple) -> int:
+        """
+        Count the keys strictly below a key.
+
+        Args:
+            key: Key to locate
+
+        Returns:
+            Zero-based position the key has (or would have) in sorted order
+        """
+        node, below = self._root, 0
+        while node:
+            if node.key < key:
+                below += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return below
+
+    def first(self, count: int, offset: int = 0) -> List[tuple]:
+        """
+        Read keys in sorted order.
+
+        Args:
+            count: Maximum number of keys
+            offset: Number of smallest keys to skip
+
+        Returns:
+            Up to count keys starting at position offset
+        """
+        stack: List[_Node] = []
+        node = self._root
+        while node:
+            below = _size(node.left)
+            if offset < below:
+                stack.append(node)
+                node = node.left
+            elif offset == below:
+                stack.append(node)
+                break
+            else:
+                offset -= below + 1
+                node = node.right
+
+        result: List[tuple] = []
+        while stack and len(result) < count:
+            node = stack.pop()
+            result.append(node.key)
+            child = node.right
+            while child:
+                stack.append(child)
+                child = child.left
+        return result
+
+class GuildLeaderboard:
+    """One order-statistics tree per metric for a guild's roster."""
+
+    def __init__(self):
+        """Initialize empty metric trees."""
+        self.trees: Dict[str, OrderStatisticTree] = {metric: OrderStatisticTree() for metric in METRICS}
+        self.keys: Dict[int, Dict[str, tuple]] = {}
+
+    def upsert(self, member_id: int, data: Dict[str, Any]) -> None:
+        """
+        Insert or re-rank a member in every metric.
+
+        Args:
+            member_id: Discord member ID
+            data: Roster entry
+        """
+        previous = self.keys.get(member_id, {})
+        keys = {}
+        for metric, tree in self.trees.items():
+            key = tuple(-value for value in metric_scores(metric, data)) + (member_id,)
+            if previous.get(metric) != key:
+                if metric in previous:
+                    tree.remove(previous[metric])
+                tree.insert(key)
+            keys[metric] = key
+        self.keys[member_id] = keys
+
+    def discard(self, member_id: int) -> None:
+        """
+        Remove a member from every metric.
+
+        Args:
+            member_id: Discord member ID
+        """
+        keys = self.keys.pop(member_id, None)
+        if keys:
+            for metric, key in keys.items():
+                self.trees[metric].remove(key)
+
+class LeaderboardIndex:
+    """
+    Maintain guild leaderboards incrementally.
+
+    A guild is built once from its roster entries on first query; after
+    that each counter or gear score change re-ranks only the member
+    concerned. Full roster reloads invalidate the guild so the next
+    query rebuilds it.
+    """
+
+    def __init__(self):
+        """Initialize the index."""
+        self._guilds: Dict[int, GuildLeaderboard] = {}
+        self._stats = {'builds': 0, 'updates': 0, 'queries': 0}
+
+    def is_loaded(self, guild_id: int) -> bool:
+        """
+        Check whether a guild's leaderboard is built.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            True if the guild is indexed
+        """
+        return guild_id in self._guilds
+
+    def load(self, guild_id: int, members: Iterable[Tuple[int, Dict[str, Any]]]) -> int:
+        """
+        Build a guild's leaderboard from its roster entries.
+
+        Args:
+            guild_id: Discord guild ID
+            members: (member_id, roster entry) pairs
+
+        Returns:
+            Number of members indexed
+        """
+        leaderboard = GuildLeaderboard()
+        for member_id, data in members:
+            leaderboard.upsert(member_id, data)
+        self._guilds[guild_id] = leaderboard
+        self._stats['builds'] += 1
+        logging.debug(f"[LeaderboardIndex] Built leaderboard for guild {guild_id} with {len(leaderboard.keys)} members")
+        return len(leaderboard.keys)
+
+    def update(self, guild_id: int, member_id: int, data: Dict[str, Any]) -> None:
+        """
+        Re-rank a member after a change (ignored until the guild is built).
+
+        Args:
+            guild_id: Discord guild ID
+            member_id: Discord member ID
+            data: Current roster entry
+        """
+        leaderboard = self._guilds.get(guild_id)
+        if leaderboard is not None:
+            leaderboard.upsert(member_id, data)
+            self._stats['updates'] += 1
+
+    def remove(self, guild_id: int, member_id: int) -> None:
+        """
+        Remove a member who left the roster.
+
+        Args:
+            guild_id: Discord guild ID
+            member_id: Discord member ID
+        """
+        leaderboard = self._guilds.get(guild_id)
+        if leaderboard is not None:
+            leaderboard.discard(member_id)
+            self._stats['updates'] += 1
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """
+        Drop a guild's leaderboard, or every leaderboard.
+
+        Args:
+            guild_id: Discord guild ID (None for all guilds)
+        """
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def top(self, guild_id: int, metric: str, limit: int, offset: int = 0) -> List[Tuple[int, float]]:
+        """
+        Get the highest ranked members.
+
+        Args:
+            guild_id: Discord guild ID
+            metric: Leaderboard metric
+            limit: Maximum number of members
+            offset: Number of leading members to skip
+
+        Returns:
+            List of (member_id, score) from the best rank down
+        """
+        self._stats['queries'] += 1
+        leaderboard = self._guilds.get(guild_id)
+        if leaderboard is None:
+            return []
+        return [(key[-1], -key[0]) for key in leaderboard.trees[metric].first(limit, offset)]
+
+    def rank(self, guild_id: int, metric: str, member_id: int) -> Optional[Tuple[int, int, float]]:
+        """
+        Get a member's position.
+
+        Args:
+            guild_id: Discord guild ID
+            metric: Leaderboard metric
+            member_id: Discord member ID
+
+        Returns:
+            (1-based rank, ranked members, score), or None if the member is not ranked
+        """
+        self._stats['queries'] += 1
+        leaderboard = self._guilds.get(guild_id)
+        if leaderboard is None or member_id not in leaderboard.keys:
+            return None
+        key = leaderboard.keys[member_id][metric]
+        tree = leaderboard.trees[metric]
+        return tree.rank(key) + 1, len(tree), -key[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with indexed guilds and members, builds, updates and queries
+        """
+        return {
+            **self._stats,
+            'guilds': len(self._guilds),
+            'members': sum(len(leaderboard.keys) for leaderboard in self._guilds.values())
+        }
+
+leaderboard_index = LeaderboardIndex()
+
+def get_leaderboards() -> LeaderboardIndex:
+    """
+    Get the shared leaderboard index.
+
+    Returns:
+        Global LeaderboardIndex instance
+    """
+    return leaderboard_index
@@ -16,6 +16,8 @@ from typing import Dict, Any, Optional, Callable, List, Union
 import discord
 from discord.ext import commands
 
+from core.dkp_ledger import BACKUP_RESTORED, get_dkp_ledger
+
 class ServiceCircuitBreaker:
     """Circuit breaker for external services (Discord API, webhooks, etc.)."""
     
@@ -395,7 +397,9 @@ class DataBackupManager:
                     (settings['guild_id'], settings['guild_name'], settings['guild_lang'], settings['guild_game'], settings['guild_server'], settings['initialized'], settings['premium'])
                 ))
             
+            ledger = get_dkp_ledger()
             for member in guild_data.get('members', []):
+                transaction_queries.append(ledger.adjustment_statement(member['guild_id'], member['member_id'], BACKUP_RESTORED, member))
                 transaction_queries.append((
                     "INSERT INTO guild_members (guild_id, member_id, username, language, GS, build, weapons, DKP, nb_events, registrations, attendances, class) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE username=VALUES(username), language=VALUES(language), GS=VALUES(GS), build=VALUES(build), weapons=VALUES(weapons), DKP=VALUES(DKP), nb_events=VALUES(nb_events), registrations=VALUES(registrations), attendances=VALUES(attendances), class=VALUES(class)",
                     (member['guild_id'], member['member_id'], member['username'], member['language'], member['GS'], member['build'], member['weapons'], member['DKP'], member['nb_events'], member['registrations'], member['attendances'], member['class'])
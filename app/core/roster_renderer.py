@@ -0,0 +1,227 @@
+"""
+Roster Renderer - Cached roster table rows, single-pass class counts, page splitting and page change tracking.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAX_MESSAGE_LENGTH = 2000
+
+ROW_FIELDS = ("username", "language", "GS", "build", "weapons", "class", "DKP", "nb_events", "registrations", "attendances")
+COLUMN_WIDTHS = (20, 8, 8, 7, 9, 14, 10, 8, 8)
+CLASSES = ("tank", "melee dps", "ranged dps", "healer", "flanker")
+
+def _present(value: Any) -> bool:
+    return isinstance(value, str) and value not in ("", "NULL", "None")
+
+def _percent(count: Any, nb_events: Any) -> str:
+    try:
+        return f"{round(count / nb_events * 100) if nb_events > 0 else 0}%"
+    except (TypeError, ZeroDivisionError):
+        return "0%"
+
+def _join_cells(cells: List[str]) -> str:
+    return "│".join(
+        [cells[0].ljust(COLUMN_WIDTHS[0])] + [cell.center(width) for cell, width in zip(cells[1:], COLUMN_WIDTHS[1:])]
+    )
+
+def render_row(data: Dict[str, Any]) -> str:
+    """
+    Render one roster table row.
+
+    Args:
+        data: Roster entry
+
+    Returns:
+        Fixed-width table row
+    """
+    nb_events = data.get("nb_events", 0) or 0
+    weapons = data.get("weapons", "NULL")
+    member_class = data.get("class", "NULL")
+    return _join_cells([
+        str(data.get("username", ""))[:COLUMN_WIDTHS[0]],
+        str(data.get("language", "en-US"))[:COLUMN_WIDTHS[1]],
+        str(data.get("GS", "NULL")),
+        "Y" if _present(data.get("build")) else " ",
+        weapons if _present(weapons) else " ",
+        member_class if _present(member_class) else " ",
+        str(data.get("DKP", 0)),
+        _percent(data.get("registrations", 0) or 0, nb_events),
+        _percent(data.get("attendances", 0) or 0, nb_events)
+    ])
+
+def render_header(labels: List[str]) -> str:
+    """
+    Render the table header from the localized column labels.
+
+    Args:
+        labels: Nine column labels
+
+    Returns:
+        Header row
+    """
+    return _join_cells(list(labels))
+
+def paginate(header: str, rows: List[str], footer: str, max_length: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """
+    Split table rows into code-block messages under the Discord length limit.
+
+    Every page repeats the header; the footer is appended to the last page.
+
+    Args:
+        header: Header row
+        rows: Table rows in display order
+        footer: Text appended after the last page's code block
+        max_length: Maximum message length
+
+    Returns:
+        Message contents, at least one
+    """
+    table_head = f"```\n{header}\n{'─' * len(header)}\n"
+    pages = []
+    lines = [table_head]
+    length = len(table_head)
+    for row in rows:
+        if length + len(row) + len(footer) + 10 > max_length:
+            lines.append("```")
+            pages.append("".join(lines))
+            lines, length = [table_head], len(table_head)
+        lines.append(f"{row}\n")
+        length += len(row) + 1
+    lines.append("```" + footer)
+    pages.append("".join(lines))
+    return pages
+
+class RosterRenderer:
+    """
+    Render roster tables with per-member row caching.
+
+    A member's row is re-rendered only when one of its displayed fields
+    changes. Page digests remember what each roster message shows, so a
+    message whose content did not change is neither fetched nor edited.
+    """
+
+    def __init__(self):
+        """Initialize the row and page caches."""
+        self._rows: Dict[int, Dict[int, Tuple[tuple, str]]] = {}
+        self._pages: Dict[int, Dict[int, str]] = {}
+        self._stats = {'renders': 0, 'rows_rendered': 0, 'rows_cached': 0, 'pages_edited': 0, 'pages_skipped': 0}
+
+    def render_rows(self, guild_id: int, members: Iterable[Tuple[int, Dict[str, Any]]]) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Render a guild's rows sorted by username and count classes in the same pass.
+
+        Args:
+            guild_id: Discord guild ID
+            members: (member_id, roster entry) pairs
+
+        Returns:
+            Tuple of (rows, class counts keyed by lower-case class name)
+        """
+        previous = self._rows.get(guild_id, {})
+        current: Dict[int, Tuple[tuple, str]] = {}
+        class_counts = dict.fromkeys(CLASSES, 0)
+        keyed_rows = []
+        for member_id, data in members:
+            signature = tuple(data.get(field) for field in ROW_FIELDS)
+            cached = previous.get(member_id)
+            if cached and cached[0] == signature:
+                row = cached[1]
+                self._stats['rows_cached'] += 1
+            else:
+                row = render_row(data)
+                self._stats['rows_rendered'] += 1
+            current[member_id] = (signature, row)
+
+            member_class = (data.get("class") or "").lower()
+            if member_class in class_counts:
+                class_counts[member_class] += 1
+            keyed_rows.append(((data.get("username") or "").lower(), row))
+
+        self._rows[guild_id] = current
+        self._stats['renders'] += 1
+        keyed_rows.sort(key=lambda item: item[0])
+        return [row for _, row in keyed_rows], class_counts
+
+    @staticmethod
+    def digest(content: str) -> str:
+        """
+        Hash a page content.
+
+        Args:
+            content: Message content
+
+        Returns:
+            Hex digest
+        """
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def page_changed(self, guild_id: int, message_id: int, digest: str) -> bool:
+        """
+        Check whether a roster message needs an edit.
+
+        Args:
+            guild_id: Discord guild ID
+            message_id: Roster message ID
+            digest: Digest of the content to show
+
+        Returns:
+            True unless the message is known to show this content
+        """
+        if self._pages.get(guild_id, {}).get(message_id) == digest:
+            self._stats['pages_skipped'] += 1
+            return False
+        return True
+
+    def remember_page(self, guild_id: int, message_id: int, digest: Optional[str]) -> None:
+        """
+        Record what a roster message shows (None forgets the message).
+
+        Args:
+            guild_id: Discord guild ID
+            message_id: Roster message ID
+            digest: Digest of the content now shown
+        """
+        pages = self._pages.setdefault(guild_id, {})
+        if digest is None:
+            pages.pop(message_id, None)
+        else:
+            pages[message_id] = digest
+            self._stats['pages_edited'] += 1
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """
+        Drop the cached rows and page digests of a guild, or of every guild.
+
+        Args:
+            guild_id: Discord guild ID (None for all guilds)
+        """
+        if guild_id is None:
+            self._rows.clear()
+            self._pages.clear()
+        else:
+            self._rows.pop(guild_id, None)
+            self._pages.pop(guild_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get renderer statistics.
+
+        Returns:
+            Dictionary with renders, rendered and cached rows, edited and skipped pages, and cached rows
+        """
+        return {
+            **self._stats,
+            'cached_rows': sum(len(rows) for rows in self._rows.values())
+        }
+
+roster_renderer = RosterRenderer()
+
+def get_roster_renderer() -> RosterRenderer:
+    """
+    Get the shared roster renderer.
+
+    Returns:
+        Global RosterRenderer instance
+    """
+    return roster_renderer
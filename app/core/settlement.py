@@ -0,0 +1,235 @@
+"""
+Settlement Engine - Per-event DKP and counter deltas applied in one idempotent batched transaction.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from core.dkp_ledger import COUNTERS, get_dkp_ledger
+
+REGISTRATIONS = "registrations"
+ATTENDANCE = "attendance"
+PHASES = (REGISTRATIONS, ATTENDANCE)
+
+Statement = Tuple[str, tuple]
+
+class Settlement:
+    """
+    Accumulate counter deltas for one phase of one event.
+
+    Deltas are summed per member in a dict, so adding is O(1) and a member
+    touched by several rules still yields a single ledger entry and a single
+    row in the batched balance update.
+    """
+
+    def __init__(self, guild_id: int, event_id: int, phase: str):
+        """
+        Initialize an empty settlement.
+
+        Args:
+            guild_id: Discord guild ID
+            event_id: Event being settled
+            phase: Settlement phase (registrations or attendance)
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown settlement phase: {phase}")
+        self.guild_id = guild_id
+        self.event_id = event_id
+        self.phase = phase
+        self.deltas: Dict[int, Dict[str, int]] = {}
+        self.reasons: Dict[int, str] = {}
+        self.dropped = 0
+
+    def add(self, member_id: int, reason: Optional[str] = None, **deltas: int) -> None:
+        """
+        Add counter deltas for a member.
+
+        Args:
+            member_id: Discord member ID
+            reason: Ledger reason for the member's entry (defaults to the phase, last one wins)
+            **deltas: Counter name (DKP, nb_events, registrations, attendances) to delta
+        """
+        for counter, delta in deltas.items():
+            if counter not in COUNTERS:
+                raise ValueError(f"Unknown settlement counter: {counter}")
+            if delta:
+                member_deltas = self.deltas.setdefault(member_id, dict.fromkeys(COUNTERS, 0))
+                member_deltas[counter] += delta
+                if reason:
+                    self.reasons[member_id] = reason
+
+    def restrict_to(self, member_ids: Set[int]) -> int:
+        """
+        Drop the deltas of members outside a set.
+
+        Balances only exist for roster members, so entries for anyone else
+        would leave the ledger ahead of the materialized balances.
+
+        Args:
+            member_ids: Member IDs allowed to receive deltas
+
+        Returns:
+            Number of members dropped
+        """
+        dropped = [member_id for member_id in self.deltas if member_id not in member_ids]
+        for member_id in dropped:
+            del self.deltas[member_id]
+            self.reasons.pop(member_id, None)
+        self.dropped += len(dropped)
+        return len(dropped)
+
+    def statements(self) -> List[Statement]:
+        """
+        Build the marker insert, the ledger entries and the balance update.
+
+        The marker's primary key (guild_id, event_id, phase) makes a second
+        settlement of the same phase fail inside the transaction, so nothing
+        is applied twice. When restrict_to() dropped every delta no marker is
+        built, so the phase can still be settled once the roster is known.
+
+        Returns:
+            List of (query, params) tuples for run_db_transaction, empty if every delta was dropped
+        """
+        if not self.deltas and self.dropped:
+            return []
+        ledger = get_dkp_ledger()
+        statements = [(
+            "INSERT INTO event_settlements (guild_id, event_id, phase, members) VALUES (%s, %s, %s, %s)",
+            (self.guild_id, self.event_id, self.phase, len(self.deltas))
+        )]
+        entries = ledger.entries_statement(self.guild_id, self.event_id, (
+            (member_id, self.reasons.get(member_id, self.phase), member_deltas)
+            for member_id, member_deltas in self.deltas.items()
+        ))
+        if entries:
+            statements.append(entries)
+            statements.append(ledger.balances_statement(self.guild_id, self.deltas))
+        return statements
+
+    def apply_to(self, members: Dict[int, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Apply the deltas to roster entries.
+
+        Args:
+            members: Roster entries by member ID (left untouched)
+
+        Returns:
+            Updated copies of the entries that have deltas
+        """
+        updated = {}
+        for member_id, member_deltas in self.deltas.items():
+            member_data = members.get(member_id)
+            if member_data is None:
+                continue
+            updated[member_id] = {
+                **member_data,
+                **{counter: (member_data.get(counter) or 0) + delta for counter, delta in member_deltas.items() if delta}
+            }
+        return updated
+
+class SettlementEngine:
+    """
+    Apply settlements exactly once per (event, phase).
+
+    A settlement already recorded in event_settlements is skipped before
+    any write; a concurrent duplicate is rejected by the marker's primary
+    key and rolled back with the rest of its transaction.
+    """
+
+    def __init__(self):
+        """Initialize the engine counters."""
+        self._stats = {'settled': 0, 'duplicates': 0, 'members': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+
+    async def is_settled(self, run_db_query: Callable[..., Awaitable[Any]], guild_id: int, event_id: int, phase: str) -> bool:
+        """
+        Check whether a phase of an event was already settled.
+
+        Args:
+            run_db_query: Database query coroutine
+            guild_id: Discord guild ID
+            event_id: Event ID
+            phase: Settlement phase
+
+        Returns:
+            True if the settlement marker exists
+        """
+        row = await run_db_query(
+            "SELECT 1 FROM event_settlements WHERE guild_id = %s AND event_id = %s AND phase = %s",
+            (guild_id, event_id, phase), fetch_one=True
+        )
+        return bool(row)
+
+    async def settle(self, settlement: Settlement, run_db_query: Callable[..., Awaitable[Any]],
+                     run_transaction: Callable[[List[Statement]], Awaitable[Any]],
+                     extra_statements: Sequence[Statement] = ()) -> bool:
+        """
+        Apply a settlement in one transaction.
+
+        Args:
+            settlement: Deltas to apply
+            run_db_query: Database query coroutine used for the marker lookup
+            run_transaction: Transaction coroutine taking (query, params) tuples
+            extra_statements: Statements committed atomically with the settlement
+
+        Returns:
+            True if applied, False if this phase of the event was already settled or every delta was dropped
+
+        Raises:
+            Exception: Transaction errors other than a duplicate settlement
+        """
+        guild_id, event_id, phase = settlement.guild_id, settlement.event_id, settlement.phase
+        statements = settlement.statements()
+        if not statements:
+            logging.warning(f"[SettlementEngine] No member of {phase} of event {event_id} in guild {guild_id} is on the roster, not settling")
+            return False
+        if await self.is_settled(run_db_query, guild_id, event_id, phase):
+            self._stats['duplicates'] += 1
+            logging.info(f"[SettlementEngine] {phase} of event {event_id} in guild {guild_id} already settled, skipping")
+            return False
+
+        start = time.perf_counter()
+        try:
+            result = await run_transaction(statements + list(extra_statements))
+        except Exception:
+            if await self.is_settled(run_db_query, guild_id, event_id, phase):
+                self._stats['duplicates'] += 1
+                logging.info(f"[SettlementEngine] {phase} of event {event_id} in guild {guild_id} settled concurrently, skipping")
+                return False
+            raise
+        if result is False:
+            raise RuntimeError(f"Settlement transaction failed for {phase} of event {event_id}")
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self._stats['settled'] += 1
+        self._stats['members'] += len(settlement.deltas)
+        self._stats['total_ms'] += elapsed
+        self._stats['max_ms'] = max(self._stats['max_ms'], elapsed)
+        logging.info(f"[SettlementEngine] Settled {phase} of event {event_id} in guild {guild_id} for {len(settlement.deltas)} members in {elapsed:.1f}ms")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get settlement statistics.
+
+        Returns:
+            Dictionary with settled and skipped counts, members touched and timings in milliseconds
+        """
+        settled = self._stats['settled']
+        return {
+            **self._stats,
+            'total_ms': round(self._stats['total_ms'], 1),
+            'max_ms': round(self._stats['max_ms'], 1),
+            'avg_ms': round(self._stats['total_ms'] / settled, 1) if settled else 0.0
+        }
+
+settlement_engine = SettlementEngine()
+
+def get_settlement_engine() -> SettlementEngine:
+    """
+    Get the shared settlement engine.
+
+    Returns:
+        Global SettlementEngine instance
+    """
+    return settlement_engine
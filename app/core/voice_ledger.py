@@ -0,0 +1,343 @@
+"""
+Voice Presence Ledger - Per-member voice join/leave intervals kept in memory and flushed in batches.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import VOICE_LEDGER_FLUSH_BATCH_SIZE, VOICE_LEDGER_RETENTION_DAYS
+
+MEMORY_WINDOW_SECONDS = 2 * 86400
+PRUNE_INTERVAL_SECONDS = 86400
+
+INSERT_QUERY = "INSERT IGNORE INTO voice_presence (guild_id, member_id, joined_at, seconds) VALUES "
+
+Interval = Tuple[float, float]
+
+class VoicePresenceLedger:
+    """
+    Track time spent in voice per guild member.
+
+    Joins open an interval, leaves close it. Closed intervals stay in memory
+    for MEMORY_WINDOW_SECONDS so attendance is answered without touching the
+    database or scanning voice channels, and are queued for a batched insert
+    into voice_presence. Members who never left are counted up to the query
+    time through their open interval.
+    """
+
+    def __init__(self, flush_batch_size: int = VOICE_LEDGER_FLUSH_BATCH_SIZE,
+                 retention_days: int = VOICE_LEDGER_RETENTION_DAYS):
+        """
+        Initialize an empty ledger.
+
+        Args:
+            flush_batch_size: Maximum rows per insert statement
+            retention_days: Days closed intervals are kept in the database
+        """
+        self.flush_batch_size = max(flush_batch_size, 1)
+        self.retention_days = retention_days
+        self._open: Dict[int, Dict[int, float]] = {}
+        self._closed: Dict[int, Dict[int, List[Interval]]] = {}
+        self._pending: List[Tuple[int, int, int, int]] = []
+        self._flush_lock = asyncio.Lock()
+        self._last_prune = 0.0
+        self._stats = {'joins': 0, 'leaves': 0, 'flushes': 0, 'flushed_rows': 0, 'flush_errors': 0, 'queries': 0}
+
+    def join(self, guild_id: int, member_id: int, at: Optional[float] = None) -> bool:
+        """
+        Open a presence interval.
+
+        Args:
+            guild_id: Discord guild ID
+            member_id: Discord member ID
+            at: Unix time of the join (defaults to now)
+
+        Returns:
+            True if an interval was opened, False if one was already open
+        """
+        members = self._open.setdefault(guild_id, {})
+        if member_id in members:
+            return False
+        members[member_id] = time.time() if at is None else at
+        self._stats['joins'] += 1
+        return True
+
+    def leave(self, guild_id: int, member_id: int, at: Optional[float] = None) -> bool:
+        """
+        Close a presence interval and queue it for the database.
+
+        Args:
+            guild_id: Discord guild ID
+            member_id: Discord member ID
+            at: Unix time of the leave (defaults to now)
+
+        Returns:
+            True if an open interval was closed
+        """
+        start = self._open.get(guild_id, {}).pop(member_id, None)
+        if start is None:
+            return False
+        end = max(start, time.time() if at is None else at)
+        self._closed.setdefault(guild_id, {}).setdefault(member_id, []).append((start, end))
+        self._pending.append((guild_id, member_id, int(start), int(end - start)))
+        self._stats['leaves'] += 1
+        return True
+
+    def seed(self, guild_id: int, connected_ids: Iterable[int], at: Optional[float] = None) -> None:
+        """
+        Align open intervals with who is connected right now.
+
+        Used on startup and after gateway reconnects, when voice updates may
+        have been missed: connected members without an open interval are
+        opened, open intervals of members no longer connected are closed.
+
+        Args:
+            guild_id: Discord guild ID
+            connected_ids: Members currently in a counted voice channel
+            at: Unix time of the snapshot (defaults to now)
+        """
+        at = time.time() if at is None else at
+        connected = set(connected_ids)
+        for member_id in list(self._open.get(guild_id, {})):
+            if member_id not in connected:
+                self.leave(guild_id, member_id, at)
+        for member_id in connected:
+            self.join(guild_id, member_id, at)
+
+    def close_all(self, at: Optional[float] = None) -> int:
+        """
+        Close every open interval, e.g. before shutting down.
+
+        Args:
+            at: Unix time of the close (defaults to now)
+
+        Returns:
+            Number of intervals closed
+        """
+        at = time.time() if at is None else at
+        return sum(self.leave(guild_id, member_id, at)
+                   for guild_id, members in list(self._open.items()) for member_id in list(members))
+
+    def load(self, rows: Iterable[Tuple[int, int, int, int]]) -> int:
+        """
+        Add closed intervals read back from the database.
+
+        Args:
+            rows: (guild_id, member_id, joined_at, seconds) tuples
+
+        Returns:
+            Number of intervals loaded
+        """
+        loaded = 0
+        for guild_id, member_id, joined_at, seconds in rows:
+            intervals = self._closed.setdefault(int(guild_id), {}).setdefault(int(member_id), [])
+            interval = (float(joined_at), float(joined_at) + float(seconds))
+            if interval not in intervals:
+                intervals.append(interval)
+                loaded += 1
+        for members in self._closed.values():
+            for intervals in members.values():
+                intervals.sort()
+        return loaded
+
+    def presence_seconds(self, guild_id: int, start: float, end: float,
+                         member_ids: Optional[Iterable[int]] = None,
+                         now: Optional[float] = None) -> Dict[int, float]:
+        """
+        Compute time in voice overlapping a window.
+
+        Args:
+            guild_id: Discord guild ID
+            start: Window start (Unix time)
+            end: Window end (Unix time)
+            member_ids: Restrict to these members (defaults to every member seen in voice)
+            now: Upper bound for open intervals (defaults to now)
+
+        Returns:
+            Dictionary of member ID to seconds in voice, members without overlap omitted
+        """
+        self._stats['queries'] += 1
+        now = time.time() if now is None else now
+        open_members = self._open.get(guild_id, {})
+        closed_members = self._closed.get(guild_id, {})
+        if member_ids is None:
+            member_ids = set(open_members) | set(closed_members)
+
+        result = {}
+        for member_id in member_ids:
+            total = 0.0
+            for joined, left in reversed(closed_members.get(member_id, ())):
+                if left <= start:
+                    break
+                total += max(0.0, min(left, end) - max(joined, start))
+            joined = open_members.get(member_id)
+            if joined is not None:
+                total += max(0.0, min(now, end) - max(joined, start))
+            if total > 0:
+                result[member_id] = total
+        return result
+
+    def attendees(self, guild_id: int, start: float, end: float, min_percent: int,
+                  now: Optional[float] = None) -> Dict[int, float]:
+        """
+        Members whose time in voice reaches a share of the window.
+
+        Args:
+            guild_id: Discord guild ID
+            start: Window start (Unix time)
+            end: Window end (Unix time)
+            min_percent: Required share of the window, 0 meaning any presence
+            now: Upper bound for open intervals (defaults to now)
+
+        Returns:
+            Dictionary of qualifying member ID to seconds in voice
+        """
+        required = max(end - start, 0) * max(min(min_percent, 100), 0) / 100
+        seconds = self.presence_seconds(guild_id, start, end, now=now)
+        return {member_id: spent for member_id, spent in seconds.items() if spent >= required}
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Drop closed intervals older than the memory window.
+
+        Args:
+            now: Current Unix time (defaults to now)
+
+        Returns:
+            Number of intervals dropped
+        """
+        cutoff = (time.time() if now is None else now) - MEMORY_WINDOW_SECONDS
+        dropped = 0
+        for guild_id in list(self._closed):
+            members = self._closed[guild_id]
+            for member_id in list(members):
+                kept = [interval for interval in members[member_id] if interval[1] >= cutoff]
+                dropped += len(members[member_id]) - len(kept)
+                if kept:
+                    members[member_id] = kept
+                else:
+                    del members[member_id]
+            if not members:
+                del self._closed[guild_id]
+        return dropped
+
+    async def warm(self, run_db_query: Callable[..., Awaitable[Any]], now: Optional[float] = None) -> int:
+        """
+        Reload the intervals of the memory window after a restart.
+
+        Args:
+            run_db_query: Database query coroutine
+            now: Current Unix time (defaults to now)
+
+        Returns:
+            Number of intervals loaded
+        """
+        since = int((time.time() if now is None else now) - MEMORY_WINDOW_SECONDS)
+        rows = await run_db_query(
+            "SELECT guild_id, member_id, joined_at, seconds FROM voice_presence WHERE joined_at + seconds >= %s",
+            (since,), fetch_all=True
+        )
+        loaded = self.load(rows or [])
+        logging.info(f"[VoiceLedger] Loaded {loaded} voice intervals from the database")
+        return loaded
+
+    async def flush(self, run_db_query: Callable[..., Awaitable[Any]]) -> int:
+        """
+        Write queued intervals in multi-row inserts.
+
+        Rows of a failed batch are queued again for the next flush. Inserts
+        are idempotent on (guild_id, member_id, joined_at).
+
+        Args:
+            run_db_query: Database query coroutine
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            written = 0
+            for offset in range(0, len(pending), self.flush_batch_size):
+                batch = pending[offset:offset + self.flush_batch_size]
+                query = INSERT_QUERY + ", ".join(["(%s, %s, %s, %s)"] * len(batch))
+                params = tuple(value for row in batch for value in row)
+                try:
+                    await run_db_query(query, params, commit=True)
+                    written += len(batch)
+                except Exception as e:
+                    self._stats['flush_errors'] += 1
+                    self._pending[:0] = pending[offset:]
+                    logging.error(f"[VoiceLedger] Error flushing {len(pending) - offset} voice intervals: {e}", exc_info=True)
+                    break
+            if written:
+                self._stats['flushes'] += 1
+                self._stats['flushed_rows'] += written
+                logging.debug(f"[VoiceLedger] Flushed {written} voice intervals")
+
+            now = time.time()
+            self.prune(now)
+            if self.retention_days > 0 and now - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+                self._last_prune = now
+                try:
+                    await run_db_query(
+                        "DELETE FROM voice_presence WHERE joined_at < %s",
+                        (int(now - self.retention_days * 86400),), commit=True
+                    )
+                except Exception as e:
+                    logging.error(f"[VoiceLedger] Error pruning old voice intervals: {e}", exc_info=True)
+            return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get ledger statistics.
+
+        Returns:
+            Dictionary with cumulative counters, open and in-memory interval
+            counts and the number of rows waiting for a flush
+        """
+        return {
+            **self._stats,
+            'open': sum(len(members) for members in self._open.values()),
+            'intervals': sum(len(intervals) for members in self._closed.values() for intervals in members.values()),
+            'pending': len(self._pending)
+        }
+
+voice_ledger = VoicePresenceLedger()
+
+def get_voice_ledger() -> VoicePresenceLedger:
+    """
+    Get the shared voice presence ledger.
+
+    Returns:
+        Global VoicePresenceLedger instance
+    """
+    return voice_ledger
+
+async def start_voice_ledger_flush_task(bot, interval: int = 60):
+    """
+    Start background task flushing closed voice intervals.
+
+    Args:
+        bot: Discord bot instance
+        interval: Flush interval in seconds
+    """
+    async def flush_loop():
+        try:
+            while True:
+                try:
+                    await asyncio.sleep(interval)
+                    await voice_ledger.flush(bot.run_db_query)
+                except Exception as e:
+                    logging.error(f"[VoiceLedger] Flush task error: {e}")
+        except asyncio.CancelledError:
+            logging.debug("[VoiceLedger] Flush task cancelled")
+            raise
+
+    task = asyncio.create_task(flush_loop())
+
+    if hasattr(bot, '_background_tasks'):
+        bot._background_tasks.append(task)
+
+    logging.info(f"[VoiceLedger] Flush task started (interval {interval}s)")
@@ -8,11 +8,21 @@ import discord
 import pytz
 from discord.ext import tasks
 
+from core.event_timeline import ATTENDANCE, CLOSE, DELETE, REMINDER, get_event_timeline
+
 # #################################################################################### #
 #                            Scheduler Configuration
 # #################################################################################### #
 TIMEZONE = pytz.timezone("Europe/Paris")
 
+TIMELINE_TASKS = {
+    CLOSE: ('events_close', 'GuildEvents', 'event_close_cron'),
+    ATTENDANCE: ('attendance_check', 'GuildAttendance', 'check_voice_presence'),
+    REMINDER: ('events_reminder', 'GuildEvents', 'event_reminder_cron'),
+    DELETE: ('events_delete', 'GuildEvents', 'event_delete_cron'),
+}
+TIMELINE_RETRY_SECONDS = 60
+
 # #################################################################################### #
 #                            Task Scheduler Core System
 # #################################################################################### #
@@ -34,12 +44,17 @@ class TaskScheduler:
             'events_reminder': asyncio.Lock(),
             'events_delete': asyncio.Lock(),
             'events_close': asyncio.Lock(),
+            'events_archive': asyncio.Lock(),
             'attendance_check': asyncio.Lock(),
+            'events_timeline': asyncio.Lock(),
             'epic_items_scraping': asyncio.Lock(),
             'wishlist_update': asyncio.Lock()
         }
         self._last_execution: Dict[str, str] = {}
-        self._task_metrics: Dict[str, Dict[str, int]] = {
+        self.timeline = get_event_timeline()
+        self._timeline_task: Optional[asyncio.Task] = None
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+        self._task_metrics: Dict[str, Dict[str, Any]] = {
             task: {'success': 0, 'failures': 0, 'total_time': 0} 
             for task in self._task_locks.keys()
         }
@@ -71,21 +86,26 @@ class TaskScheduler:
             coroutine: Coroutine function to execute
             *args: Arguments for the coroutine
             **kwargs: Keyword arguments for the coroutine
+            
+        Returns:
+            Result of the coroutine, None if it failed
         """
         if task_name not in self._task_metrics:
             self._task_metrics[task_name] = {'success': 0, 'failures': 0, 'total_time': 0}
         
         start_time = time.time()
         try:
-            await coroutine(*args, **kwargs)
+            result = await coroutine(*args, **kwargs)
             self._task_metrics[task_name]['success'] += 1
             execution_time = int((time.time() - start_time) * 1000)
             self._task_metrics[task_name]['total_time'] += execution_time
             logging.info(f"[Scheduler] {task_name} completed successfully in {execution_time}ms")
+            return result
         except Exception as e:
             self._task_metrics[task_name]['failures'] += 1
             execution_time = int((time.time() - start_time) * 1000)
             logging.exception(f"[Scheduler] {task_name} failed after {execution_time}ms: {e}")
+            return None
     
     async def _safe_get_cog(self, cog_name: str) -> Optional[Any]:
         """
@@ -113,12 +133,14 @@ class TaskScheduler:
         - Epic items scraping
         - Contract cleanup
         - Roster updates
-        - Event management
-        - Attendance checks
+        - Event creation and archival
+        - Event timeline rebuild
         - Wishlist updates
+        
+        Event closing, attendance checks, reminders and message cleanup are
+        fired by the event timeline sleeper when each event's transition is due.
         """
         now = datetime.now(TIMEZONE).strftime("%H:%M")
-        now_time = datetime.now(TIMEZONE)
 
         if now == "03:30" and self._should_execute('epic_items_scraping', now):
             if self._task_locks['epic_items_scraping'].locked():
@@ -151,7 +173,7 @@ class TaskScheduler:
                 logging.warning("[Scheduler] Roster update already running, skipping")
             else:
                 async with self._task_locks['roster']:
-                    logging.info("[Scheduler] Launching roster update for all guilds")
+                    logging.info("[Scheduler] Launching roster reconciliation for all guilds")
                     guild_members_cog = await self._safe_get_cog("GuildMembers")
                     if guild_members_cog:
                         await self._execute_with_monitoring(
@@ -168,62 +190,36 @@ class TaskScheduler:
                     logging.info("[Scheduler] Automatic event creation triggered")
                     events_cog = await self._safe_get_cog("GuildEvents")
                     if events_cog:
-                        await self._execute_with_monitoring(
+                        guild_report = await self._execute_with_monitoring(
                             'events_create',
                             events_cog.create_events_for_all_premium_guilds
                         )
+                        if guild_report is not None:
+                            self._task_metrics['events_create']['last_run_guilds'] = guild_report
 
-        if now in ["13:00", "18:00"] and self._should_execute('events_reminder', now):
-            if self._task_locks['events_reminder'].locked():
-                logging.warning("[Scheduler] Event reminder already running, skipping")
-            else:
-                async with self._task_locks['events_reminder']:
-                    logging.info("[Scheduler] Automatic registration reminder triggered")
-                    events_cog = await self._safe_get_cog("GuildEvents")
-                    if events_cog:
-                        await self._execute_with_monitoring(
-                            'events_reminder',
-                            events_cog.event_reminder_cron
-                        )
-
-        if now in ["23:30", "04:30"] and self._should_execute('events_delete', now):
-            if self._task_locks['events_delete'].locked():
-                logging.warning("[Scheduler] Event deletion already running, skipping")
+        if now == "04:45" and self._should_execute('events_archive', now):
+            if self._task_locks['events_archive'].locked():
+                logging.warning("[Scheduler] Event archival already running, skipping")
             else:
-                async with self._task_locks['events_delete']:
-                    logging.info("[Scheduler] Automatic deletion of finished events")
+                async with self._task_locks['events_archive']:
+                    logging.info("[Scheduler] Automatic archival of closed events")
                     events_cog = await self._safe_get_cog("GuildEvents")
                     if events_cog:
                         await self._execute_with_monitoring(
-                            'events_delete',
-                            events_cog.event_delete_cron
+                            'events_archive',
+                            events_cog.event_archive_cron
                         )
 
-        if now_time.minute % 5 == 0 and self._should_execute('events_close', f"{now}:{now_time.minute//5}"):
-            if self._task_locks['events_close'].locked():
-                logging.debug("[Scheduler] Event closure already running, skipping")
+        if now == "00:05" and self._should_execute('events_timeline', now):
+            if self._task_locks['events_timeline'].locked():
+                logging.warning("[Scheduler] Event timeline rebuild already running, skipping")
             else:
-                async with self._task_locks['events_close']:
-                    logging.info("[Scheduler] Automatic closure of confirmed events")
-                    events_cog = await self._safe_get_cog("GuildEvents")
-                    if events_cog:
-                        await self._execute_with_monitoring(
-                            'events_close',
-                            events_cog.event_close_cron
-                        )
-
-        if now_time.minute % 5 == 0 and self._should_execute('attendance_check', f"{now}:{now_time.minute//5}"):
-            if self._task_locks['attendance_check'].locked():
-                logging.debug("[Scheduler] Attendance check already running, skipping")
-            else:
-                async with self._task_locks['attendance_check']:
-                    logging.debug("[Scheduler] Automatic voice presence check")
-                    attendance_cog = await self._safe_get_cog("GuildAttendance")
-                    if attendance_cog:
-                        await self._execute_with_monitoring(
-                            'attendance_check',
-                            attendance_cog.check_voice_presence
-                        )
+                async with self._task_locks['events_timeline']:
+                    logging.info("[Scheduler] Daily event timeline rebuild")
+                    await self._execute_with_monitoring(
+                        'events_timeline',
+                        self.rebuild_event_timeline
+                    )
 
         if now in ["09:00", "22:00"] and self._should_execute('wishlist_update', now):
             if self._task_locks['wishlist_update'].locked():
@@ -322,6 +318,81 @@ class TaskScheduler:
         await asyncio.gather(*[process_guild(guild_id) for guild_id in guild_ids], return_exceptions=True)
         logging.info(f"[Scheduler] Roster update completed for {len(guild_ids)} guilds")
 
+# #################################################################################### #
+#                            Event Timeline
+# #################################################################################### #
+    def start_event_timeline(self) -> None:
+        """
+        Start the event timeline sleeper if it is not already running.
+        """
+        if self._timeline_task and not self._timeline_task.done():
+            return
+        self._timeline_task = asyncio.create_task(self._run_event_timeline())
+        if hasattr(self.bot, '_background_tasks'):
+            self.bot._background_tasks.append(self._timeline_task)
+
+    async def _run_event_timeline(self) -> None:
+        """
+        Build the timeline from the database, then sleep until transitions are due.
+        """
+        while True:
+            try:
+                await self.rebuild_event_timeline()
+                break
+            except Exception as e:
+                logging.error(f"[Scheduler] Event timeline build failed, retrying in {TIMELINE_RETRY_SECONDS}s: {e}", exc_info=True)
+                await asyncio.sleep(TIMELINE_RETRY_SECONDS)
+        await self.timeline.run(self._dispatch_transitions)
+
+    async def rebuild_event_timeline(self) -> int:
+        """
+        Rebuild the event timeline from events_data.
+        
+        Only events that can still have a pending transition are read:
+        everything not closed, plus closed events from the last two days.
+        
+        Returns:
+            Number of transitions scheduled
+        """
+        query = """
+            SELECT guild_id, event_id, event_date, event_time, duration, status
+            FROM events_data
+            WHERE status <> 'Closed' OR event_date >= CURDATE() - INTERVAL 2 DAY
+        """
+        rows = await self.bot.run_db_query(query, fetch_all=True)
+        self.timeline.clear()
+        scheduled = 0
+        for guild_id, event_id, event_date, event_time, duration, status in rows or ():
+            scheduled += self.timeline.schedule_event(guild_id, event_id, event_date, event_time, duration, status)
+        logging.info(f"[Scheduler] Event timeline built: {scheduled} transitions for {len(rows or ())} events")
+        return scheduled
+
+    async def _dispatch_transitions(self, kind: str, due: Dict[int, Set[int]]) -> None:
+        """
+        Run the cron handler of a transition kind for the due events only.
+        
+        Handlers run in their own task so a slow close does not delay the
+        next transition; runs of the same kind are serialized by its task lock.
+        
+        Args:
+            kind: Transition kind (close, attendance, reminder, delete)
+            due: {guild_id: {event_id}} of the due events
+        """
+        task_key, cog_name, method_name = TIMELINE_TASKS[kind]
+        count = sum(len(event_ids) for event_ids in due.values())
+        logging.info(f"[Scheduler] {kind} transition due for {count} event(s) in {len(due)} guild(s)")
+
+        async def run():
+            cog = await self._safe_get_cog(cog_name)
+            if not cog:
+                return
+            async with self._task_locks[task_key]:
+                await self._execute_with_monitoring(task_key, getattr(cog, method_name), due=due)
+
+        task = asyncio.create_task(run())
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
 # #################################################################################### #
 #                            Health Monitoring and Status
 # #################################################################################### #
@@ -330,12 +401,14 @@ class TaskScheduler:
         Get scheduler health status and metrics.
         
         Returns:
-            Dictionary containing task metrics, active locks, and last executions
+            Dictionary containing task metrics, active locks, last executions
+            and event timeline statistics
         """
         return {
             'task_metrics': self._task_metrics,
             'active_locks': {name: lock.locked() for name, lock in self._task_locks.items()},
-            'last_executions': self._last_execution
+            'last_executions': self._last_execution,
+            'event_timeline': self.timeline.get_stats()
         }
 
 # #################################################################################### #
@@ -368,6 +441,7 @@ def setup_task_scheduler(bot):
         logging.debug("[Scheduler] Waiting for bot to be ready...")
         await bot.wait_until_ready()
         logging.debug("[Scheduler] Bot is ready, starting scheduler")
+        _scheduler_instance.start_event_timeline()
     
     @scheduled_tasks.after_loop
     async def after_scheduled_tasks():
@@ -0,0 +1,55 @@
+-- Cache delta sync: updated_at watermarks and delete tombstones
+-- Apply on existing databases created from an older schema_structure.sql
+
+ALTER TABLE `events_data`
+  ADD COLUMN `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last modification timestamp (cache delta sync watermark)',
+  ADD KEY `idx_events_data_updated_at` (`updated_at`);
+
+ALTER TABLE `guild_members`
+  ADD COLUMN `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last modification timestamp (cache delta sync watermark)',
+  ADD KEY `idx_guild_members_updated_at` (`updated_at`);
+
+ALTER TABLE `user_setup`
+  ADD COLUMN `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last modification timestamp (cache delta sync watermark)',
+  ADD KEY `idx_user_setup_updated_at` (`updated_at`);
+
+CREATE TABLE IF NOT EXISTS `cache_changelog` (
+  `id` bigint(20) NOT NULL AUTO_INCREMENT,
+  `table_name` varchar(64) NOT NULL COMMENT 'Source table of the deleted row',
+  `guild_id` bigint(20) NOT NULL COMMENT 'Discord guild ID of the deleted row',
+  `row_id` bigint(20) NOT NULL COMMENT 'Second primary key column of the deleted row (event_id, member_id, user_id)',
+  `changed_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`id`),
+  KEY `idx_cache_changelog_changed_at` (`changed_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Delete tombstones consumed by the cache delta sync';
+
+DELIMITER ;;
+
+DROP TRIGGER IF EXISTS events_data_cache_changelog_delete;;
+CREATE TRIGGER events_data_cache_changelog_delete
+AFTER DELETE ON events_data
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('events_data', OLD.guild_id, OLD.event_id);
+END;;
+
+DROP TRIGGER IF EXISTS guild_members_cache_changelog_delete;;
+CREATE TRIGGER guild_members_cache_changelog_delete
+AFTER DELETE ON guild_members
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('guild_members', OLD.guild_id, OLD.member_id);
+END;;
+
+DROP TRIGGER IF EXISTS user_setup_cache_changelog_delete;;
+CREATE TRIGGER user_setup_cache_changelog_delete
+AFTER DELETE ON user_setup
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('user_setup', OLD.guild_id, OLD.user_id);
+END;;
+
+DELIMITER ;
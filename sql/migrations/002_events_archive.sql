@@ -0,0 +1,31 @@
+-- Event archival: cold storage for closed events past the archive horizon
+-- Apply on existing databases created from an older schema_structure.sql
+
+CREATE TABLE IF NOT EXISTS `events_archive` (
+  `guild_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) NOT NULL,
+  `game_id` int(11) NOT NULL DEFAULT 1 COMMENT 'Game type ID (FK to games_list)',
+  `name` varchar(255) NOT NULL COMMENT 'Event display name',
+  `event_date` date NOT NULL,
+  `event_time` time NOT NULL,
+  `duration` smallint(6) NOT NULL COMMENT 'Event duration in minutes',
+  `dkp_value` smallint(6) NOT NULL COMMENT 'DKP reward for attendance',
+  `dkp_ins` smallint(6) NOT NULL COMMENT 'DKP reward for registration',
+  `status` varchar(50) NOT NULL COMMENT 'Event status at archival time',
+  `initial_members` longtext DEFAULT NULL CHECK (json_valid(`initial_members`)),
+  `registrations` longtext DEFAULT NULL,
+  `actual_presence` longtext DEFAULT NULL CHECK (json_valid(`actual_presence`)),
+  `archived_at` timestamp NOT NULL DEFAULT current_timestamp() COMMENT 'When the event left events_data',
+  PRIMARY KEY (`guild_id`,`event_id`),
+  KEY `idx_events_archive_guild_date` (`guild_id`,`event_date`),
+  CONSTRAINT `fk_events_archive_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Closed events moved out of events_data after the archive horizon';
+
+CREATE OR REPLACE VIEW `events_history` AS
+SELECT guild_id, event_id, name, event_date, event_time, duration,
+       dkp_value, dkp_ins, status, registrations, actual_presence, 0 AS archived
+FROM events_data
+UNION ALL
+SELECT guild_id, event_id, name, event_date, event_time, duration,
+       dkp_value, dkp_ins, status, registrations, actual_presence, 1 AS archived
+FROM events_archive;
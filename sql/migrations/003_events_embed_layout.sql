@@ -0,0 +1,6 @@
+-- Event embeds: store the announcement layout so embeds can be rendered from cache
+-- Apply on existing databases created from an older schema_structure.sql
+-- Events created before this migration keep a NULL layout and are rendered from defaults
+
+ALTER TABLE `events_data`
+  ADD COLUMN `embed_layout` longtext DEFAULT NULL CHECK (json_valid(`embed_layout`)) COMMENT 'Announcement description and field layout captured at creation' AFTER `actual_presence`;
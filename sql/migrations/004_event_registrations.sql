@@ -0,0 +1,43 @@
+-- Event registrations: one row per (event, member) instead of a JSON document per event
+-- Apply on existing databases created from an older schema_structure.sql
+-- events_data.registrations stays as the compatibility snapshot written when an event closes;
+-- it is emptied for open events here so the table is their only source of truth
+
+CREATE TABLE IF NOT EXISTS `event_registrations` (
+  `guild_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) NOT NULL,
+  `member_id` bigint(20) NOT NULL,
+  `status` varchar(16) NOT NULL COMMENT 'Registration status (presence, tentative, absence)',
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last status change (registration order and cache delta sync watermark)',
+  PRIMARY KEY (`guild_id`,`event_id`,`member_id`),
+  KEY `idx_event_registrations_status` (`guild_id`,`event_id`,`status`),
+  KEY `idx_event_registrations_updated_at` (`updated_at`),
+  CONSTRAINT `fk_event_registrations_event` FOREIGN KEY (`guild_id`, `event_id`) REFERENCES `events_data` (`guild_id`, `event_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='One row per member registration on an active event';
+
+INSERT IGNORE INTO `event_registrations` (guild_id, event_id, member_id, status)
+SELECT e.guild_id, e.event_id, r.member_id, s.status
+FROM events_data e
+JOIN (SELECT 'presence' AS status UNION ALL SELECT 'tentative' UNION ALL SELECT 'absence') s
+JOIN JSON_TABLE(
+  JSON_EXTRACT(e.registrations, CONCAT('$.', s.status)), '$[*]'
+  COLUMNS (member_id bigint(20) PATH '$')
+) r
+WHERE JSON_VALID(e.registrations) AND r.member_id IS NOT NULL;
+
+UPDATE `events_data`
+SET registrations = '{"presence": [], "tentative": [], "absence": []}'
+WHERE status <> 'Closed';
+
+DELIMITER ;;
+
+DROP TRIGGER IF EXISTS event_registrations_cache_changelog_delete;;
+CREATE TRIGGER event_registrations_cache_changelog_delete
+AFTER DELETE ON event_registrations
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('event_registrations', OLD.guild_id, OLD.event_id);
+END;;
+
+DELIMITER ;
@@ -0,0 +1,15 @@
+-- Voice presence ledger: closed voice intervals flushed in batches by the bot, attendance is their overlap with the event window
+-- Apply on existing databases created from an older schema_structure.sql
+
+CREATE TABLE IF NOT EXISTS `voice_presence` (
+  `guild_id` bigint(20) NOT NULL,
+  `member_id` bigint(20) NOT NULL,
+  `joined_at` int(10) unsigned NOT NULL COMMENT 'Unix time the member joined voice',
+  `seconds` int(10) unsigned NOT NULL COMMENT 'Time spent in voice before leaving',
+  PRIMARY KEY (`guild_id`,`member_id`,`joined_at`),
+  KEY `idx_voice_presence_joined_at` (`joined_at`),
+  CONSTRAINT `fk_voice_presence_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Closed voice presence intervals used for attendance';
+
+ALTER TABLE `guild_settings`
+  ADD COLUMN IF NOT EXISTS `attendance_min_presence` tinyint(3) unsigned DEFAULT NULL COMMENT 'Share of an event spent in voice to count as present (percent, NULL = bot default)' AFTER `premium`;
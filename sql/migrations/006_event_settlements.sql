@@ -0,0 +1,13 @@
+-- Event settlements: registration and attendance DKP are applied at most once per (event, phase)
+-- Apply on existing databases created from an older schema_structure.sql
+-- Events already processed are not backfilled; they are past their attendance window and never settled again
+
+CREATE TABLE IF NOT EXISTS `event_settlements` (
+  `guild_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) NOT NULL,
+  `phase` varchar(16) NOT NULL COMMENT 'Settlement phase (registrations, attendance)',
+  `members` int(11) NOT NULL DEFAULT 0 COMMENT 'Members whose counters changed',
+  `settled_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`guild_id`,`event_id`,`phase`),
+  CONSTRAINT `fk_event_settlements_event` FOREIGN KEY (`guild_id`, `event_id`) REFERENCES `events_data` (`guild_id`, `event_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='One row per applied DKP settlement phase of an event (idempotency marker)';
@@ -0,0 +1,47 @@
+-- DKP ledger: append-only counter entries, guild_members counters become their materialized sum
+-- Apply on existing databases created from an older schema_structure.sql
+-- Current counters are recorded as one opening_balance entry per member so a rebuild from the ledger reproduces them
+-- Rerunning the migration adds no opening entry for members the ledger already covers
+
+CREATE TABLE IF NOT EXISTS `dkp_ledger` (
+  `entry_id` bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  `guild_id` bigint(20) NOT NULL,
+  `member_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) DEFAULT NULL COMMENT 'Settled event (NULL for entries outside an event)',
+  `reason` varchar(32) NOT NULL COMMENT 'Entry reason (registration, members_role, present_and_present, roster_removed, ...)',
+  `DKP` decimal(10,2) NOT NULL DEFAULT 0.00 COMMENT 'DKP delta',
+  `nb_events` int(11) NOT NULL DEFAULT 0 COMMENT 'nb_events delta',
+  `registrations` int(11) NOT NULL DEFAULT 0 COMMENT 'registrations delta',
+  `attendances` int(11) NOT NULL DEFAULT 0 COMMENT 'attendances delta',
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`entry_id`),
+  KEY `idx_dkp_ledger_member` (`guild_id`,`member_id`),
+  KEY `idx_dkp_ledger_event` (`guild_id`,`event_id`),
+  CONSTRAINT `fk_dkp_ledger_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Append-only DKP and counter entries; guild_members counters are their materialized sum';
+
+INSERT INTO `dkp_ledger` (guild_id, member_id, event_id, reason, DKP, nb_events, registrations, attendances)
+SELECT g.guild_id, g.member_id, NULL, 'opening_balance',
+       COALESCE(g.DKP, 0), COALESCE(g.nb_events, 0), COALESCE(g.registrations, 0), COALESCE(g.attendances, 0)
+FROM `guild_members` g
+WHERE (COALESCE(g.DKP, 0) <> 0 OR COALESCE(g.nb_events, 0) <> 0
+       OR COALESCE(g.registrations, 0) <> 0 OR COALESCE(g.attendances, 0) <> 0)
+  AND NOT EXISTS (SELECT 1 FROM `dkp_ledger` l WHERE l.guild_id = g.guild_id AND l.member_id = g.member_id);
+
+DELIMITER ;;
+
+DROP TRIGGER IF EXISTS guild_members_dkp_ledger_close;;
+CREATE TRIGGER guild_members_dkp_ledger_close
+AFTER DELETE ON guild_members
+FOR EACH ROW
+BEGIN
+    IF COALESCE(OLD.DKP, 0) <> 0 OR COALESCE(OLD.nb_events, 0) <> 0
+       OR COALESCE(OLD.registrations, 0) <> 0 OR COALESCE(OLD.attendances, 0) <> 0 THEN
+        INSERT INTO dkp_ledger (guild_id, member_id, event_id, reason, DKP, nb_events, registrations, attendances)
+        VALUES (OLD.guild_id, OLD.member_id, NULL, 'roster_removed',
+                -COALESCE(OLD.DKP, 0), -COALESCE(OLD.nb_events, 0),
+                -COALESCE(OLD.registrations, 0), -COALESCE(OLD.attendances, 0));
+    END IF;
+END;;
+
+DELIMITER ;
@@ -0,0 +1,6 @@
+-- Member list pagination: roster tables larger than five messages get extra messages created on demand
+-- Apply on existing databases created from an older schema_structure.sql
+-- Existing guilds start with no extra message; they are created on the next roster update that needs them
+
+ALTER TABLE `guild_channels`
+  ADD COLUMN IF NOT EXISTS `members_extra_messages` longtext DEFAULT NULL CHECK (json_valid(`members_extra_messages`)) COMMENT 'Member list messages beyond members_m5 (JSON array of message IDs)' AFTER `members_m5`;
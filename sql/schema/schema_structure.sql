@@ -33,6 +33,24 @@ CREATE TABLE `absence_messages` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Absence request messages tracking';
 /*!40101 SET character_set_client = @saved_cs_client */;
 
+--
+-- Table structure for table `cache_changelog`
+--
+
+DROP TABLE IF EXISTS `cache_changelog`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8mb4 */;
+CREATE TABLE `cache_changelog` (
+  `id` bigint(20) NOT NULL AUTO_INCREMENT,
+  `table_name` varchar(64) NOT NULL COMMENT 'Source table of the deleted row',
+  `guild_id` bigint(20) NOT NULL COMMENT 'Discord guild ID of the deleted row',
+  `row_id` bigint(20) NOT NULL COMMENT 'Second primary key column of the deleted row (event_id, member_id, user_id)',
+  `changed_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`id`),
+  KEY `idx_cache_changelog_changed_at` (`changed_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Delete tombstones consumed by the cache delta sync';
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `contracts`
 --
@@ -48,6 +66,31 @@ CREATE TABLE `contracts` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Guild contract messages';
 /*!40101 SET character_set_client = @saved_cs_client */;
 
+--
+-- Table structure for table `dkp_ledger`
+--
+
+DROP TABLE IF EXISTS `dkp_ledger`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8mb4 */;
+CREATE TABLE `dkp_ledger` (
+  `entry_id` bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  `guild_id` bigint(20) NOT NULL,
+  `member_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) DEFAULT NULL COMMENT 'Settled event (NULL for entries outside an event)',
+  `reason` varchar(32) NOT NULL COMMENT 'Entry reason (registration, members_role, present_and_present, roster_removed, ...)',
+  `DKP` decimal(10,2) NOT NULL DEFAULT 0.00 COMMENT 'DKP delta',
+  `nb_events` int(11) NOT NULL DEFAULT 0 COMMENT 'nb_events delta',
+  `registrations` int(11) NOT NULL DEFAULT 0 COMMENT 'registrations delta',
+  `attendances` int(11) NOT NULL DEFAULT 0 COMMENT 'attendances delta',
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`entry_id`),
+  KEY `idx_dkp_ledger_member` (`guild_id`,`member_id`),
+  KEY `idx_dkp_ledger_event` (`guild_id`,`event_id`),
+  CONSTRAINT `fk_dkp_ledger_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Append-only DKP and counter entries; guild_members counters are their materialized sum';
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `dynamic_voice_channels`
 --
@@ -144,6 +187,93 @@ SET character_set_client = utf8mb4;
   1 AS `has_icon` */;
 SET character_set_client = @saved_cs_client;
 
+--
+-- Table structure for table `event_registrations`
+--
+
+DROP TABLE IF EXISTS `event_registrations`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8mb4 */;
+CREATE TABLE `event_registrations` (
+  `guild_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) NOT NULL,
+  `member_id` bigint(20) NOT NULL,
+  `status` varchar(16) NOT NULL COMMENT 'Registration status (presence, tentative, absence)',
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last status change (registration order and cache delta sync watermark)',
+  PRIMARY KEY (`guild_id`,`event_id`,`member_id`),
+  KEY `idx_event_registrations_status` (`guild_id`,`event_id`,`status`),
+  KEY `idx_event_registrations_updated_at` (`updated_at`),
+  CONSTRAINT `fk_event_registrations_event` FOREIGN KEY (`guild_id`, `event_id`) REFERENCES `events_data` (`guild_id`, `event_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='One row per member registration on an active event';
+/*!40101 SET character_set_client = @saved_cs_client */;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_unicode_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'STRICT_TRANS_TABLES,ERROR_FOR_DIVISION_BY_ZERO,NO_AUTO_CREATE_USER,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`USER_discordbot`@`localhost`*/ /*!50003 TRIGGER event_registrations_cache_changelog_delete
+AFTER DELETE ON event_registrations
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('event_registrations', OLD.guild_id, OLD.event_id);
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+
+--
+-- Table structure for table `event_settlements`
+--
+
+DROP TABLE IF EXISTS `event_settlements`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8mb4 */;
+CREATE TABLE `event_settlements` (
+  `guild_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) NOT NULL,
+  `phase` varchar(16) NOT NULL COMMENT 'Settlement phase (registrations, attendance)',
+  `members` int(11) NOT NULL DEFAULT 0 COMMENT 'Members whose counters changed',
+  `settled_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`guild_id`,`event_id`,`phase`),
+  CONSTRAINT `fk_event_settlements_event` FOREIGN KEY (`guild_id`, `event_id`) REFERENCES `events_data` (`guild_id`, `event_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='One row per applied DKP settlement phase of an event (idempotency marker)';
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Table structure for table `events_archive`
+--
+
+DROP TABLE IF EXISTS `events_archive`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8mb4 */;
+CREATE TABLE `events_archive` (
+  `guild_id` bigint(20) NOT NULL,
+  `event_id` bigint(20) NOT NULL,
+  `game_id` int(11) NOT NULL DEFAULT 1 COMMENT 'Game type ID (FK to games_list)',
+  `name` varchar(255) NOT NULL COMMENT 'Event display name',
+  `event_date` date NOT NULL,
+  `event_time` time NOT NULL,
+  `duration` smallint(6) NOT NULL COMMENT 'Event duration in minutes',
+  `dkp_value` smallint(6) NOT NULL COMMENT 'DKP reward for attendance',
+  `dkp_ins` smallint(6) NOT NULL COMMENT 'DKP reward for registration',
+  `status` varchar(50) NOT NULL COMMENT 'Event status at archival time',
+  `initial_members` longtext DEFAULT NULL CHECK (json_valid(`initial_members`)),
+  `registrations` longtext DEFAULT NULL,
+  `actual_presence` longtext DEFAULT NULL CHECK (json_valid(`actual_presence`)),
+  `archived_at` timestamp NOT NULL DEFAULT current_timestamp() COMMENT 'When the event left events_data',
+  PRIMARY KEY (`guild_id`,`event_id`),
+  KEY `idx_events_archive_guild_date` (`guild_id`,`event_date`),
+  CONSTRAINT `fk_events_archive_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Closed events moved out of events_data after the archive horizon';
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `events_calendar`
 --
@@ -190,15 +320,62 @@ CREATE TABLE `events_data` (
   `initial_members` longtext DEFAULT NULL CHECK (json_valid(`initial_members`)),
   `registrations` longtext DEFAULT '{"presence": [], "tentative": [], "absence": []}',
   `actual_presence` longtext DEFAULT NULL CHECK (json_valid(`actual_presence`)),
+  `embed_layout` longtext DEFAULT NULL CHECK (json_valid(`embed_layout`)) COMMENT 'Announcement description and field layout captured at creation',
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last modification timestamp (cache delta sync watermark)',
   PRIMARY KEY (`guild_id`,`event_id`),
   KEY `idx_events_data_date` (`event_date`),
   KEY `idx_events_data_status` (`status`),
   KEY `idx_events_data_game` (`game_id`),
   KEY `idx_events_data_guild_date` (`guild_id`,`event_date`),
+  KEY `idx_events_data_updated_at` (`updated_at`),
   CONSTRAINT `fk_events_data_game` FOREIGN KEY (`game_id`) REFERENCES `games_list` (`id`) ON DELETE NO ACTION ON UPDATE CASCADE,
   CONSTRAINT `fk_events_data_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Individual event instances with registration data';
 /*!40101 SET character_set_client = @saved_cs_client */;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_unicode_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'STRICT_TRANS_TABLES,ERROR_FOR_DIVISION_BY_ZERO,NO_AUTO_CREATE_USER,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`USER_discordbot`@`localhost`*/ /*!50003 TRIGGER events_data_cache_changelog_delete
+AFTER DELETE ON events_data
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('events_data', OLD.guild_id, OLD.event_id);
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+
+--
+-- Temporary table structure for view `events_history`
+--
+
+DROP TABLE IF EXISTS `events_history`;
+/*!50001 DROP VIEW IF EXISTS `events_history`*/;
+SET @saved_cs_client     = @@character_set_client;
+SET character_set_client = utf8mb4;
+/*!50001 CREATE VIEW `events_history` AS SELECT
+ 1 AS `guild_id`,
+  1 AS `event_id`,
+  1 AS `name`,
+  1 AS `event_date`,
+  1 AS `event_time`,
+  1 AS `duration`,
+  1 AS `dkp_value`,
+  1 AS `dkp_ins`,
+  1 AS `status`,
+  1 AS `registrations`,
+  1 AS `actual_presence`,
+  1 AS `archived` */;
+SET character_set_client = @saved_cs_client;
 
 --
 -- Table structure for table `games_list`
@@ -237,6 +414,7 @@ CREATE TABLE `guild_channels` (
   `members_m3` bigint(20) DEFAULT NULL COMMENT 'Member list message 3 (pagination)',
   `members_m4` bigint(20) DEFAULT NULL COMMENT 'Member list message 4 (pagination)',
   `members_m5` bigint(20) DEFAULT NULL COMMENT 'Member list message 5 (pagination)',
+  `members_extra_messages` longtext DEFAULT NULL CHECK (json_valid(`members_extra_messages`)) COMMENT 'Member list messages beyond members_m5 (JSON array of message IDs)',
   `groups_channel` bigint(20) DEFAULT NULL COMMENT 'Channel for group management and display',
   `statics_channel` bigint(20) DEFAULT NULL COMMENT 'Channel for static group displays',
   `statics_message` bigint(20) DEFAULT NULL COMMENT 'Message ID for static groups list',
@@ -301,12 +479,61 @@ CREATE TABLE `guild_members` (
   `registrations` int(11) DEFAULT 0 COMMENT 'Number of event registrations',
   `attendances` int(11) DEFAULT 0 COMMENT 'Number of event attendances',
   `class` varchar(32) DEFAULT NULL COMMENT 'Character class/role',
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last modification timestamp (cache delta sync watermark)',
   PRIMARY KEY (`guild_id`,`member_id`),
   KEY `idx_guild_members_dkp` (`DKP` DESC),
   KEY `idx_guild_members_class` (`class`),
+  KEY `idx_guild_members_updated_at` (`updated_at`),
   CONSTRAINT `fk_guild_members_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Guild member profiles and game statistics';
 /*!40101 SET character_set_client = @saved_cs_client */;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_unicode_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'STRICT_TRANS_TABLES,ERROR_FOR_DIVISION_BY_ZERO,NO_AUTO_CREATE_USER,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`USER_discordbot`@`localhost`*/ /*!50003 TRIGGER guild_members_cache_changelog_delete
+AFTER DELETE ON guild_members
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('guild_members', OLD.guild_id, OLD.member_id);
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_unicode_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'STRICT_TRANS_TABLES,ERROR_FOR_DIVISION_BY_ZERO,NO_AUTO_CREATE_USER,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`USER_discordbot`@`localhost`*/ /*!50003 TRIGGER guild_members_dkp_ledger_close
+AFTER DELETE ON guild_members
+FOR EACH ROW
+BEGIN
+    IF COALESCE(OLD.DKP, 0) <> 0 OR COALESCE(OLD.nb_events, 0) <> 0
+       OR COALESCE(OLD.registrations, 0) <> 0 OR COALESCE(OLD.attendances, 0) <> 0 THEN
+        INSERT INTO dkp_ledger (guild_id, member_id, event_id, reason, DKP, nb_events, registrations, attendances)
+        VALUES (OLD.guild_id, OLD.member_id, NULL, 'roster_removed',
+                -COALESCE(OLD.DKP, 0), -COALESCE(OLD.nb_events, 0),
+                -COALESCE(OLD.registrations, 0), -COALESCE(OLD.attendances, 0));
+    END IF;
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Temporary table structure for view `guild_overview`
@@ -415,6 +642,7 @@ CREATE TABLE `guild_settings` (
   `guild_server` varchar(20) DEFAULT NULL COMMENT 'Game server name/region',
   `initialized` tinyint(1) DEFAULT 0 COMMENT 'Whether guild setup is complete',
   `premium` tinyint(1) DEFAULT 0 COMMENT 'Premium features enabled flag',
+  `attendance_min_presence` tinyint(3) unsigned DEFAULT NULL COMMENT 'Share of an event spent in voice to count as present (percent, NULL = bot default)',
   `created_at` datetime DEFAULT current_timestamp(),
   `updated_at` datetime DEFAULT current_timestamp() ON UPDATE current_timestamp(),
   PRIMARY KEY (`guild_id`)
@@ -701,12 +929,53 @@ CREATE TABLE `user_setup` (
   `gs` smallint(5) DEFAULT NULL,
   `playtime` varchar(64) DEFAULT NULL,
   `game_mode` varchar(64) DEFAULT NULL COMMENT 'User preferred game mode (PvE/PvP/Mixed)',
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp() COMMENT 'Last modification timestamp (cache delta sync watermark)',
   PRIMARY KEY (`guild_id`,`user_id`),
   KEY `idx_user_setup_locale` (`locale`),
   KEY `idx_user_setup_motif` (`motif`),
+  KEY `idx_user_setup_updated_at` (`updated_at`),
   CONSTRAINT `fk_user_setup_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='User registration and setup process data';
 /*!40101 SET character_set_client = @saved_cs_client */;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_unicode_ci */ ;
+/*!50003 SET @saved_sql_mode       = @@sql_mode */ ;
+/*!50003 SET sql_mode              = 'STRICT_TRANS_TABLES,ERROR_FOR_DIVISION_BY_ZERO,NO_AUTO_CREATE_USER,NO_ENGINE_SUBSTITUTION' */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`USER_discordbot`@`localhost`*/ /*!50003 TRIGGER user_setup_cache_changelog_delete
+AFTER DELETE ON user_setup
+FOR EACH ROW
+BEGIN
+    INSERT INTO cache_changelog (table_name, guild_id, row_id)
+    VALUES ('user_setup', OLD.guild_id, OLD.user_id);
+END */;;
+DELIMITER ;
+/*!50003 SET sql_mode              = @saved_sql_mode */ ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+
+--
+-- Table structure for table `voice_presence`
+--
+
+DROP TABLE IF EXISTS `voice_presence`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8mb4 */;
+CREATE TABLE `voice_presence` (
+  `guild_id` bigint(20) NOT NULL,
+  `member_id` bigint(20) NOT NULL,
+  `joined_at` int(10) unsigned NOT NULL COMMENT 'Unix time the member joined voice',
+  `seconds` int(10) unsigned NOT NULL COMMENT 'Time spent in voice before leaving',
+  PRIMARY KEY (`guild_id`,`member_id`,`joined_at`),
+  KEY `idx_voice_presence_joined_at` (`joined_at`),
+  CONSTRAINT `fk_voice_presence_guild` FOREIGN KEY (`guild_id`) REFERENCES `guild_settings` (`guild_id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Closed voice presence intervals used for attendance';
+/*!40101 SET character_set_client = @saved_cs_client */;
 
 --
 -- Table structure for table `weapons`
@@ -948,6 +1217,24 @@ DELIMITER ;
 /*!50001 SET character_set_results     = @saved_cs_results */;
 /*!50001 SET collation_connection      = @saved_col_connection */;
 
+--
+-- Final view structure for view `events_history`
+--
+
+/*!50001 DROP VIEW IF EXISTS `events_history`*/;
+/*!50001 SET @saved_cs_client          = @@character_set_client */;
+/*!50001 SET @saved_cs_results         = @@character_set_results */;
+/*!50001 SET @saved_col_connection     = @@collation_connection */;
+/*!50001 SET character_set_client      = utf8mb4 */;
+/*!50001 SET character_set_results     = utf8mb4 */;
+/*!50001 SET collation_connection      = utf8mb4_unicode_ci */;
+/*!50001 CREATE ALGORITHM=UNDEFINED */
+/*!50013 DEFINER=`USER_discordbot`@`localhost` SQL SECURITY DEFINER */
+/*!50001 VIEW `events_history` AS select `events_data`.`guild_id` AS `guild_id`,`events_data`.`event_id` AS `event_id`,`events_data`.`name` AS `name`,`events_data`.`event_date` AS `event_date`,`events_data`.`event_time` AS `event_time`,`events_data`.`duration` AS `duration`,`events_data`.`dkp_value` AS `dkp_value`,`events_data`.`dkp_ins` AS `dkp_ins`,`events_data`.`status` AS `status`,`events_data`.`registrations` AS `registrations`,`events_data`.`actual_presence` AS `actual_presence`,0 AS `archived` from `events_data` union all select `events_archive`.`guild_id` AS `guild_id`,`events_archive`.`event_id` AS `event_id`,`events_archive`.`name` AS `name`,`events_archive`.`event_date` AS `event_date`,`events_archive`.`event_time` AS `event_time`,`events_archive`.`duration` AS `duration`,`events_archive`.`dkp_value` AS `dkp_value`,`events_archive`.`dkp_ins` AS `dkp_ins`,`events_archive`.`status` AS `status`,`events_archive`.`registrations` AS `registrations`,`events_archive`.`actual_presence` AS `actual_presence`,1 AS `archived` from `events_archive` */;
+/*!50001 SET character_set_client      = @saved_cs_client */;
+/*!50001 SET character_set_results     = @saved_cs_results */;
+/*!50001 SET collation_connection      = @saved_col_connection */;
+
 --
 -- Final view structure for view `guild_overview`
 --
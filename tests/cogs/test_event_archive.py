@@ -0,0 +1,124 @@
+"""
+Tests for event archival - Chunked moves from events_data to events_archive and the events_history view.
+"""
+
+import re
+import pytest
+from datetime import timezone
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+from cogs import guild_events
+from cogs.guild_attendance import GuildAttendance
+from cogs.guild_events import GuildEvents
+
+SQL_DIR = Path(__file__).parent.parent.parent / "sql"
+
+
+def table_columns(sql, table):
+    """Get the column names of a CREATE TABLE statement."""
+    body = re.search(rf"CREATE TABLE (?:IF NOT EXISTS )?`{table}` \((.*?)\n\) ENGINE", sql, re.S).group(1)
+    return re.findall(r"^\s+`(\w+)`", body, re.M)
+
+
+def view_branches(sql):
+    """Get the selected columns and source table of each branch of the events_history view."""
+    view = re.search(r"VIEW `events_history` AS\s+(.*?);", sql, re.S).group(1)
+    branches = []
+    for select, table in re.findall(r"select\s+(.*?)\s+from\s+`?(\w+)`?", view, re.S | re.I):
+        columns = [re.split(r"\s+AS\s+", column.strip(), flags=re.I)[-1].strip("`") for column in select.split(",")]
+        branches.append((table, columns))
+    return branches
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestEventArchive:
+    """Test the archive cron."""
+
+    async def test_closed_events_move_in_chunks_and_leave_the_cache(self, monkeypatch):
+        """Test each chunk is copied then deleted in one transaction and archived events are evicted."""
+        monkeypatch.setattr(guild_events, "EVENTS_ARCHIVE_BATCH_SIZE", 2)
+        monkeypatch.setattr(guild_events.pytz, "timezone", lambda name: timezone.utc)
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        bot.run_db_query = AsyncMock(side_effect=[[(1, 10), (1, 11)], [(2, 20)]])
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_events, "run_db_transaction", transaction)
+        cog = GuildEvents(bot)
+        for guild_id, event_id in ((1, 10), (1, 11), (1, 12), (2, 20)):
+            await cog.set_event_in_cache(guild_id, event_id, {"event_id": event_id, "status": "Closed"})
+
+        archived = await cog.event_archive_cron()
+
+        assert archived == 3
+        assert transaction.await_count == 2
+        (copy_query, copy_params), (delete_query, delete_params) = transaction.await_args_list[0].args[0]
+        assert copy_query.startswith("INSERT IGNORE INTO events_archive") and "FROM events_data" in copy_query
+        assert delete_query.startswith("DELETE FROM events_data")
+        assert copy_params == delete_params == (1, 10, 1, 11)
+        assert await cog.get_event_from_cache(1, 10) is None
+        assert await cog.get_event_from_cache(2, 20) is None
+        assert await cog.get_event_from_cache(1, 12) is not None
+
+    async def test_failed_chunk_keeps_its_events(self, monkeypatch):
+        """Test a rolled back chunk stops the run and leaves the events cached."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        bot.run_db_query = AsyncMock(return_value=[(1, 10)])
+        monkeypatch.setattr(guild_events.pytz, "timezone", lambda name: timezone.utc)
+        monkeypatch.setattr(guild_events, "run_db_transaction", AsyncMock(side_effect=Exception("lock wait timeout")))
+        cog = GuildEvents(bot)
+        await cog.set_event_in_cache(1, 10, {"event_id": 10, "status": "Closed"})
+
+        assert await cog.event_archive_cron() == 0
+        assert await cog.get_event_from_cache(1, 10) is not None
+
+    async def test_closed_events_are_read_through_the_history_view(self):
+        """Test attendance history reads events_history unless the archive is excluded."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        bot.run_db_query = AsyncMock(return_value=[(10, "Raid", "2025-01-06", "21:00:00", 60, 10, "Closed", None, "[1]")])
+        cog = GuildAttendance(bot)
+
+        events = await cog.get_closed_events_for_guild(1)
+        assert "FROM events_history" in bot.run_db_query.await_args.args[0]
+        assert events[0]["actual_presence"] == [1]
+
+        await cog.get_closed_events_for_guild(1, include_archive=False)
+        assert "FROM events_data" in bot.run_db_query.await_args.args[0]
+
+
+@pytest.mark.unit
+class TestEventArchiveSchema:
+    """Test the archive table and view definitions."""
+
+    @pytest.mark.parametrize("sql_file", ["schema/schema_structure.sql", "migrations/002_events_archive.sql"])
+    def test_history_view_unions_the_same_columns(self, sql_file):
+        """Test both branches of the view select the same columns, each present in its source table."""
+        schema = (SQL_DIR / "schema" / "schema_structure.sql").read_text(encoding="utf-8")
+        sql = (SQL_DIR / sql_file).read_text(encoding="utf-8")
+        final_view = sql[sql.index("Final view structure"):] if "Final view structure" in sql else sql
+
+        branches = view_branches(final_view)
+
+        assert [table for table, _ in branches] == ["events_data", "events_archive"]
+        assert branches[0][1] == branches[1][1]
+        for table, columns in branches:
+            assert set(columns) - {"archived"} <= set(table_columns(schema, table))
+
+    def test_archive_table_holds_every_moved_column(self):
+        """Test the migration and the schema agree on events_archive and cover the columns the cron copies."""
+        schema = (SQL_DIR / "schema" / "schema_structure.sql").read_text(encoding="utf-8")
+        migration = (SQL_DIR / "migrations" / "002_events_archive.sql").read_text(encoding="utf-8")
+        moved = ["guild_id", "event_id", "game_id", "name", "event_date", "event_time", "duration", "dkp_value",
+                 "dkp_ins", "status", "initial_members", "registrations", "actual_presence"]
+
+        assert table_columns(migration, "events_archive") == table_columns(schema, "events_archive")
+        assert set(moved) <= set(table_columns(schema, "events_archive"))
+        assert set(moved) <= set(table_columns(schema, "events_data"))
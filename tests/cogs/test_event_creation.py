@@ -0,0 +1,118 @@
+"""
+Tests for recurring event creation - Concurrent premium guild pipeline with one batched insert per guild.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+from cogs.guild_events import GuildEvents, EVENT_INSERT_COLUMNS
+
+GAME_ID = 1
+
+
+def make_guild(guild_id):
+    """Build a guild whose channel sends announcements with sequential IDs."""
+    counter = iter(range(guild_id * 100, guild_id * 100 + 50))
+
+    async def send(embed):
+        message = Mock()
+        message.id = next(counter)
+        message.channel.id = 10
+        message.add_reaction = AsyncMock()
+        message.edit = AsyncMock()
+        return message
+
+    channel = Mock()
+    channel.id = 10
+    channel.send = AsyncMock(side_effect=send)
+    guild = Mock()
+    guild.id = guild_id
+    guild.get_channel = Mock(return_value=channel)
+    guild.create_scheduled_event = AsyncMock()
+    return guild
+
+
+async def make_cog(premium_ids, standard_ids):
+    """Build a GuildEvents cog with premium and standard guilds playing the same game."""
+    bot = Mock()
+    bot.cache = GlobalCacheSystem()
+    bot.run_db_query = AsyncMock()
+
+    async def execute_with_reliability(service, execute):
+        return await execute()
+
+    bot.reliability_system.execute_with_reliability = execute_with_reliability
+    bot.guilds = [make_guild(guild_id) for guild_id in (*premium_ids, *standard_ids)]
+    for guild in bot.guilds:
+        premium = guild.id in premium_ids
+        await bot.cache.set_guild_data(guild.id, 'settings', {"guild_lang": "en-US", "guild_game": GAME_ID, "premium": premium})
+        await bot.cache.set_guild_data(guild.id, 'channels', {"events_channel": 10, "voice_war_channel": 11})
+    await bot.cache.set('static_data', {"events": [
+        {"name": "Raid", "day": "monday", "time": "21:00", "duration": 60},
+        {"name": "Siege", "day": "monday", "time": "22:00", "duration": 90},
+    ]}, f'events_calendar_{GAME_ID}')
+
+    cog = GuildEvents(bot)
+    cog.schedule_event_transitions = Mock()
+    cog.get_next_date_for_day = Mock(side_effect=lambda day, time_str, tz, tomorrow_only=False:
+                                     datetime(2025, 1, 6, *map(int, time_str.split(":"))))
+    return cog
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestRecurringEventCreation:
+    """Test the premium guild event creation pipeline."""
+
+    async def test_one_insert_per_guild_and_shared_calendar(self):
+        """Test each premium guild gets its events in one insert and the calendar is resolved once."""
+        cog = await make_cog(premium_ids=(1, 2), standard_ids=(3,))
+
+        report = await cog.create_events_for_all_premium_guilds()
+
+        assert set(report) == {1, 2}
+        assert all(entry["events"] == 2 and entry["status"] == "ok" for entry in report.values())
+        assert cog.get_next_date_for_day.call_count == 2
+        assert cog.bot.run_db_query.await_count == 2
+        query, params = cog.bot.run_db_query.await_args.args
+        assert query.count("(%s") == 2
+        assert len(params) == 2 * len(EVENT_INSERT_COLUMNS)
+        assert await cog.get_event_from_cache(2, 200) is not None
+        assert cog.schedule_event_transitions.call_count == 4
+        assert cog.bot.guilds[2].get_channel.return_value.send.await_count == 0
+
+    async def test_failed_batch_falls_back_and_removes_orphaned_posts(self):
+        """Test events are inserted one by one after a failed batch and unsaved events lose their posts."""
+        cog = await make_cog(premium_ids=(1,), standard_ids=())
+        guild = cog.bot.guilds[0]
+        scheduled_events = [Mock(delete=AsyncMock()), Mock(delete=AsyncMock())]
+        guild.create_scheduled_event = AsyncMock(side_effect=scheduled_events)
+        announcements = []
+        send = guild.get_channel.return_value.send.side_effect
+
+        async def send_and_track(embed):
+            message = await send(embed)
+            message.delete = AsyncMock()
+            announcements.append(message)
+            return message
+
+        guild.get_channel.return_value.send.side_effect = send_and_track
+        cog.bot.run_db_query = AsyncMock(side_effect=[Exception("deadlock"), None, Exception("duplicate")])
+
+        created = await cog.create_events_for_guild(guild)
+
+        assert created == 1
+        assert cog.bot.run_db_query.await_count == 3
+        assert await cog.get_event_from_cache(1, 100) is not None
+        assert await cog.get_event_from_cache(1, 101) is None
+        announcements[0].delete.assert_not_awaited()
+        announcements[1].delete.assert_awaited_once()
+        scheduled_events[1].delete.assert_awaited_once()
+        assert cog.schedule_event_transitions.call_count == 1
@@ -0,0 +1,142 @@
+"""
+Tests for event group assignment - Memoized groups shared by previews and the close step, the timeline-driven close
+and the statics message.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+from cogs import guild_events
+from cogs.guild_events import GuildEvents
+from core.group_engine import GroupEngine
+
+GUILD_ID = 1
+EVENT_ID = 1000
+CLASSES = ("Tank", "Healer", "Melee DPS", "Ranged DPS", "Flanker", "Melee DPS")
+
+
+async def make_cog():
+    """Build a GuildEvents cog with a 12-member roster and one cached event."""
+    bot = Mock()
+    bot.cache = GlobalCacheSystem()
+    bot.run_db_query = AsyncMock()
+    await bot.cache.set('roster_data', {
+        (GUILD_ID, uid): {"class": CLASSES[uid % len(CLASSES)], "GS": 5000 + uid, "weapons": "SNS/GS"}
+        for uid in range(1, 13)
+    }, 'guild_members')
+
+    guild = Mock()
+    guild.id = GUILD_ID
+    members = {uid: Mock(display_name=f"m{uid}", mention=f"<@{uid}>") for uid in range(1, 13)}
+    guild.get_member = members.get
+
+    cog = GuildEvents(bot)
+    await cog.set_event_in_cache(GUILD_ID, EVENT_ID, {
+        "event_id": EVENT_ID, "status": "Closed",
+        "registrations": {"presence": list(range(1, 11)), "tentative": [11, 12], "absence": []},
+    })
+    return cog, guild
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestEventGroupMemo:
+    """Test memoized group assignments."""
+
+    async def test_groups_are_reused_until_an_input_changes(self):
+        """Test a second call reuses the stored assignment and a GS change recomputes it."""
+        cog, guild = await make_cog()
+        engine = GroupEngine()
+        engine.assign_async = AsyncMock(side_effect=engine.assign_async)
+        cog.group_engine = engine
+        presence, tentative = list(range(1, 11)), [11, 12]
+
+        roster = await cog._build_group_roster(guild, presence + tentative)
+        first = await cog._get_event_groups(GUILD_ID, EVENT_ID, presence, tentative, roster)
+        again = await cog._get_event_groups(GUILD_ID, EVENT_ID, presence, tentative, roster)
+
+        assert again == first
+        assert engine.assign_async.await_count == 1
+        event = await cog.get_event_from_cache(GUILD_ID, EVENT_ID)
+        assert [list(g) for g in event["group_assignment"]["groups"]] == [[m["user_id"] for m in g] for g in first]
+
+        roster["members"]["3"]["GS"] = 6500
+        await cog._get_event_groups(GUILD_ID, EVENT_ID, presence, tentative, roster)
+        assert engine.assign_async.await_count == 2
+
+        await cog._get_event_groups(GUILD_ID, EVENT_ID, presence[:-1], tentative, roster)
+        assert engine.assign_async.await_count == 3
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestEventClose:
+    """Test closing the events the timeline reports as due."""
+
+    async def test_due_events_close_without_a_second_window_check(self, monkeypatch):
+        """Test every due open event is closed whatever its start time and other events are left alone."""
+        cog, guild = await make_cog()
+        channel = Mock()
+        channel.get_partial_message = Mock(return_value=Mock(clear_reactions=AsyncMock()))
+        guild.get_channel = Mock(return_value=channel)
+        cog.bot.get_guild = Mock(return_value=guild)
+        cog.bot.get_cog = Mock(return_value=None)
+        cog.update_event_embed = AsyncMock()
+        cog.create_groups = AsyncMock()
+        cog.schedule_event_transitions = Mock()
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_events, "run_db_transaction", transaction)
+        await cog.bot.cache.set_guild_data(GUILD_ID, 'settings', {"guild_lang": "en-US"})
+        await cog.bot.cache.set_guild_data(GUILD_ID, 'channels', {"events_channel": 10})
+        events = [
+            {"event_id": 1, "status": "Confirmed", "event_date": "2020-01-06", "event_time": "21:00", "duration": 60},
+            {"event_id": 2, "status": "Planned", "event_date": "not a date", "event_time": None, "duration": 60},
+            {"event_id": 3, "status": "Closed", "event_date": "2020-01-06", "event_time": "21:00", "duration": 60},
+            {"event_id": 4, "status": "Planned", "event_date": "2020-01-06", "event_time": "21:00", "duration": 60},
+        ]
+        for event in events:
+            await cog.set_event_in_cache(GUILD_ID, event["event_id"], dict(event))
+        cog.get_all_guild_events = AsyncMock(return_value=events)
+
+        await cog.event_close_cron(due={GUILD_ID: {1, 2, 3}})
+
+        closed = [params for _, params in transaction.await_args.args[0]]
+        assert [(status, event_id) for status, _, _, event_id in closed] == [("Closed", 1), ("Closed", 2)]
+        assert (await cog.get_event_from_cache(GUILD_ID, 2))["status"] == "Closed"
+        assert (await cog.get_event_from_cache(GUILD_ID, 4))["status"] == "Planned"
+        assert cog.create_groups.await_count == cog.schedule_event_transitions.call_count == 2
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestStaticGroupsMessage:
+    """Test the hashed statics message renderer."""
+
+    async def test_unchanged_statics_are_not_edited(self):
+        """Test message ids come from the cache and an unchanged view is neither fetched nor edited."""
+        cog, guild = await make_cog()
+        channel = Mock()
+        partial = Mock()
+        partial.edit = AsyncMock()
+        channel.get_partial_message = Mock(return_value=partial)
+        cog.bot.get_channel = Mock(return_value=channel)
+        cog.bot.get_guild = Mock(return_value=guild)
+        await cog.bot.cache.set_guild_data(GUILD_ID, 'channels', {"statics_channel": 50, "statics_message": 60})
+        await cog.bot.cache.set_guild_data(GUILD_ID, 'static_groups', {"Core": {"leader_id": 1, "member_ids": [1, 2, 3]}})
+
+        assert await cog.update_static_groups_message(GUILD_ID)
+        assert await cog.update_static_groups_message(GUILD_ID)
+        assert partial.edit.await_count == 1
+        channel.get_partial_message.assert_called_with(60)
+
+        await cog.bot.cache.set_guild_data(GUILD_ID, 'static_groups', {"Core": {"leader_id": 1, "member_ids": [1, 2]}})
+        assert await cog.update_static_groups_message(GUILD_ID)
+        assert partial.edit.await_count == 2
+        cog.bot.run_db_query.assert_not_called()
+        channel.fetch_message.assert_not_called()
@@ -0,0 +1,196 @@
+"""
+Tests for event announcements - Reaction mailbox, debounced flushes and fetch-free embed rendering.
+
+The load test replays 500 reactions spread over 30 seconds. Time is compressed by
+REACTION_LOAD_TEST_SCALE (default 0.02, i.e. 0.6s of wall time); set it to 1 to
+replay in real time.
+"""
+
+import asyncio
+import os
+import random
+import time
+import pytest
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+import cogs.guild_events as guild_events
+from cogs.guild_events import GuildEvents, REGISTRATION_EMOJIS
+
+GUILD_ID = 1
+CHANNEL_ID = 100
+EVENT_ID = 1000
+
+
+def make_cog(monkeypatch, debounce_ms):
+    """Build a GuildEvents cog wired to an in-memory cache and a mocked channel."""
+    monkeypatch.setattr(guild_events, "EVENT_REACTION_DEBOUNCE_MS", debounce_ms)
+    bot = Mock()
+    bot.cache = GlobalCacheSystem()
+    bot.run_db_query = AsyncMock()
+
+    message = Mock()
+    message.edit = AsyncMock()
+    partial = Mock()
+    partial.remove_reaction = AsyncMock()
+    partial.edit = AsyncMock()
+    channel = Mock()
+    channel.fetch_message = AsyncMock(return_value=message)
+    channel.get_partial_message = Mock(return_value=partial)
+    guild = Mock()
+    guild.id = GUILD_ID
+    guild.get_channel = Mock(return_value=channel)
+
+    cog = GuildEvents(bot)
+    cog.update_event_embed = AsyncMock()
+    return cog, guild, channel, partial
+
+
+async def seed_event(cog):
+    """Store an empty planned event in the cache."""
+    await cog.set_event_in_cache(GUILD_ID, EVENT_ID, {
+        "event_id": EVENT_ID, "status": "Planned",
+        "registrations": {"presence": [], "tentative": [], "absence": []},
+    })
+
+
+async def drain(cog):
+    """Wait until every mailbox has been flushed."""
+    while any(not q.empty() for q in cog._reaction_mailboxes.values()):
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(guild_events.EVENT_REACTION_DEBOUNCE_MS / 1000 + 0.05)
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestReactionPipeline:
+    """Test the per-event registration mailbox."""
+
+    async def test_operations_apply_in_order_with_one_write_per_flush(self, monkeypatch):
+        """Test a burst is coalesced and a status switch clears the previous reaction."""
+        cog, guild, channel, partial = make_cog(monkeypatch, debounce_ms=50)
+        await seed_event(cog)
+
+        cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, ("add", 7, "presence"))
+        await asyncio.sleep(0.01)
+        cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, ("add", 7, "absence"))
+        cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, ("add", 8, "tentative"))
+        cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, ("remove", 8, "presence"))
+        await drain(cog)
+
+        event = await cog.get_event_from_cache(GUILD_ID, EVENT_ID)
+        assert list(event["registrations"]["absence"]) == [7]
+        assert list(event["registrations"]["tentative"]) == [8]
+        assert cog.bot.run_db_query.await_count == 2
+        assert cog.update_event_embed.await_count == 2
+        partial.remove_reaction.assert_awaited_once()
+        assert partial.remove_reaction.await_args.args[0] == REGISTRATION_EMOJIS["presence"]
+
+    async def test_click_writes_one_registration_row(self, monkeypatch):
+        """Test a click upserts or deletes only the clicking member's row."""
+        cog, guild, channel, partial = make_cog(monkeypatch, debounce_ms=20)
+        await seed_event(cog)
+
+        cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, ("add", 7, "presence"))
+        await drain(cog)
+        query, params = cog.bot.run_db_query.await_args.args
+        assert query.startswith("INSERT INTO event_registrations")
+        assert params == (GUILD_ID, EVENT_ID, 7, "presence")
+
+        cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, ("remove", 7, "presence"))
+        await drain(cog)
+        query, params = cog.bot.run_db_query.await_args.args
+        assert query.startswith("DELETE FROM event_registrations")
+        assert params == (GUILD_ID, EVENT_ID, 7)
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    async def test_load_500_reactions_in_30_seconds(self, monkeypatch):
+        """Replay 500 reactions over 30s and report edits sent and end-to-end lag."""
+        scale = float(os.getenv("REACTION_LOAD_TEST_SCALE", "0.02"))
+        window_ms = 1500
+        cog, guild, channel, partial = make_cog(monkeypatch, debounce_ms=max(1, int(window_ms * scale)))
+        await seed_event(cog)
+
+        rng = random.Random(31)
+        statuses = list(REGISTRATION_EMOJIS)
+        offsets = sorted(rng.uniform(0, 30 * scale) for _ in range(500))
+        start = time.monotonic()
+        for offset in offsets:
+            delay = start + offset - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            op = ("add", rng.randint(1, 150), rng.choice(statuses))
+            cog._enqueue_registration_op(guild, CHANNEL_ID, EVENT_ID, op)
+        await drain(cog)
+
+        stats = cog.get_reaction_pipeline_stats()
+        edits = cog.update_event_embed.await_count
+        lag = stats["max_lag"] / scale
+        print(f"\n[reaction load] reactions=500 edits={edits} db_writes={stats['db_writes']} "
+              f"max_end_to_end_lag={lag:.2f}s (debounce {window_ms}ms, scale {scale})")
+
+        assert stats["enqueued"] == 500
+        assert edits == stats["db_writes"]
+        assert edits <= 30 * 1000 // window_ms + 2
+        assert lag < (window_ms / 1000) * 3
+        event = await cog.get_event_from_cache(GUILD_ID, EVENT_ID)
+        registered = [m for status in statuses for m in event["registrations"][status]]
+        assert len(registered) == len(set(registered))
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestEventEmbedRendering:
+    """Test fetch-free rendering of event announcements."""
+
+    async def test_embed_is_rendered_from_cache_and_edited_without_fetch(self, monkeypatch):
+        """Test the stored layout is filled with cached status and registrations."""
+        cog, guild, channel, partial = make_cog(monkeypatch, debounce_ms=50)
+        del cog.update_event_embed
+        channel.guild = guild
+        guild.get_member = Mock(return_value=object())
+        layout = cog._build_event_layout("en-US", "Join us", guild_events.discord.Color.blue(),
+                                         "02-01-2025", "21:00", 60, 5, 2, "https://discord.com/channels/1/2")
+        await cog.set_event_in_cache(GUILD_ID, EVENT_ID, {
+            "event_id": EVENT_ID, "name": "Raid", "status": "Confirmed",
+            "registrations": {"presence": [7, 8], "tentative": [], "absence": [9]},
+            "embed_layout": guild_events.json.dumps(layout),
+        })
+
+        event = await cog.get_event_from_cache(GUILD_ID, EVENT_ID)
+        await cog.update_event_embed(channel, event)
+
+        channel.fetch_message.assert_not_called()
+        channel.get_partial_message.assert_called_with(EVENT_ID)
+        embed = partial.edit.await_args.kwargs["embed"]
+        fields = {field.name: field.value for field in embed.fields}
+        assert embed.description == "Join us"
+        assert embed.color == guild_events.discord.Color.green()
+        assert any(name.endswith("(2)") and value == "<@7>, <@8>" for name, value in fields.items())
+        assert embed.footer.text == f"Event ID = {EVENT_ID}"
+
+    async def test_canceled_event_without_stored_layout_hides_registration_fields(self, monkeypatch):
+        """Test events created before layouts were stored still render."""
+        cog, guild, channel, partial = make_cog(monkeypatch, debounce_ms=50)
+        del cog.update_event_embed
+        channel.guild = guild
+        await cog.bot.cache.set_guild_data(GUILD_ID, 'channels', {"voice_war_channel": 2})
+        await cog.set_event_in_cache(GUILD_ID, EVENT_ID, {
+            "event_id": EVENT_ID, "name": "Raid", "status": "Canceled", "event_date": "2025-01-02",
+            "event_time": "21:00:00", "duration": 60, "dkp_value": 5,
+            "registrations": {"presence": [7], "tentative": [], "absence": []},
+        })
+
+        event = await cog.get_event_from_cache(GUILD_ID, EVENT_ID)
+        await cog.update_event_embed(channel, event, content="")
+
+        embed = partial.edit.await_args.kwargs["embed"]
+        assert [field.value for field in embed.fields][:3] == ["02-01-2025", "21:00", "60"]
+        assert len(embed.fields) == 4
+        assert embed.color == guild_events.discord.Color.red()
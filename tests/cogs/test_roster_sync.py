@@ -0,0 +1,365 @@
+"""
+Tests for roster synchronization - Role-based change sets applied in one transaction with an incremental cache patch,
+coalesced member events, checksum reconciliation, roster table pages, weapon lookup tables and roster export/import.
+"""
+
+import json
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+from cache_loader import compile_weapon_tables
+from cogs import guild_members
+from cogs.guild_members import GuildMembers, roster_checksum
+from core.roster_renderer import RosterRenderer
+
+GUILD_ID = 1
+MEMBERS_ROLE_ID = 100
+ABSENT_ROLE_ID = 101
+
+
+def discord_member(member_id, name, is_bot=False):
+    """Build a Discord member with a display name."""
+    return Mock(id=member_id, display_name=name, bot=is_bot)
+
+
+def db_member(name, **fields):
+    """Build a guild_members row as returned by the bulk read."""
+    return {"username": name, "language": "en", "GS": 0, "build": "", "weapons": "NULL", "class": "NULL",
+            "DKP": 0, "nb_events": 0, "registrations": 0, "attendances": 0, **fields}
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestRosterSync:
+    """Test the roster sync engine shared by /maj_roster and the scheduler."""
+
+    async def test_changes_land_in_one_transaction_and_patch_the_cache(self, monkeypatch):
+        """Test role holders are diffed once, written in one transaction and patched into the cache."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        other_guild_entry = db_member("Elsewhere")
+        await bot.cache.set('roster_data', {
+            (GUILD_ID, 1): db_member("Old name", DKP=40),
+            (GUILD_ID, 2): db_member("Leaver"),
+            (2, 9): other_guild_entry,
+        }, 'guild_members')
+        cog = GuildMembers(bot)
+        cog._get_guild_members_bulk = AsyncMock(return_value={1: db_member("Old name", DKP=40), 2: db_member("Leaver")})
+        cog._get_user_setup_bulk = AsyncMock(return_value={})
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_members, "run_db_transaction", transaction)
+
+        members_role = Mock(members=[discord_member(1, "New name"), discord_member(3, "Recruit"), discord_member(4, "Bot", is_bot=True)])
+        absent_role = Mock(members=[discord_member(5, "Away")])
+        guild = Mock(id=GUILD_ID)
+        guild.get_role = lambda role_id: {MEMBERS_ROLE_ID: members_role, ABSENT_ROLE_ID: absent_role}.get(role_id)
+
+        counts = await cog._sync_roster(guild, MEMBERS_ROLE_ID, ABSENT_ROLE_ID, "en-US")
+
+        assert counts == (1, 1, 2)
+        queries = transaction.await_args.args[0]
+        assert transaction.await_count == 1
+        assert [query.split()[0] for query, _ in queries] == ["DELETE", "UPDATE", "INSERT"]
+        assert queries[2][0].count("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)") == 2
+        columns = queries[2][0].split("(", 1)[1].split(")", 1)[0].split(",")
+        assert len(queries[2][1]) == 2 * len(columns) == 24
+
+        roster = await bot.cache.get('roster_data', 'guild_members')
+        assert (GUILD_ID, 2) not in roster
+        assert roster[(GUILD_ID, 1)]["username"] == "New name" and roster[(GUILD_ID, 1)]["DKP"] == 40
+        assert roster[(GUILD_ID, 3)]["username"] == "Recruit" and "member_id" not in roster[(GUILD_ID, 3)]
+        assert (GUILD_ID, 5) in roster and (GUILD_ID, 4) not in roster
+        assert roster[(2, 9)] == other_guild_entry
+
+    async def test_in_sync_roster_and_failed_transaction_leave_the_cache_alone(self, monkeypatch):
+        """Test no transaction runs without changes and a rolled back one does not touch the cache."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set('roster_data', {(GUILD_ID, 1): db_member("Alice")}, 'guild_members')
+        cog = GuildMembers(bot)
+        cog._get_guild_members_bulk = AsyncMock(return_value={1: db_member("Alice")})
+        cog._get_user_setup_bulk = AsyncMock(return_value={1: {"locale": "en-US"}})
+        transaction = AsyncMock(return_value=False)
+        monkeypatch.setattr(guild_members, "run_db_transaction", transaction)
+
+        guild = Mock(id=GUILD_ID)
+        members_role = Mock(members=[discord_member(1, "Alice")])
+        guild.get_role = lambda role_id: members_role if role_id == MEMBERS_ROLE_ID else None
+
+        assert await cog._sync_roster(guild, MEMBERS_ROLE_ID, None, "en-US") == (0, 0, 0)
+        assert transaction.await_count == 0
+
+        members_role.members.append(discord_member(2, "Bob"))
+        assert await cog._sync_roster(guild, MEMBERS_ROLE_ID, None, "en-US") == (0, 0, 0)
+        assert transaction.await_count == 1
+        assert (GUILD_ID, 2) not in await bot.cache.get('roster_data', 'guild_members')
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestEventDrivenRoster:
+    """Test roster maintenance from member events and the scheduled reconciliation."""
+
+    async def test_member_events_are_coalesced_into_one_flush(self, monkeypatch):
+        """Test a burst of updates, joins and leaves becomes one transaction on the touched members only."""
+        bot = Mock()
+        bot.get_cog = Mock(return_value=None)
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set('roster_data', {(GUILD_ID, 1): db_member("Alice"), (GUILD_ID, 2): db_member("Bob")}, 'guild_members')
+        cog = GuildMembers(bot)
+        cog._roster_sync_config = AsyncMock(return_value=(MEMBERS_ROLE_ID, None, "en-US"))
+        roster = {1: db_member("Alice"), 2: db_member("Bob"), 4: db_member("Dave")}
+        cog._get_guild_members_bulk = AsyncMock(side_effect=lambda guild_id, member_ids: {
+            member_id: roster[member_id] for member_id in member_ids if member_id in roster
+        })
+        cog._get_user_setup_bulk = AsyncMock(return_value={})
+        cog.update_recruitment_message = AsyncMock()
+        cog.update_members_message = AsyncMock()
+        cog._roster_checksums[GUILD_ID] = roster_checksum([(1, "Alice"), (2, "Bob"), (4, "Dave")])
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_members, "run_db_transaction", transaction)
+        monkeypatch.setattr(guild_members, "ROSTER_DEBOUNCE_MS", 0)
+        monkeypatch.setattr(guild_members, "ROSTER_WORKER_IDLE_SECONDS", 0.01)
+
+        guild = Mock(id=GUILD_ID)
+        role = Mock(id=MEMBERS_ROLE_ID)
+
+        def member(member_id, name, roles):
+            return Mock(id=member_id, display_name=name, bot=False, guild=guild, roles=roles)
+
+        await cog.on_member_update(member(1, "Alice", [role]), member(1, "Alicia", [role]))
+        await cog.on_member_update(member(3, "Carol", []), member(3, "Carol", [role]))
+        await cog.on_member_remove(member(2, "Bob", [role]))
+        await cog.on_member_update(member(1, "Alicia", [role]), member(1, "Ali", [role]))
+        await cog._roster_workers[GUILD_ID]
+
+        assert transaction.await_count == 1
+        assert [query.split()[0] for query, _ in transaction.await_args.args[0]] == ["DELETE", "UPDATE", "INSERT"]
+        assert sorted(cog._get_guild_members_bulk.await_args.args[1]) == [1, 2, 3]
+        assert sorted(cog._get_user_setup_bulk.await_args.args[1]) == [1, 2, 3]
+        assert cog._roster_checksums[GUILD_ID] == roster_checksum([(1, "Ali"), (3, "Carol"), (4, "Dave")])
+        assert cog.update_members_message.await_count == 1
+        assert (await bot.cache.get('roster_data', 'guild_members'))[(GUILD_ID, 1)]["username"] == "Ali"
+        assert GUILD_ID not in cog._roster_mailboxes
+
+    async def test_only_roster_relevant_updates_are_queued(self):
+        """Test other role changes and nicknames of non-members never reach the mailbox."""
+        bot = Mock()
+        bot.get_cog = Mock(return_value=None)
+        cog = GuildMembers(bot)
+        cog._roster_sync_config = AsyncMock(return_value=(MEMBERS_ROLE_ID, ABSENT_ROLE_ID, "en-US"))
+        cog._enqueue_roster_change = Mock()
+
+        guild = Mock(id=GUILD_ID)
+        members_role, absent_role, other_role = Mock(id=MEMBERS_ROLE_ID), Mock(id=ABSENT_ROLE_ID), Mock(id=999)
+
+        def member(name, roles):
+            return Mock(id=1, display_name=name, bot=False, guild=guild, roles=roles)
+
+        await cog.on_member_update(member("Alice", [members_role]), member("Alice", [members_role, other_role]))
+        await cog.on_member_update(member("Guest", []), member("Visitor", [other_role]))
+        assert cog._enqueue_roster_change.call_count == 0
+
+        await cog.on_member_update(member("Alice", [members_role]), member("Alice", [absent_role]))
+        await cog.on_member_update(member("Alice", [absent_role]), member("Alicia", [absent_role]))
+        await cog.on_member_update(member("Alicia", [absent_role]), member("Alicia", []))
+        assert cog._enqueue_roster_change.call_count == 3
+
+    async def test_batch_read_is_limited_to_the_batched_members(self):
+        """Test the flush-side read filters guild_members by member ID instead of loading the roster."""
+        bot = Mock()
+        bot.cache = Mock(get_bulk_guild_members=AsyncMock())
+        bot.run_db_query = AsyncMock(return_value=[(3, "Carol", "en", 0, "", "NULL", 0, 0, 0, 0, "NULL")])
+        cog = GuildMembers(bot)
+
+        members = await cog._get_guild_members_bulk(GUILD_ID, [3, 7])
+
+        query, params = bot.run_db_query.await_args.args
+        assert "member_id IN (%s,%s)" in query
+        assert params == (GUILD_ID, 3, 7)
+        assert list(members) == [3]
+        assert bot.cache.get_bulk_guild_members.await_count == 0
+        assert await cog._get_guild_members_bulk(GUILD_ID, []) == {}
+
+    async def test_reconciliation_diffs_only_on_checksum_mismatch(self):
+        """Test the scheduled run skips guilds whose role holders match the synced checksum."""
+        bot = Mock()
+        cog = GuildMembers(bot)
+        cog._roster_sync_config = AsyncMock(return_value=(MEMBERS_ROLE_ID, None, "en-US"))
+        cog._sync_roster = AsyncMock(return_value=(0, 0, 0))
+        cog.update_recruitment_message = AsyncMock()
+        cog.update_members_message = AsyncMock()
+
+        alice = discord_member(1, "Alice")
+        members_role = Mock(members=[alice])
+        guild = Mock(id=GUILD_ID)
+        guild.get_role = lambda role_id: members_role if role_id == MEMBERS_ROLE_ID else None
+        bot.get_guild = Mock(return_value=guild)
+
+        await cog.run_maj_roster(GUILD_ID)
+        assert cog._sync_roster.await_count == 1
+
+        cog._roster_checksums[GUILD_ID] = roster_checksum([(1, "Alice")])
+        await cog.run_maj_roster(GUILD_ID)
+        assert cog._sync_roster.await_count == 1
+
+        alice.display_name = "Alicia"
+        await cog.run_maj_roster(GUILD_ID)
+        assert cog._sync_roster.await_count == 2
+        assert cog._roster_stats["checksum_hits"] == 1
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestRosterPages:
+    """Test roster table pages written to the member list messages."""
+
+    async def test_pages_grow_shrink_and_skip_unchanged_messages(self, monkeypatch):
+        """Test extra messages are created and deleted on demand and unchanged pages are not touched."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        bot.run_db_query = AsyncMock()
+        for i in range(1, 6):
+            await bot.cache.set_guild_data(GUILD_ID, f'members_m{i}', 100 + i)
+        cog = GuildMembers(bot)
+        cog.roster_renderer = RosterRenderer()
+        monkeypatch.setattr(guild_members.asyncio, "sleep", AsyncMock())
+
+        channel = Mock()
+        channel.get_partial_message = Mock(side_effect=lambda message_id: Mock(id=message_id, edit=AsyncMock(), delete=AsyncMock()))
+        channel.send = AsyncMock(side_effect=[Mock(id=200), Mock(id=201)])
+
+        pages = [f"page {i}" for i in range(7)]
+        await cog._publish_roster_pages(GUILD_ID, channel, pages, "now")
+
+        assert channel.get_partial_message.call_count == 5
+        assert channel.send.await_count == 2
+        assert await bot.cache.get_guild_data(GUILD_ID, 'members_extra_messages') == [200, 201]
+
+        channel.get_partial_message.reset_mock()
+        await cog._publish_roster_pages(GUILD_ID, channel, pages[:2] + ["page 2 changed"], "now")
+
+        touched = [call.args[0] for call in channel.get_partial_message.call_args_list]
+        assert touched == [103, 104, 105, 200, 201]
+        assert await bot.cache.get_guild_data(GUILD_ID, 'members_extra_messages') == []
+        assert bot.run_db_query.await_args.args[1] == (None, GUILD_ID)
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestWeaponTables:
+    """Test classes resolved from the compiled weapon tables."""
+
+    async def test_roster_diff_classifies_from_compiled_tables(self):
+        """Test pair lookups ignore weapon order and a whole guild is classified with one table read."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        weapon_roles, valid_codes = compile_weapon_tables({1: [
+            {"role": "Tank", "weapon1": "SNS", "weapon2": "GS"},
+            {"role": "Healer", "weapon1": "W", "weapon2": "S"},
+            {"role": "Flanker", "weapon1": "GS", "weapon2": "SNS"},
+        ]})
+        await bot.cache.set_static_data('weapon_roles', weapon_roles)
+        await bot.cache.set_static_data('valid_weapon_codes', valid_codes)
+        await bot.cache.set_guild_data(GUILD_ID, 'guild_game', 1)
+        cog = GuildMembers(bot)
+
+        assert await cog.determine_class(["GS", "SNS"], GUILD_ID) == "Tank"
+        assert await cog.get_valid_weapons(GUILD_ID) == {"SNS", "GS", "W", "S"}
+        assert await cog._process_weapons_optimized("s, w", GUILD_ID) == ("S/W", "Healer")
+        assert await cog._process_weapons_optimized("gs/GS", GUILD_ID) == ("NULL", "NULL")
+
+        cog.get_weapon_tables = AsyncMock(wraps=cog.get_weapon_tables)
+        actual_members = {member_id: discord_member(member_id, f"m{member_id}") for member_id in (1, 2, 3)}
+        user_setup = {1: {"weapons": "GS/SNS"}, 2: {"weapons": "W/SNS"}, 3: {"weapons": "s/w"}}
+
+        _, _, to_insert = await cog._calculate_roster_changes(GUILD_ID, actual_members, {}, user_setup, "en-US")
+
+        assert [(m["weapons"], m["class"]) for m in to_insert] == [("GS/SNS", "Tank"), ("SNS/W", "NULL"), ("S/W", "Healer")]
+        assert cog.get_weapon_tables.await_count == 1
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestRosterTransfer:
+    """Test the streamed roster export and the validated bulk import."""
+
+    async def test_export_streams_keyset_pages(self, monkeypatch):
+        """Test the export reads pages after the last member ID and encodes each row as it arrives."""
+        monkeypatch.setattr(guild_members, "ROSTER_EXPORT_PAGE_SIZE", 2)
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        pages = [
+            [(1, "=cmd", "en-US", 3000, None, "GS/SNS", "Tank", Decimal("12.50"), 4, 3, 2, "20h", "PvE", 1),
+             (5, "Bob", "fr", 0, None, "NULL", "NULL", Decimal("0.00"), 0, 0, 0, None, None, 0)],
+            [(9, "Carl", "de", 2500, "https://questlog.gg/b", "S/W", "Healer", Decimal("1.00"), 1, 1, 1, None, None, 3)],
+        ]
+        bot.run_db_query = AsyncMock(side_effect=pages)
+        cog = GuildMembers(bot)
+
+        csv_lines = [line async for line in cog._stream_roster_export(GUILD_ID, "csv")]
+
+        assert csv_lines[0].decode().startswith("member_id,username,")
+        assert csv_lines[1].decode().startswith("1,'=cmd,en-US,3000,,GS/SNS,Tank,12.50,")
+        assert len(csv_lines) == 4
+        assert guild_members.encode_roster_row(("\tx", "\ry", "ok"), "csv") == b"'\tx,\"'\ry\",ok\r\n"
+        assert [call.args[1][2] for call in bot.run_db_query.await_args_list] == [0, 5]
+
+        bot.run_db_query = AsyncMock(side_effect=pages[1:])
+        ndjson_lines = [line async for line in cog._stream_roster_export(GUILD_ID, "ndjson")]
+        assert json.loads(ndjson_lines[0]) == {
+            "member_id": 9, "username": "Carl", "language": "de", "GS": 2500, "build": "https://questlog.gg/b",
+            "weapons": "S/W", "class": "Healer", "DKP": 1.0, "nb_events": 1, "registrations": 1,
+            "attendances": 1, "playtime": None, "game_mode": None, "wishlist_items": 3
+        }
+
+    async def test_import_validates_rows_and_applies_chunked_upserts(self, monkeypatch):
+        """Test invalid and unknown rows are rejected and valid ones land in chunked upserts with one cache patch."""
+        monkeypatch.setattr(guild_members, "ROSTER_IMPORT_CHUNK_SIZE", 2)
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set('roster_data', {(GUILD_ID, member_id): db_member(f"m{member_id}") for member_id in (1, 2, 3)}, 'guild_members')
+        weapon_roles, valid_codes = compile_weapon_tables({1: [{"role": "Tank", "weapon1": "SNS", "weapon2": "GS"}]})
+        await bot.cache.set_static_data('weapon_roles', weapon_roles)
+        await bot.cache.set_static_data('valid_weapon_codes', valid_codes)
+        await bot.cache.set_guild_data(GUILD_ID, 'guild_game', 1)
+        cog = GuildMembers(bot)
+        cog._patch_roster_cache = AsyncMock(wraps=cog._patch_roster_cache)
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_members, "run_db_transaction", transaction)
+
+        text = (
+            "member_id,GS,weapons,build\n"
+            "1,3100,gs/sns,https://questlog.gg/b\n"
+            "2,,,https://maxroll.gg/x\n"
+            "3,3200,,\n"
+            "4,3000,,\n"
+            "1,99999,,\n"
+            "2,,SNS/W,\n"
+            "3,,,http://questlog.gg/b\n"
+            "1,,GS/gs,\n"
+        )
+        updated, rejected = await cog._import_roster_rows(GUILD_ID, text, "csv")
+
+        assert updated == 3
+        assert rejected == [5, 6, 7, 8, 9]
+        queries = transaction.await_args.args[0]
+        assert len(queries) == 2
+        assert queries[0][1] == (GUILD_ID, 1, 3100, "GS/SNS", "Tank", "https://questlog.gg/b",
+                                 GUILD_ID, 2, None, None, None, "https://maxroll.gg/x")
+        assert queries[1][1] == (GUILD_ID, 3, 3200, None, None, None)
+        assert cog._patch_roster_cache.await_count == 1
+
+        roster = await bot.cache.get('roster_data', 'guild_members')
+        assert roster[(GUILD_ID, 1)]["class"] == "Tank" and roster[(GUILD_ID, 1)]["GS"] == 3100
+        assert roster[(GUILD_ID, 2)]["build"] == "https://maxroll.gg/x" and roster[(GUILD_ID, 2)]["GS"] == 0
+
+        rows = list(guild_members.iter_roster_import('{"member_id": 1, "gs": 2000}\n\nnot json\n[1]\n', "ndjson"))
+        assert rows == [(1, {"member_id": 1, "gs": 2000}), (3, None), (4, None)]
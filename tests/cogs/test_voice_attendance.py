@@ -0,0 +1,202 @@
+"""
+Tests for voice attendance - Ledger fed by voice state updates, the presence threshold, DKP settlement and the leaderboard.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+from cogs import guild_attendance
+from cogs.guild_attendance import GuildAttendance
+from core import voice_ledger
+from core.leaderboard import LeaderboardIndex
+from core.settlement import SettlementEngine
+from core.voice_ledger import VoicePresenceLedger
+
+GUILD_ID = 1
+START = datetime(2025, 1, 6, 21, 0, tzinfo=timezone.utc)
+
+
+def voice_state(channel):
+    """Build a voice state connected to the given channel (None when disconnected)."""
+    state = Mock()
+    state.channel = channel
+    return state
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestVoiceAttendance:
+    """Test attendance computed from the voice ledger."""
+
+    async def test_voice_updates_and_threshold_decide_attendance(self, monkeypatch):
+        """Test joins, AFK moves and leaves are recorded and the guild threshold filters short stays."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set_guild_data(GUILD_ID, 'settings', {"guild_lang": "en-US", "attendance_min_presence": 75})
+        cog = GuildAttendance(bot)
+        cog.voice_ledger = VoicePresenceLedger()
+
+        guild = Mock()
+        guild.id = GUILD_ID
+        guild.afk_channel = Mock()
+        raid = Mock()
+        clock = [START]
+        monkeypatch.setattr(voice_ledger, "time", Mock(time=lambda: clock[0].timestamp()))
+
+        def member(member_id, is_bot=False):
+            return Mock(id=member_id, bot=is_bot, guild=guild)
+
+        await cog.on_voice_state_update(member(1), voice_state(None), voice_state(raid))
+        await cog.on_voice_state_update(member(2), voice_state(None), voice_state(raid))
+        clock[0] = START + timedelta(minutes=20)
+        await cog.on_voice_state_update(member(1), voice_state(raid), voice_state(Mock()))
+        await cog.on_voice_state_update(member(2), voice_state(raid), voice_state(None))
+        clock[0] = START + timedelta(minutes=50)
+        await cog.on_voice_state_update(member(1), voice_state(Mock()), voice_state(guild.afk_channel))
+        await cog.on_voice_state_update(member(3, is_bot=True), voice_state(None), voice_state(raid))
+
+        event = {"event_id": 10, "event_start": START, "event_end": START + timedelta(hours=1)}
+        end = START + timedelta(hours=1)
+
+        assert await cog._get_voice_attendees(guild, event, end) == {1}
+        await bot.cache.update_guild_data(GUILD_ID, 'settings', lambda s: {**s, "attendance_min_presence": 25})
+        assert await cog._get_voice_attendees(guild, event, end) == {1, 2}
+        assert cog.voice_ledger.get_stats()['open'] == 0
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestEventSettlement:
+    """Test registration DKP applied through the settlement engine."""
+
+    async def test_registrations_settle_once_in_one_transaction(self, monkeypatch):
+        """Test the role set is read once, every delta lands in one transaction and a retry changes nothing."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set_guild_data(GUILD_ID, 'guild_lang', "en-US")
+        await bot.cache.set_guild_data(GUILD_ID, 'roles', {"members": 5})
+        await bot.cache.set('roster_data', {
+            (GUILD_ID, uid): {"DKP": 10, "nb_events": 3, "registrations": 2, "attendances": 1} for uid in (1, 2, 3)
+        }, 'guild_members')
+        settled_markers = set()
+
+        async def run_db_query(query, params, **kwargs):
+            return (1,) if params in settled_markers else None
+
+        async def run_db_transaction(statements):
+            settled_markers.add(statements[0][1][:3])
+            return True
+
+        bot.run_db_query = AsyncMock(side_effect=run_db_query)
+        transaction = AsyncMock(side_effect=run_db_transaction)
+        monkeypatch.setattr(guild_attendance, "run_db_transaction", transaction)
+        role = Mock(members=[Mock(id=uid) for uid in (1, 2, 3)])
+        guild = Mock()
+        guild.get_role = Mock(return_value=role)
+        bot.get_guild = Mock(return_value=guild)
+        cog = GuildAttendance(bot)
+        cog.settlement_engine = SettlementEngine()
+        cog._send_registration_notification = AsyncMock()
+        event = {"dkp_ins": 5, "registrations": {"presence": [1, 4], "tentative": [2], "absence": []}}
+
+        await cog._process_event_registrations(GUILD_ID, 10, event)
+        await cog._process_event_registrations(GUILD_ID, 10, event)
+
+        assert transaction.await_count == 1
+        assert sorted(transaction.await_args.args[0][1][1][1::8]) == [1, 2, 3]
+        assert guild.get_role.call_count == 2
+        roster = await bot.cache.get('roster_data', 'guild_members')
+        assert roster[(GUILD_ID, 1)] == {"DKP": 15, "nb_events": 4, "registrations": 3, "attendances": 1}
+        assert roster[(GUILD_ID, 3)] == {"DKP": 10, "nb_events": 4, "registrations": 2, "attendances": 1}
+        assert (GUILD_ID, 4) not in roster
+        cog._send_registration_notification.assert_awaited_once()
+
+    async def test_nothing_is_settled_while_the_roster_is_not_loaded(self, monkeypatch):
+        """Test an empty roster cache leaves both phases unsettled instead of recording an empty settlement."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set_guild_data(GUILD_ID, 'guild_lang', "en-US")
+        await bot.cache.set_guild_data(GUILD_ID, 'roles', {"members": 5})
+        await bot.cache.set('roster_data', {(2, 9): {"DKP": 0}}, 'guild_members')
+        bot.run_db_query = AsyncMock(return_value=None)
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_attendance, "run_db_transaction", transaction)
+        guild = Mock()
+        guild.get_role = Mock(return_value=Mock(members=[Mock(id=1)]))
+        bot.get_guild = Mock(return_value=guild)
+        cog = GuildAttendance(bot)
+        cog.settlement_engine = SettlementEngine()
+        cog._send_registration_notification = AsyncMock()
+
+        await cog._process_event_registrations(GUILD_ID, 10, {"dkp_ins": 5, "registrations": {"presence": [1]}})
+        changes = [{"member_id": 1, "dkp_change": 10, "attendance_change": 1, "code": "present"}]
+
+        assert await cog._apply_attendance_changes(GUILD_ID, 10, changes, [1]) is None
+        assert transaction.await_count == 0
+        cog._send_registration_notification.assert_not_awaited()
+
+
+@pytest.mark.cog
+@pytest.mark.asyncio
+class TestDKPLeaderboard:
+    """Test the leaderboard command and its incremental maintenance."""
+
+    async def test_leaderboard_follows_settled_changes(self):
+        """Test the index is built once from the roster and re-ranked by cache patches."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        await bot.cache.set_guild_data(GUILD_ID, 'guild_lang', "en-US")
+        await bot.cache.set('roster_data', {
+            (GUILD_ID, 1): {"username": "Alpha", "DKP": 30, "nb_events": 4, "attendances": 2, "GS": 3000},
+            (GUILD_ID, 2): {"username": "Bravo", "DKP": 60, "nb_events": 4, "attendances": 4, "GS": 2900},
+            (2, 9): {"username": "Other", "DKP": 500, "nb_events": 1, "attendances": 1, "GS": 3500},
+        }, 'guild_members')
+        cog = GuildAttendance(bot)
+        cog.leaderboards = LeaderboardIndex()
+        ctx = Mock()
+        ctx.guild.id = GUILD_ID
+        ctx.author.id = 1
+        ctx.defer = AsyncMock()
+        ctx.followup.send = AsyncMock()
+
+        await cog.dkp_leaderboard(ctx, metric="dkp", limit=10)
+        embed = ctx.followup.send.await_args.kwargs["embed"]
+        assert embed.description.splitlines() == ["`#1` **Bravo** - 60 DKP", "`#2` **Alpha** - 30 DKP"]
+        assert cog.leaderboards.rank(GUILD_ID, "dkp", 1) == (2, 2, 30.0)
+
+        await cog._update_centralized_cache(GUILD_ID, {1: {"username": "Alpha", "DKP": 75, "nb_events": 5, "attendances": 3, "GS": 3000}})
+        await cog.dkp_leaderboard(ctx, metric="dkp", limit=1)
+        embed = ctx.followup.send.await_args.kwargs["embed"]
+        assert embed.description == "`#1` **Alpha** - 75 DKP"
+        assert cog.leaderboards.rank(GUILD_ID, "dkp", 1) == (1, 2, 75.0)
+        assert cog.leaderboards.get_stats()['builds'] == 1
+
+    async def test_rebuild_reloads_the_roster_and_drops_the_index(self, monkeypatch):
+        """Test the officer rebuild recomputes balances in one transaction and re-indexes from fresh roster data."""
+        bot = Mock()
+        bot.cache = GlobalCacheSystem()
+        bot.cache_loader.reload_category = AsyncMock()
+        await bot.cache.set_guild_data(GUILD_ID, 'guild_lang', "en-US")
+        transaction = AsyncMock(return_value=True)
+        monkeypatch.setattr(guild_attendance, "run_db_transaction", transaction)
+        cog = GuildAttendance(bot)
+        cog.leaderboards = LeaderboardIndex()
+        cog.leaderboards.load(GUILD_ID, [(1, {"DKP": 10})])
+        ctx = Mock()
+        ctx.guild.id = GUILD_ID
+        ctx.defer = AsyncMock()
+        ctx.followup.send = AsyncMock()
+
+        await cog.dkp_rebuild(ctx)
+
+        (query, params), = transaction.await_args.args[0]
+        assert "FROM dkp_ledger" in query and params == (GUILD_ID, GUILD_ID)
+        bot.cache_loader.reload_category.assert_awaited_once_with('guild_members', GUILD_ID)
+        assert cog.leaderboards.get_stats()['guilds'] == 0
@@ -56,6 +56,7 @@ class MockDBQueryError(Exception):
 import types
 db_module = types.ModuleType('db')
 db_module.DBQueryError = MockDBQueryError
+db_module.run_db_transaction = AsyncMock(return_value=True)
 sys.modules['db'] = db_module
 
 # Mock pytz module for profile_setup.py
@@ -360,6 +361,7 @@ sys.modules['core.translation'] = translation_module
 
 # Also create the core module
 core_module = types.ModuleType('core')
+core_module.__path__ = [os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app', 'core')]
 sys.modules['core'] = core_module
 
 # Create core.functions module with necessary functions
@@ -453,7 +455,12 @@ def mock_get_nested_value(data, keys, max_depth=10):
             return None
     return current
 
+async def mock_get_effective_locale(bot, guild_id, user_id):
+    """Mock get_effective_locale function."""
+    return 'en-US'
+
 core_functions_module.get_user_message = mock_get_user_message
+core_functions_module.get_effective_locale = mock_get_effective_locale
 core_functions_module.get_guild_message = mock_get_guild_message
 core_functions_module.sanitize_kwargs = mock_sanitize_kwargs
 core_functions_module.get_nested_value = mock_get_nested_value
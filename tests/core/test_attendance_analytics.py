@@ -0,0 +1,80 @@
+"""
+Tests for core.attendance_analytics module - Presence matrix bookkeeping and vectorized aggregates.
+"""
+
+import json
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+np = pytest.importorskip("numpy")
+
+from core.attendance_analytics import AttendanceAnalytics, GuildAttendanceMatrix
+
+GUILD_ID = 1
+TODAY = date(2025, 3, 31)
+
+
+@pytest.mark.core
+class TestGuildAttendanceMatrix:
+    """Test the member x event matrix and its aggregates."""
+
+    def test_aggregates_match_hand_counts(self):
+        """Test rolling, no-show, conversion and weekday rates on a small history."""
+        matrix = GuildAttendanceMatrix(members_capacity=1, events_capacity=1)
+        matrix.set_event(1, date(2025, 1, 6), {"presence": [1, 2], "tentative": [3], "absence": []}, [1, 3])
+        matrix.set_event(2, date(2025, 3, 17), {"presence": [1], "tentative": [], "absence": [2]}, [2])
+        matrix.set_event(3, "2025-03-27", {"presence": [1, 2], "tentative": [], "absence": []}, [1])
+
+        stats = matrix.aggregates(TODAY, member_ids=[1, 2, 99])
+
+        assert stats["member_ids"] == [1, 2]
+        assert stats["events"] == 3 and stats["window_events"] == 2
+        assert np.allclose(stats["rolling_rate"], [0.5, 0.5])
+        assert np.allclose(stats["no_show_rate"], [1 / 3, 1.0])
+        assert np.allclose(stats["conversion_rate"], [2 / 3, 0.0])
+        assert stats["events_per_weekday"].tolist() == [2, 0, 0, 1, 0, 0, 0]
+        assert np.allclose(stats["weekday_rate"][1], [0.5, 0, 0, 0, 0, 0, 0])
+
+    def test_rewriting_an_event_replaces_its_column(self):
+        """Test recording an event twice keeps one column with the latest presence."""
+        matrix = GuildAttendanceMatrix()
+        matrix.set_event(1, date(2025, 3, 24), {"presence": [1]}, [])
+        matrix.set_event(1, date(2025, 3, 24), {"presence": [1]}, [1])
+
+        stats = matrix.aggregates(TODAY)
+
+        assert stats["events"] == 1
+        assert stats["no_show_rate"].tolist() == [0.0]
+        assert stats["attended"].tolist() == [1]
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestAttendanceAnalytics:
+    """Test the per-guild cache."""
+
+    async def test_built_once_then_updated_incrementally(self):
+        """Test the history is read once and closed events are appended without a query."""
+        analytics = AttendanceAnalytics()
+        analytics.record_event(GUILD_ID, 5, date(2025, 3, 30), {"presence": [1]}, [1])
+        run_db_query = AsyncMock(return_value=[
+            (1, date(2025, 3, 24), json.dumps({"presence": [1, 2], "tentative": [], "absence": []}), json.dumps([2])),
+            (2, date(2025, 3, 25), None, None),
+        ])
+
+        stats = await analytics.aggregates(run_db_query, GUILD_ID, TODAY)
+        assert stats["events"] == 2
+
+        analytics.record_event(GUILD_ID, 3, date(2025, 3, 30), {"presence": [1]}, [1])
+        stats = await analytics.aggregates(run_db_query, GUILD_ID, TODAY, member_ids=[1])
+
+        assert run_db_query.await_count == 1
+        assert stats["events"] == 3
+        assert np.allclose(stats["rolling_rate"], [1 / 3])
+        assert analytics.get_stats()["events_recorded"] == 1
@@ -0,0 +1,79 @@
+"""
+Tests for core.dkp_ledger module - Batched ledger entries, incremental balances and rebuilds.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core.dkp_ledger import BACKUP_RESTORED, DKPLedger
+
+GUILD_ID = 1
+EVENT_ID = 10
+
+
+@pytest.mark.core
+class TestDKPLedger:
+    """Test statement building."""
+
+    def test_entries_and_balances_are_batched(self):
+        """Test a batch becomes one multi-row insert and one increment without reading balances."""
+        ledger = DKPLedger()
+        deltas = {1: {"DKP": 5, "registrations": 1}, 2: {"DKP": -3}}
+
+        entries = ledger.entries_statement(GUILD_ID, EVENT_ID, [(1, "registration", deltas[1]), (2, "present_but_absent", deltas[2])])
+        balances = ledger.balances_statement(GUILD_ID, deltas)
+
+        assert entries[0].startswith("INSERT INTO dkp_ledger")
+        assert entries[0].count("(%s, %s, %s, %s, %s, %s, %s, %s)") == 2
+        assert entries[1] == (GUILD_ID, 1, EVENT_ID, "registration", 5, 0, 1, 0, GUILD_ID, 2, EVENT_ID, "present_but_absent", -3, 0, 0, 0)
+        assert "SELECT" not in balances[0].split("JOIN")[0]
+        assert "COALESCE(g.DKP, 0) + d.dkp" in balances[0]
+        assert balances[1] == (1, 5, 0, 1, 0, 2, -3, 0, 0, 0, GUILD_ID)
+        assert ledger.get_stats()['entries'] == 2
+
+    def test_empty_batches_build_nothing(self):
+        """Test no statement is produced when there is nothing to record."""
+        ledger = DKPLedger()
+
+        assert ledger.entries_statement(GUILD_ID, EVENT_ID, []) is None
+        assert ledger.balances_statement(GUILD_ID, {}) is None
+
+    def test_adjustment_brings_the_ledger_sum_to_the_restored_balances(self):
+        """Test a restore entry is the difference between the restored values and the current ledger sums."""
+        ledger = DKPLedger()
+
+        query, params = ledger.adjustment_statement(GUILD_ID, 7, BACKUP_RESTORED, {"DKP": "12.50", "nb_events": 4, "registrations": None})
+
+        assert query.strip().startswith("INSERT INTO dkp_ledger")
+        assert "%s - COALESCE(SUM(DKP), 0)" in query
+        assert params == (GUILD_ID, 7, BACKUP_RESTORED, "12.50", 4, 0, 0, GUILD_ID, 7)
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestDKPLedgerQueries:
+    """Test rebuilds and per-event audits."""
+
+    async def test_rebuild_and_event_entries(self):
+        """Test balances are recomputed from the ledger sums and event entries are read by index."""
+        ledger = DKPLedger()
+        run_transaction = AsyncMock(return_value=True)
+
+        assert await ledger.rebuild_balances(run_transaction, GUILD_ID)
+        (query, params), = run_transaction.await_args.args[0]
+        assert "GROUP BY member_id" in query and "COALESCE(l.dkp, 0)" in query
+        assert params == (GUILD_ID, GUILD_ID)
+
+        run_db_query = AsyncMock(return_value=[(1, "present_and_present", 10, 0, 0, 1, "2025-01-06 22:00:00")])
+        entries = await ledger.get_event_entries(run_db_query, GUILD_ID, EVENT_ID)
+
+        assert entries == [{
+            "member_id": 1, "reason": "present_and_present", "DKP": 10, "nb_events": 0,
+            "registrations": 0, "attendances": 1, "created_at": "2025-01-06 22:00:00"
+        }]
+        assert run_db_query.await_args.args[1] == (GUILD_ID, EVENT_ID)
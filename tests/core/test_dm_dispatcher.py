@@ -0,0 +1,77 @@
+"""
+Tests for core.dm_dispatcher module - Rate-limited DM batches with dedup, retries and a closed-DM cache.
+"""
+
+import time
+import pytest
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+import discord
+from core import dm_dispatcher
+from core.dm_dispatcher import DMDispatcher
+
+
+def make_member(member_id, side_effect=None):
+    """Build a member whose send() is recorded."""
+    member = Mock()
+    member.id = member_id
+    member.name = f"member{member_id}"
+    member.send = AsyncMock(side_effect=side_effect)
+    return member
+
+
+def http_error(cls, status):
+    """Build a discord HTTP exception with the given status."""
+    return cls(Mock(status=status, reason="error"), "error")
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestDMDispatcher:
+    """Test the DMDispatcher class."""
+
+    async def test_batch_report_dedup_and_closed_dm_cache(self):
+        """Test duplicates are sent once and 403 recipients are skipped next time."""
+        dispatcher = DMDispatcher(rate_per_second=1000, burst=100)
+        alice = make_member(1)
+        closed = make_member(2, side_effect=http_error(discord.Forbidden, 403))
+
+        report = await dispatcher.send_batch("test", [alice, alice, closed, None], lambda m: f"hi {m.name}", dedup_key="k")
+
+        assert report['requested'] == 3
+        assert report['sent'] == [1] and report['forbidden'] == [2]
+        alice.send.assert_awaited_once_with("hi member1")
+
+        again = await dispatcher.send_batch("test", [alice, closed], "hi", dedup_key="k")
+        assert again['sent'] == [] and sorted(again['skipped']) == [1, 2]
+        assert closed.send.await_count == 1
+
+    async def test_transient_errors_are_retried(self, monkeypatch):
+        """Test 5xx errors are retried and 4xx errors are not."""
+        monkeypatch.setattr(dm_dispatcher, "RETRY_BASE_DELAY", 0)
+        dispatcher = DMDispatcher(rate_per_second=1000, burst=100, max_retries=2)
+        flaky = make_member(1, side_effect=[http_error(discord.HTTPException, 503), None])
+        broken = make_member(2, side_effect=http_error(discord.HTTPException, 400))
+
+        report = await dispatcher.send_batch("test", [flaky, broken], "hi")
+
+        assert report['sent'] == [1] and report['failed'] == [2]
+        assert report['retries'] == 1
+        assert broken.send.await_count == 1
+
+    async def test_global_rate_limit_spaces_sends(self):
+        """Test sends beyond the burst wait for the token bucket."""
+        dispatcher = DMDispatcher(max_concurrency=10, rate_per_second=50, burst=1)
+        members = [make_member(i) for i in range(6)]
+
+        start = time.monotonic()
+        report = await dispatcher.send_batch("test", members, "hi")
+
+        assert len(report['sent']) == 6
+        assert time.monotonic() - start >= 0.09
+        assert dispatcher.get_stats()['rate_wait'] > 0
@@ -0,0 +1,86 @@
+"""
+Tests for core.event_timeline module - Heap of event transitions and the due-time sleeper.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core import event_timeline
+from core.event_timeline import EventTimeline, TIMEZONE, CLOSE, ATTENDANCE, REMINDER, DELETE
+
+
+def at(day, hour, minute=0):
+    """Localized datetime in the bot timezone."""
+    return TIMEZONE.localize(datetime(2025, 1, day, hour, minute))
+
+
+@pytest.mark.core
+class TestEventTimeline:
+    """Test transition scheduling and popping."""
+
+    def test_planned_event_transitions_fire_in_order(self):
+        """Test a planned event yields reminders, close, attendance and cleanup at their times."""
+        timeline = EventTimeline()
+        timeline.schedule_event(1, 10, "2025-01-02", timedelta(hours=21), 60, "Planned", now=at(1, 12))
+
+        assert timeline.next_due() == at(2, 13)
+        assert timeline.pop_due(at(2, 18)) == {REMINDER: {1: {10}}}
+        assert timeline.pop_due(at(2, 20, 44)) == {}
+        assert timeline.pop_due(at(2, 20, 45)) == {CLOSE: {1: {10}}}
+        assert timeline.pop_due(at(2, 21, 59)) == {}
+        assert timeline.pop_due(at(2, 22)) == {ATTENDANCE: {1: {10}}}
+        assert timeline.next_due() == at(2, 23, 30)
+        assert timeline.pop_due(at(2, 23, 30)) == {DELETE: {1: {10}}}
+        assert timeline.get_stats()['tracked_events'] == 0
+
+    def test_reschedule_replaces_pending_transitions(self):
+        """Test canceling keeps only the cleanup and removing drops everything."""
+        timeline = EventTimeline()
+        timeline.schedule_event(1, 10, "2025-01-02", "21:00:00", 60, "Planned", now=at(1, 12))
+        timeline.schedule_event(1, 11, "2025-01-02", "21:00:00", 60, "Planned", now=at(1, 12))
+        timeline.schedule_event(1, 10, "2025-01-02", "21:00:00", 60, "Canceled", now=at(1, 12))
+        timeline.remove_event(1, 11)
+
+        assert timeline.pop_due(at(3, 0)) == {DELETE: {1: {10}}}
+        assert timeline.next_due() is None
+
+    def test_missed_window_expires_instead_of_firing(self):
+        """Test reminders and close past their window are dropped."""
+        timeline = EventTimeline()
+        timeline.schedule_event(1, 10, "2025-01-02", "21:00", 120, "Confirmed", now=at(2, 20))
+
+        due = timeline.pop_due(at(2, 23))
+
+        assert due == {ATTENDANCE: {1: {10}}}
+        assert timeline.get_stats()['expired'] == 3
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestEventTimelineSleeper:
+    """Test the sleeper task."""
+
+    async def test_sleeper_wakes_for_newly_scheduled_transition(self, monkeypatch):
+        """Test scheduling an earlier transition interrupts the current sleep."""
+        monkeypatch.setattr(event_timeline, "current_time", datetime.now)
+        timeline = EventTimeline()
+        fired = asyncio.Queue()
+
+        async def dispatch(kind, due):
+            await fired.put((kind, due))
+
+        task = asyncio.create_task(timeline.run(dispatch))
+        await asyncio.sleep(0.01)
+        start = datetime.now().replace(second=0, microsecond=0) + timedelta(minutes=14)
+        timeline.schedule_event(1, 10, start.date(), start.time(), 60, "Planned")
+
+        kind, due = await asyncio.wait_for(fired.get(), timeout=1)
+        task.cancel()
+
+        assert (kind, due) == (CLOSE, {1: {10}})
@@ -287,7 +287,7 @@ class TestGetEffectiveLocale:
         from core.functions import get_effective_locale
         
         # Simulate cache error
-        mock_bot.cache_loader.ensure_guild_settings_loaded.side_effect = Exception("Cache error")
+        mock_bot.cache.get_guild_member_data.side_effect = Exception("Cache error")
         
         with patch('logging.error') as mock_error:
             result = await get_effective_locale(mock_bot, 123456789, 987654321)
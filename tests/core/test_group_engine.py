@@ -0,0 +1,137 @@
+"""
+Tests for core.group_engine module - Pure group assignment modes, quality metrics and the benchmark suite.
+
+The benchmark times every mode up to 300 members and logs the results; it only
+runs when GROUP_ENGINE_BENCHMARK is set to 1.
+"""
+
+import logging
+import os
+import random
+import time
+import pytest
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core.group_engine import GroupEngine, CLASSES, LEGACY, ENHANCED, OPTIMIZED, MODES, optimal_sizes
+
+
+def make_event(size, seed=7, tentative_ratio=0.15):
+    """Build a synthetic registration list and roster with a realistic class mix."""
+    rng = random.Random(seed)
+    weights = (0.2, 0.2, 0.25, 0.2, 0.15)
+    roster = {}
+    for uid in range(1, size + 1):
+        gs = rng.choice(["N/A", str(int(rng.gauss(5500, 350)))]) if rng.random() < 0.05 else int(rng.gauss(5500, 350))
+        roster[str(uid)] = {"pseudo": f"m{uid}", "GS": gs, "weapons": "SNS/GS", "class": rng.choices(CLASSES, weights)[0]}
+    ids = list(range(1, size + 1))
+    rng.shuffle(ids)
+    cut = int(size * (1 - tentative_ratio))
+    return ids[:cut], ids[cut:], roster
+
+
+def placed_ids(groups):
+    """Flatten groups into member IDs."""
+    return [m["user_id"] for group in groups for m in group]
+
+
+@pytest.mark.core
+class TestGroupEngine:
+    """Test the GroupEngine modes."""
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_every_known_member_is_placed_once(self, mode):
+        """Test each mode places every rostered registrant exactly once in groups of at most 6."""
+        presence, tentative, roster = make_event(53)
+        groups = GroupEngine().assign(presence + [999], tentative, roster, mode=mode)
+
+        assert sorted(placed_ids(groups)) == sorted(presence + tentative)
+        assert all(0 < len(group) <= 6 for group in groups)
+        assert {m["user_id"] for group in groups for m in group if m["tentative"]} == set(tentative)
+
+    def test_static_group_is_kept_and_completed(self):
+        """Test a static with one absentee stays together, gains a tank for the missing one and is never split."""
+        presence, tentative, roster = make_event(30)
+        static = [uid for uid in presence if roster[str(uid)]["class"] != "Tank"][:6]
+        absent = static.pop()
+        roster[str(absent)]["class"] = "Tank"
+        presence.remove(absent)
+        statics = {"Core": {"member_ids": static + [absent]}}
+
+        for mode in (ENHANCED, OPTIMIZED):
+            groups = GroupEngine().assign(presence, tentative, roster, statics, mode=mode)
+            core = next(group for group in groups if static[0] in {m["user_id"] for m in group})
+            ids = {m["user_id"] for m in core}
+            assert set(static) <= ids and len(core) == 6
+            assert any(m["class"] == "Tank" for m in core if m["user_id"] not in static)
+
+    def test_optimized_mode_does_not_worsen_objective(self):
+        """Test the swap search only lowers the class balance + GS variance objective."""
+        engine = GroupEngine()
+        presence, tentative, roster = make_event(100, seed=3)
+
+        enhanced = engine.evaluate(engine.assign(presence, tentative, roster, mode=ENHANCED))
+        optimized = engine.evaluate(engine.assign(presence, tentative, roster, mode=OPTIMIZED))
+
+        assert optimized['objective'] < enhanced['objective']
+        assert optimized['members'] == enhanced['members']
+        assert engine.get_stats()['by_mode'][OPTIMIZED] == 1
+
+    def test_optimal_sizes(self):
+        """Test group sizes prefer full groups and never exceed 6."""
+        assert optimal_sizes(0) == []
+        assert optimal_sizes(12) == [6, 6]
+        assert sum(optimal_sizes(40)) == 40 and max(optimal_sizes(40)) == 6
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestGroupEngineAsync:
+    """Test event loop offloading."""
+
+    async def test_large_inputs_run_in_a_thread(self):
+        """Test assign_async offloads from the threshold up and runs inline below it."""
+        engine = GroupEngine(offload_threshold=50)
+        presence, tentative, roster = make_event(60)
+
+        big = await engine.assign_async(presence, tentative, roster)
+        small = await engine.assign_async(presence[:10], [], roster)
+
+        assert len(placed_ids(big)) == 60 and len(placed_ids(small)) == 10
+        assert engine.get_stats()['offloaded'] == 1
+
+
+@pytest.mark.core
+class TestGroupEngineBenchmark:
+    """Compare modes on synthetic events."""
+
+    @pytest.mark.parametrize("size", [40, 100])
+    def test_modes_place_everyone_and_optimized_beats_enhanced(self, size):
+        """Test every mode places all members and optimized balance is never worse than enhanced."""
+        presence, tentative, roster = make_event(size, seed=size)
+        engine = GroupEngine()
+        results = {mode: engine.evaluate(engine.assign(presence, tentative, roster, mode=mode)) for mode in (LEGACY, ENHANCED, OPTIMIZED)}
+
+        assert all(quality['members'] == size for quality in results.values())
+        assert results[OPTIMIZED]['objective'] <= results[ENHANCED]['objective']
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    @pytest.mark.skipif(os.getenv("GROUP_ENGINE_BENCHMARK") != "1", reason="set GROUP_ENGINE_BENCHMARK=1 to run the benchmark")
+    @pytest.mark.parametrize("size", [40, 100, 300])
+    def test_benchmark_modes(self, size):
+        """Report speed and balance of legacy, enhanced and optimized assignment."""
+        presence, tentative, roster = make_event(size, seed=size)
+        engine = GroupEngine()
+        for mode in (LEGACY, ENHANCED, OPTIMIZED):
+            start = time.perf_counter()
+            groups = engine.assign(presence, tentative, roster, mode=mode)
+            elapsed = (time.perf_counter() - start) * 1000
+            quality = engine.evaluate(groups)
+            logging.info(f"[group bench] members={size} mode={mode:<9} time={elapsed:7.1f}ms groups={quality['groups']} "
+                         f"no_tank={quality['missing_tank']} no_healer={quality['missing_healer']} "
+                         f"class_penalty={quality['class_penalty']} gs_mean_stdev={quality['gs_mean_stdev']} "
+                         f"objective={quality['objective']}")
@@ -0,0 +1,70 @@
+"""
+Tests for core.leaderboard module - Order-statistics tree and incrementally maintained guild rankings.
+"""
+
+import random
+import pytest
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core.leaderboard import LeaderboardIndex, OrderStatisticTree, DKP, ATTENDANCE, GS
+
+GUILD_ID = 1
+
+
+@pytest.mark.core
+class TestOrderStatisticTree:
+    """Test ranks and ordered reads against a sorted list."""
+
+    def test_matches_sorted_reference(self):
+        """Test inserts, removes, ranks and offset reads agree with sorting."""
+        rng = random.Random(7)
+        tree = OrderStatisticTree()
+        keys = set()
+        for i in range(500):
+            key = (rng.randint(0, 50), i)
+            tree.insert(key)
+            keys.add(key)
+        for key in rng.sample(sorted(keys), 200):
+            tree.remove(key)
+            keys.discard(key)
+        ordered = sorted(keys)
+
+        assert len(tree) == len(ordered)
+        for offset in (0, 1, 17, len(ordered) - 2, len(ordered)):
+            assert tree.first(5, offset) == ordered[offset:offset + 5]
+        for key in rng.sample(ordered, 25):
+            assert tree.rank(key) == ordered.index(key)
+
+
+@pytest.mark.core
+class TestLeaderboardIndex:
+    """Test guild rankings."""
+
+    def test_updates_rerank_only_the_changed_member(self):
+        """Test top-N and own rank follow DKP, attendance rate and GS changes."""
+        index = LeaderboardIndex()
+        index.load(GUILD_ID, [
+            (1, {"DKP": 50, "nb_events": 10, "attendances": 9, "GS": 3000}),
+            (2, {"DKP": 80, "nb_events": 10, "attendances": 5, "GS": "NULL"}),
+            (3, {"DKP": 20, "nb_events": 0, "attendances": 0, "GS": 3200}),
+        ])
+
+        assert index.top(GUILD_ID, DKP, 2) == [(2, 80.0), (1, 50.0)]
+        assert index.top(GUILD_ID, ATTENDANCE, 3) == [(1, 0.9), (2, 0.5), (3, 0.0)]
+        assert index.rank(GUILD_ID, GS, 2) == (3, 3, 0.0)
+
+        index.update(GUILD_ID, 3, {"DKP": 95, "nb_events": 1, "attendances": 1, "GS": 3200})
+        index.remove(GUILD_ID, 2)
+        index.update(99, 1, {"DKP": 1})
+
+        assert index.top(GUILD_ID, DKP, 5) == [(3, 95.0), (1, 50.0)]
+        assert index.rank(GUILD_ID, ATTENDANCE, 3) == (1, 2, 1.0)
+        assert index.rank(GUILD_ID, DKP, 2) is None
+        assert not index.is_loaded(99)
+
+        index.invalidate(GUILD_ID)
+        assert index.top(GUILD_ID, DKP, 5) == []
@@ -0,0 +1,85 @@
+"""
+Tests for core.roster_renderer module - Row caching, single-pass class counts, page splitting and page digests.
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core.roster_renderer import RosterRenderer, paginate, render_header, render_row
+
+GUILD_ID = 1
+
+
+def entry(name, member_class="Tank", **fields):
+    """Build a roster entry."""
+    return {"username": name, "language": "en", "GS": 3000, "build": "https://questlog.gg/b", "weapons": "SNS/GS",
+            "class": member_class, "DKP": 10, "nb_events": 4, "registrations": 3, "attendances": 2, **fields}
+
+
+@pytest.mark.core
+class TestRosterRenderer:
+    """Test rendering and caching."""
+
+    def test_rows_are_sorted_counted_and_reused(self):
+        """Test rows come back sorted with class counts and only changed members are re-rendered."""
+        renderer = RosterRenderer()
+        members = [(1, entry("bob", "Healer")), (2, entry("Alice")), (3, entry("carl", None, build=None))]
+
+        rows, counts = renderer.render_rows(GUILD_ID, members)
+
+        assert [row.split("│")[0].strip() for row in rows] == ["Alice", "bob", "carl"]
+        assert rows[0].split("│")[7].strip() == "75%" and rows[0].split("│")[8].strip() == "50%"
+        assert rows[2].split("│")[3].strip() == "" and rows[2].split("│")[5].strip() == ""
+        assert counts == {"tank": 1, "melee dps": 0, "ranged dps": 0, "healer": 1, "flanker": 0}
+        assert len(rows[0]) == len(render_header(["Name", "Lang", "GS", "Build", "Weapons", "Class", "DKP", "Reg", "Att"]))
+
+        members[0] = (1, entry("bob", "Healer", DKP=25))
+        renderer.render_rows(GUILD_ID, members[:2])
+
+        stats = renderer.get_stats()
+        assert stats["rows_rendered"] == 4 and stats["rows_cached"] == 1
+        assert stats["cached_rows"] == 2
+
+    def test_cells_are_padded_like_str_center(self):
+        """Test odd padding lands on the same side as the str.center layout the table always used."""
+        header = render_header(["Name", "Lang", "GS", "Build", "Weapons", "Class", "DKP", "Reg", "Att"])
+        row = render_row(entry("A" * 30, language="en-US-long", GS=12, DKP=7))
+
+        assert header.split("│") == ["Name".ljust(20), "Lang".center(8), "GS".center(8), "Build".center(7),
+                                     "Weapons".center(9), "Class".center(14), "DKP".center(10), "Reg".center(8), "Att".center(8)]
+        assert row.split("│")[:3] == ["A" * 20, "en-US-lo".center(8), "12".center(8)]
+        assert row.split("│")[4] == "SNS/GS".center(9) == "  SNS/GS "
+        assert row.split("│")[6] == "7".center(10)
+
+    def test_render_stays_fast_at_a_thousand_members(self):
+        """Test a cold 1,000 member render stays under a millisecond per member."""
+        renderer = RosterRenderer()
+        members = [(member_id, entry(f"member{member_id}")) for member_id in range(1000)]
+
+        start = time.perf_counter()
+        rows, _ = renderer.render_rows(GUILD_ID, members)
+        pages = paginate(render_header(["Name"] * 9), rows, "\nfooter")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed / 1000 < 0.001
+        assert all(len(page) <= 2000 for page in pages)
+        assert sum(page.count("│") // 8 - 1 for page in pages) == 1000
+        assert pages[-1].endswith("```\nfooter")
+
+    def test_page_digests_skip_unchanged_pages(self):
+        """Test a page is reported unchanged only for the digest it last showed."""
+        renderer = RosterRenderer()
+        digest = renderer.digest("page")
+
+        assert renderer.page_changed(GUILD_ID, 10, digest)
+        renderer.remember_page(GUILD_ID, 10, digest)
+        assert not renderer.page_changed(GUILD_ID, 10, digest)
+        assert renderer.page_changed(GUILD_ID, 10, renderer.digest("other"))
+
+        renderer.remember_page(GUILD_ID, 10, None)
+        assert renderer.page_changed(GUILD_ID, 10, digest)
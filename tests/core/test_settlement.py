@@ -0,0 +1,120 @@
+"""
+Tests for core.settlement module - Delta accumulation, ledger entries, the batched update and once-per-phase settlement.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core.settlement import Settlement, SettlementEngine, REGISTRATIONS, ATTENDANCE
+
+GUILD_ID = 1
+EVENT_ID = 10
+
+
+@pytest.mark.core
+class TestSettlement:
+    """Test delta accumulation and statement building."""
+
+    def test_deltas_are_merged_into_one_row_per_member(self):
+        """Test repeated adds sum per member and zero deltas are dropped."""
+        settlement = Settlement(GUILD_ID, EVENT_ID, REGISTRATIONS)
+        settlement.add(1, reason="members_role", nb_events=1)
+        settlement.add(1, reason="registration", registrations=1, DKP=5)
+        settlement.add(2, registrations=1, DKP=5)
+        settlement.add(3, DKP=0)
+
+        statements = settlement.statements()
+
+        assert settlement.deltas[1] == {"DKP": 5, "nb_events": 1, "registrations": 1, "attendances": 0}
+        assert 3 not in settlement.deltas
+        assert len(statements) == 3
+        marker, entries, update = statements
+        assert marker[1] == (GUILD_ID, EVENT_ID, REGISTRATIONS, 2)
+        assert entries[1] == (
+            GUILD_ID, 1, EVENT_ID, "registration", 5, 1, 1, 0,
+            GUILD_ID, 2, EVENT_ID, REGISTRATIONS, 5, 0, 1, 0
+        )
+        assert update[0].count("UNION ALL") == 1
+        assert update[1] == (1, 5, 1, 1, 0, 2, 5, 0, 1, 0, GUILD_ID)
+
+    def test_apply_to_returns_updated_copies(self):
+        """Test roster entries are copied with their deltas and unknown members skipped."""
+        settlement = Settlement(GUILD_ID, EVENT_ID, ATTENDANCE)
+        settlement.add(1, DKP=-3)
+        settlement.add(2, DKP=10, attendances=1)
+        members = {1: {"DKP": 20, "attendances": 4, "class": "Tank"}}
+
+        updated = settlement.apply_to(members)
+
+        assert updated == {1: {"DKP": 17, "attendances": 4, "class": "Tank"}}
+        assert members[1]["DKP"] == 20
+
+    def test_restrict_to_drops_members_outside_the_roster(self):
+        """Test dropped members get neither a ledger entry nor a balance row."""
+        settlement = Settlement(GUILD_ID, EVENT_ID, REGISTRATIONS)
+        settlement.add(1, reason="registration", DKP=5)
+        settlement.add(4, reason="registration", DKP=5)
+
+        assert settlement.restrict_to({1, 2}) == 1
+
+        marker, entries, update = settlement.statements()
+        assert marker[1] == (GUILD_ID, EVENT_ID, REGISTRATIONS, 1)
+        assert entries[1] == (GUILD_ID, 1, EVENT_ID, "registration", 5, 0, 0, 0)
+        assert update[1] == (1, 5, 0, 0, 0, GUILD_ID)
+        assert 4 not in settlement.reasons
+
+    def test_no_marker_when_every_delta_was_dropped(self):
+        """Test a settlement emptied by restrict_to builds no statement, while a phase with no deltas still gets its marker."""
+        settlement = Settlement(GUILD_ID, EVENT_ID, REGISTRATIONS)
+        settlement.add(4, reason="registration", DKP=5)
+
+        assert settlement.restrict_to({1, 2}) == 1
+        assert settlement.statements() == []
+        assert len(Settlement(GUILD_ID, EVENT_ID, ATTENDANCE).statements()) == 1
+
+    def test_unknown_phase_and_counter_are_rejected(self):
+        """Test typos cannot silently write to the wrong counter or phase."""
+        with pytest.raises(ValueError):
+            Settlement(GUILD_ID, EVENT_ID, "bonus")
+        with pytest.raises(ValueError):
+            Settlement(GUILD_ID, EVENT_ID, ATTENDANCE).add(1, dkp=5)
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestSettlementEngine:
+    """Test once-per-phase application."""
+
+    async def test_settle_is_idempotent_per_event_and_phase(self):
+        """Test a settled phase is skipped and a concurrent duplicate is reported instead of raised."""
+        engine = SettlementEngine()
+        settlement = Settlement(GUILD_ID, EVENT_ID, ATTENDANCE)
+        settlement.add(1, DKP=10, attendances=1)
+        run_transaction = AsyncMock(return_value=True)
+
+        assert await engine.settle(settlement, AsyncMock(return_value=None), run_transaction, [("UPDATE events_data", ())])
+        assert len(run_transaction.await_args.args[0]) == 4
+
+        assert not await engine.settle(settlement, AsyncMock(return_value=(1,)), run_transaction)
+        assert run_transaction.await_count == 1
+
+        racing = AsyncMock(side_effect=Exception("Duplicate entry"))
+        assert not await engine.settle(settlement, AsyncMock(side_effect=[None, (1,)]), racing)
+
+        with pytest.raises(Exception):
+            await engine.settle(settlement, AsyncMock(return_value=None), AsyncMock(side_effect=Exception("db down")))
+
+        stats = engine.get_stats()
+        assert stats['settled'] == 1 and stats['duplicates'] == 2
+
+        emptied = Settlement(GUILD_ID, EVENT_ID + 1, ATTENDANCE)
+        emptied.add(4, DKP=10)
+        emptied.restrict_to({1})
+        run_db_query = AsyncMock(return_value=None)
+        assert not await engine.settle(emptied, run_db_query, run_transaction)
+        assert run_transaction.await_count == 1 and run_db_query.await_count == 0
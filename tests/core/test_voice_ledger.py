@@ -0,0 +1,90 @@
+"""
+Tests for core.voice_ledger module - Voice presence intervals, window overlap and batched flushes.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from core.voice_ledger import VoicePresenceLedger
+
+GUILD_ID = 1
+T0 = 1_700_000_000.0
+
+
+@pytest.mark.core
+class TestVoicePresenceLedger:
+    """Test interval bookkeeping and overlap queries."""
+
+    def test_overlap_sums_intervals_inside_the_window(self):
+        """Test closed and open intervals are clipped to the window and summed per member."""
+        ledger = VoicePresenceLedger()
+        ledger.join(GUILD_ID, 1, T0 - 600)
+        ledger.leave(GUILD_ID, 1, T0 + 1200)
+        ledger.join(GUILD_ID, 1, T0 + 1800)
+        ledger.join(GUILD_ID, 2, T0 + 3000)
+        ledger.join(GUILD_ID, 3, T0 - 7200)
+        ledger.leave(GUILD_ID, 3, T0 - 3600)
+
+        seconds = ledger.presence_seconds(GUILD_ID, T0, T0 + 3600, now=T0 + 3300)
+
+        assert seconds == {1: 1200 + 1500, 2: 300}
+        assert ledger.presence_seconds(GUILD_ID, T0, T0 + 3600, member_ids=[2, 99], now=T0 + 3300) == {2: 300}
+
+    def test_attendees_apply_the_threshold(self):
+        """Test members below the required share of the window are not counted."""
+        ledger = VoicePresenceLedger()
+        ledger.seed(GUILD_ID, [1, 2], at=T0)
+        ledger.leave(GUILD_ID, 2, T0 + 900)
+
+        assert set(ledger.attendees(GUILD_ID, T0, T0 + 3600, 50, now=T0 + 3600)) == {1}
+        assert set(ledger.attendees(GUILD_ID, T0, T0 + 3600, 0, now=T0 + 3600)) == {1, 2}
+
+    def test_seed_closes_missed_leaves_and_ignores_duplicates(self):
+        """Test reseeding closes members who left unseen and keeps ongoing intervals."""
+        ledger = VoicePresenceLedger()
+        ledger.seed(GUILD_ID, [1, 2], at=T0)
+        assert not ledger.join(GUILD_ID, 1, T0 + 10)
+
+        ledger.seed(GUILD_ID, [1], at=T0 + 60)
+
+        assert ledger.get_stats()['open'] == 1
+        assert ledger.presence_seconds(GUILD_ID, T0, T0 + 120, now=T0 + 120) == {1: 120, 2: 60}
+        assert not ledger.leave(GUILD_ID, 2, T0 + 200)
+
+
+@pytest.mark.core
+@pytest.mark.asyncio
+class TestVoicePresenceLedgerFlush:
+    """Test batched persistence."""
+
+    async def test_flush_batches_rows_and_requeues_failures(self):
+        """Test pending intervals are written in multi-row inserts and a failed batch is retried."""
+        ledger = VoicePresenceLedger(flush_batch_size=2, retention_days=0)
+        for member_id in range(1, 6):
+            ledger.join(GUILD_ID, member_id, T0)
+            ledger.leave(GUILD_ID, member_id, T0 + member_id)
+        run_db_query = AsyncMock(side_effect=[None, Exception("db down")])
+
+        assert await ledger.flush(run_db_query) == 2
+        query, params = run_db_query.await_args_list[0].args
+        assert query.count("(%s, %s, %s, %s)") == 2
+        assert params == (GUILD_ID, 1, int(T0), 1, GUILD_ID, 2, int(T0), 2)
+        assert ledger.get_stats()['pending'] == 3
+
+        run_db_query = AsyncMock()
+        assert await ledger.flush(run_db_query) == 3
+        assert run_db_query.await_count == 2
+        assert ledger.get_stats()['pending'] == 0
+
+    async def test_warm_restores_recent_intervals(self):
+        """Test intervals read back from the database count toward attendance."""
+        ledger = VoicePresenceLedger()
+        run_db_query = AsyncMock(return_value=[(GUILD_ID, 7, int(T0), 1800)])
+
+        assert await ledger.warm(run_db_query, now=T0 + 3600) == 1
+        assert ledger.presence_seconds(GUILD_ID, T0, T0 + 3600, now=T0 + 3600) == {7: 1800}
@@ -0,0 +1,83 @@
+"""
+Tests for cache module - Immutable views and copy-on-write updates.
+"""
+
+import pytest
+from types import MappingProxyType
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem, freeze, thaw
+
+
+@pytest.mark.unit
+class TestFreezeThaw:
+    """Test freeze/thaw helpers."""
+
+    def test_freeze_nested_structures(self):
+        """Test nested dicts and lists become read-only."""
+        frozen = freeze({"registrations": {"presence": [1, 2]}, "tags": {"a"}})
+
+        assert isinstance(frozen, MappingProxyType)
+        assert isinstance(frozen["registrations"], MappingProxyType)
+        assert frozen["registrations"]["presence"] == (1, 2)
+        assert frozen["tags"] == frozenset({"a"})
+        with pytest.raises(TypeError):
+            frozen["status"] = "Closed"
+
+    def test_thaw_returns_independent_copy(self):
+        """Test thawed values can be mutated without touching the frozen view."""
+        frozen = freeze({"registrations": {"presence": [1]}})
+        copy = thaw(frozen)
+
+        copy["registrations"]["presence"].append(2)
+
+        assert copy["registrations"]["presence"] == [1, 2]
+        assert frozen["registrations"]["presence"] == (1,)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCopyOnWriteUpdate:
+    """Test GlobalCacheSystem.update()."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a fresh cache instance for each test."""
+        return GlobalCacheSystem()
+
+    async def test_update_replaces_value_without_mutating_old_view(self, cache):
+        """Test readers holding the previous view are unaffected."""
+        await cache.set_guild_data(1, "event_10", freeze({"registrations": {"presence": []}}))
+        old_view = await cache.get_guild_data(1, "event_10", _auto_reload=False)
+
+        def register(event):
+            event["registrations"]["presence"].append(42)
+            return event
+
+        new_view = await cache.update_guild_data(1, "event_10", register)
+
+        assert new_view["registrations"]["presence"] == (42,)
+        assert old_view["registrations"]["presence"] == ()
+        assert await cache.get_guild_data(1, "event_10", _auto_reload=False) is new_view
+
+    async def test_update_declined_keeps_entry(self, cache):
+        """Test returning None from the updater leaves the entry untouched."""
+        await cache.set_guild_data(1, "event_10", freeze({"status": "Planned"}))
+
+        result = await cache.update_guild_data(1, "event_10", lambda event: None)
+
+        assert result is None
+        assert (await cache.get_guild_data(1, "event_10", _auto_reload=False))["status"] == "Planned"
+
+    async def test_update_missing_entry_receives_none(self, cache):
+        """Test the updater sees None for missing keys."""
+        seen = []
+
+        await cache.update_guild_data(1, "event_99", lambda event: seen.append(event))
+
+        assert seen == [None]
+        assert await cache.get_guild_data(1, "event_99", _auto_reload=False) is None
@@ -0,0 +1,210 @@
+"""
+Tests for cache_loader module - Delta synchronization, staged load and lazy hydration.
+"""
+
+import asyncio
+import pytest
+import time
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+
+# Import test utilities
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "app"))
+
+from cache import GlobalCacheSystem
+from cache_loader import CacheLoader
+
+
+def make_loader(responses):
+    """Build a CacheLoader whose DB answers queries by matching substrings."""
+    bot = Mock()
+    bot.cache = GlobalCacheSystem()
+
+    async def run_db_query(query, params=None, **kwargs):
+        for needle, result in responses.items():
+            if needle in query:
+                return result
+        return None
+
+    bot.run_db_query = AsyncMock(side_effect=run_db_query)
+    loader = CacheLoader(bot)
+    loader._initial_load_complete = True
+    return loader
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDeltaSync:
+    """Test CacheLoader.sync_deltas()."""
+
+    async def test_sync_disabled_without_watermarks(self):
+        """Test nothing is queried before watermarks are initialized."""
+        loader = make_loader({})
+
+        result = await loader.sync_deltas()
+
+        assert result == {'patched': 0, 'deleted': 0}
+        loader.bot.run_db_query.assert_not_called()
+
+    async def test_sync_patches_changed_rows_and_applies_tombstones(self):
+        """Test upserts are patched and tombstoned rows are removed."""
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        event_row = (1, 10, "Raid", "2025-01-02", "21:00", 60, 5, 0, "Planned", '{"presence": [7]}', None, None)
+        member_row = (1, 7, "Alice", "en-US", "Tank", 3000, None, "SNS/GS", 10, 2, 2, 1)
+        loader = make_loader({
+            "SELECT NOW()": (now,),
+            "FROM events_data": [event_row],
+            "FROM guild_members": [member_row],
+            "FROM user_setup": [],
+            "FROM cache_changelog WHERE id": [(5, "guild_members", 1, 8)],
+        })
+        loader._delta_watermarks = {table: now for table in ('events_data', 'guild_members', 'user_setup')}
+        loader._loaded_categories = {'events_data', 'guild_members', 'user_setup'}
+        await loader.bot.cache.set('roster_data', {(1, 8): {'class': 'Healer'}}, 'guild_members')
+
+        result = await loader.sync_deltas()
+
+        assert result == {'patched': 2, 'deleted': 1}
+        event = await loader.bot.cache.get_guild_data(1, 'event_10', _auto_reload=False)
+        assert event['registrations']['presence'] == (7,)
+        roster = await loader.bot.cache.get('roster_data', 'guild_members')
+        assert (1, 7) in roster and (1, 8) not in roster
+        assert loader._changelog_watermark == 5
+
+    async def test_registration_rows_override_json_and_deletions_refresh_event(self):
+        """Test event_registrations rows win over the JSON column and tombstones re-read them."""
+        event_row = (1, 10, "Raid", "2025-01-02", "21:00", 60, 5, 0, "Planned", '{"presence": [7]}', None, None)
+        responses = {
+            "FROM events_data": [event_row],
+            "FROM event_registrations": [(1, 10, 8, "tentative"), (1, 10, 9, "presence")],
+        }
+        loader = make_loader(responses)
+
+        await loader.ensure_events_data_loaded()
+        event = await loader.bot.cache.get_guild_data(1, 'event_10', _auto_reload=False)
+        assert event['registrations']['presence'] == (9,)
+        assert event['registrations']['tentative'] == (8,)
+
+        responses["FROM event_registrations"] = [(1, 10, 9, "presence")]
+        await loader._apply_tombstones([(6, "event_registrations", 1, 10)])
+        event = await loader.bot.cache.get_guild_data(1, 'event_10', _auto_reload=False)
+        assert event['registrations']['tentative'] == ()
+        assert event['name'] == "Raid"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStagedLoad:
+    """Test the staged startup orchestrator."""
+
+    def _stub_loaders(self, loader, order, failing=()):
+        """Replace every ensure_*_loaded method with a recording stub."""
+        from cache_loader import CATEGORY_DEPENDENCIES
+
+        for category in CATEGORY_DEPENDENCIES:
+            async def ensure(category=category):
+                order.append(category)
+                if category not in failing:
+                    loader._loaded_categories.add(category)
+            setattr(loader, f"ensure_{category}_loaded", ensure)
+
+    async def test_dependencies_load_first_and_events_are_set(self):
+        """Test eager dependents start after their dependencies and signal readiness."""
+        loader = make_loader({})
+        loader._initial_load_complete = False
+        order = []
+        self._stub_loaders(loader, order)
+
+        await loader.load_all_shared_data()
+
+        assert order.index('games_list') < order.index('weapons') < order.index('weapons_combinations')
+        assert 'guild_settings' not in order
+        assert await loader.wait_for_categories('events_data', 'weapons', timeout=0.1)
+        assert loader.get_load_timings()['weapons']['status'] == 'loaded'
+        assert loader.get_load_timings()['guild_settings']['status'] == 'lazy'
+
+    async def test_critical_failure_is_retried_then_raised(self, monkeypatch):
+        """Test a failing critical category is retried per category and reported."""
+        import cache_loader
+        monkeypatch.setattr(cache_loader.asyncio, "sleep", AsyncMock())
+        loader = make_loader({})
+        loader._initial_load_complete = False
+        order = []
+        self._stub_loaders(loader, order, failing=('games_list',))
+
+        with pytest.raises(RuntimeError):
+            await loader.load_all_shared_data()
+
+        assert order.count('games_list') == cache_loader.CATEGORY_MAX_ATTEMPTS
+        assert order.count('weapons') == 1
+        assert loader.get_load_timings()['games_list']['status'] == 'failed'
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLazyHydration:
+    """Test per-guild hydration and idle eviction."""
+
+    async def test_concurrent_callers_share_one_hydration(self):
+        """Test only one set of per-guild queries runs for concurrent first accesses."""
+        loader = make_loader({
+            "FROM guild_settings": [(1, False, "fr-FR", "Guild", 1, "EU", True, False, 70)],
+            "FROM guild_members": [(1, 7, "Alice", "fr", "Tank", 3000, None, "SNS/GS", 0, 0, 0, 0)],
+        })
+
+        results = await asyncio.gather(*(loader.ensure_guild_hydrated(1) for _ in range(5)))
+
+        assert results == [True] * 5
+        settings_queries = [c for c in loader.bot.run_db_query.call_args_list if "FROM guild_settings" in c.args[0]]
+        assert len(settings_queries) == 1
+        assert settings_queries[0].args[1] == (1,)
+        assert await loader.bot.cache.get_guild_data(1, 'guild_lang', _auto_reload=False) == "fr-FR"
+        settings = await loader.bot.cache.get_guild_data(1, 'settings', _auto_reload=False)
+        assert settings['attendance_min_presence'] == 70
+        assert 'guild_settings' not in loader.get_loaded_categories()
+
+    async def test_failed_hydration_is_retried_on_next_access(self):
+        """Test a guild is not marked hydrated when a loader fails."""
+        loader = make_loader({})
+        loader.bot.run_db_query.side_effect = Exception("db down")
+
+        assert await loader.ensure_guild_hydrated(1) is False
+        assert loader.get_hydration_stats()['hydrated_guilds'] == 0
+
+    async def test_roster_accessor_hydrates_only_the_requested_guild(self):
+        """Test direct roster and ideal staff readers hydrate their guild, and an expired roster reloads that guild only."""
+        loader = make_loader({
+            "FROM guild_members": [(1, 7, "Alice", "fr", "Tank", 3000, None, "SNS/GS", 0, 0, 0, 0)],
+            "FROM guild_ideal_staff": [(1, "Tank", 2)],
+        })
+        loader.bot.cache.bot = loader.bot
+        loader.bot.cache_loader = loader
+        loader.bot.cache._initial_load_complete = True
+
+        assert list(await loader.bot.cache.get_guild_roster(1)) == [(1, 7)]
+        assert await loader.bot.cache.get_guild_ideal_staff(1) == {"Tank": 2}
+        assert loader.get_hydration_stats()['hydrated_guilds'] == 1
+
+        await loader.bot.cache.delete('roster_data', 'guild_members')
+        loader.bot.run_db_query.reset_mock()
+        assert list(await loader.bot.cache.get_guild_roster(1)) == [(1, 7)]
+        assert [c.args[1] for c in loader.bot.run_db_query.call_args_list] == [(1,)]
+
+    async def test_idle_guild_is_evicted(self):
+        """Test eviction drops only the idle guild's entries."""
+        loader = make_loader({})
+        await loader.ensure_guild_hydrated(1)
+        await loader.ensure_guild_hydrated(2)
+        await loader.bot.cache.set_guild_data(1, 'guild_lang', "fr-FR")
+        await loader.bot.cache.set_guild_data(2, 'guild_lang', "en-US")
+        await loader.bot.cache.set('roster_data', {(1, 7): {}, (2, 8): {}}, 'guild_members')
+        loader._guild_last_access[1] = time.time() - 100
+
+        evicted = await loader.evict_idle_guilds(idle_ttl=50)
+
+        assert evicted == 1
+        assert await loader.bot.cache.get_guild_data(1, 'guild_lang', _auto_reload=False) is None
+        assert await loader.bot.cache.get_guild_data(2, 'guild_lang', _auto_reload=False) == "en-US"
+        assert list(await loader.bot.cache.get('roster_data', 'guild_members')) == [(2, 8)]